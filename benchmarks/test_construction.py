@@ -0,0 +1,121 @@
+"""Benchmarks for building SendLive instances and their adapters, and the objects adapters build for api calls.
+
+Run with `pytest benchmarks`, which requires pytest-benchmark to be installed.
+"""
+
+from collections.abc import Iterator
+from typing import Any, Optional
+from unittest import mock
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from sendlive import SendLive
+from sendlive.constants import (
+    AWSCredentials,
+    BaseCredential,
+    GCPCredentials,
+    LocalCredentials,
+)
+from sendlive.mixins import TagMixin
+from sendlive.providers.aws.utils import build_medialive_channel_params_from_defaults
+from sendlive.providers.gcp.utils import (
+    build_gcp_channel_obj_from_defaults,
+    construct_gcp_channel_name,
+    construct_gcp_channel_output_path,
+    construct_gcp_input_endpoint_name,
+)
+
+CREDENTIALS: dict[str, BaseCredential] = {
+    "aws": AWSCredentials(
+        access_key="testing", secret_key="testing", region="ap-southeast-2"
+    ),
+    "gcp": GCPCredentials(
+        project_id="testing",
+        service_account_json={"type": "service_account"},
+        region="australia-southeast1",
+    ),
+    "local": LocalCredentials(),
+}
+
+# a typical set of user tags, and a large one
+TAGS = {
+    "small": {"Team": "video", "Environment": "production"},
+    "large": {f"Tag Key {i}": f"value-{i}" for i in range(50)},
+}
+
+
+@pytest.fixture(autouse=True)
+def gcp_service_account() -> Iterator[None]:
+    """Skip parsing the fake service account key, which is not a real key."""
+    with mock.patch("sendlive.providers.gcp.mixins.Credentials"):
+        yield
+
+
+@pytest.mark.parametrize("provider", list(CREDENTIALS))
+def test_sendlive_adapter_construction(
+    benchmark: BenchmarkFixture, provider: str
+) -> None:
+    """Benchmark building a SendLive instance and its adapter, as done once per process or configuration change."""
+    credentials = CREDENTIALS[provider]
+
+    def build() -> object:
+        sendlive = SendLive(credentials=credentials)
+        adapter = sendlive.adapter
+        sendlive.close()
+        return adapter
+
+    benchmark(build)
+
+
+@pytest.mark.parametrize("size", list(TAGS))
+def test_get_operation_tags(benchmark: BenchmarkFixture, size: str) -> None:
+    """Benchmark merging user tags with the sendlive tags, as done for every resource created."""
+    benchmark(TagMixin().get_operation_tags, TAGS[size])
+
+
+@pytest.mark.parametrize("size", list(TAGS))
+def test_get_operation_tags_lowercase_no_space_keys(
+    benchmark: BenchmarkFixture, size: str
+) -> None:
+    """Benchmark normalizing tags into gcp labels, as done for every gcp resource created."""
+    benchmark(TagMixin().get_operation_tags_lowercase_no_space_keys, TAGS[size])
+
+
+def test_build_gcp_channel_obj_from_defaults(benchmark: BenchmarkFixture) -> None:
+    """Benchmark building the channel object sent to create each gcp channel."""
+    name = construct_gcp_channel_name("testing", "australia-southeast1", "my-stream")
+    input_str = construct_gcp_input_endpoint_name(
+        "testing", "australia-southeast1", "my-stream"
+    )
+    tags = TagMixin().get_operation_tags_lowercase_no_space_keys(TAGS["small"])
+    channel = benchmark(
+        build_gcp_channel_obj_from_defaults,
+        name,
+        input_str,
+        "gs://sendlive-bucket",
+        tags=tags,
+        output_path=construct_gcp_channel_output_path("my-stream"),
+    )
+    assert channel.name == name
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [None, {"timecodeConfig": {"source": "EMBEDDED"}}],
+    ids=["", "overrides"],
+)
+def test_build_medialive_channel_params_from_defaults(
+    benchmark: BenchmarkFixture, overrides: Optional[dict[str, Any]]
+) -> None:
+    """Benchmark building the params sent to create each medialive channel."""
+    params = benchmark(
+        build_medialive_channel_params_from_defaults,
+        "my-stream",
+        input_id="input-1",
+        channel_group_name="sendlive",
+        channel_name="my-stream",
+        tags=TAGS["small"],
+        encoder_settings_overrides=overrides,
+    )
+    assert params["Name"] == "my-stream"
@@ -0,0 +1,154 @@
+"""End to end benchmarks for creating streams, one at a time and in bulk.
+
+AWS streams are created against moto's medialive, with mediapackagev2 (which moto does not support) stubbed. Bulk
+creation is measured against the simulated local provider, which adds a fixed latency to every api call and long
+running operation, so that the results show how well creation overlaps provider latency rather than how fast the
+provider is.
+
+Run with `pytest benchmarks`, which requires pytest-benchmark to be installed.
+"""
+import itertools
+import os
+from collections.abc import Iterator
+from typing import Any
+from unittest import mock
+
+import pytest
+from botocore.stub import Stubber
+from moto import mock_medialive
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from sendlive.constants import (
+    AWSCredentials,
+    AWSOptions,
+    LatencyDistribution,
+    LocalCredentials,
+    LocalOptions,
+)
+from sendlive.providers.aws.adapter import AWSAdapter
+from sendlive.providers.aws.mediapackage import MediaPackageV2ChannelGroup
+from sendlive.providers.local.adapter import LocalAdapter
+
+REGION = "ap-southeast-2"
+CHANNEL_GROUP_ARN = (
+    f"arn:aws:mediapackagev2:{REGION}:123456789012:channelGroup/sendlive"
+)
+
+# simulated latency of each local provider api call, and duration of each long running operation
+LOCAL_LATENCY = 0.005
+BULK_STREAMS = 200
+
+
+def _add_input_urls(parsed: dict[str, Any], **kwargs: Any) -> None:
+    """Add the push url medialive gives each input destination, which moto leaves out."""
+    for destination in parsed.get("Input", {}).get("Destinations", []):
+        destination.setdefault(
+            "Url", f"rtmp://203.0.113.1:1935/{destination.get('StreamName')}"
+        )
+
+
+@pytest.fixture
+def aws_adapter() -> Iterator[AWSAdapter]:
+    """Build an adapter whose medialive calls go to moto, with the channel group already resolved."""
+    with mock.patch.dict(
+        os.environ,
+        {"AWS_ACCESS_KEY_ID": "testing", "AWS_SECRET_ACCESS_KEY": "testing"},
+    ), mock_medialive():
+        adapter = AWSAdapter(
+            credentials=AWSCredentials(
+                access_key="testing", secret_key="testing", region=REGION
+            ),
+            provider_options=AWSOptions(
+                # moto does not support input security groups, nor check inputs' groups exist
+                medialive_input_security_group_id=1234,
+                medialive_role_arn="arn:aws:iam::123456789012:role/MediaLiveAccessRole",
+                medialive_waiter_delay=0,
+                state_backend="memory",
+            ),
+        )
+        adapter.medialive.meta.events.register(
+            "after-call.medialive.CreateInput", _add_input_urls
+        )
+        adapter.mediapackage_channel_groups.add(
+            MediaPackageV2ChannelGroup(name="sendlive", arn=CHANNEL_GROUP_ARN)
+        )
+        yield adapter
+        adapter.close()
+
+
+def _add_mediapackagev2_responses(mediapackagev2: Stubber, name: str) -> None:
+    """Stub the mediapackagev2 channel and origin endpoint created for a stream."""
+    channel_arn = f"{CHANNEL_GROUP_ARN}/channel/{name}"
+    mediapackagev2.add_response(
+        "create_channel",
+        {
+            "Arn": channel_arn,
+            "ChannelName": name,
+            "ChannelGroupName": "sendlive",
+            "CreatedAt": "2024-01-01",
+            "ModifiedAt": "2024-01-01",
+            "ResponseMetadata": {"HTTPStatusCode": 200},
+        },
+    )
+    mediapackagev2.add_response(
+        "create_origin_endpoint",
+        {
+            "Arn": f"{channel_arn}/originEndpoint/{name}",
+            "ChannelGroupName": "sendlive",
+            "ChannelName": name,
+            "OriginEndpointName": name,
+            "ContainerType": "TS",
+            "Segment": {},
+            "CreatedAt": "2024-01-01",
+            "ModifiedAt": "2024-01-01",
+            "HlsManifests": [
+                {"ManifestName": "index", "Url": f"https://egress/{name}/index.m3u8"}
+            ],
+        },
+    )
+
+
+def test_aws_adapter_create_stream(
+    benchmark: BenchmarkFixture, aws_adapter: AWSAdapter
+) -> None:
+    """Benchmark creating every resource of a new aws stream."""
+    names = (f"stream-{i}" for i in itertools.count())
+    with Stubber(aws_adapter.mediapackagev2) as mediapackagev2:
+
+        def setup() -> tuple[tuple[Any, ...], dict[str, Any]]:
+            name = next(names)
+            _add_mediapackagev2_responses(mediapackagev2, name)
+            return (name,), {}
+
+        stream = benchmark.pedantic(
+            aws_adapter.create_stream, setup=setup, rounds=50, warmup_rounds=1
+        )
+    assert stream.channel_id is not None
+
+
+def _local_adapter(run: str) -> LocalAdapter:
+    latency = LatencyDistribution(mean=LOCAL_LATENCY)
+    # each run gets its own simulated account, and region to record its streams under in the local state
+    return LocalAdapter(
+        credentials=LocalCredentials(account_id=run, region=run),
+        provider_options=LocalOptions(latency=latency, operation_duration=latency),
+    )
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 8, 32])
+def test_local_adapter_create_streams(
+    benchmark: BenchmarkFixture, max_concurrency: int
+) -> None:
+    """Benchmark creating streams in bulk against a provider with a fixed latency per call."""
+    runs = itertools.count()
+
+    def setup() -> tuple[tuple[Any, ...], dict[str, Any]]:
+        adapter = _local_adapter(f"run-{next(runs)}")
+        names = [f"stream-{i}" for i in range(BULK_STREAMS)]
+        return (adapter, names), {}
+
+    def create_streams(adapter: LocalAdapter, names: list[str]) -> int:
+        return len(adapter.create_streams(names, max_concurrency).succeeded)
+
+    created = benchmark.pedantic(create_streams, setup=setup, rounds=3)
+    assert created == BULK_STREAMS
@@ -0,0 +1,35 @@
+"""Microbenchmarks for generating DNS compliant resource names.
+
+Run with `pytest benchmarks`, which requires pytest-benchmark to be installed.
+"""
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from sendlive.utils import generate_dns_compliant_name, validate_dns_compliant_name
+
+
+def test_generate_dns_compliant_name(benchmark: BenchmarkFixture) -> None:
+    """Benchmark generating a name with the default parameters."""
+    name = benchmark(generate_dns_compliant_name)
+    assert validate_dns_compliant_name(name) == name
+
+
+def test_generate_dns_compliant_name_with_collisions(
+    benchmark: BenchmarkFixture,
+) -> None:
+    """Benchmark generating a name when the first candidates already exist."""
+
+    def run() -> str:
+        attempts: list[str] = []
+
+        def exists(name: str) -> bool:
+            attempts.append(name)
+            return len(attempts) < 3
+
+        return generate_dns_compliant_name(exists=exists)
+
+    benchmark(run)
+
+
+def test_validate_dns_compliant_name(benchmark: BenchmarkFixture) -> None:
+    """Benchmark validating a name against the bucket naming rules."""
+    benchmark(validate_dns_compliant_name, "sendlive-amber-brook-cedar")
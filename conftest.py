@@ -0,0 +1,44 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from moto import mock_sts
+
+from sendlive.constants import AWSCredentials
+from sendlive.providers.local.cloud import reset_local_clouds
+from sendlive.state import STATE_PATH_ENV_VAR, close_state_backends
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Give every test its own local state database, and simulated local provider, rather than sharing them."""
+    state_path = tmp_path / "state.sqlite3"
+    monkeypatch.setenv(STATE_PATH_ENV_VAR, str(state_path))
+    yield state_path
+    close_state_backends()
+    reset_local_clouds()
+
+
+@pytest.fixture(autouse=True)
+def aws_account() -> Iterator[None]:
+    """Answer the sts lookups aws adapters make for the account they record resources under, without the network."""
+    with mock_sts():
+        yield
+
+
+@pytest.fixture(scope="function")
+def aws_credentials(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point boto3 at fake credentials, so moto mocked clients never reach a real account."""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_SECURITY_TOKEN", "testing")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "ap-southeast-2")
+
+
+@pytest.fixture(scope="function")
+def sendlive_aws_credentials() -> AWSCredentials:
+    """Credentials for an aws adapter, matching the fake account the moto mocks answer for."""
+    return AWSCredentials(
+        access_key="testing", secret_key="testing", region="ap-southeast-2"
+    )
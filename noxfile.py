@@ -177,6 +177,20 @@ def coverage(session: Session) -> None:
     session.run("coverage", *args)
 
 
+@session(python=python_versions[0])
+def benchmarks(session: Session) -> None:
+    """Run the benchmarks, saving the results as json in .benchmarks to compare across commits."""
+    session.run_always("poetry", "install", external=True)
+    session.install("pytest", "pytest-benchmark")
+    session.run(
+        "pytest",
+        "benchmarks",
+        "--benchmark-autosave",
+        "--benchmark-columns=min,median,mean,stddev,rounds",
+        *session.posargs,
+    )
+
+
 @session(python=python_versions[0])
 def typeguard(session: Session) -> None:
     """Runtime type checking using Typeguard."""
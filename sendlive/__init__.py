@@ -1,42 +1,33 @@
-"""Main sendlive package."""
-from typing import Optional
-
-from pydantic import BaseModel, ConfigDict, computed_field
-
-from sendlive.adapter import BaseAdapter
-from sendlive.constants import (
-    BaseCredential,
-    ProviderOptions,
-    ServiceProvider,
-)
-from sendlive.stream import BaseStream
-from sendlive.utils import get_adapter_for_provider
-
-
-class SendLive(BaseModel):
-    """SendLive is a library for creating live streams with different cloud vendors, using one interface."""
-
-    credentials: BaseCredential
-    provider_options: Optional[ProviderOptions] = None
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
-    @property
-    def service_provider(self) -> ServiceProvider:
-        """Return the service provider, based on the provided credentials."""
-        return self.credentials.service_provider
-
-    @computed_field  # type: ignore[misc]
-    @property
-    def adapter(self) -> BaseAdapter:
-        """Return the adapter for the configured service provider."""
-        adapter_cls = get_adapter_for_provider(provider=self.service_provider)
-        return adapter_cls(
-            credentials=self.credentials, provider_options=self.provider_options
-        )
-
-    def create_stream(
-        self,
-        name: str,
-    ) -> BaseStream:
-        """Create a stream using the configured service provider."""
-        return self.adapter.create_stream(name=name)
+"""Main sendlive package.
+
+The public interface is loaded lazily on first attribute access, so that `import sendlive` (and the command-line
+interface) stays fast, and pydantic and provider SDKs are only imported once they are actually used.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sendlive.core import AsyncSendLive, BaseSendLive, SendLive
+
+__all__ = ["AsyncSendLive", "BaseSendLive", "SendLive"]
+
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "AsyncSendLive": "sendlive.core",
+    "BaseSendLive": "sendlive.core",
+    "SendLive": "sendlive.core",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public attributes from their defining module on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public attributes, including those not yet imported."""
+    return sorted({*globals(), *__all__})
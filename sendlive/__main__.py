@@ -1,11 +1,351 @@
-"""Command-line interface."""
+"""Command-line interface.
+
+Every command writes its results to stdout as json lines, one object per stream or resource, as soon as each is ready,
+so that large batches can be piped into other tools while still in progress. Logs and summaries go to stderr.
+
+pydantic and the provider SDKs are only imported once a command runs, so that `sendlive --help` stays fast.
+"""
+import json
+import sys
+import threading
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Optional, TextIO
+
 import click
 
+from sendlive.exceptions import SendLiveError
+
+if TYPE_CHECKING:
+    from sendlive.adapter import BaseAdapter
+    from sendlive.gc import GarbageCollectionResult, SendLiveResource
+    from sendlive.stream import BaseStream
+
+# provider names accepted on the command line, and the service provider each refers to
+PROVIDERS = {"aws": "aws_medialive", "gcp": "gcp", "local": "local"}
+
+_output_lock = threading.Lock()
+
+
+def write_json_line(value: dict[str, Any]) -> None:
+    """Write a json line to stdout, from any thread, flushing it straight away."""
+    line = json.dumps(value, default=str)
+    with _output_lock:
+        click.echo(line)
+
+
+class CLIContext:
+    """The provider configuration passed to every command, building the adapter on first use."""
+
+    def __init__(
+        self,
+        provider: str,
+        credentials_file: Optional[str],
+        options_file: Optional[str],
+    ) -> None:
+        """Configure the provider, credentials and options the adapter is built from."""
+        self.provider = provider
+        self.credentials_file = credentials_file
+        self.options_file = options_file
+        self._adapter: Optional[BaseAdapter] = None
+
+    @property
+    def adapter(self) -> "BaseAdapter":
+        """Return the adapter of the configured provider, loading its credentials and options."""
+        if self._adapter is None:
+            from sendlive.constants import ServiceProvider
+            from sendlive.credentials import load_credentials, load_provider_options
+            from sendlive.utils import get_adapter_for_provider
+
+            service_provider = ServiceProvider(PROVIDERS[self.provider])
+            adapter_cls = get_adapter_for_provider(service_provider)
+            self._adapter = adapter_cls(
+                credentials=load_credentials(service_provider, self.credentials_file),
+                provider_options=load_provider_options(
+                    service_provider, self.options_file
+                ),
+            )
+        return self._adapter
+
+    def close(self) -> None:
+        """Close the adapter, if one has been built."""
+        if self._adapter is not None:
+            self._adapter.close()
+            self._adapter = None
+
+
+pass_cli_context = click.make_pass_decorator(CLIContext)
+
+
+def read_names(names: Iterable[str], file: Optional[TextIO]) -> list[str]:
+    """Combine names passed as arguments with those read from file, one per line, skipping blanks and # comments."""
+    file_names = (line.strip() for line in file) if file is not None else ()
+    return list(
+        dict.fromkeys(
+            name for name in (*names, *file_names) if name and not name.startswith("#")
+        )
+    )
+
+
+def write_deletion_results(result: "GarbageCollectionResult") -> None:
+    """Write a json line per resource deleted, or to be deleted on a dry run, and a summary to stderr."""
+    if result.dry_run:
+        for resource in result.orphans:
+            write_json_line({**_resource_summary(resource), "dry_run": True})
+    for deletion in result.deletions:
+        write_json_line(
+            {
+                **_resource_summary(deletion.resource),
+                "deleted": deletion.succeeded,
+                "error": deletion.error,
+                "duration": deletion.duration,
+            }
+        )
+    click.echo(result.report(), err=True)
+    if result.failed:
+        sys.exit(1)
+
+
+def _resource_summary(resource: "SendLiveResource") -> dict[str, Any]:
+    return {
+        "provider": resource.provider,
+        "resource_type": resource.resource_type,
+        "resource_id": resource.resource_id,
+        "stream_name": resource.stream_name,
+    }
+
 
-@click.command()
+class SendLiveGroup(click.Group):
+    """Reports sendlive errors, such as missing credentials or provider failures, as command-line errors."""
+
+    def invoke(self, ctx: click.Context) -> Any:
+        """Invoke the command, turning sendlive errors into a message and non-zero exit."""
+        try:
+            return super().invoke(ctx)
+        except SendLiveError as e:
+            raise click.ClickException(str(e)) from e
+
+
+@click.group(cls=SendLiveGroup)
 @click.version_option()
-def main() -> None:
-    """sendlive."""
+@click.option(
+    "--provider",
+    type=click.Choice(list(PROVIDERS)),
+    default="aws",
+    show_default=True,
+    envvar="SENDLIVE_PROVIDER",
+    help="Cloud provider to manage streams on.",
+)
+@click.option(
+    "--credentials-file",
+    type=click.Path(exists=True, dir_okay=False),
+    envvar="SENDLIVE_CREDENTIALS_FILE",
+    help="Json file of provider credentials, taking precedence over those in the environment.",
+)
+@click.option(
+    "--options-file",
+    type=click.Path(exists=True, dir_okay=False),
+    envvar="SENDLIVE_OPTIONS_FILE",
+    help="Json file of provider options.",
+)
+@click.option("-v", "--verbose", is_flag=True, help="Log provider calls to stderr.")
+@click.pass_context
+def main(
+    ctx: click.Context,
+    provider: str,
+    credentials_file: Optional[str],
+    options_file: Optional[str],
+    verbose: bool,
+) -> None:
+    """Sendlive - create and manage live streams on AWS or GCP.
+
+    Credentials are read from the environment (AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY and AWS_REGION for AWS, or
+    GOOGLE_APPLICATION_CREDENTIALS and SENDLIVE_GCP_REGION for GCP), or from --credentials-file. The local provider
+    simulates streams in memory, for trying sendlive out without an account.
+    """
+    if verbose:
+        import logging
+
+        from sendlive.logger import configure_logging
+
+        configure_logging(logging.DEBUG, json_format=True, stream=sys.stderr)
+    cli_context = CLIContext(provider, credentials_file, options_file)
+    ctx.obj = cli_context
+    ctx.call_on_close(cli_context.close)
+
+
+@main.command()
+@click.argument("names", nargs=-1)
+@click.option(
+    "-f",
+    "--file",
+    type=click.File("r"),
+    help="File of stream names to create, one per line, or - for stdin.",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    help="Maximum number of streams created at once.",
+)
+@click.option(
+    "--latency-mode",
+    type=click.Choice(["standard", "low"]),
+    help="Encode and package streams for standard or low latency.",
+)
+@pass_cli_context
+def create(
+    cli_context: CLIContext,
+    names: tuple[str, ...],
+    file: Optional[TextIO],
+    concurrency: Optional[int],
+    latency_mode: Optional[str],
+) -> None:
+    """Create streams, writing a json line per stream as each is created."""
+    from sendlive.bulk import StreamCreationResult
+
+    stream_names = read_names(names, file)
+    if not stream_names:
+        raise click.UsageError("No stream names given.")
+
+    def on_result(result: StreamCreationResult) -> None:
+        line: dict[str, Any] = {
+            "name": result.name,
+            "created": result.succeeded,
+            "duration": result.duration,
+        }
+        if result.stream is not None:
+            line["urls"] = result.stream.get_url().model_dump()
+        else:
+            line["error"] = result.error
+        write_json_line(line)
+
+    kwargs: dict[str, Any] = {}
+    if concurrency is not None:
+        kwargs["max_concurrency"] = concurrency
+    if latency_mode is not None:
+        kwargs["latency_mode"] = latency_mode
+    result = cli_context.adapter.create_streams(
+        stream_names, on_result=on_result, **kwargs
+    )
+    click.echo(
+        f"created {len(result.succeeded)} streams in {result.duration:.2f}s "
+        f"({result.streams_per_second:.1f}/s), {len(result.failed)} failed",
+        err=True,
+    )
+    if result.failed:
+        sys.exit(1)
+
+
+@main.command(name="list")
+@pass_cli_context
+def list_streams(cli_context: CLIContext) -> None:
+    """List the names of every sendlive stream."""
+    for name in cli_context.adapter.list_streams():
+        write_json_line({"name": name})
+
+
+def _recorded_streams(
+    cli_context: CLIContext, names: Iterable[str]
+) -> Iterator["BaseStream"]:
+    """Yield each named stream recorded in the local state, writing an error line for those that are not."""
+    missing = False
+    for name in names:
+        stream = cli_context.adapter.get_stream(name)
+        if stream is None:
+            missing = True
+            write_json_line({"name": name, "error": "Stream not found."})
+        else:
+            yield stream
+    if missing:
+        sys.exit(1)
+
+
+@main.command()
+@click.argument("names", nargs=-1, required=True)
+@pass_cli_context
+def status(cli_context: CLIContext, names: tuple[str, ...]) -> None:
+    """Show whether streams are live, checking with the provider."""
+    for stream in _recorded_streams(cli_context, names):
+        write_json_line({"name": stream.name, "alive": stream.is_alive()})
+
+
+@main.command()
+@click.argument("names", nargs=-1, required=True)
+@pass_cli_context
+def url(cli_context: CLIContext, names: tuple[str, ...]) -> None:
+    """Show the urls to push streams to and watch them at."""
+    for stream in _recorded_streams(cli_context, names):
+        write_json_line({"name": stream.name, **stream.get_url().model_dump()})
+
+
+@main.command()
+@click.argument("names", nargs=-1)
+@click.option(
+    "-f",
+    "--file",
+    type=click.File("r"),
+    help="File of stream names to delete, one per line, or - for stdin.",
+)
+@click.option("--dry-run", is_flag=True, help="List the resources without deleting.")
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    help="Maximum number of resources deleted at once.",
+)
+@pass_cli_context
+def delete(
+    cli_context: CLIContext,
+    names: tuple[str, ...],
+    file: Optional[TextIO],
+    dry_run: bool,
+    concurrency: Optional[int],
+) -> None:
+    """Delete every resource of streams, which must be stopped first."""
+    stream_names = read_names(names, file)
+    if not stream_names:
+        raise click.UsageError("No stream names given.")
+    kwargs = {} if concurrency is None else {"max_concurrency": concurrency}
+    write_deletion_results(
+        cli_context.adapter.delete_streams(stream_names, dry_run=dry_run, **kwargs)
+    )
+
+
+@main.command()
+@click.option(
+    "--keep",
+    multiple=True,
+    help="Name of a stream whose resources are never deleted, can be repeated.",
+)
+@click.option(
+    "--dry-run/--force",
+    default=True,
+    help="List orphans without deleting them, the default, or delete them.",
+)
+@click.option(
+    "--all",
+    "include_unknown",
+    is_flag=True,
+    help="Also collect resources unknown to the local state, such as those of streams created on other hosts.",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    help="Maximum number of resources listed or deleted at once.",
+)
+@pass_cli_context
+def gc(
+    cli_context: CLIContext,
+    keep: tuple[str, ...],
+    dry_run: bool,
+    include_unknown: bool,
+    concurrency: Optional[int],
+) -> None:
+    """List the resources of streams that are neither live nor kept, deleting them with --force."""
+    kwargs = {} if concurrency is None else {"max_concurrency": concurrency}
+    write_deletion_results(
+        cli_context.adapter.collect_garbage(
+            keep=keep, dry_run=dry_run, include_unknown=include_unknown, **kwargs
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -1,9 +1,29 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from collections.abc import Iterable
+from types import TracebackType
+from typing import Any, Callable, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+from typing_extensions import Self
 
+from sendlive.bulk import (
+    DEFAULT_BULK_MAX_CONCURRENCY,
+    BulkStreamCreationResult,
+    StreamCreationResult,
+    create_streams,
+    create_streams_async,
+)
+from sendlive.cache import CoalescingTTLCache
 from sendlive.constants import BaseCredential, ProviderOptions
+from sendlive.gc import (
+    DEFAULT_GC_MAX_CONCURRENCY,
+    GarbageCollectionResult,
+    GCResourceType,
+    collect_garbage,
+    delete_streams,
+)
+from sendlive.profiles import LatencyMode
 from sendlive.stream import BaseStream
 
 
@@ -15,6 +35,10 @@ class BaseAdapter(BaseModel, ABC):
     credentials: BaseCredential
     provider_options: Optional[ProviderOptions] = None
 
+    _list_streams_cache: Optional[CoalescingTTLCache[list[str]]] = PrivateAttr(
+        default=None
+    )
+
     # @abstractmethod
     # def setup_provider(self) -> None:
     #     """Run any required steps to setup the cloud provider, such as creating a client and setting it on the adapter instance."""
@@ -27,12 +51,159 @@ class BaseAdapter(BaseModel, ABC):
         """
 
     @abstractmethod
+    def fetch_stream_names(self) -> list[str]:
+        """Fetch the names of all sendlive streams from the cloud provider, bypassing the list_streams cache."""
+
+    @property
+    def list_streams_cache(self) -> CoalescingTTLCache[list[str]]:
+        """Get the cache of list_streams results."""
+        if self._list_streams_cache is None:
+            self._list_streams_cache = CoalescingTTLCache(
+                ttl=(
+                    self.provider_options.list_streams_cache_ttl
+                    if self.provider_options
+                    else ProviderOptions().list_streams_cache_ttl
+                )
+            )
+        return self._list_streams_cache
+
     def list_streams(self) -> list[str]:
-        """Fetch a list of all streams from the cloud provider."""
+        """Fetch a list of all streams from the cloud provider.
+
+        Results are cached for `list_streams_cache_ttl` seconds, and concurrent callers share a single provider call.
+        """
+        return list(self.list_streams_cache.get("streams", self.fetch_stream_names))
 
     @abstractmethod
-    def create_stream(self, name: str) -> BaseStream:
-        """Create a new stream on the cloud provider."""
+    def create_stream(
+        self, name: str, *, latency_mode: LatencyMode = "standard"
+    ) -> BaseStream:
+        """Create a new stream on the cloud provider.
+
+        Streams created with latency_mode="low" are encoded and packaged for low latency, see `sendlive.profiles`.
+        """
+
+    def get_stream(self, name: str) -> Optional[BaseStream]:
+        """Return a stream created earlier from the local state, or None if no stream of that name is recorded."""
+        return None
+
+    def setup_shared_resources(self) -> None:
+        """Create or look up resources that are shared by every stream this adapter creates.
+
+        Called once before a bulk creation, so that each stream in the batch reuses the same resources (such as an
+        input security group or storage bucket) rather than each creating their own.
+        """
+
+    def create_streams(
+        self,
+        names: Iterable[str],
+        max_concurrency: int = DEFAULT_BULK_MAX_CONCURRENCY,
+        on_result: Optional[Callable[[StreamCreationResult], None]] = None,
+        latency_mode: LatencyMode = "standard",
+    ) -> BulkStreamCreationResult:
+        """Create many streams, with up to max_concurrency provider calls in flight at once.
+
+        Failures are reported per stream in the returned result rather than aborting the whole batch. If set,
+        on_result is called with each stream's result as soon as it is ready.
+        """
+        self.setup_shared_resources()
+        return create_streams(
+            lambda name: self.create_stream(name, latency_mode=latency_mode),
+            names,
+            max_concurrency,
+            on_result,
+        )
+
+    async def create_streams_async(
+        self,
+        names: Iterable[str],
+        max_concurrency: int = DEFAULT_BULK_MAX_CONCURRENCY,
+        on_result: Optional[Callable[[StreamCreationResult], None]] = None,
+        latency_mode: LatencyMode = "standard",
+    ) -> BulkStreamCreationResult:
+        """Create many streams without blocking the event loop, with up to max_concurrency in flight at once."""
+        await asyncio.to_thread(self.setup_shared_resources)
+        return await create_streams_async(
+            lambda name: self.create_stream_async(name, latency_mode=latency_mode),
+            names,
+            max_concurrency,
+            on_result,
+        )
+
+    async def list_streams_async(self) -> list[str]:
+        """Fetch a list of all streams from the cloud provider without blocking the event loop.
+
+        Defaults to running `list_streams` in a worker thread - adapters with native asyncio support should override this.
+        """
+        return await asyncio.to_thread(self.list_streams)
+
+    async def create_stream_async(
+        self, name: str, *, latency_mode: LatencyMode = "standard"
+    ) -> BaseStream:
+        """Create a new stream on the cloud provider without blocking the event loop.
+
+        Defaults to running `create_stream` in a worker thread - adapters with native asyncio support should override this.
+        """
+        return await asyncio.to_thread(
+            self.create_stream, name, latency_mode=latency_mode
+        )
+
+    def gc_resource_types(self) -> list[GCResourceType]:
+        """Return the types of sendlive resource the garbage collector lists and deletes through this adapter."""
+        return []
+
+    def gc_desired_stream_names(self) -> set[str]:
+        """Return the names of the streams this adapter created in full, which the garbage collector keeps."""
+        return set()
+
+    def gc_recorded_resource_ids(self) -> set[str]:
+        """Return the ids of the resources this adapter recorded creating, which the garbage collector may delete."""
+        return set()
+
+    def collect_garbage(
+        self,
+        keep: Iterable[str] = (),
+        dry_run: bool = False,
+        max_concurrency: int = DEFAULT_GC_MAX_CONCURRENCY,
+        include_unknown: bool = False,
+    ) -> GarbageCollectionResult:
+        """Delete the resources of streams that are neither live, desired nor named in keep, see `sendlive.gc`.
+
+        Unless include_unknown is True, only resources this adapter recorded creating, and the rest of their streams,
+        are deleted.
+        """
+        return collect_garbage(
+            [self], keep, dry_run, max_concurrency, include_unknown=include_unknown
+        )
+
+    def delete_streams(
+        self,
+        names: Iterable[str],
+        dry_run: bool = False,
+        max_concurrency: int = DEFAULT_GC_MAX_CONCURRENCY,
+    ) -> GarbageCollectionResult:
+        """Delete every resource of the named streams, which must be stopped first, see `sendlive.gc`."""
+        return delete_streams([self], names, dry_run, max_concurrency)
+
+    def close(self) -> None:
+        """Release any clients or connections held by the adapter."""
+
+    async def aclose(self) -> None:
+        """Release any clients or connections held by the adapter, including asyncio clients."""
+        self.close()
+
+    def __enter__(self) -> Self:
+        """Use the adapter as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the adapter."""
+        self.close()
 
     def __init__(self, credentials: BaseCredential, *args: Any, **kwargs: Any) -> None:
         """Init the adapter and perform any required cloud provider setup steps."""
@@ -0,0 +1,164 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from sendlive.logger import logger
+from sendlive.stream import BaseStream
+
+DEFAULT_BULK_MAX_CONCURRENCY = 25
+
+
+class StreamCreationResult(BaseModel):
+    """The outcome of creating a single stream as part of a bulk creation."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    name: str
+    """The name of the stream."""
+    stream: Optional[BaseStream] = None
+    """The created stream, if creation succeeded."""
+    exception: Optional[BaseException] = Field(default=None, exclude=True)
+    """The exception raised while creating the stream, if creation failed."""
+    duration: float
+    """Time taken to create the stream, in seconds."""
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the stream was created successfully."""
+        return self.exception is None
+
+    @property
+    def error(self) -> Optional[str]:
+        """A description of the error raised while creating the stream, if creation failed."""
+        if self.exception is None:
+            return None
+        return f"{type(self.exception).__name__}: {self.exception}"
+
+
+class BulkStreamCreationResult(BaseModel):
+    """The outcome of a bulk stream creation, with per-stream results and aggregate timing."""
+
+    results: list[StreamCreationResult]
+    """Per-stream results, in the same order as the requested names."""
+    duration: float
+    """Wall clock time taken to create all streams, in seconds."""
+
+    @property
+    def succeeded(self) -> list[StreamCreationResult]:
+        """Results for streams that were created successfully."""
+        return [result for result in self.results if result.succeeded]
+
+    @property
+    def failed(self) -> list[StreamCreationResult]:
+        """Results for streams that failed to be created."""
+        return [result for result in self.results if not result.succeeded]
+
+    @property
+    def streams(self) -> list[BaseStream]:
+        """The streams that were created successfully."""
+        return [result.stream for result in self.results if result.stream is not None]
+
+    @property
+    def streams_per_second(self) -> float:
+        """Throughput of the bulk creation, in streams created per second."""
+        if self.duration == 0:
+            return 0.0
+        return len(self.succeeded) / self.duration
+
+    @property
+    def mean_stream_duration(self) -> float:
+        """Mean time taken to create a single stream, in seconds."""
+        if not self.results:
+            return 0.0
+        return sum(result.duration for result in self.results) / len(self.results)
+
+    @property
+    def max_stream_duration(self) -> float:
+        """Longest time taken to create a single stream, in seconds."""
+        return max((result.duration for result in self.results), default=0.0)
+
+
+def _creation_result(
+    name: str,
+    started: float,
+    stream: Optional[BaseStream] = None,
+    exception: Optional[BaseException] = None,
+) -> StreamCreationResult:
+    """Build a stream creation result, logging the failure if creation failed."""
+    if exception is not None:
+        logger.warning("Failed to create stream %s: %r", name, exception)
+    return StreamCreationResult(
+        name=name,
+        stream=stream,
+        exception=exception,
+        duration=time.perf_counter() - started,
+    )
+
+
+def create_streams(
+    create_stream: Callable[[str], BaseStream],
+    names: Iterable[str],
+    max_concurrency: int = DEFAULT_BULK_MAX_CONCURRENCY,
+    on_result: Optional[Callable[[StreamCreationResult], None]] = None,
+) -> BulkStreamCreationResult:
+    """Create streams by fanning calls to create_stream out over a pool of worker threads.
+
+    A failure to create one stream is recorded in its result rather than aborting the rest of the batch. If set,
+    on_result is called with each result as soon as it is ready, from the worker thread that created the stream.
+    """
+
+    def create_one(name: str) -> StreamCreationResult:
+        started = time.perf_counter()
+        try:
+            result = _creation_result(name, started, stream=create_stream(name))
+        except Exception as e:
+            result = _creation_result(name, started, exception=e)
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="sendlive-bulk"
+    ) as executor:
+        results = list(executor.map(create_one, names))
+    return BulkStreamCreationResult(
+        results=results, duration=time.perf_counter() - started
+    )
+
+
+async def create_streams_async(
+    create_stream: Callable[[str], Awaitable[BaseStream]],
+    names: Iterable[str],
+    max_concurrency: int = DEFAULT_BULK_MAX_CONCURRENCY,
+    on_result: Optional[Callable[[StreamCreationResult], None]] = None,
+) -> BulkStreamCreationResult:
+    """Create streams concurrently on the running event loop, with at most max_concurrency in flight at once.
+
+    A failure to create one stream is recorded in its result rather than aborting the rest of the batch. If set,
+    on_result is called with each result as soon as it is ready.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def create_one(name: str) -> StreamCreationResult:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                result = _creation_result(
+                    name, started, stream=await create_stream(name)
+                )
+            except Exception as e:
+                result = _creation_result(name, started, exception=e)
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(create_one(name) for name in names))
+    return BulkStreamCreationResult(
+        results=list(results), duration=time.perf_counter() - started
+    )
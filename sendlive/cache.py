@@ -0,0 +1,55 @@
+import time
+from collections.abc import Hashable
+from concurrent.futures import Future
+from threading import Lock
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class CoalescingTTLCache(Generic[T]):
+    """Caches loaded values for a fixed time, and coalesces concurrent loads of the same key.
+
+    While a value is being loaded, other callers asking for the same key wait on that load rather than each making
+    their own provider call. A ttl of zero disables caching, but concurrent calls are still coalesced.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """Cache values for ttl seconds."""
+        self.ttl = ttl
+        self._values: dict[Hashable, tuple[float, T]] = {}
+        self._in_flight: dict[Hashable, Future[T]] = {}
+        self._lock = Lock()
+
+    def get(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """Return the cached value for key, calling loader to load it if it is missing or expired."""
+        with self._lock:
+            cached = self._values.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self.ttl:
+                return cached[1]
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                future: Future[T] = Future()
+                self._in_flight[key] = future
+        if in_flight is not None:
+            return in_flight.result()
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            self._values[key] = (time.monotonic(), value)
+            del self._in_flight[key]
+        future.set_result(value)
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop the cached value for key, or all cached values if key is unset."""
+        with self._lock:
+            if key is None:
+                self._values.clear()
+            else:
+                self._values.pop(key, None)
@@ -1,14 +1,17 @@
 from enum import Enum
-from typing import Optional
+from typing import Any, Literal, Optional
 
 from pydantic import BaseModel, Field, SecretStr
 
+from sendlive.profiles import EncodingProfile
+
 
 class ServiceProvider(Enum):
     """Enum for the different cloud providers."""
 
     AWS = "aws_medialive"
     GCP = "gcp"
+    LOCAL = "local"
 
 
 class BaseCredential(BaseModel):
@@ -35,14 +38,79 @@ class GCPCredentials(BaseCredential):
     region: str
 
 
+class LocalCredentials(BaseCredential):
+    """Credentials for the simulated local provider, which needs none - adapters with the same account share resources."""
+
+    account_id: str = "local"
+    region: str = "local"
+    service_provider: ServiceProvider = ServiceProvider.LOCAL
+
+
+class RetryPolicy(BaseModel):
+    """How provider api calls are retried and rate limited, see sendlive.retry."""
+
+    # total attempts made for a call, including the first
+    max_attempts: int = 5
+    # backoff before the nth retry is drawn uniformly from 0 up to initial_backoff * multiplier ** (n - 1) seconds,
+    # capped at max_backoff
+    initial_backoff: float = 0.5
+    max_backoff: float = 20.0
+    multiplier: float = 2.0
+    # each successful call earns budget_ratio retries, up to budget_capacity, and each retry spends one, so that
+    # retries are cut off rather than amplifying load while a provider is failing
+    budget_ratio: float = 0.2
+    budget_capacity: float = 20.0
+    # client side rate limit of calls per second to each provider region, shared by all instances, unset disables it
+    requests_per_second: Optional[float] = None
+    # number of calls that may be made in a burst before requests_per_second applies
+    burst: int = 10
+
+
 class ProviderOptions(BaseModel):
     """Base abstract class for cloud service provider options."""
 
+    # seconds that list_streams results are cached for, 0 disables caching
+    list_streams_cache_ttl: float = 5.0
+
+    retry_policy: RetryPolicy = RetryPolicy()
+
+    # where created resources are recorded, see sendlive.state: "sqlite" persists them to state_path, and "memory"
+    # keeps them for the lifetime of the process
+    state_backend: Literal["sqlite", "memory"] = "sqlite"
+    # defaults to $SENDLIVE_STATE_PATH, or ~/.cache/sendlive/state.sqlite3
+    state_path: Optional[str] = None
+
+
+# maximum number of pooled urllib3 connections kept per boto3 client, unless configured otherwise
+DEFAULT_MAX_POOL_CONNECTIONS = 10
+
 
 class AWSOptions(ProviderOptions):
     """AWS configuration."""
 
-    medialive_input_security_group_id: Optional[int]
+    medialive_input_security_group_id: Optional[int] = None
+
+    # maximum number of pooled urllib3 connections kept per boto3 client
+    max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS
+
+    # id of the aws account of the credentials, which resources are recorded under in the local state, looked up
+    # with sts when unset
+    account_id: Optional[str] = None
+
+    # iam role that medialive channels assume to push their output to mediapackage
+    medialive_role_arn: Optional[str] = None
+
+    # seconds between polls while waiting for a medialive channel to be created, started or stopped
+    medialive_waiter_delay: int = 5
+
+    # mediapackagev2 channel group that streams are packaged in, created if it does not exist
+    mediapackage_channel_group_name: str = "sendlive"
+
+    # what streams are encoded to, defaults to a 1080p to 240p ladder, see sendlive.profiles
+    encoding_profile: Optional[EncodingProfile] = None
+    # medialive encoder settings deep merged into those compiled from the encoding profile, in the lower camel case
+    # of the medialive api documentation, such as {"timecodeConfig": {"source": "EMBEDDED"}}
+    medialive_encoder_settings_overrides: Optional[dict[str, Any]] = None
 
 
 class GCPOptions(ProviderOptions):
@@ -50,9 +118,55 @@ class GCPOptions(ProviderOptions):
 
     get_or_create_bucket: bool = True
 
-    # if unset, first check using labels on gcp, then generate a name with faker
+    # if unset, first check using labels on gcp, then generate a random dns compliant name
     bucket_name: Optional[str] = None
 
+    # if set, bucket names found by label are also cached in this json file, so they are remembered across restarts
+    bucket_cache_path: Optional[str] = None
+
+    # what streams are encoded to, defaults to a single 720p rendition, see sendlive.profiles
+    encoding_profile: Optional[EncodingProfile] = None
+
+
+class LatencyDistribution(BaseModel):
+    """A distribution of simulated latencies, in seconds."""
+
+    distribution: Literal["constant", "uniform", "lognormal"] = "constant"
+    # the latency of constant distributions, and the mean of the others
+    mean: float = 0.0
+    # uniform latencies are drawn from mean +/- spread, and lognormal latencies use spread as the standard deviation
+    # of the underlying normal distribution, giving a long tail
+    spread: float = 0.0
+    # latencies are capped at max, if set
+    max: Optional[float] = None
+
+
+class LocalOptions(ProviderOptions):
+    """Configuration of the simulated local provider, see sendlive.providers.local.
+
+    The simulated provider is shared by every adapter with the same account id, and is configured by the options of the
+    first adapter created for it.
+    """
+
+    # seeds the simulated latencies and errors, so that runs are reproducible
+    seed: Optional[int] = None
+
+    # latency of each api call
+    latency: LatencyDistribution = LatencyDistribution()
+    # time long running operations, such as creating or starting a channel, take to complete
+    operation_duration: LatencyDistribution = LatencyDistribution()
+
+    # probability of an api call being throttled, or failing with a transient error
+    throttle_rate: float = 0.0
+    error_rate: float = 0.0
+
+    # maximum number of inputs and channels that may exist at once, unset for no limit
+    max_inputs: Optional[int] = None
+    max_channels: Optional[int] = None
+
+    # local resources only last as long as the process, so are not recorded on disk by default
+    state_backend: Literal["sqlite", "memory"] = "memory"
+
 
 CREATED_BY_KEY = "Created By"
 CREATED_BY_VALUE = "sendlive"
@@ -0,0 +1,184 @@
+"""The SendLive interfaces for creating live streams through the configured cloud provider."""
+from collections.abc import Iterable
+from types import TracebackType
+from typing import Any, Optional
+
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+from typing_extensions import Self
+
+from sendlive.adapter import BaseAdapter
+from sendlive.bulk import DEFAULT_BULK_MAX_CONCURRENCY, BulkStreamCreationResult
+from sendlive.constants import (
+    BaseCredential,
+    ProviderOptions,
+    ServiceProvider,
+)
+from sendlive.profiles import LatencyMode
+from sendlive.stream import BaseStream
+from sendlive.utils import get_adapter_for_provider
+
+# Fields that the adapter is built from - assigning to any of these invalidates the cached adapter.
+ADAPTER_CONFIG_FIELDS: frozenset[str] = frozenset({"credentials", "provider_options"})
+
+
+class BaseSendLive(BaseModel):
+    """Shared configuration and adapter handling for the sync and asyncio SendLive interfaces."""
+
+    credentials: BaseCredential
+    provider_options: Optional[ProviderOptions] = None
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    _adapter: Optional[BaseAdapter] = PrivateAttr(default=None)
+    # adapters replaced since they were built, kept open until close for the streams they returned
+    _replaced_adapters: list[BaseAdapter] = PrivateAttr(default_factory=list)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, invalidating the cached adapter if its configuration changed."""
+        super().__setattr__(name, value)
+        if name in ADAPTER_CONFIG_FIELDS:
+            self.invalidate_adapter()
+
+    @property
+    def service_provider(self) -> ServiceProvider:
+        """Return the service provider, based on the provided credentials."""
+        return self.credentials.service_provider
+
+    @property
+    def adapter(self) -> BaseAdapter:
+        """Return the adapter for the configured service provider.
+
+        The adapter is built on first access and reused for the lifetime of this instance, or until
+        `credentials` or `provider_options` are reassigned, see `invalidate_adapter`.
+        """
+        if self._adapter is None:
+            adapter_cls = get_adapter_for_provider(provider=self.service_provider)
+            self._adapter = adapter_cls(
+                credentials=self.credentials, provider_options=self.provider_options
+            )
+        return self._adapter
+
+    def invalidate_adapter(self) -> None:
+        """Discard the cached adapter so that it is rebuilt on next access.
+
+        Call this after mutating `credentials` or `provider_options` in place. Streams returned earlier use the
+        discarded adapter's clients, so it is kept open until this instance is closed, rather than breaking them.
+        """
+        if self._adapter is not None:
+            self._replaced_adapters.append(self._adapter)
+            self._adapter = None
+
+    def _take_adapters(self) -> list[BaseAdapter]:
+        """Discard the cached adapter and every adapter it replaced, returning them to be closed."""
+        adapters = self._replaced_adapters
+        if self._adapter is not None:
+            adapters.append(self._adapter)
+        self._adapter = None
+        self._replaced_adapters = []
+        return adapters
+
+
+class SendLive(BaseSendLive):
+    """SendLive is a library for creating live streams with different cloud vendors, using one interface."""
+
+    def close(self) -> None:
+        """Close the cached adapter, and any it replaced, after which streams they returned can no longer be used."""
+        for adapter in self._take_adapters():
+            adapter.close()
+
+    def __enter__(self) -> Self:
+        """Use the SendLive instance as a context manager, closing the adapter on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the adapter."""
+        self.close()
+
+    def list_streams(self) -> list[str]:
+        """List streams using the configured service provider."""
+        return self.adapter.list_streams()
+
+    def create_stream(
+        self,
+        name: str,
+        latency_mode: LatencyMode = "standard",
+    ) -> BaseStream:
+        """Create a stream using the configured service provider.
+
+        Pass latency_mode="low" to encode and package the stream for a glass to glass latency of a few seconds.
+        """
+        return self.adapter.create_stream(name=name, latency_mode=latency_mode)
+
+    def create_streams(
+        self,
+        names: Iterable[str],
+        max_concurrency: int = DEFAULT_BULK_MAX_CONCURRENCY,
+        latency_mode: LatencyMode = "standard",
+    ) -> BulkStreamCreationResult:
+        """Create many streams concurrently using the configured service provider.
+
+        Resources shared between streams are set up once for the whole batch, and failures are reported per stream
+        rather than aborting the batch.
+        """
+        return self.adapter.create_streams(
+            names, max_concurrency=max_concurrency, latency_mode=latency_mode
+        )
+
+
+class AsyncSendLive(BaseSendLive):
+    """Asyncio counterpart to SendLive, for use within an event loop.
+
+    Provider calls are awaited natively where the provider SDK supports asyncio, and are otherwise run in a worker
+    thread so that the event loop is never blocked.
+    """
+
+    async def aclose(self) -> None:
+        """Close the cached adapter, and any it replaced, after which streams they returned can no longer be used."""
+        for adapter in self._take_adapters():
+            await adapter.aclose()
+
+    async def __aenter__(self) -> Self:
+        """Use the AsyncSendLive instance as an async context manager, closing the adapter on exit."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the adapter."""
+        await self.aclose()
+
+    async def list_streams(self) -> list[str]:
+        """List streams using the configured service provider."""
+        return await self.adapter.list_streams_async()
+
+    async def create_stream(
+        self,
+        name: str,
+        latency_mode: LatencyMode = "standard",
+    ) -> BaseStream:
+        """Create a stream using the configured service provider, see `SendLive.create_stream`."""
+        return await self.adapter.create_stream_async(
+            name=name, latency_mode=latency_mode
+        )
+
+    async def create_streams(
+        self,
+        names: Iterable[str],
+        max_concurrency: int = DEFAULT_BULK_MAX_CONCURRENCY,
+        latency_mode: LatencyMode = "standard",
+    ) -> BulkStreamCreationResult:
+        """Create many streams concurrently using the configured service provider.
+
+        Resources shared between streams are set up once for the whole batch, and failures are reported per stream
+        rather than aborting the batch.
+        """
+        return await self.adapter.create_streams_async(
+            names, max_concurrency=max_concurrency, latency_mode=latency_mode
+        )
@@ -0,0 +1,119 @@
+"""Loading provider credentials and options from the environment or json files, such as for the command-line interface.
+
+AWS credentials are read from the standard AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY and AWS_REGION (or
+AWS_DEFAULT_REGION) environment variables. GCP credentials are read from the service account key file named by
+GOOGLE_APPLICATION_CREDENTIALS, with the region taken from SENDLIVE_GCP_REGION, and the project from
+SENDLIVE_GCP_PROJECT_ID or else the service account's own project. The simulated local provider needs no credentials.
+
+A credentials file is a json object of the fields of the provider's credentials, such as `AWSCredentials`, which take
+precedence over the environment. An options file is a json object of the fields of its options, such as `AWSOptions`.
+"""
+import json
+import os
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from pydantic import ValidationError
+
+from sendlive.constants import (
+    AWSCredentials,
+    AWSOptions,
+    BaseCredential,
+    GCPCredentials,
+    GCPOptions,
+    LocalCredentials,
+    LocalOptions,
+    ProviderOptions,
+    ServiceProvider,
+)
+from sendlive.exceptions import SendLiveError
+
+GCP_PROJECT_ID_ENV_VAR = "SENDLIVE_GCP_PROJECT_ID"
+GCP_REGION_ENV_VAR = "SENDLIVE_GCP_REGION"
+
+CREDENTIALS_CLASSES: dict[ServiceProvider, type[BaseCredential]] = {
+    ServiceProvider.AWS: AWSCredentials,
+    ServiceProvider.GCP: GCPCredentials,
+    ServiceProvider.LOCAL: LocalCredentials,
+}
+OPTIONS_CLASSES: dict[ServiceProvider, type[ProviderOptions]] = {
+    ServiceProvider.AWS: AWSOptions,
+    ServiceProvider.GCP: GCPOptions,
+    ServiceProvider.LOCAL: LocalOptions,
+}
+
+
+def read_json_object(path: Union[str, Path]) -> dict[str, Any]:
+    """Read a json file that must contain an object."""
+    try:
+        with Path(path).expanduser().open() as f:
+            contents = json.load(f)
+    except (OSError, ValueError) as e:
+        raise SendLiveError(f"Could not read {path}: {e}") from e
+    if not isinstance(contents, dict):
+        raise SendLiveError(f"{path} must contain a json object.")
+    return contents
+
+
+def _credentials_from_environment(
+    provider: ServiceProvider, environ: Mapping[str, str]
+) -> dict[str, Any]:
+    """Return the credential fields set in the environment, leaving out those that are not."""
+    values: dict[str, Any]
+    if provider == ServiceProvider.AWS:
+        values = {
+            "access_key": environ.get("AWS_ACCESS_KEY_ID"),
+            "secret_key": environ.get("AWS_SECRET_ACCESS_KEY"),
+            "region": environ.get("AWS_REGION", environ.get("AWS_DEFAULT_REGION")),
+        }
+    elif provider == ServiceProvider.GCP:
+        service_account_path = environ.get("GOOGLE_APPLICATION_CREDENTIALS")
+        service_account_json = (
+            read_json_object(service_account_path) if service_account_path else {}
+        )
+        values = {
+            "service_account_json": service_account_json or None,
+            "project_id": environ.get(
+                GCP_PROJECT_ID_ENV_VAR, service_account_json.get("project_id")
+            ),
+            "region": environ.get(GCP_REGION_ENV_VAR),
+        }
+    else:
+        values = {}
+    return {field: value for field, value in values.items() if value is not None}
+
+
+def load_credentials(
+    provider: ServiceProvider,
+    path: Optional[Union[str, Path]] = None,
+    environ: Optional[Mapping[str, str]] = None,
+) -> BaseCredential:
+    """Load the credentials of a provider from the environment, overridden by the credentials file at path if set.
+
+    Raises SendLiveError naming any fields that are missing or invalid.
+    """
+    values = _credentials_from_environment(
+        provider, os.environ if environ is None else environ
+    )
+    if path is not None:
+        values.update(read_json_object(path))
+    try:
+        return CREDENTIALS_CLASSES[provider](**values)
+    except ValidationError as e:
+        fields = ", ".join(sorted({str(error["loc"][0]) for error in e.errors()}))
+        raise SendLiveError(
+            f"Missing or invalid {provider.value} credentials: {fields}."
+        ) from e
+
+
+def load_provider_options(
+    provider: ServiceProvider, path: Optional[Union[str, Path]] = None
+) -> Optional[ProviderOptions]:
+    """Load the options of a provider from the options file at path, or return None to use the defaults."""
+    if path is None:
+        return None
+    try:
+        return OPTIONS_CLASSES[provider](**read_json_object(path))
+    except ValidationError as e:
+        raise SendLiveError(f"Invalid {provider.value} options in {path}: {e}") from e
@@ -11,3 +11,15 @@ class SendLiveProviderError(SendLiveError):
 
 class SendLiveProviderPermissionError(SendLiveProviderError):
     """Exception raised when a permission error is returned by a cloud provider."""
+
+
+class SendLiveProviderThrottlingError(SendLiveProviderError):
+    """Exception raised when a cloud provider keeps rejecting requests as too many, after retrying."""
+
+
+class SendLiveProviderUnavailableError(SendLiveProviderError):
+    """Exception raised when a cloud provider keeps failing with transient server or connection errors, after retrying."""
+
+
+class SendLiveTimeoutError(SendLiveError):
+    """Exception raised when an operation does not complete within the allowed time."""
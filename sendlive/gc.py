@@ -0,0 +1,406 @@
+"""Garbage collection of sendlive resources left behind by failed or abandoned streams.
+
+Every resource sendlive creates is tagged as created by sendlive. The garbage collector lists those resources from
+each adapter, every resource type at once, and finds the orphans: resources of streams that are neither live (such as
+having a running channel), nor desired, nor to be kept, and shared resources (such as input security groups) used only
+by orphans.
+
+Tags alone don't show a resource was abandoned, as it may belong to a stream created on another host, or before the
+local state was created or after it was lost. So a resource is only orphaned given positive evidence: the local state of
+the adapter listing it records it, or another resource of its stream. A stream is desired if the local state records it
+as created in full, so idle streams created with start=False are kept, and only streams that failed part way through
+being created are orphans. Passing include_unknown=True to `collect_garbage` also orphans resources unknown to the
+local state, as when the state was lost.
+Orphans are then deleted in dependency order - a channel before the input attached to it - with a bounded number of
+deletions in flight at once.
+
+Garbage collection should not be run while streams are being created, as the resources of a stream that is part way
+through being created look just like those of one that failed part way through.
+
+`delete_streams` deletes every resource of the named streams in the same way.
+"""
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from sendlive.exceptions import SendLiveError
+from sendlive.logger import logger
+
+if TYPE_CHECKING:
+    from sendlive.adapter import BaseAdapter
+
+DEFAULT_GC_MAX_CONCURRENCY = 10
+
+
+class SendLiveResource(BaseModel):
+    """A provider resource tagged as created by sendlive."""
+
+    provider: str
+    resource_type: str
+    """The type of resource, named after the api that manages it, such as "medialive.input"."""
+    resource_id: str
+    """The ARN or resource path of the resource."""
+    provider_id: Optional[str] = None
+    """The id the provider's api refers to the resource by, where that is not its resource id."""
+    name: str
+    stream_name: Optional[str] = None
+    """The name of the stream the resource belongs to, or None for resources shared between streams."""
+    live: bool = False
+    """Whether the resource is in use, such as a channel that is running, and so must never be deleted."""
+    references: list[str] = []
+    """The resource or provider ids of the resources using a shared resource."""
+    attributes: dict[str, Any] = {}
+    """Anything else needed to delete the resource, such as the name of its parent."""
+
+    @property
+    def ids(self) -> set[str]:
+        """Every id the resource can be referred to by."""
+        return {self.resource_id} | ({self.provider_id} if self.provider_id else set())
+
+
+class GCResourceType(NamedTuple):
+    """A type of sendlive resource that an adapter can list and delete for the garbage collector."""
+
+    resource_type: str
+    list_resources: Callable[[], list[SendLiveResource]]
+    """Lists every resource of this type tagged as created by sendlive, that is not already being deleted."""
+    delete_resource: Callable[[SendLiveResource], None]
+    """Deletes a resource, returning once it is deleted, so that resources it was attached to can be deleted."""
+    delete_after: tuple[str, ...] = ()
+    """The resource types whose orphans are deleted before orphans of this type, such as channels before inputs."""
+
+
+class ResourceDeletionResult(BaseModel):
+    """The outcome of deleting a single orphaned resource."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    resource: SendLiveResource
+    exception: Optional[BaseException] = Field(default=None, exclude=True)
+    """The exception raised while deleting the resource, if deletion failed or was skipped."""
+    duration: float
+    """Time taken to delete the resource, in seconds."""
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the resource was deleted."""
+        return self.exception is None
+
+    @property
+    def error(self) -> Optional[str]:
+        """A description of the error raised while deleting the resource, if deletion failed."""
+        if self.exception is None:
+            return None
+        return f"{type(self.exception).__name__}: {self.exception}"
+
+
+class GarbageCollectionResult(BaseModel):
+    """The outcome of a garbage collection, with the resources listed, the orphans found and throughput."""
+
+    dry_run: bool
+    resources: list[SendLiveResource]
+    """Every sendlive resource listed."""
+    orphans: list[SendLiveResource]
+    """The listed resources found to be orphaned, in the order they are deleted."""
+    deletions: list[ResourceDeletionResult] = []
+    """Per-orphan results, empty on a dry run."""
+    list_duration: float
+    """Wall clock time taken to list all resources, in seconds."""
+    delete_duration: float = 0.0
+    """Wall clock time taken to delete all orphans, in seconds."""
+
+    @property
+    def deleted(self) -> list[SendLiveResource]:
+        """The orphans that were deleted."""
+        return [result.resource for result in self.deletions if result.succeeded]
+
+    @property
+    def failed(self) -> list[ResourceDeletionResult]:
+        """Results for orphans that failed to be deleted, or were skipped as a resource attached to them was."""
+        return [result for result in self.deletions if not result.succeeded]
+
+    @property
+    def resources_listed_per_second(self) -> float:
+        """Throughput of listing, in resources listed per second."""
+        if self.list_duration == 0:
+            return 0.0
+        return len(self.resources) / self.list_duration
+
+    @property
+    def deletions_per_second(self) -> float:
+        """Throughput of deletion, in orphans deleted per second."""
+        if self.delete_duration == 0:
+            return 0.0
+        return len(self.deleted) / self.delete_duration
+
+    def report(self) -> str:
+        """Summarise the garbage collection and its throughput, one line per statistic."""
+        lines = [
+            f"listed {len(self.resources)} resources in {self.list_duration:.2f}s "
+            f"({self.resources_listed_per_second:.1f}/s)",
+            f"found {len(self.orphans)} orphaned resources",
+        ]
+        if self.dry_run:
+            lines.append("dry run, so no resources were deleted")
+        else:
+            lines.append(
+                f"deleted {len(self.deleted)} resources in {self.delete_duration:.2f}s "
+                f"({self.deletions_per_second:.1f}/s), {len(self.failed)} failed"
+            )
+        return "\n".join(lines)
+
+
+def find_orphans(
+    resources: Iterable[SendLiveResource],
+    keep: Iterable[str] = (),
+    recorded_ids: Optional[Iterable[str]] = None,
+) -> list[SendLiveResource]:
+    """Return the resources that belong to neither a live stream nor a stream to keep.
+
+    A shared resource is orphaned once every resource using it is. Given recorded_ids, only the streams with a resource
+    in recorded_ids, and shared resources in recorded_ids, can be orphaned.
+    """
+    resources = list(resources)
+    kept_streams = set(keep) | {
+        resource.stream_name
+        for resource in resources
+        if resource.live and resource.stream_name is not None
+    }
+    recorded = None if recorded_ids is None else set(recorded_ids)
+    if recorded is not None:
+        # streams without a recorded resource may be in use elsewhere, so are kept
+        recorded_streams = {
+            resource.stream_name for resource in resources if resource.ids & recorded
+        }
+        kept_streams |= {
+            resource.stream_name
+            for resource in resources
+            if resource.stream_name is not None
+            and resource.stream_name not in recorded_streams
+        }
+    orphans = [
+        resource
+        for resource in resources
+        if resource.stream_name is not None and resource.stream_name not in kept_streams
+    ]
+    orphan_ids = {id_ for orphan in orphans for id_ in orphan.ids}
+    orphans.extend(
+        resource
+        for resource in resources
+        if resource.stream_name is None
+        and not resource.live
+        and (recorded is None or resource.ids & recorded)
+        and all(reference in orphan_ids for reference in resource.references)
+    )
+    return orphans
+
+
+def _deletion_stages(
+    resource_types: list[GCResourceType],
+) -> list[list[str]]:
+    """Group an adapter's resource types into stages, where each stage is deleted after those before it."""
+    by_name = {
+        resource_type.resource_type: resource_type for resource_type in resource_types
+    }
+    stage_of: dict[str, int] = {}
+
+    def stage(name: str, visiting: tuple[str, ...] = ()) -> int:
+        if name in visiting:
+            raise SendLiveError(
+                f"Resource types {visiting} are deleted after each other."
+            )
+        if name not in stage_of:
+            stage_of[name] = 1 + max(
+                (
+                    stage(dependency, (*visiting, name))
+                    for dependency in by_name[name].delete_after
+                    if dependency in by_name
+                ),
+                default=-1,
+            )
+        return stage_of[name]
+
+    stages: list[list[str]] = []
+    for name in by_name:
+        index = stage(name)
+        stages.extend([] for _ in range(index + 1 - len(stages)))
+        stages[index].append(name)
+    return stages
+
+
+def collect_garbage(
+    adapters: Iterable["BaseAdapter"],
+    keep: Iterable[str] = (),
+    dry_run: bool = False,
+    max_concurrency: int = DEFAULT_GC_MAX_CONCURRENCY,
+    include_unknown: bool = False,
+) -> GarbageCollectionResult:
+    """List the sendlive resources of each adapter, and delete those orphaned, see the module docs.
+
+    Streams named in keep, or desired by an adapter (see `BaseAdapter.gc_desired_stream_names`), are never deleted, nor
+    is anything they use. Unless include_unknown is True, neither are resources unknown to the local state of every
+    adapter (see `BaseAdapter.gc_recorded_resource_ids`). If dry_run is True, orphans are found but not deleted. Up to
+    max_concurrency list or delete calls are made at once. If a resource fails to be deleted, resources of the same
+    stream, and shared resources it uses, are skipped rather than deleted.
+    """
+    adapters = list(adapters)
+    keep = set(keep).union(*(adapter.gc_desired_stream_names() for adapter in adapters))
+    recorded_ids = (
+        None
+        if include_unknown
+        else set().union(*(adapter.gc_recorded_resource_ids() for adapter in adapters))
+    )
+    return _delete_resources(
+        adapters,
+        lambda resources: find_orphans(resources, keep, recorded_ids),
+        dry_run,
+        max_concurrency,
+    )
+
+
+def delete_streams(
+    adapters: Iterable["BaseAdapter"],
+    names: Iterable[str],
+    dry_run: bool = False,
+    max_concurrency: int = DEFAULT_GC_MAX_CONCURRENCY,
+) -> GarbageCollectionResult:
+    """Delete every resource of the named streams, in the same way as `collect_garbage`.
+
+    The resources of the streams are reported as the result's orphans. A stream that is live, such as having a running
+    channel, is not deleted, and its resources are reported as failed. Shared resources are left to the garbage
+    collector.
+    """
+    names = set(names)
+    return _delete_resources(
+        adapters,
+        lambda resources: [
+            resource for resource in resources if resource.stream_name in names
+        ],
+        dry_run,
+        max_concurrency,
+    )
+
+
+def _delete_resources(
+    adapters: Iterable["BaseAdapter"],
+    select: Callable[[list[SendLiveResource]], list[SendLiveResource]],
+    dry_run: bool,
+    max_concurrency: int,
+) -> GarbageCollectionResult:
+    """List the sendlive resources of each adapter, and delete those selected in dependency order."""
+    adapter_resource_types = [
+        (adapter, adapter.gc_resource_types()) for adapter in adapters
+    ]
+    with ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="sendlive-gc"
+    ) as executor:
+        start = time.monotonic()
+        # listing every type of resource at once, and failing before anything is deleted if any listing fails, as
+        # a shared resource can only be judged orphaned given everything that might use it
+        listings = [
+            executor.submit(resource_type.list_resources)
+            for _, resource_types in adapter_resource_types
+            for resource_type in resource_types
+        ]
+        resources_by_type = [listing.result() for listing in listings]
+        list_duration = time.monotonic() - start
+        resources = [
+            resource for resources in resources_by_type for resource in resources
+        ]
+        orphans = select(resources)
+        orphan_ids = {id(orphan) for orphan in orphans}
+        logger.debug(
+            "Listed %d sendlive resources in %.2fs, %d to delete",
+            len(resources),
+            list_duration,
+            len(orphans),
+        )
+
+        # each stage of deletion is the orphans of every resource type, of every adapter, that are deleted next
+        stages: list[list[tuple[SendLiveResource, GCResourceType]]] = []
+        listed = iter(resources_by_type)
+        for _, resource_types in adapter_resource_types:
+            adapter_resources = {
+                resource_type.resource_type: next(listed)
+                for resource_type in resource_types
+            }
+            by_name = {
+                resource_type.resource_type: resource_type
+                for resource_type in resource_types
+            }
+            for index, names in enumerate(_deletion_stages(resource_types)):
+                stages.extend([] for _ in range(index + 1 - len(stages)))
+                stages[index].extend(
+                    (resource, by_name[name])
+                    for name in names
+                    for resource in adapter_resources[name]
+                    if id(resource) in orphan_ids
+                )
+        ordered_orphans = [resource for stage in stages for resource, _ in stage]
+        if dry_run:
+            return GarbageCollectionResult(
+                dry_run=True,
+                resources=resources,
+                orphans=ordered_orphans,
+                list_duration=list_duration,
+            )
+
+        failed_streams: set[tuple[str, Optional[str]]] = set()
+        failed_ids: set[str] = set()
+
+        def delete(
+            resource: SendLiveResource, resource_type: GCResourceType
+        ) -> ResourceDeletionResult:
+            started = time.monotonic()
+            exception: Optional[BaseException] = None
+            if resource.live:
+                exception = SendLiveError(
+                    f"{resource.resource_id} is live, so stream {resource.stream_name} must be stopped to be deleted."
+                )
+            elif (resource.provider, resource.stream_name) in failed_streams or any(
+                reference in failed_ids for reference in resource.references
+            ):
+                exception = SendLiveError(
+                    f"Skipped deleting {resource.resource_id}, as a resource attached to it failed to be deleted."
+                )
+            else:
+                try:
+                    resource_type.delete_resource(resource)
+                    logger.debug("Deleted orphaned resource %s", resource.resource_id)
+                except Exception as e:
+                    logger.debug(
+                        "Failed to delete orphaned resource %s",
+                        resource.resource_id,
+                        exc_info=True,
+                    )
+                    exception = e
+            return ResourceDeletionResult(
+                resource=resource,
+                exception=exception,
+                duration=time.monotonic() - started,
+            )
+
+        start = time.monotonic()
+        deletions: list[ResourceDeletionResult] = []
+        for stage in stages:
+            stage_results = list(executor.map(lambda item: delete(*item), stage))
+            for result in stage_results:
+                if not result.succeeded:
+                    if result.resource.stream_name is not None:
+                        failed_streams.add(
+                            (result.resource.provider, result.resource.stream_name)
+                        )
+                    failed_ids.update(result.resource.ids)
+            deletions.extend(stage_results)
+        delete_duration = time.monotonic() - start
+    return GarbageCollectionResult(
+        dry_run=False,
+        resources=resources,
+        orphans=ordered_orphans,
+        deletions=deletions,
+        list_duration=list_duration,
+        delete_duration=delete_duration,
+    )
@@ -0,0 +1,88 @@
+"""Running interdependent provider calls concurrently.
+
+Creating a stream means creating several provider resources, some of which need the result of others (a channel
+needs the id of its input), while others are independent and can be created at the same time. Each resource is
+created by a `Task`, which is started as soon as every task it depends on has completed.
+"""
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Any, NamedTuple, Optional
+
+from sendlive.exceptions import SendLiveError
+from sendlive.logger import logger
+
+
+class Task(NamedTuple):
+    """A step in a task graph."""
+
+    fn: Callable[[Mapping[str, Any]], Any]
+    """Called with the results of the tasks it depends on, keyed by task name."""
+    depends_on: tuple[str, ...] = ()
+    """Names of the tasks that must complete before this one is started."""
+
+
+def _check_task_graph(tasks: Mapping[str, Task]) -> None:
+    """Raise a SendLiveError if a task depends on an unknown task, or the dependencies form a cycle."""
+    for name, task in tasks.items():
+        unknown = [
+            dependency for dependency in task.depends_on if dependency not in tasks
+        ]
+        if unknown:
+            raise SendLiveError(f"Task {name} depends on unknown tasks {unknown}.")
+    resolved: set[str] = set()
+    remaining = dict(tasks)
+    while remaining:
+        ready = [
+            name
+            for name, task in remaining.items()
+            if resolved.issuperset(task.depends_on)
+        ]
+        if not ready:
+            raise SendLiveError(f"Tasks {sorted(remaining)} have cyclic dependencies.")
+        for name in ready:
+            resolved.add(name)
+            del remaining[name]
+
+
+def run_task_graph(tasks: Mapping[str, Task], executor: Executor) -> dict[str, Any]:
+    """Run tasks on executor, each as soon as the tasks it depends on complete, and return their results by name.
+
+    If a task fails, no further tasks are started, and its error is raised once the tasks already
+    running have finished.
+    """
+    _check_task_graph(tasks)
+    results: dict[str, Any] = {}
+    running: dict[Future[Any], str] = {}
+    pending = dict(tasks)
+    started = time.perf_counter()
+
+    def submit_ready() -> None:
+        for name, task in list(pending.items()):
+            if all(dependency in results for dependency in task.depends_on):
+                del pending[name]
+                dependencies = {
+                    dependency: results[dependency] for dependency in task.depends_on
+                }
+                running[executor.submit(task.fn, dependencies)] = name
+
+    submit_ready()
+    error: Optional[BaseException] = None
+    while running:
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            name = running.pop(future)
+            task_error = future.exception()
+            if task_error is not None:
+                logger.debug("Task %s failed: %r", name, task_error)
+                error = error or task_error
+                continue
+            results[name] = future.result()
+            logger.debug(
+                "Task %s completed after %.2fs", name, time.perf_counter() - started
+            )
+        if error is None:
+            submit_ready()
+    if error is not None:
+        raise error
+    return results
@@ -0,0 +1,310 @@
+"""Instrumentation of provider api calls.
+
+Every call sendlive makes to a provider is timed and reported as a `ProviderCallRecord` to the installed
+`Instrumentation` once it completes. GCP calls are wrapped in `instrument_call`, and boto3 clients are instrumented
+through botocore's event hooks (see `BotoClientRegistry`). Nothing is installed by default, in which case
+`instrument_call` returns a shared no-op context manager and no timing is done at all.
+
+Install an implementation with `set_instrumentation`, such as `InMemoryInstrumentation` for tests and ad hoc
+profiling, or `OpenTelemetryInstrumentation` to export spans and metrics through an OpenTelemetry tracer and meter.
+"""
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Sequence
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, TypeVar, Union
+
+from typing_extensions import Protocol, Self
+
+if TYPE_CHECKING:
+    from sendlive.operations import PendingOperation
+
+T = TypeVar("T")
+
+# Upper bounds of latency histogram buckets, in seconds. Provider calls range from tens of milliseconds for simple
+# api calls to many minutes for long running operations.
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+    600.0,
+)
+
+
+class ProviderCallRecord(NamedTuple):
+    """A completed provider api call."""
+
+    provider: str
+    """The provider the call was made to, such as "aws" or "gcp"."""
+    operation: str
+    """The operation called, such as "medialive.create_input"."""
+    started: float
+    """When the call started, in seconds since the epoch."""
+    duration: float
+    """Time taken by the call, in seconds."""
+    retries: int
+    """Number of times the call was retried."""
+    error: Optional[str]
+    """The class name of the error the call raised, if it failed."""
+
+
+class Instrumentation(Protocol):
+    """Receives a record of every provider api call made by sendlive.
+
+    record_call is called on the thread that made the call (or, for long running operations tracked in the
+    background, the operation poller thread), so should be quick and thread-safe.
+    """
+
+    def record_call(self, record: ProviderCallRecord) -> None:
+        """Record a completed provider api call."""
+
+
+class ProviderCall:
+    """Context manager timing a single provider api call, reporting it to an instrumentation once it exits."""
+
+    __slots__ = (
+        "instrumentation",
+        "provider",
+        "operation",
+        "retries",
+        "_started",
+        "_start",
+    )
+
+    def __init__(
+        self, instrumentation: Instrumentation, provider: str, operation: str
+    ) -> None:
+        """Prepare to time a call to operation."""
+        self.instrumentation = instrumentation
+        self.provider = provider
+        self.operation = operation
+        self.retries = 0
+        self._started = 0.0
+        self._start = 0.0
+
+    def add_retries(self, retries: int) -> None:
+        """Count retries made while completing the call."""
+        self.retries += retries
+
+    def __enter__(self) -> Self:
+        """Start timing the call."""
+        self._started = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def finish(self, error: Optional[str] = None) -> None:
+        """Stop timing the call and report it, along with the class name of the error it failed with, if any."""
+        self.instrumentation.record_call(
+            ProviderCallRecord(
+                provider=self.provider,
+                operation=self.operation,
+                started=self._started,
+                duration=time.perf_counter() - self._start,
+                retries=self.retries,
+                error=error,
+            )
+        )
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Stop timing the call and report it."""
+        self.finish(exc_type.__name__ if exc_type is not None else None)
+
+
+class _NoOpProviderCall:
+    """Stand in for ProviderCall when no instrumentation is installed."""
+
+    __slots__ = ()
+
+    def add_retries(self, retries: int) -> None:
+        pass
+
+    def finish(self, error: Optional[str] = None) -> None:
+        pass
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+
+_NO_OP_CALL = _NoOpProviderCall()
+_instrumentation: Optional[Instrumentation] = None
+
+
+def set_instrumentation(instrumentation: Optional[Instrumentation]) -> None:
+    """Install the instrumentation that provider api calls are reported to, or None to stop reporting them."""
+    global _instrumentation  # noqa: PLW0603
+    _instrumentation = instrumentation
+
+
+def get_instrumentation() -> Optional[Instrumentation]:
+    """Return the installed instrumentation, if any."""
+    return _instrumentation
+
+
+def instrument_call(
+    provider: str, operation: str
+) -> Union[ProviderCall, _NoOpProviderCall]:
+    """Return a context manager timing a call to operation, and reporting it to the installed instrumentation."""
+    if _instrumentation is None:
+        return _NO_OP_CALL
+    return ProviderCall(_instrumentation, provider, operation)
+
+
+def instrument_pending_operation(
+    provider: str, operation: str, pending: "PendingOperation[T]"
+) -> "PendingOperation[T]":
+    """Time a long running operation tracked in the background, reporting it once the pending handle resolves."""
+    if _instrumentation is None:
+        return pending
+    call = ProviderCall(_instrumentation, provider, operation).__enter__()
+
+    def finish(resolved: "PendingOperation[T]") -> None:
+        error = resolved.exception(0)
+        call.finish(type(error).__name__ if error is not None else None)
+
+    pending.add_done_callback(finish)
+    return pending
+
+
+class LatencyHistogram:
+    """Counts of call durations falling into fixed latency buckets."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """Create an empty histogram with the passed in bucket upper bounds, in seconds."""
+        self.buckets = tuple(buckets)
+        # the final count is for durations above the last bucket
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, duration: float) -> None:
+        """Count a call duration."""
+        self.counts[bisect_left(self.buckets, duration)] += 1
+        self.count += 1
+        self.total += duration
+
+    @property
+    def mean(self) -> float:
+        """Mean call duration, in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+
+class InMemoryInstrumentation:
+    """Keeps every provider call record in memory, along with per operation aggregates.
+
+    Aggregates are keyed by (provider, operation).
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """Create an empty collector, using the passed in latency histogram buckets."""
+        self.buckets = tuple(buckets)
+        self.records: list[ProviderCallRecord] = []
+        self.latencies: dict[tuple[str, str], LatencyHistogram] = {}
+        self.retries: defaultdict[tuple[str, str], int] = defaultdict(int)
+        self.errors: defaultdict[tuple[str, str], defaultdict[str, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+        self._lock = threading.Lock()
+
+    def record_call(self, record: ProviderCallRecord) -> None:
+        """Record a completed provider api call."""
+        key = (record.provider, record.operation)
+        with self._lock:
+            self.records.append(record)
+            histogram = self.latencies.get(key)
+            if histogram is None:
+                histogram = self.latencies[key] = LatencyHistogram(self.buckets)
+            histogram.observe(record.duration)
+            self.retries[key] += record.retries
+            if record.error is not None:
+                self.errors[key][record.error] += 1
+
+    def calls(
+        self, provider: Optional[str] = None, operation: Optional[str] = None
+    ) -> list[ProviderCallRecord]:
+        """Return the recorded calls, optionally only those to a provider and/or operation."""
+        with self._lock:
+            return [
+                record
+                for record in self.records
+                if (provider is None or record.provider == provider)
+                and (operation is None or record.operation == operation)
+            ]
+
+    def clear(self) -> None:
+        """Discard everything recorded so far."""
+        with self._lock:
+            self.records.clear()
+            self.latencies.clear()
+            self.retries.clear()
+            self.errors.clear()
+
+
+class OpenTelemetryInstrumentation:
+    """Reports provider api calls as OpenTelemetry spans and metrics.
+
+    Takes a tracer and/or meter from the OpenTelemetry api (such as `trace.get_tracer("sendlive")` and
+    `metrics.get_meter("sendlive")`), so sendlive itself does not depend on OpenTelemetry. Spans are created once a
+    call completes, with its recorded start and end times.
+    """
+
+    def __init__(self, tracer: Any = None, meter: Any = None) -> None:
+        """Create the instruments used to report provider api calls."""
+        self.tracer = tracer
+        self.duration = self.retries = self.errors = None
+        if meter is not None:
+            self.duration = meter.create_histogram(
+                "sendlive.provider.call.duration",
+                unit="s",
+                description="Duration of provider api calls.",
+            )
+            self.retries = meter.create_counter(
+                "sendlive.provider.call.retries",
+                description="Retries of provider api calls.",
+            )
+            self.errors = meter.create_counter(
+                "sendlive.provider.call.errors",
+                description="Provider api calls that raised an error.",
+            )
+
+    def record_call(self, record: ProviderCallRecord) -> None:
+        """Report a completed provider api call."""
+        attributes: dict[str, Any] = {
+            "sendlive.provider": record.provider,
+            "sendlive.operation": record.operation,
+        }
+        if self.duration is not None:
+            self.duration.record(record.duration, attributes)
+        if self.retries is not None and record.retries:
+            self.retries.add(record.retries, attributes)
+        if self.errors is not None and record.error is not None:
+            self.errors.add(1, {**attributes, "error.type": record.error})
+        if self.tracer is not None:
+            start_time = int(record.started * 1e9)
+            span_attributes = {**attributes, "sendlive.retries": record.retries}
+            if record.error is not None:
+                span_attributes["error.type"] = record.error
+            span = self.tracer.start_span(
+                record.operation, start_time=start_time, attributes=span_attributes
+            )
+            span.end(end_time=start_time + int(record.duration * 1e9))
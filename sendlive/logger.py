@@ -1,11 +1,214 @@
+"""Logging for sendlive.
+
+sendlive never configures logging itself: records are sent to the "sendlive" logger, which only has a NullHandler,
+so it is up to the application to decide where (and whether) they go. Applications without their own logging setup
+can call configure_logging.
+
+Provider responses are logged with log_response, which is gated on the log level and only redacts, truncates and
+formats the response when a record is actually emitted.
+"""
+import json
 import logging
 import sys
+from collections.abc import Mapping
+from typing import Any, Optional, TextIO
+
+logger = logging.getLogger("sendlive")
+logger.addHandler(logging.NullHandler())
 
-logging.basicConfig(
-    level=logging.INFO,
-    stream=sys.stdout,
-    format="%(asctime)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
+DEFAULT_LOG_FORMAT = "%(asctime)s - %(message)s"
+DEFAULT_LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Fields whose values are replaced when logging provider responses, compared case insensitively ignoring "_" and "-".
+# Input urls are included, as RTMP push urls contain the stream key.
+DEFAULT_REDACTED_FIELDS = frozenset(
+    {
+        "accesskey",
+        "password",
+        "secret",
+        "secretkey",
+        "sessiontoken",
+        "streamkey",
+        "token",
+        "uri",
+        "url",
+        "username",
+    }
 )
+REDACTED = "<redacted>"
+# Fields dropped entirely when logging provider responses, as they are noise.
+OMITTED_FIELDS = frozenset({"ResponseMetadata"})
 
-logger = logging.getLogger("sendlive")
+DEFAULT_MAX_STRING_LENGTH = 200
+DEFAULT_MAX_ITEMS = 20
+DEFAULT_MAX_DEPTH = 8
+
+# Attributes set on every LogRecord, anything else on a record was passed in with extra= and is structured data.
+_STANDARD_RECORD_ATTRIBUTES = frozenset(
+    {*logging.makeLogRecord({}).__dict__, "message", "asctime", "taskName"}
+)
+
+_configured_handler: Optional[logging.Handler] = None
+
+
+def _normalise_field(field: str) -> str:
+    return field.lower().replace("_", "").replace("-", "")
+
+
+def _to_loggable(value: Any) -> Any:
+    """Convert a provider response object into plain python containers where possible."""
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, Mapping):
+        return value
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return list(value)
+    if hasattr(value, "_pb"):
+        # proto-plus messages, as returned by the google cloud client libraries
+        return type(value).to_dict(value)
+    properties = getattr(value, "_properties", None)
+    if isinstance(properties, Mapping):
+        # google cloud storage resources such as buckets
+        return properties
+    return str(value)
+
+
+class SanitisedResponse:
+    """A provider response, redacted and truncated only when it is formatted or serialised.
+
+    Passing one of these as a logging argument defers all of the work to when a record is actually emitted.
+    """
+
+    __slots__ = (
+        "response",
+        "redacted_fields",
+        "max_string_length",
+        "max_items",
+        "max_depth",
+    )
+
+    def __init__(
+        self,
+        response: Any,
+        redacted_fields: frozenset[str] = DEFAULT_REDACTED_FIELDS,
+        max_string_length: int = DEFAULT_MAX_STRING_LENGTH,
+        max_items: int = DEFAULT_MAX_ITEMS,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+    ) -> None:
+        """Wrap a provider response."""
+        self.response = response
+        self.redacted_fields = redacted_fields
+        self.max_string_length = max_string_length
+        self.max_items = max_items
+        self.max_depth = max_depth
+
+    def sanitise(self) -> Any:
+        """Return the response as plain python containers, with sensitive fields redacted and large values truncated."""
+        return self._sanitise(self.response, 0)
+
+    def _sanitise(self, value: Any, depth: int) -> Any:  # noqa: PLR0911
+        value = _to_loggable(value)
+        if isinstance(value, str):
+            if len(value) > self.max_string_length:
+                return f"{value[: self.max_string_length]}...<{len(value) - self.max_string_length} more chars>"
+            return value
+        if isinstance(value, (int, float, bool)) or value is None:
+            return value
+        if depth >= self.max_depth:
+            return "<truncated>"
+        if isinstance(value, Mapping):
+            sanitised: dict[str, Any] = {}
+            for index, (field, item) in enumerate(value.items()):
+                if index >= self.max_items:
+                    sanitised["..."] = f"<{len(value) - self.max_items} more items>"
+                    break
+                key = str(field)
+                if key in OMITTED_FIELDS:
+                    continue
+                if _normalise_field(key) in self.redacted_fields:
+                    sanitised[key] = REDACTED
+                else:
+                    sanitised[key] = self._sanitise(item, depth + 1)
+            return sanitised
+        items = [self._sanitise(item, depth + 1) for item in value[: self.max_items]]
+        if len(value) > self.max_items:
+            items.append(f"<{len(value) - self.max_items} more items>")
+        return items
+
+    def __str__(self) -> str:
+        """Format the sanitised response as compact json."""
+        return json.dumps(self.sanitise(), default=str, separators=(",", ":"))
+
+
+def log_response(
+    operation: str,
+    response: Any,
+    level: int = logging.DEBUG,
+    **fields: Any,
+) -> None:
+    """Log a provider response for operation, such as "medialive.create_input".
+
+    Nothing is formatted unless the level is enabled. The operation, sanitised response and any extra fields are
+    attached to the record, so that JSONFormatter can emit them as structured data.
+    """
+    if not logger.isEnabledFor(level):
+        return
+    response = SanitisedResponse(response)
+    logger.log(
+        level,
+        "%s response: %s",
+        operation,
+        response,
+        extra={"operation": operation, "response": response, **fields},
+    )
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, SanitisedResponse):
+        return value.sanitise()
+    return str(value)
+
+
+class JSONFormatter(logging.Formatter):
+    """Format log records as single line json objects, including any structured fields passed with extra=."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as json."""
+        entry: dict[str, Any] = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=_json_default)
+
+
+def configure_logging(
+    level: int = logging.INFO,
+    json_format: bool = False,
+    stream: Optional[TextIO] = None,
+) -> logging.Handler:
+    """Send sendlive log records at or above level to stream (stdout by default), as text or json lines.
+
+    Intended for scripts and the command-line interface; applications with their own logging setup should configure
+    the "sendlive" logger themselves instead. Calling this again replaces the previously configured handler.
+    """
+    global _configured_handler  # noqa: PLW0603
+    handler = logging.StreamHandler(stream or sys.stdout)
+    if json_format:
+        handler.setFormatter(JSONFormatter())
+    else:
+        handler.setFormatter(
+            logging.Formatter(DEFAULT_LOG_FORMAT, datefmt=DEFAULT_LOG_DATE_FORMAT)
+        )
+    if _configured_handler is not None:
+        logger.removeHandler(_configured_handler)
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    _configured_handler = handler
+    return handler
@@ -1,6 +1,16 @@
-from typing import Optional
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
-from sendlive.constants import CREATED_BY_KEY, CREATED_BY_VALUE, DEFAULT_TAGS
+from sendlive.constants import (
+    CREATED_BY_KEY,
+    CREATED_BY_VALUE,
+    DEFAULT_TAGS,
+    ProviderOptions,
+)
+from sendlive.exceptions import SendLiveError
+from sendlive.profiles import LatencyMode
+from sendlive.state import ResourceRecord, StateBackend, get_state_backend
 from sendlive.types import MappingTags
 
 
@@ -33,3 +43,117 @@ class TagMixin:
         tags = self.get_operation_tags(tags)
 
         return {key.replace(" ", "-").lower(): value for key, value in tags.items()}
+
+
+class StateMixin(ABC):
+    """Mixin recording the resources an adapter creates in its state backend, and looking them up again.
+
+    See `sendlive.state`. Subclasses set state_provider and implement state_account and state_region.
+    """
+
+    state_provider: ClassVar[str]
+
+    if TYPE_CHECKING:
+        provider_options: Optional[ProviderOptions]
+
+    @property
+    @abstractmethod
+    def state_account(self) -> str:
+        """Get the account, such as the AWS account id or GCP project id, resources are recorded under."""
+
+    @property
+    @abstractmethod
+    def state_region(self) -> str:
+        """Get the region resources are recorded under."""
+
+    @property
+    def state(self) -> StateBackend:
+        """Get the state backend configured by the provider options."""
+        return get_state_backend(self.provider_options)
+
+    def record_resource(
+        self,
+        resource_type: str,
+        resource_id: str,
+        name: str,
+        stream_name: Optional[str] = None,
+        **attributes: Any,
+    ) -> ResourceRecord:
+        """Record a resource created or found by this adapter."""
+        record = ResourceRecord(
+            provider=self.state_provider,
+            account=self.state_account,
+            region=self.state_region,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            name=name,
+            stream_name=stream_name,
+            attributes=attributes,
+        )
+        self.state.put(record)
+        return record
+
+    def find_resource(self, resource_type: str, name: str) -> Optional[ResourceRecord]:
+        """Return the record of a resource created in this adapter's account and region, by its name."""
+        return self.state.find_one(
+            self.state_provider,
+            self.state_account,
+            self.state_region,
+            resource_type,
+            name,
+        )
+
+    def check_recorded_latency_mode(
+        self, resource_type: str, name: str, latency_mode: LatencyMode
+    ) -> None:
+        """Raise if the resource encoding a stream recorded in the local state has another latency mode.
+
+        Resources recorded without a latency mode were created before streams could be low latency, so are standard.
+        """
+        record = self.find_resource(resource_type, name)
+        recorded_mode = (
+            record.attributes.get("latency_mode", "standard") if record else "standard"
+        )
+        if recorded_mode != latency_mode:
+            raise SendLiveError(
+                f"Stream {name} was created with latency_mode={recorded_mode!r}, not {latency_mode!r} - delete it "
+                "before creating it again with another latency mode."
+            )
+
+    def find_recorded_resource_ids(self) -> set[str]:
+        """Return the ids of every resource recorded in this adapter's account and region."""
+        return {
+            record.resource_id
+            for record in self.state.find(
+                self.state_provider, self.state_account, self.state_region
+            )
+        }
+
+    def find_complete_stream_names(self, resource_types: Iterable[str]) -> set[str]:
+        """Return the names of the streams recorded in this adapter's account and region with every resource type."""
+        recorded_types: dict[str, set[str]] = {}
+        for record in self.state.find(
+            self.state_provider, self.state_account, self.state_region
+        ):
+            if record.stream_name is not None:
+                recorded_types.setdefault(record.stream_name, set()).add(
+                    record.resource_type
+                )
+        required_types = set(resource_types)
+        return {
+            stream_name
+            for stream_name, types in recorded_types.items()
+            if required_types <= types
+        }
+
+    def find_stream_resources(self, stream_name: str) -> dict[str, ResourceRecord]:
+        """Return the records of a stream's resources in this adapter's account and region, keyed by resource type."""
+        return {
+            record.resource_type: record
+            for record in self.state.find(
+                self.state_provider,
+                self.state_account,
+                self.state_region,
+                stream_name=stream_name,
+            )
+        }
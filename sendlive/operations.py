@@ -0,0 +1,234 @@
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Generic, Optional, TypeVar
+
+from typing_extensions import Protocol, Self
+
+from sendlive.exceptions import SendLiveTimeoutError
+from sendlive.logger import logger
+
+T = TypeVar("T")
+
+DEFAULT_INITIAL_POLL_DELAY = 1.0
+DEFAULT_MAX_POLL_DELAY = 30.0
+DEFAULT_POLL_DELAY_MULTIPLIER = 1.5
+
+
+class PollableOperation(Protocol):
+    """A provider long running operation, such as a google.api_core Operation."""
+
+    def done(self) -> bool:
+        """Refresh the operation and return whether it has completed."""
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """Return the result of the operation, raising its error if it failed."""
+
+
+class PendingOperation(Generic[T]):
+    """A lightweight handle to a long running operation that is being tracked in the background.
+
+    Handles are returned immediately, and resolve once the operation poller sees the underlying operation complete.
+    """
+
+    def __init__(
+        self,
+        operation: Optional[PollableOperation] = None,
+        transform: Optional[Callable[[Any], T]] = None,
+    ) -> None:
+        """Wrap a provider operation, optionally transforming its result once it completes."""
+        self.operation = operation
+        self._transform = transform
+        self._future: Future[T] = Future()
+
+    @classmethod
+    def from_result(cls, result: T) -> Self:
+        """Create an already completed handle, for when no long running operation was required."""
+        pending = cls()
+        pending._future.set_result(result)
+        return pending
+
+    def done(self) -> bool:
+        """Return whether the operation has completed, without making any api calls."""
+        return self._future.done()
+
+    def result(self, timeout: Optional[float] = None) -> T:
+        """Wait up to timeout seconds for the operation to complete and return its result."""
+        try:
+            return self._future.result(timeout)
+        except FutureTimeoutError as e:
+            raise SendLiveTimeoutError(
+                f"Operation did not complete within {timeout} seconds."
+            ) from e
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        """Wait up to timeout seconds for the operation to complete and return the error it raised, if any."""
+        return self._future.exception(timeout)
+
+    def add_done_callback(self, fn: Callable[[Self], Any]) -> None:
+        """Call fn with this handle once the operation completes.
+
+        Callbacks run on the poller thread, so should be quick to avoid delaying other operations.
+        If the operation has already completed, fn is called immediately.
+        """
+        self._future.add_done_callback(lambda _: fn(self))
+
+    def _resolve(self) -> None:
+        """Set the result of this handle from the completed operation."""
+        if self.operation is None:
+            return
+        try:
+            result = self.operation.result()
+            self._future.set_result(
+                self._transform(result) if self._transform else result
+            )
+        except Exception as e:
+            self._future.set_exception(e)
+
+    def _fail(self, exception: BaseException) -> None:
+        """Fail this handle with the passed in exception."""
+        self._future.set_exception(exception)
+
+
+class _PollEntry:
+    """Polling state for a single outstanding operation."""
+
+    def __init__(
+        self, pending: PendingOperation[Any], delay: float, deadline: Optional[float]
+    ) -> None:
+        self.pending = pending
+        self.delay = delay
+        self.deadline = deadline
+
+
+class OperationPoller:
+    """Drives many outstanding long running operations from a single background thread.
+
+    Each operation is polled with its own exponential backoff, so hundreds of operations can be tracked concurrently
+    without a blocked thread per operation.
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = DEFAULT_INITIAL_POLL_DELAY,
+        max_delay: float = DEFAULT_MAX_POLL_DELAY,
+        multiplier: float = DEFAULT_POLL_DELAY_MULTIPLIER,
+    ) -> None:
+        """Configure the polling backoff; the poller thread is started on first use."""
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self._queue: list[tuple[float, int, _PollEntry]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._shutdown = False
+
+    def __len__(self) -> int:
+        """Return the number of operations still being polled."""
+        with self._condition:
+            return len(self._queue)
+
+    def submit(
+        self,
+        operation: PollableOperation,
+        transform: Optional[Callable[[Any], T]] = None,
+        timeout: Optional[float] = None,
+    ) -> PendingOperation[T]:
+        """Start tracking an operation and return a handle to it.
+
+        If the operation has not completed within timeout seconds, the handle fails with a SendLiveTimeoutError.
+        """
+        pending: PendingOperation[T] = PendingOperation(operation, transform)
+        now = time.monotonic()
+        entry = _PollEntry(
+            pending,
+            self.initial_delay,
+            now + timeout if timeout is not None else None,
+        )
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit operations to a shut down poller.")
+            self._schedule(entry, now + self.initial_delay)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sendlive-operation-poller", daemon=True
+                )
+                self._thread.start()
+        return pending
+
+    def shutdown(self) -> None:
+        """Stop the poller thread. Operations still outstanding are left unresolved."""
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def _schedule(self, entry: _PollEntry, when: float) -> None:
+        """Queue an entry to be polled at the passed in monotonic time. Must be called holding the condition."""
+        heapq.heappush(self._queue, (when, next(self._counter), entry))
+        self._condition.notify()
+
+    def _run(self) -> None:
+        """Poll due operations until shut down."""
+        while True:
+            with self._condition:
+                while not self._shutdown and (
+                    not self._queue or self._queue[0][0] > time.monotonic()
+                ):
+                    self._condition.wait(
+                        self._queue[0][0] - time.monotonic() if self._queue else None
+                    )
+                if self._shutdown:
+                    return
+                _, _, entry = heapq.heappop(self._queue)
+            self._poll(entry)
+
+    def _poll(self, entry: _PollEntry) -> None:
+        """Poll a single operation, resolving it if complete or rescheduling it with backoff otherwise."""
+        operation = entry.pending.operation
+        try:
+            done = operation is None or operation.done()
+        except Exception as e:
+            entry.pending._fail(e)
+            return
+        if done:
+            entry.pending._resolve()
+            return
+        now = time.monotonic()
+        if entry.deadline is not None and now >= entry.deadline:
+            entry.pending._fail(
+                SendLiveTimeoutError(
+                    f"Operation {operation} did not complete before its deadline."
+                )
+            )
+            return
+        entry.delay = min(entry.delay * self.multiplier, self.max_delay)
+        next_poll = now + entry.delay
+        if entry.deadline is not None:
+            next_poll = min(next_poll, entry.deadline)
+        logger.debug(
+            "Operation %s not yet done, polling again in %.1fs", operation, entry.delay
+        )
+        with self._condition:
+            self._schedule(entry, next_poll)
+
+
+_default_poller: Optional[OperationPoller] = None
+_default_poller_lock = threading.Lock()
+
+
+def get_default_operation_poller() -> OperationPoller:
+    """Return the operation poller shared by all adapters in this process."""
+    global _default_poller  # noqa: PLW0603
+    if _default_poller is None:
+        with _default_poller_lock:
+            if _default_poller is None:
+                _default_poller = OperationPoller()
+    return _default_poller
@@ -0,0 +1,115 @@
+"""Encoding profiles, which describe what a stream is encoded to independently of the provider encoding it.
+
+A profile is a ladder of video renditions sharing a frame rate and GOP length, an audio rendition, and the length of
+the segments and playlist window the encoded output is packaged in. Each provider compiles profiles to its own
+settings: `sendlive.providers.aws.utils.compile_medialive_encoder_settings` and
+`sendlive.providers.gcp.utils.compile_gcp_channel_streams`. Profiles are immutable and hashable, so compiled settings
+and channel templates are cached per profile.
+
+Streams are created with a latency mode: "standard" streams are encoded to the configured profile, while "low" streams
+are encoded to it as tuned by `to_low_latency`, trading some encoding efficiency and player buffer for a glass to glass
+latency of a few seconds.
+"""
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing_extensions import Self
+
+LatencyMode = Literal["standard", "low"]
+
+
+class VideoRendition(BaseModel):
+    """A single rung of a profile's video ladder."""
+
+    model_config = ConfigDict(frozen=True)
+
+    # used in the names of the encoder outputs of the rendition, such as "720p"
+    name: str = Field(pattern=r"^[a-z0-9_]+$")
+    width: int = Field(gt=0)
+    height: int = Field(gt=0)
+    # average bitrate, in bits per second
+    bitrate: int = Field(gt=0)
+
+
+class AudioRendition(BaseModel):
+    """The AAC audio encoded alongside each video rendition."""
+
+    model_config = ConfigDict(frozen=True)
+
+    bitrate: int = Field(default=128000, gt=0)
+    sample_rate: int = 48000
+    channels: Literal[1, 2] = 2
+
+
+class EncodingProfile(BaseModel):
+    """A rendition ladder and the segmenting of its output, compiled to each provider's encoder settings."""
+
+    model_config = ConfigDict(frozen=True)
+
+    video: tuple[VideoRendition, ...] = Field(min_length=1)
+    audio: AudioRendition = AudioRendition()
+    h264_profile: Literal["baseline", "main", "high"] = "main"
+    frame_rate: int = Field(default=25, gt=0)
+    # seconds between keyframes, which segments can only be cut on
+    gop_seconds: float = Field(default=2.0, gt=0)
+    segment_seconds: float = Field(default=4.0, gt=0)
+    # seconds of segments listed in live playlists, which players start playing from the end of
+    playlist_window_seconds: float = Field(default=60.0, gt=0)
+    # container segments are packaged in, unset uses the provider's default
+    container: Optional[Literal["ts", "cmaf"]] = None
+    # serve low latency HLS, with segments split into parts that players fetch as they are encoded, where supported
+    low_latency_hls: bool = False
+
+    @model_validator(mode="after")
+    def _check_ladder(self) -> Self:
+        """Check renditions have distinct names, and segments are at least a GOP long."""
+        names = [rendition.name for rendition in self.video]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Video rendition names must be unique: {names}")
+        if self.segment_seconds < self.gop_seconds:
+            raise ValueError("segment_seconds must be at least gop_seconds")
+        if self.playlist_window_seconds < self.segment_seconds:
+            raise ValueError("playlist_window_seconds must be at least segment_seconds")
+        return self
+
+
+def merge_overrides(
+    base: Mapping[str, Any], overrides: Mapping[str, Any]
+) -> dict[str, Any]:
+    """Return base with overrides deep merged into it, leaving both unchanged.
+
+    Nested mappings are merged key by key, while any other value in overrides, including a list, replaces the value in
+    base. Only the mappings on the path to an override are copied, everything else is shared with base.
+    """
+    merged = dict(base)
+    for key, value in overrides.items():
+        existing = merged.get(key)
+        if isinstance(value, Mapping) and isinstance(existing, Mapping):
+            merged[key] = merge_overrides(existing, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+@lru_cache(maxsize=32)
+def to_low_latency(
+    profile: EncodingProfile, segment_seconds: float, playlist_window_seconds: float
+) -> EncodingProfile:
+    """Tune a profile for low latency streaming.
+
+    Segments are shortened to segment_seconds, each a single GOP so that they can be cut as soon as they are encoded,
+    and packaged as CMAF with low latency HLS. The playlist window is shortened to playlist_window_seconds, so that
+    players start close to the live edge.
+    """
+    return EncodingProfile.model_validate(
+        {
+            **dict(profile),
+            "gop_seconds": segment_seconds,
+            "segment_seconds": segment_seconds,
+            "playlist_window_seconds": playlist_window_seconds,
+            "container": "cmaf",
+            "low_latency_hls": True,
+        }
+    )
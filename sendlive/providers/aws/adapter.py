@@ -1,15 +1,34 @@
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
 
 from mypy_boto3_medialive.type_defs import InputSecurityGroupTypeDef
 from pydantic import ConfigDict
 from typing_extensions import override
 
 from sendlive.adapter import BaseAdapter
-from sendlive.constants import AWSCredentials
-from sendlive.exceptions import SendLiveError
+from sendlive.constants import AWSCredentials, AWSOptions
+from sendlive.gc import GCResourceType, SendLiveResource
+from sendlive.graph import Task, run_task_graph
+from sendlive.logger import logger
+from sendlive.profiles import EncodingProfile, LatencyMode, to_low_latency
+from sendlive.providers.aws.constants import (
+    AWS_DEFAULT_ENCODING_PROFILE,
+    AWS_LOW_LATENCY_PLAYLIST_WINDOW_SECONDS,
+    AWS_LOW_LATENCY_SEGMENT_SECONDS,
+    MEDIALIVE_CHANNEL,
+    MEDIALIVE_DELETABLE_CHANNEL_STATES,
+    MEDIALIVE_DELETED_STATES,
+    MEDIALIVE_INPUT,
+    MEDIALIVE_INPUT_SECURITY_GROUP,
+    MEDIAPACKAGEV2_CHANNEL,
+    MEDIAPACKAGEV2_ORIGIN_ENDPOINT,
+)
 from sendlive.providers.aws.mixins import MediaLiveMixin, MediaPackageV2Mixin
 from sendlive.providers.aws.stream import AWSStream
 
+# the most stream resources that are ever independent of each other, and so created at the same time
+MAX_STREAM_SETUP_CONCURRENCY = 3
+
 
 class AWSAdapter(MediaLiveMixin, MediaPackageV2Mixin, BaseAdapter):
     """Adapter for AWS."""
@@ -22,9 +41,100 @@ class AWSAdapter(MediaLiveMixin, MediaPackageV2Mixin, BaseAdapter):
     def setup_stream(self) -> None:
         return None
 
+    def resolve_input_security_group_id(self) -> int:
+        """Return the input security group id to use for a new stream.
+
+        Uses the group configured in provider options if set, otherwise an existing sendlive input security group is
+        reused, or one is created if none exists.
+        """
+        if (
+            self.provider_options is not None
+            and self.provider_options.medialive_input_security_group_id is not None
+        ):
+            return self.provider_options.medialive_input_security_group_id
+        input_security_group: InputSecurityGroupTypeDef = (
+            self.get_or_create_input_security_group()
+        )
+        return int(input_security_group["Id"])
+
     @override
-    def list_streams(self) -> list[str]:
-        return []
+    def setup_shared_resources(self) -> None:
+        self.resolve_input_security_group_id()
+
+    def get_encoding_profile(
+        self, latency_mode: LatencyMode = "standard"
+    ) -> EncodingProfile:
+        """Get the profile streams are encoded to, tuned for low latency if latency_mode is "low"."""
+        profile = (
+            self.provider_options.encoding_profile if self.provider_options else None
+        ) or AWS_DEFAULT_ENCODING_PROFILE
+        if latency_mode == "low":
+            return to_low_latency(
+                profile,
+                AWS_LOW_LATENCY_SEGMENT_SECONDS,
+                AWS_LOW_LATENCY_PLAYLIST_WINDOW_SECONDS,
+            )
+        return profile
+
+    @override
+    def fetch_stream_names(self) -> list[str]:
+        # Streams are created with an input named after the stream, and later a channel of the same name.
+        input_names = self.list_sendlive_input_names()
+        channel_names = self.list_sendlive_channel_names()
+        return list(dict.fromkeys([*input_names, *channel_names]))
+
+    def record_stream(
+        self, stream: AWSStream, latency_mode: LatencyMode = "standard"
+    ) -> None:
+        """Record each resource the stream is made up of in the local state, under the stream's name.
+
+        The latency mode the stream was created with is recorded on its medialive channel.
+        """
+        attributes: dict[str, dict[str, Optional[str]]] = {
+            MEDIALIVE_INPUT: {"id": stream.input_id, "endpoint": stream.endpoint},
+            MEDIAPACKAGEV2_CHANNEL: {
+                "channel_group_name": stream.mediapackage_channel_group_name
+            },
+            MEDIAPACKAGEV2_ORIGIN_ENDPOINT: {"url": stream.url},
+            MEDIALIVE_CHANNEL: {"id": stream.channel_id, "latency_mode": latency_mode},
+        }
+        for resource_type, arn in stream.resource_arns.items():
+            self.record_resource(
+                resource_type,
+                arn,
+                name=stream.name,
+                stream_name=stream.name,
+                **attributes.get(resource_type, {}),
+            )
+
+    @override
+    def get_stream(self, name: str) -> Optional[AWSStream]:
+        """Return a stream created earlier, rebuilt from the local state without any api calls."""
+        records = self.find_stream_resources(name)
+        if not records:
+            return None
+
+        def attribute(resource_type: str, key: str) -> Optional[str]:
+            record = records.get(resource_type)
+            return record.attributes.get(key) if record is not None else None
+
+        stream = AWSStream(
+            name=name,
+            endpoint=attribute(MEDIALIVE_INPUT, "endpoint"),
+            input_id=attribute(MEDIALIVE_INPUT, "id"),
+            channel_id=attribute(MEDIALIVE_CHANNEL, "id"),
+            mediapackage_channel_group_name=attribute(
+                MEDIAPACKAGEV2_CHANNEL, "channel_group_name"
+            ),
+            url=attribute(MEDIAPACKAGEV2_ORIGIN_ENDPOINT, "url"),
+            resource_arns={
+                resource_type: record.resource_id
+                for resource_type, record in records.items()
+            },
+        )
+        options = self.provider_options or AWSOptions()
+        stream.bind(self.clients, waiter_delay=options.medialive_waiter_delay)
+        return stream
 
     @override
     def create_stream(
@@ -32,26 +142,271 @@ class AWSAdapter(MediaLiveMixin, MediaPackageV2Mixin, BaseAdapter):
         name: str,
         input_security_group_id: Optional[int] = None,
         setup_endpoint: bool = True,
+        start: bool = False,
+        *,
+        latency_mode: LatencyMode = "standard",
     ) -> AWSStream:
-        if input_security_group_id is None:
-            if (
-                self.provider_options is None
-                or self.provider_options.medialive_input_security_group_id is None
-            ):
-                input_security_group: InputSecurityGroupTypeDef = (
-                    self.create_input_security_group()
+        """Create a stream, and unless setup_endpoint is False, every aws resource it is made up of.
+
+        Resources are created as a task graph, so that independent resources are created at the same time: the
+        mediapackagev2 channel group and channel are created while the medialive input is, and the origin endpoint
+        while the medialive channel is. If start is True, the channel is started as soon as it has been created.
+
+        With latency_mode="low", the stream is encoded in one second GOPs, packaged in one second CMAF segments, and
+        served as low latency HLS with the shortest playlist window mediapackagev2 allows.
+
+        Every resource created is recorded in the local state, even if a later one fails. A stream that was already
+        fully created is returned from the state rather than created again, as long as it was created with the same
+        latency_mode.
+        """
+        options = self.provider_options or AWSOptions()
+        stream = AWSStream(name=name)
+        stream.bind(self.clients, waiter_delay=options.medialive_waiter_delay)
+        if not setup_endpoint:
+            return stream
+        existing_stream = self.get_stream(name)
+        if existing_stream is not None and existing_stream.channel_id is not None:
+            self.check_recorded_latency_mode(MEDIALIVE_CHANNEL, name, latency_mode)
+            logger.debug("Reusing stream %s recorded in the local state", name)
+            if start:
+                existing_stream.start()
+            return existing_stream
+        tags = dict(self.get_tags())
+        encoding_profile = self.get_encoding_profile(latency_mode)
+        tasks = {
+            "input_security_group": Task(
+                lambda _: (
+                    input_security_group_id
+                    if input_security_group_id is not None
+                    else self.resolve_input_security_group_id()
                 )
-                input_security_group_id = int(input_security_group["Id"])
-            else:
-                input_security_group_id = (
-                    self.provider_options.medialive_input_security_group_id
+            ),
+            "input": Task(
+                lambda results: stream.setup_endpoint(
+                    clients=self.clients,
+                    security_input_group_id=results["input_security_group"],
+                    tags=tags,
+                ),
+                depends_on=("input_security_group",),
+            ),
+            "channel_group": Task(
+                lambda _: self.get_or_create_mediapackagev2_channel_group(
+                    options.mediapackage_channel_group_name
                 )
-        stream = AWSStream(name=name)
-        if not self._boto_session:
-            raise SendLiveError("Boto session not set up.")
-        if setup_endpoint:
-            stream.setup_endpoint(
-                boto_session=self._boto_session,
-                security_input_group_id=input_security_group_id,
+            ),
+            "mediapackage_channel": Task(
+                lambda results: stream.setup_mediapackage_channel(
+                    self.clients, results["channel_group"].name, tags
+                ),
+                depends_on=("channel_group",),
+            ),
+            "origin_endpoint": Task(
+                lambda _: stream.setup_origin_endpoint(
+                    self.clients, tags, encoding_profile
+                ),
+                depends_on=("mediapackage_channel",),
+            ),
+            "channel": Task(
+                lambda _: stream.setup_channel(
+                    self.clients,
+                    options.medialive_role_arn,
+                    tags,
+                    encoding_profile,
+                    options.medialive_encoder_settings_overrides,
+                ),
+                depends_on=("input", "mediapackage_channel"),
+            ),
+        }
+        if start:
+            tasks["start"] = Task(
+                lambda _: stream.start(), depends_on=("channel", "origin_endpoint")
             )
+        # each stream gets its own small pool, so that streams created in bulk never queue behind each other's waits
+        with ThreadPoolExecutor(
+            max_workers=MAX_STREAM_SETUP_CONCURRENCY,
+            thread_name_prefix=f"sendlive-aws-{name}",
+        ) as executor:
+            try:
+                run_task_graph(tasks, executor)
+            finally:
+                self.record_stream(stream, latency_mode)
         return stream
+
+    def list_gc_medialive_channels(self) -> list[SendLiveResource]:
+        """List sendlive medialive channels for the garbage collector, where any that can't be deleted are live."""
+        return [
+            SendLiveResource(
+                provider=self.state_provider,
+                resource_type=MEDIALIVE_CHANNEL,
+                resource_id=channel["Arn"],
+                provider_id=channel["Id"],
+                name=channel["Name"],
+                stream_name=channel["Name"],
+                live=channel.get("State") not in MEDIALIVE_DELETABLE_CHANNEL_STATES,
+            )
+            for channel in self.list_sendlive_channels()
+            if channel.get("State") not in MEDIALIVE_DELETED_STATES
+        ]
+
+    def list_gc_medialive_inputs(self) -> list[SendLiveResource]:
+        """List sendlive medialive inputs for the garbage collector."""
+        return [
+            SendLiveResource(
+                provider=self.state_provider,
+                resource_type=MEDIALIVE_INPUT,
+                resource_id=medialive_input["Arn"],
+                provider_id=medialive_input["Id"],
+                name=medialive_input["Name"],
+                stream_name=medialive_input["Name"],
+            )
+            for medialive_input in self.list_sendlive_inputs()
+            if medialive_input.get("State") not in MEDIALIVE_DELETED_STATES
+        ]
+
+    def list_gc_input_security_groups(self) -> list[SendLiveResource]:
+        """List sendlive input security groups for the garbage collector, which are shared by the inputs using them.
+
+        The group configured in provider options is live, so never deleted.
+        """
+        configured_id = (
+            self.provider_options.medialive_input_security_group_id
+            if self.provider_options
+            else None
+        )
+        return [
+            SendLiveResource(
+                provider=self.state_provider,
+                resource_type=MEDIALIVE_INPUT_SECURITY_GROUP,
+                resource_id=input_security_group.get("Arn", input_security_group["Id"]),
+                provider_id=input_security_group["Id"],
+                name=input_security_group["Id"],
+                live=input_security_group["Id"] == str(configured_id),
+                references=input_security_group.get("Inputs", []),
+            )
+            for input_security_group in self.list_sendlive_input_security_groups()
+            if input_security_group.get("State") != "DELETED"
+        ]
+
+    def list_gc_mediapackagev2_channels(self) -> list[SendLiveResource]:
+        """List the mediapackagev2 channels in the sendlive channel group for the garbage collector."""
+        channel_group_name = (
+            self.provider_options or AWSOptions()
+        ).mediapackage_channel_group_name
+        return [
+            SendLiveResource(
+                provider=self.state_provider,
+                resource_type=MEDIAPACKAGEV2_CHANNEL,
+                resource_id=channel["Arn"],
+                name=channel["ChannelName"],
+                stream_name=channel["ChannelName"],
+                attributes={"channel_group_name": channel_group_name},
+            )
+            for channel in self.list_mediapackagev2_channels(channel_group_name)
+        ]
+
+    def list_gc_mediapackagev2_origin_endpoints(self) -> list[SendLiveResource]:
+        """List the origin endpoints of channels in the sendlive channel group for the garbage collector."""
+        channel_group_name = (
+            self.provider_options or AWSOptions()
+        ).mediapackage_channel_group_name
+        return [
+            SendLiveResource(
+                provider=self.state_provider,
+                resource_type=MEDIAPACKAGEV2_ORIGIN_ENDPOINT,
+                resource_id=origin_endpoint["Arn"],
+                name=origin_endpoint["OriginEndpointName"],
+                stream_name=channel["ChannelName"],
+                attributes={
+                    "channel_group_name": channel_group_name,
+                    "channel_name": channel["ChannelName"],
+                },
+            )
+            for channel in self.list_mediapackagev2_channels(channel_group_name)
+            for origin_endpoint in self.list_mediapackagev2_origin_endpoints(
+                channel_group_name, channel["ChannelName"]
+            )
+        ]
+
+    def _forget_after(
+        self, delete: Callable[[SendLiveResource], None]
+    ) -> Callable[[SendLiveResource], None]:
+        """Wrap a garbage collector deletion, so that deleted resources are also removed from the local state."""
+
+        def delete_and_forget(resource: SendLiveResource) -> None:
+            delete(resource)
+            self.state.delete(resource.resource_id)
+
+        return delete_and_forget
+
+    @override
+    def gc_recorded_resource_ids(self) -> set[str]:
+        """Every resource created is recorded in the local state, including shared input security groups and channel groups."""
+        return self.find_recorded_resource_ids()
+
+    @override
+    def gc_desired_stream_names(self) -> set[str]:
+        """Streams are recorded in the local state once all of their resources have been created."""
+        return self.find_complete_stream_names(
+            (
+                MEDIALIVE_INPUT,
+                MEDIALIVE_CHANNEL,
+                MEDIAPACKAGEV2_CHANNEL,
+                MEDIAPACKAGEV2_ORIGIN_ENDPOINT,
+            )
+        )
+
+    @override
+    def gc_resource_types(self) -> list[GCResourceType]:
+        """Medialive channels are deleted first, as they use every other resource of their stream."""
+        return [
+            GCResourceType(
+                MEDIALIVE_CHANNEL,
+                self.list_gc_medialive_channels,
+                self._forget_after(
+                    lambda resource: self.delete_medialive_channel(
+                        str(resource.provider_id)
+                    )
+                ),
+            ),
+            GCResourceType(
+                MEDIALIVE_INPUT,
+                self.list_gc_medialive_inputs,
+                self._forget_after(
+                    lambda resource: self.delete_medialive_input(
+                        str(resource.provider_id)
+                    )
+                ),
+                delete_after=(MEDIALIVE_CHANNEL,),
+            ),
+            GCResourceType(
+                MEDIALIVE_INPUT_SECURITY_GROUP,
+                self.list_gc_input_security_groups,
+                self._forget_after(
+                    lambda resource: self.delete_input_security_group(
+                        str(resource.provider_id)
+                    )
+                ),
+                delete_after=(MEDIALIVE_INPUT,),
+            ),
+            GCResourceType(
+                MEDIAPACKAGEV2_ORIGIN_ENDPOINT,
+                self.list_gc_mediapackagev2_origin_endpoints,
+                self._forget_after(
+                    lambda resource: self.delete_mediapackagev2_origin_endpoint(
+                        resource.attributes["channel_group_name"],
+                        resource.attributes["channel_name"],
+                        resource.name,
+                    )
+                ),
+            ),
+            GCResourceType(
+                MEDIAPACKAGEV2_CHANNEL,
+                self.list_gc_mediapackagev2_channels,
+                self._forget_after(
+                    lambda resource: self.delete_mediapackagev2_channel(
+                        resource.attributes["channel_group_name"], resource.name
+                    )
+                ),
+                delete_after=(MEDIALIVE_CHANNEL, MEDIAPACKAGEV2_ORIGIN_ENDPOINT),
+            ),
+        ]
@@ -0,0 +1,204 @@
+from contextvars import ContextVar
+from http import HTTPStatus
+from threading import Lock
+from typing import Any, Callable, Optional, TypeVar
+
+from boto3.session import Session
+from botocore import xform_name
+from botocore.config import Config
+from botocore.exceptions import WaiterError
+from botocore.model import OperationModel
+
+from sendlive.constants import DEFAULT_MAX_POOL_CONNECTIONS, RetryPolicy
+from sendlive.exceptions import SendLiveError, SendLiveTimeoutError
+from sendlive.instrumentation import ProviderCall, get_instrumentation, instrument_call
+from sendlive.retry import ProviderRetrier
+
+T = TypeVar("T")
+
+# provider name that api calls are reported under by sendlive.instrumentation
+INSTRUMENTATION_PROVIDER = "aws"
+_CALL_CONTEXT_KEY = "sendlive_provider_call"
+# retries BotoClientRegistry.call has made of the api call in progress, not yet reported with an attempt of it
+_pending_retries: ContextVar[int] = ContextVar(
+    "sendlive_aws_pending_retries", default=0
+)
+
+
+def _add_pending_retries(retries: int) -> None:
+    """Count retries of the api call in progress, to report with its next attempt."""
+    _pending_retries.set(_pending_retries.get() + retries)
+
+
+def _take_pending_retries() -> int:
+    """Return the retries of the api call in progress not yet reported, and mark them reported."""
+    retries = _pending_retries.get()
+    if retries:
+        _pending_retries.set(0)
+    return retries
+
+
+def _start_call(model: OperationModel, context: dict[str, Any], **_: Any) -> None:
+    """Start timing an api call, if instrumentation is installed."""
+    instrumentation = get_instrumentation()
+    if instrumentation is None:
+        return
+    operation = f"{model.service_model.service_name}.{xform_name(model.name)}"
+    context[_CALL_CONTEXT_KEY] = ProviderCall(
+        instrumentation, INSTRUMENTATION_PROVIDER, operation
+    ).__enter__()
+
+
+def _end_call(
+    http_response: Any, parsed: dict[str, Any], context: dict[str, Any], **_: Any
+) -> None:
+    """Report a completed api call, including the retries made before it and the error code if it failed."""
+    call: Optional[ProviderCall] = context.pop(_CALL_CONTEXT_KEY, None)
+    if call is None:
+        return
+    call.add_retries(
+        parsed.get("ResponseMetadata", {}).get("RetryAttempts", 0)
+        + _take_pending_retries()
+    )
+    error = None
+    if http_response.status_code >= HTTPStatus.MULTIPLE_CHOICES:
+        error = parsed.get("Error", {}).get("Code") or "ClientError"
+    call.finish(error)
+
+
+def _fail_call(exception: Exception, context: dict[str, Any], **_: Any) -> None:
+    """Report an api call that failed without a response, such as on a connection error."""
+    call: Optional[ProviderCall] = context.pop(_CALL_CONTEXT_KEY, None)
+    if call is not None:
+        call.add_retries(_take_pending_retries())
+        call.finish(type(exception).__name__)
+
+
+class BotoClientRegistry:
+    """Lazily builds and caches boto3 clients keyed by (service, region).
+
+    Every client is instrumented, so that each api call it makes is reported to the installed instrumentation.
+    Building a boto3 client loads the botocore service model and creates a new urllib3 connection pool, so clients
+    are built once and then shared. boto3 sessions are not thread-safe, so client creation is serialised with a lock,
+    whereas the clients themselves are thread-safe and can be used from any number of worker threads.
+
+    botocore's own retries are disabled, as calls are instead retried according to the registry's retry policy,
+    see `call`.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> None:
+        """Bind the registry to a boto3 session."""
+        self.session = session
+        self.config = Config(
+            max_pool_connections=max_pool_connections,
+            retries={"total_max_attempts": 1},
+        )
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._clients: dict[tuple[str, Optional[str]], Any] = {}
+        self._retriers: dict[Optional[str], ProviderRetrier] = {}
+        self._lock = Lock()
+
+    def client(self, service_name: str, region_name: Optional[str] = None) -> Any:
+        """Return the client for the passed in service and region, building it on first use.
+
+        If region_name is unset, the region of the bound session is used.
+        """
+        key = (service_name, region_name or self.session.region_name)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        with self._lock:
+            # Another thread may have built the client while we were waiting on the lock.
+            client = self._clients.get(key)
+            if client is None:
+                client = self.session.client(
+                    service_name,  # type: ignore[call-overload]
+                    region_name=key[1],
+                    config=self.config,
+                )
+                self._instrument(client)
+                self._clients[key] = client
+        return client
+
+    def call(
+        self,
+        operation: str,
+        fn: Callable[[], T],
+        idempotent: Optional[bool] = None,
+        region_name: Optional[str] = None,
+    ) -> T:
+        """Call fn, which makes the api call for operation (such as "medialive.create_input"), retrying it as needed.
+
+        Calls are rate limited and retried per region according to the retry policy, and throttling, transient and
+        permission errors are raised as sendlive exceptions once retries run out. See `sendlive.retry`. Each attempt is
+        reported to the installed instrumentation by the client, along with the retries made before it.
+        """
+        region = region_name or self.session.region_name
+        retrier = self._retriers.get(region)
+        if retrier is None:
+            retrier = self._retriers.setdefault(
+                region,
+                ProviderRetrier(INSTRUMENTATION_PROVIDER, region, self.retry_policy),
+            )
+        token = _pending_retries.set(0)
+        try:
+            return retrier.call(
+                operation, fn, idempotent=idempotent, on_retry=_add_pending_retries
+            )
+        finally:
+            _pending_retries.reset(token)
+
+    def wait(
+        self,
+        service_name: str,
+        waiter_name: str,
+        description: str,
+        delay: int,
+        **params: Any,
+    ) -> None:
+        """Wait on a boto3 waiter, such as medialive's channel_running, polling every delay seconds.
+
+        Waiter errors are raised as sendlive exceptions, naming what was waited on with description, such as
+        "stream my-stream".
+        """
+        operation = f"{service_name}.{waiter_name}.wait"
+        waiter = self.client(service_name).get_waiter(waiter_name)
+        try:
+            with instrument_call(INSTRUMENTATION_PROVIDER, operation):
+                waiter.wait(WaiterConfig={"Delay": delay}, **params)
+        except WaiterError as e:
+            if "Max attempts exceeded" in str(e):
+                raise SendLiveTimeoutError(
+                    f"Timed out waiting for {waiter_name} on {description}."
+                ) from e
+            raise SendLiveError(
+                f"Failed waiting for {waiter_name} on {description}: {e}"
+            ) from e
+
+    @staticmethod
+    def _instrument(client: Any) -> None:
+        """Register the event handlers that report each api call made by the client.
+
+        The handler starting the timer is registered first, so that it still runs when a stubber answers the call.
+        """
+        events = client.meta.events
+        events.register_first("before-call.*.*", _start_call)
+        events.register("after-call.*.*", _end_call)
+        events.register("after-call-error.*.*", _fail_call)
+
+    def close(self) -> None:
+        """Close all clients built by this registry, releasing their connection pools."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+    def __len__(self) -> int:
+        """Return the number of clients built by this registry."""
+        return len(self._clients)
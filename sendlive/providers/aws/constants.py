@@ -1,5 +1,31 @@
+from copy import deepcopy
 from typing import Any
 
+from mypy_boto3_medialive.type_defs import InputWhitelistRuleCidrTypeDef
+
+from sendlive.profiles import EncodingProfile, VideoRendition
+
+# Resource types recorded in the local state, see sendlive.state
+
+MEDIALIVE_INPUT_SECURITY_GROUP = "medialive.input_security_group"
+MEDIALIVE_INPUT = "medialive.input"
+MEDIALIVE_CHANNEL = "medialive.channel"
+MEDIAPACKAGEV2_CHANNEL_GROUP = "mediapackagev2.channel_group"
+MEDIAPACKAGEV2_CHANNEL = "mediapackagev2.channel"
+MEDIAPACKAGEV2_ORIGIN_ENDPOINT = "mediapackagev2.origin_endpoint"
+
+# medialive channels can only be deleted in these states, so a channel in any other, such as running, is live
+MEDIALIVE_DELETABLE_CHANNEL_STATES = frozenset(
+    {"IDLE", "CREATE_FAILED", "UPDATE_FAILED"}
+)
+# states of medialive resources that are, or are being, deleted
+MEDIALIVE_DELETED_STATES = frozenset({"DELETING", "DELETED"})
+
+# Mediapackage
+
+DEFAULT_ORIGIN_ENDPOINT_MANIFEST_NAME = "index"
+
+# segment and playlist window durations are set from the stream's encoding profile
 DEFAULT_ORIGIN_ENDPOINT_HLS_PACKAGE: dict[str, Any] = {
     "adMarkers": "NONE",
     "adTriggers": [
@@ -12,311 +38,108 @@ DEFAULT_ORIGIN_ENDPOINT_HLS_PACKAGE: dict[str, Any] = {
     "adsOnDeliveryRestrictions": "RESTRICTED",
     "includeIframeOnlyStream": False,
     "playlistType": "EVENT",
-    "playlistWindowSeconds": 60,
     "programDateTimeIntervalSeconds": 0,
-    "segmentDurationSeconds": 4,
     "streamSelection": {"streamOrder": "ORIGINAL"},
     "useAudioRenditionGroup": False,
 }
 
 # Medialive
 
-DEFAULT_MEDIALIVE_ENCODER_SETTINGS: dict[str, Any] = {
-    "audioDescriptions": [
-        {
-            "audioSelectorName": "Default",
-            "audioTypeControl": "FOLLOW_INPUT",
-            "codecSettings": {
-                "aacSettings": {
-                    "bitrate": 128000,
-                    "codingMode": "CODING_MODE_2_0",
-                    "inputType": "NORMAL",
-                    "profile": "LC",
-                    "rateControlMode": "CBR",
-                    "rawFormat": "NONE",
-                    "sampleRate": 48000,
-                    "spec": "MPEG4",
-                }
-            },
-            "languageCodeControl": "FOLLOW_INPUT",
-            "name": "audio_0",
-        },
-        {
-            "audioSelectorName": "Default",
-            "audioTypeControl": "FOLLOW_INPUT",
-            "codecSettings": {
-                "aacSettings": {
-                    "bitrate": 128000,
-                    "codingMode": "CODING_MODE_2_0",
-                    "inputType": "NORMAL",
-                    "profile": "LC",
-                    "rateControlMode": "CBR",
-                    "rawFormat": "NONE",
-                    "sampleRate": 48000,
-                    "spec": "MPEG4",
-                }
-            },
-            "languageCodeControl": "FOLLOW_INPUT",
-            "name": "audio_1",
-        },
-        {
-            "audioSelectorName": "Default",
-            "audioTypeControl": "FOLLOW_INPUT",
-            "codecSettings": {
-                "aacSettings": {
-                    "bitrate": 128000,
-                    "codingMode": "CODING_MODE_2_0",
-                    "inputType": "NORMAL",
-                    "profile": "LC",
-                    "rateControlMode": "CBR",
-                    "rawFormat": "NONE",
-                    "sampleRate": 48000,
-                    "spec": "MPEG4",
-                }
-            },
-            "languageCodeControl": "FOLLOW_INPUT",
-            "name": "audio_2",
-        },
-        {
-            "audioSelectorName": "Default",
-            "audioTypeControl": "FOLLOW_INPUT",
-            "codecSettings": {
-                "aacSettings": {
-                    "bitrate": 128000,
-                    "codingMode": "CODING_MODE_2_0",
-                    "inputType": "NORMAL",
-                    "profile": "LC",
-                    "rateControlMode": "CBR",
-                    "rawFormat": "NONE",
-                    "sampleRate": 48000,
-                    "spec": "MPEG4",
-                }
-            },
-            "languageCodeControl": "FOLLOW_INPUT",
-            "name": "audio_3",
-        },
-    ],
-    "globalConfiguration": {
-        "outputLockingMode": "PIPELINE_LOCKING",
-        "outputTimingSource": "INPUT_CLOCK",
-        "supportLowFramerateInputs": "DISABLED",
-    },
-    "outputGroups": [
-        {
-            "outputGroupSettings": {
-                "mediaPackageGroupSettings": {
-                    "destination": {"destinationRefId": "changeme"}
-                }
-            },
-            "outputs": [
-                {
-                    "audioDescriptionNames": ["audio_0"],
-                    "outputName": "emp_1080p25",
-                    "outputSettings": {"mediaPackageOutputSettings": {}},
-                    "videoDescriptionName": "emp_1080p25",
-                },
-                {
-                    "audioDescriptionNames": ["audio_1"],
-                    "outputName": "emp_720p25",
-                    "outputSettings": {"mediaPackageOutputSettings": {}},
-                    "videoDescriptionName": "emp_720p25",
-                },
-                {
-                    "audioDescriptionNames": ["audio_2"],
-                    "outputName": "emp_480p25",
-                    "outputSettings": {"mediaPackageOutputSettings": {}},
-                    "videoDescriptionName": "emp_480p25",
-                },
-                {
-                    "audioDescriptionNames": ["audio_3"],
-                    "outputName": "emp_240p25",
-                    "outputSettings": {"mediaPackageOutputSettings": {}},
-                    "videoDescriptionName": "emp_240p25",
-                },
-            ],
-        }
-    ],
-    "timecodeConfig": {"source": "SYSTEMCLOCK"},
-    "videoDescriptions": [
-        {
-            "codecSettings": {
-                "h264Settings": {
-                    "adaptiveQuantization": "HIGH",
-                    "afdSignaling": "NONE",
-                    "bitrate": 5000000,
-                    "colorMetadata": "INSERT",
-                    "entropyEncoding": "CABAC",
-                    "flickerAq": "ENABLED",
-                    "forceFieldPictures": "DISABLED",
-                    "framerateControl": "SPECIFIED",
-                    "framerateDenominator": 1,
-                    "framerateNumerator": 25,
-                    "gopBReference": "ENABLED",
-                    "gopClosedCadence": 1,
-                    "gopNumBFrames": 5,
-                    "gopSize": 1.92,
-                    "gopSizeUnits": "SECONDS",
-                    "level": "H264_LEVEL_AUTO",
-                    "lookAheadRateControl": "HIGH",
-                    "maxBitrate": 5000000,
-                    "numRefFrames": 3,
-                    "parControl": "SPECIFIED",
-                    "parDenominator": 1,
-                    "parNumerator": 1,
-                    "profile": "MAIN",
-                    "rateControlMode": "QVBR",
-                    "scanType": "PROGRESSIVE",
-                    "sceneChangeDetect": "ENABLED",
-                    "slices": 1,
-                    "spatialAq": "ENABLED",
-                    "subgopLength": "DYNAMIC",
-                    "syntax": "DEFAULT",
-                    "temporalAq": "ENABLED",
-                    "timecodeInsertion": "DISABLED",
-                }
-            },
-            "height": 1080,
-            "name": "emp_1080p25",
-            "respondToAfd": "NONE",
-            "scalingBehavior": "DEFAULT",
-            "sharpness": 50,
-            "width": 1920,
-        },
-        {
-            "codecSettings": {
-                "h264Settings": {
-                    "adaptiveQuantization": "HIGH",
-                    "afdSignaling": "NONE",
-                    "bitrate": 3000000,
-                    "colorMetadata": "INSERT",
-                    "entropyEncoding": "CABAC",
-                    "flickerAq": "ENABLED",
-                    "forceFieldPictures": "DISABLED",
-                    "framerateControl": "SPECIFIED",
-                    "framerateDenominator": 1,
-                    "framerateNumerator": 25,
-                    "gopBReference": "ENABLED",
-                    "gopClosedCadence": 1,
-                    "gopNumBFrames": 5,
-                    "gopSize": 1.92,
-                    "gopSizeUnits": "SECONDS",
-                    "level": "H264_LEVEL_AUTO",
-                    "lookAheadRateControl": "HIGH",
-                    "maxBitrate": 3000000,
-                    "numRefFrames": 3,
-                    "parControl": "SPECIFIED",
-                    "parDenominator": 1,
-                    "parNumerator": 1,
-                    "profile": "MAIN",
-                    "rateControlMode": "QVBR",
-                    "scanType": "PROGRESSIVE",
-                    "sceneChangeDetect": "ENABLED",
-                    "slices": 1,
-                    "spatialAq": "ENABLED",
-                    "subgopLength": "DYNAMIC",
-                    "syntax": "DEFAULT",
-                    "temporalAq": "ENABLED",
-                    "timecodeInsertion": "DISABLED",
-                }
-            },
-            "height": 720,
-            "name": "emp_720p25",
-            "respondToAfd": "NONE",
-            "scalingBehavior": "DEFAULT",
-            "sharpness": 75,
-            "width": 1280,
-        },
-        {
-            "codecSettings": {
-                "h264Settings": {
-                    "adaptiveQuantization": "HIGH",
-                    "afdSignaling": "NONE",
-                    "bitrate": 1500000,
-                    "colorMetadata": "INSERT",
-                    "entropyEncoding": "CABAC",
-                    "flickerAq": "ENABLED",
-                    "forceFieldPictures": "DISABLED",
-                    "framerateControl": "SPECIFIED",
-                    "framerateDenominator": 1,
-                    "framerateNumerator": 25,
-                    "gopBReference": "ENABLED",
-                    "gopClosedCadence": 1,
-                    "gopNumBFrames": 5,
-                    "gopSize": 1.92,
-                    "gopSizeUnits": "SECONDS",
-                    "level": "H264_LEVEL_AUTO",
-                    "lookAheadRateControl": "HIGH",
-                    "maxBitrate": 1500000,
-                    "numRefFrames": 3,
-                    "parControl": "SPECIFIED",
-                    "parDenominator": 1,
-                    "parNumerator": 1,
-                    "profile": "MAIN",
-                    "rateControlMode": "QVBR",
-                    "scanType": "PROGRESSIVE",
-                    "sceneChangeDetect": "ENABLED",
-                    "slices": 1,
-                    "spatialAq": "ENABLED",
-                    "subgopLength": "DYNAMIC",
-                    "syntax": "DEFAULT",
-                    "temporalAq": "ENABLED",
-                    "timecodeInsertion": "DISABLED",
-                }
-            },
-            "height": 480,
-            "name": "emp_480p25",
-            "respondToAfd": "NONE",
-            "scalingBehavior": "STRETCH_TO_OUTPUT",
-            "sharpness": 100,
-            "width": 854,
-        },
-        {
-            "codecSettings": {
-                "h264Settings": {
-                    "adaptiveQuantization": "HIGH",
-                    "afdSignaling": "NONE",
-                    "bitrate": 750000,
-                    "colorMetadata": "INSERT",
-                    "entropyEncoding": "CABAC",
-                    "flickerAq": "ENABLED",
-                    "forceFieldPictures": "DISABLED",
-                    "framerateControl": "SPECIFIED",
-                    "framerateDenominator": 1,
-                    "framerateNumerator": 25,
-                    "gopBReference": "ENABLED",
-                    "gopClosedCadence": 1,
-                    "gopNumBFrames": 5,
-                    "gopSize": 1.92,
-                    "gopSizeUnits": "SECONDS",
-                    "level": "H264_LEVEL_AUTO",
-                    "lookAheadRateControl": "HIGH",
-                    "maxBitrate": 750000,
-                    "numRefFrames": 3,
-                    "parControl": "SPECIFIED",
-                    "parDenominator": 1,
-                    "parNumerator": 1,
-                    "profile": "MAIN",
-                    "rateControlMode": "QVBR",
-                    "scanType": "PROGRESSIVE",
-                    "sceneChangeDetect": "ENABLED",
-                    "slices": 1,
-                    "spatialAq": "ENABLED",
-                    "subgopLength": "DYNAMIC",
-                    "syntax": "DEFAULT",
-                    "temporalAq": "ENABLED",
-                    "timecodeInsertion": "DISABLED",
-                }
-            },
-            "height": 240,
-            "name": "emp_240p25",
-            "respondToAfd": "NONE",
-            "scalingBehavior": "STRETCH_TO_OUTPUT",
-            "sharpness": 100,
-            "width": 426,
-        },
-    ],
+# id of the channel destination that the medialive output group pushes to mediapackage through
+MEDIALIVE_MEDIAPACKAGE_DESTINATION_ID = "mediapackage"
+
+DEFAULT_INPUT_SECURITY_GROUP_WHITELIST_RULES: list[InputWhitelistRuleCidrTypeDef] = [
+    {"Cidr": "0.0.0.0/0"}
+]
+
+# The parts of medialive encoder settings that are the same for every profile, see compile_medialive_encoder_settings
+
+DEFAULT_MEDIALIVE_AAC_SETTINGS: dict[str, Any] = {
+    "inputType": "NORMAL",
+    "profile": "LC",
+    "rateControlMode": "CBR",
+    "rawFormat": "NONE",
+    "spec": "MPEG4",
+}
+
+# aac coding mode of each number of audio channels
+MEDIALIVE_AAC_CODING_MODES = {1: "CODING_MODE_1_0", 2: "CODING_MODE_2_0"}
+
+DEFAULT_MEDIALIVE_H264_SETTINGS: dict[str, Any] = {
+    "adaptiveQuantization": "HIGH",
+    "afdSignaling": "NONE",
+    "colorMetadata": "INSERT",
+    "entropyEncoding": "CABAC",
+    "flickerAq": "ENABLED",
+    "forceFieldPictures": "DISABLED",
+    "framerateControl": "SPECIFIED",
+    "framerateDenominator": 1,
+    "gopBReference": "ENABLED",
+    "gopClosedCadence": 1,
+    "gopNumBFrames": 5,
+    "gopSizeUnits": "SECONDS",
+    "level": "H264_LEVEL_AUTO",
+    "lookAheadRateControl": "HIGH",
+    "numRefFrames": 3,
+    "parControl": "SPECIFIED",
+    "parDenominator": 1,
+    "parNumerator": 1,
+    "rateControlMode": "QVBR",
+    "scanType": "PROGRESSIVE",
+    "sceneChangeDetect": "ENABLED",
+    "slices": 1,
+    "spatialAq": "ENABLED",
+    "subgopLength": "DYNAMIC",
+    "syntax": "DEFAULT",
+    "temporalAq": "ENABLED",
+    "timecodeInsertion": "DISABLED",
+}
+
+DEFAULT_MEDIALIVE_GLOBAL_CONFIGURATION: dict[str, Any] = {
+    "outputLockingMode": "PIPELINE_LOCKING",
+    "outputTimingSource": "INPUT_CLOCK",
+    "supportLowFramerateInputs": "DISABLED",
 }
 
+# profile that streams are encoded with unless AWSOptions.encoding_profile is set, with a gop of 48 frames at 25fps
+AWS_DEFAULT_ENCODING_PROFILE = EncodingProfile(
+    video=(
+        VideoRendition(name="1080p", width=1920, height=1080, bitrate=5000000),
+        VideoRendition(name="720p", width=1280, height=720, bitrate=3000000),
+        VideoRendition(name="480p", width=854, height=480, bitrate=1500000),
+        VideoRendition(name="240p", width=426, height=240, bitrate=750000),
+    ),
+    h264_profile="main",
+    frame_rate=25,
+    gop_seconds=1.92,
+    segment_seconds=4,
+    playlist_window_seconds=60,
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Compile DEFAULT_MEDIALIVE_ENCODER_SETTINGS, kept for compatibility, from the default profile on first access.
+
+    The settings are a copy, so modifying them doesn't change the settings streams are encoded with.
+    """
+    if name != "DEFAULT_MEDIALIVE_ENCODER_SETTINGS":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # utils imports this module, so can only be imported once this module is loaded
+    from sendlive.providers.aws.utils import (  # noqa: PLC0415
+        compile_medialive_encoder_settings,
+    )
+
+    settings = globals()[name] = deepcopy(
+        compile_medialive_encoder_settings(AWS_DEFAULT_ENCODING_PROFILE)
+    )
+    return settings
+
+
+# segment length of streams created with latency_mode="low", and their playlist window, the shortest mediapackagev2
+# allows
+AWS_LOW_LATENCY_SEGMENT_SECONDS = 1
+AWS_LOW_LATENCY_PLAYLIST_WINDOW_SECONDS = 30
+
 MEDIALIVE_DEFAULT_INPUT_SPEC: dict[str, Any] = {
     "codec": "AVC",
     "maximumBitrate": "MAX_20_MBPS",
@@ -332,7 +155,6 @@ DEFAULT_MEDIALIVE_CHANNEL_PARAMS: dict[str, Any] = {
             "mediaPackageSettings": [{"channelId": "changeme"}],
         }
     ],
-    "encoderSettings": DEFAULT_MEDIALIVE_ENCODER_SETTINGS,
     "inputAttachments": [
         {
             "inputAttachmentName": "changeme",
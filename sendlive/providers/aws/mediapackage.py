@@ -29,4 +29,5 @@ class MediaPackageV2ChannelGroup(BaseModel):
     arn: str
     """The ARN of the channel group."""
 
-    channels: list[MediaPackageV2Channel] = []
+    channels: dict[str, MediaPackageV2Channel] = {}
+    """The channels known to be in the group, by name."""
@@ -1,37 +1,68 @@
+from collections.abc import Iterable, Mapping
 from http import HTTPStatus
-from typing import Any, Optional
+from threading import Lock
+from typing import Any, ClassVar, Optional, Union
 
 from boto3.session import Session
 from mypy_boto3_medialive import MediaLiveClient
 from mypy_boto3_medialive.type_defs import (
+    ChannelSummaryTypeDef,
     CreateInputSecurityGroupResponseTypeDef,
     InputSecurityGroupTypeDef,
+    InputTypeDef,
+    InputWhitelistRuleCidrTypeDef,
 )
 from mypy_boto3_mediapackagev2 import mediapackagev2Client
 from mypy_boto3_mediapackagev2.literals import ContainerTypeType
 from mypy_boto3_mediapackagev2.type_defs import (
+    ChannelListConfigurationTypeDef,
     CreateChannelGroupRequestRequestTypeDef,
     CreateChannelGroupResponseTypeDef,
     CreateChannelResponseTypeDef,
     CreateOriginEndpointResponseTypeDef,
+    GetChannelGroupResponseTypeDef,
+    OriginEndpointListConfigurationTypeDef,
 )
-from pydantic import BaseModel, ConfigDict, PrivateAttr, computed_field
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
-from sendlive.constants import AWSCredentials, AWSOptions
+from sendlive.constants import (
+    CREATED_BY_KEY,
+    CREATED_BY_VALUE,
+    DEFAULT_MAX_POOL_CONNECTIONS,
+    AWSCredentials,
+    AWSOptions,
+)
 from sendlive.exceptions import SendLiveError
-from sendlive.logger import logger
-from sendlive.mixins import TagMixin
+from sendlive.logger import log_response, logger
+from sendlive.mixins import StateMixin, TagMixin
+from sendlive.providers.aws.clients import (
+    INSTRUMENTATION_PROVIDER,
+    BotoClientRegistry,
+)
+from sendlive.providers.aws.constants import (
+    DEFAULT_INPUT_SECURITY_GROUP_WHITELIST_RULES,
+    MEDIALIVE_INPUT_SECURITY_GROUP,
+    MEDIAPACKAGEV2_CHANNEL_GROUP,
+)
 from sendlive.providers.aws.mediapackage import (
     MediaPackageV2Channel,
     MediaPackageV2ChannelGroup,
 )
+from sendlive.registry import ResourceRegistry
 from sendlive.types import MappingTags
 
+# aws account ids by access key, so that each account is only looked up once per process
+_account_ids: dict[str, str] = {}
+_account_ids_lock = Lock()
+
 
-class AWSBaseMixin(BaseModel, TagMixin):
+class AWSBaseMixin(BaseModel, TagMixin, StateMixin):
     """Base mixin for AWS operations."""
 
+    state_provider: ClassVar[str] = INSTRUMENTATION_PROVIDER
     _boto_session: Session = PrivateAttr()
+    _clients: BotoClientRegistry = PrivateAttr()
+    _access_key: str = PrivateAttr()
     provider_options: Optional[AWSOptions] = None
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -42,34 +73,92 @@ class AWSBaseMixin(BaseModel, TagMixin):
     def __init__(self, credentials: AWSCredentials, **data: dict[Any, Any]) -> None:
         """Set up boto session."""
         super().__init__(credentials=credentials, **data)
+        self._access_key = credentials.access_key
         self._boto_session = Session(
             aws_access_key_id=credentials.access_key,
             aws_secret_access_key=credentials.secret_key.get_secret_value(),
             region_name=credentials.region,
         )
+        self._clients = BotoClientRegistry(
+            self._boto_session,
+            max_pool_connections=(
+                self.provider_options.max_pool_connections
+                if self.provider_options
+                else DEFAULT_MAX_POOL_CONNECTIONS
+            ),
+            retry_policy=(
+                self.provider_options.retry_policy if self.provider_options else None
+            ),
+        )
+
+    @property
+    def state_account(self) -> str:
+        """Get the id of the aws account of the credentials, which resources are recorded under.
+
+        The account id is taken from the provider options if set, and is otherwise looked up with sts, once per
+        process for each access key.
+        """
+        if self.provider_options and self.provider_options.account_id:
+            return self.provider_options.account_id
+        account_id = _account_ids.get(self._access_key)
+        if account_id is None:
+            identity = self._clients.call(
+                "sts.get_caller_identity",
+                lambda: self._clients.client("sts").get_caller_identity(),
+            )
+            with _account_ids_lock:
+                account_id = _account_ids.setdefault(
+                    self._access_key, identity["Account"]
+                )
+        return account_id
+
+    @property
+    def state_region(self) -> str:
+        """Get the region of the boto session, which resources are recorded under."""
+        return str(self._boto_session.region_name)
+
+    @property
+    def clients(self) -> BotoClientRegistry:
+        """Return the registry of boto3 clients shared by this instance."""
+        return self._clients
+
+    def close(self) -> None:
+        """Close the boto3 clients created by this instance."""
+        self._clients.close()
 
 
 class MediaLiveMixin(AWSBaseMixin):
     """Mixin for MediaLive operations."""
 
+    # input security groups looked up or created by this instance, by their sorted whitelisted cidrs
+    _input_security_groups: dict[tuple[str, ...], InputSecurityGroupTypeDef] = (
+        PrivateAttr(default_factory=dict)
+    )
+    _input_security_group_lock: Lock = PrivateAttr(default_factory=Lock)
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    @computed_field  # type: ignore[misc]
     @property
     def medialive(self) -> MediaLiveClient:
         """Return medialive boto3 client."""
-        return self._boto_session.client("medialive")
+        client: MediaLiveClient = self._clients.client("medialive")
+        return client
 
     def create_input_security_group(
-        self, tags: Optional[MappingTags] = None
+        self,
+        tags: Optional[MappingTags] = None,
+        whitelist_rules: Optional[list[InputWhitelistRuleCidrTypeDef]] = None,
     ) -> InputSecurityGroupTypeDef:
         """Create a medialive input security group and return it."""
         if not self._boto_session:
             raise SendLiveError("Boto session not set up.")
         input_security_group: CreateInputSecurityGroupResponseTypeDef = (
-            self.medialive.create_input_security_group(
-                WhitelistRules=[{"Cidr": "0.0.0.0/0"}],
-                Tags=self.get_tags(tags),
+            self._clients.call(
+                "medialive.create_input_security_group",
+                lambda: self.medialive.create_input_security_group(
+                    WhitelistRules=whitelist_rules
+                    or DEFAULT_INPUT_SECURITY_GROUP_WHITELIST_RULES,
+                    Tags=self.get_tags(tags),
+                ),
             )
         )
         if (
@@ -84,21 +173,236 @@ class MediaLiveMixin(AWSBaseMixin):
         ]
         if "Id" not in new_input_security_group:
             raise SendLiveError("Created input security group did not return an id.")
-        logger.info(f"\n\nINPUT SEC GROUP RES:{input_security_group}\n\n")
+        log_response("medialive.create_input_security_group", input_security_group)
+        self._record_input_security_group(new_input_security_group)
         return new_input_security_group
 
+    def _record_input_security_group(
+        self, input_security_group: InputSecurityGroupTypeDef
+    ) -> None:
+        self.record_resource(
+            MEDIALIVE_INPUT_SECURITY_GROUP,
+            input_security_group.get("Arn", input_security_group["Id"]),
+            name=input_security_group["Id"],
+            **input_security_group,
+        )
+
+    @staticmethod
+    def _whitelist_cidrs(
+        whitelist_rules: Iterable[Mapping[str, Any]],
+    ) -> tuple[str, ...]:
+        """Return the cidrs of an input security group's whitelist rules, sorted so that they can be compared."""
+        return tuple(sorted(rule["Cidr"] for rule in whitelist_rules))
+
+    def is_sendlive_resource(self, tags: Optional[MappingTags]) -> bool:
+        """Check whether a resource's tags mark it as created by sendlive."""
+        return bool(tags and tags.get(CREATED_BY_KEY) == CREATED_BY_VALUE)
+
+    def list_sendlive_inputs(self) -> list[InputTypeDef]:
+        """Page through medialive inputs and return those created by sendlive."""
+        paginator = self.medialive.get_paginator("list_inputs")
+        return self._clients.call(
+            "medialive.list_inputs",
+            lambda: [
+                medialive_input
+                for page in paginator.paginate()
+                for medialive_input in page["Inputs"]
+                if self.is_sendlive_resource(medialive_input.get("Tags"))
+            ],
+        )
+
+    def list_sendlive_input_names(self) -> list[str]:
+        """Page through medialive inputs and return the names of those created by sendlive."""
+        return [
+            medialive_input["Name"] for medialive_input in self.list_sendlive_inputs()
+        ]
+
+    def list_sendlive_channels(self) -> list[ChannelSummaryTypeDef]:
+        """Page through medialive channels and return those created by sendlive."""
+        paginator = self.medialive.get_paginator("list_channels")
+        return self._clients.call(
+            "medialive.list_channels",
+            lambda: [
+                channel
+                for page in paginator.paginate()
+                for channel in page["Channels"]
+                if self.is_sendlive_resource(channel.get("Tags"))
+            ],
+        )
+
+    def list_sendlive_channel_names(self) -> list[str]:
+        """Page through medialive channels and return the names of those created by sendlive."""
+        return [channel["Name"] for channel in self.list_sendlive_channels()]
+
+    def list_sendlive_input_security_groups(self) -> list[InputSecurityGroupTypeDef]:
+        """Page through medialive input security groups and return those created by sendlive."""
+        paginator = self.medialive.get_paginator("list_input_security_groups")
+        return self._clients.call(
+            "medialive.list_input_security_groups",
+            lambda: [
+                input_security_group
+                for page in paginator.paginate()
+                for input_security_group in page["InputSecurityGroups"]
+                if self.is_sendlive_resource(input_security_group.get("Tags"))
+            ],
+        )
+
+    @property
+    def waiter_delay(self) -> int:
+        """Get the delay between polls while waiting on a medialive resource, in seconds."""
+        return (self.provider_options or AWSOptions()).medialive_waiter_delay
+
+    def delete_medialive_channel(self, channel_id: str) -> None:
+        """Delete a medialive channel, which must not be running, returning once it is deleted."""
+        response = self._clients.call(
+            "medialive.delete_channel",
+            lambda: self.medialive.delete_channel(ChannelId=channel_id),
+        )
+        log_response("medialive.delete_channel", response)
+        self._clients.wait(
+            "medialive",
+            "channel_deleted",
+            f"channel {channel_id}",
+            self.waiter_delay,
+            ChannelId=channel_id,
+        )
+
+    def delete_medialive_input(self, input_id: str) -> None:
+        """Delete a medialive input, which must not be attached to a channel, returning once it is deleted."""
+        response = self._clients.call(
+            "medialive.delete_input",
+            lambda: self.medialive.delete_input(InputId=input_id),
+        )
+        log_response("medialive.delete_input", response)
+        self._clients.wait(
+            "medialive",
+            "input_deleted",
+            f"input {input_id}",
+            self.waiter_delay,
+            InputId=input_id,
+        )
+
+    def delete_input_security_group(self, input_security_group_id: str) -> None:
+        """Delete a medialive input security group, which must not be used by any input."""
+        response = self._clients.call(
+            "medialive.delete_input_security_group",
+            lambda: self.medialive.delete_input_security_group(
+                InputSecurityGroupId=input_security_group_id
+            ),
+        )
+        log_response("medialive.delete_input_security_group", response)
+        with self._input_security_group_lock:
+            self._input_security_groups = {
+                cidrs: input_security_group
+                for cidrs, input_security_group in self._input_security_groups.items()
+                if input_security_group["Id"] != input_security_group_id
+            }
+
+    def find_input_security_group(
+        self,
+        whitelist_rules: Optional[list[InputWhitelistRuleCidrTypeDef]] = None,
+    ) -> Optional[InputSecurityGroupTypeDef]:
+        """Find an existing sendlive tagged medialive input security group with the passed in whitelist rules.
+
+        Groups recorded in the local state are checked first, and only if none match are groups listed from medialive.
+        """
+        wanted_cidrs = self._whitelist_cidrs(
+            whitelist_rules or DEFAULT_INPUT_SECURITY_GROUP_WHITELIST_RULES
+        )
+        for record in self.state.find(
+            self.state_provider,
+            self.state_account,
+            self.state_region,
+            MEDIALIVE_INPUT_SECURITY_GROUP,
+        ):
+            if (
+                self._whitelist_cidrs(record.attributes.get("WhitelistRules", []))
+                == wanted_cidrs
+            ):
+                recorded_group: InputSecurityGroupTypeDef = record.attributes  # type: ignore[assignment]
+                return recorded_group
+        paginator = self.medialive.get_paginator("list_input_security_groups")
+
+        def find() -> Optional[InputSecurityGroupTypeDef]:
+            for page in paginator.paginate():
+                for input_security_group in page["InputSecurityGroups"]:
+                    if (
+                        input_security_group.get("State") != "DELETED"
+                        and self.is_sendlive_resource(input_security_group.get("Tags"))
+                        and self._whitelist_cidrs(
+                            input_security_group.get("WhitelistRules", [])
+                        )
+                        == wanted_cidrs
+                    ):
+                        return input_security_group
+            return None
+
+        input_security_group = self._clients.call(
+            "medialive.list_input_security_groups", find
+        )
+        if input_security_group is not None:
+            self._record_input_security_group(input_security_group)
+        return input_security_group
+
+    def get_or_create_input_security_group(
+        self,
+        tags: Optional[MappingTags] = None,
+        whitelist_rules: Optional[list[InputWhitelistRuleCidrTypeDef]] = None,
+    ) -> InputSecurityGroupTypeDef:
+        """Return a sendlive medialive input security group, reusing an existing one where possible.
+
+        The group with the requested whitelist rules is looked up (or created if none is found) on first use, then
+        cached on this instance, so every later stream whitelisting the same cidrs reuses it without any further api
+        calls.
+        """
+        cidrs = self._whitelist_cidrs(
+            whitelist_rules or DEFAULT_INPUT_SECURITY_GROUP_WHITELIST_RULES
+        )
+        input_security_group = self._input_security_groups.get(cidrs)
+        if input_security_group is not None:
+            return input_security_group
+        with self._input_security_group_lock:
+            input_security_group = self._input_security_groups.get(cidrs)
+            if input_security_group is None:
+                input_security_group = self.find_input_security_group(whitelist_rules)
+                if input_security_group is None:
+                    input_security_group = self.create_input_security_group(
+                        tags, whitelist_rules
+                    )
+                else:
+                    logger.debug(
+                        "Reusing existing input security group %s",
+                        input_security_group.get("Id"),
+                    )
+                self._input_security_groups[cidrs] = input_security_group
+        return input_security_group
+
 
 class MediaPackageV2Mixin(AWSBaseMixin):
     """Mixin for MediaPackageV2 operations."""
 
-    mediapackage_channel_groups: list[MediaPackageV2ChannelGroup] = []
+    _mediapackage_channel_groups: ResourceRegistry[MediaPackageV2ChannelGroup] = (
+        PrivateAttr(
+            default_factory=lambda: ResourceRegistry(
+                key=lambda channel_group: channel_group.name
+            )
+        )
+    )
+    _mediapackage_channel_group_lock: Lock = PrivateAttr(default_factory=Lock)
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    @computed_field  # type: ignore[misc]
+    @property
+    def mediapackage_channel_groups(
+        self,
+    ) -> ResourceRegistry[MediaPackageV2ChannelGroup]:
+        """Get the mediapackagev2 channel groups created or looked up by this instance, by name."""
+        return self._mediapackage_channel_groups
+
     @property
     def mediapackagev2(self) -> mediapackagev2Client:
         """Return a MediaPackageV2 boto3 client."""
-        return self._boto_session.client("mediapackagev2")
+        client: mediapackagev2Client = self._clients.client("mediapackagev2")
+        return client
 
     def create_mediapackagev2_channel_group(
         self,
@@ -116,62 +420,115 @@ class MediaPackageV2Mixin(AWSBaseMixin):
         if description:
             create_args["Description"] = description
         mediapackagev2_channel_group: CreateChannelGroupResponseTypeDef = (
-            self.mediapackagev2.create_channel_group(**create_args)
+            self._clients.call(
+                "mediapackagev2.create_channel_group",
+                lambda: self.mediapackagev2.create_channel_group(**create_args),
+            )
         )
-        logger.info(
-            f"\n\nMEDIAPACKAGEV2 CREATE CHANNEL GROUP RES:{mediapackagev2_channel_group}\n\n"
+        log_response(
+            "mediapackagev2.create_channel_group", mediapackagev2_channel_group
         )
         return mediapackagev2_channel_group
 
+    def get_or_create_mediapackagev2_channel_group(
+        self, channel_group_name: str, tags: Optional[MappingTags] = None
+    ) -> MediaPackageV2ChannelGroup:
+        """Return the named mediapackagev2 channel group, creating it if it does not exist.
+
+        The group is remembered on this instance and recorded in the local state once found or created, so later
+        streams, and later instances, reuse it without any further api calls.
+        """
+        known_channel_group = self.mediapackage_channel_groups.get(channel_group_name)
+        if known_channel_group is not None:
+            return known_channel_group
+        with self._mediapackage_channel_group_lock:
+            known_channel_group = self.mediapackage_channel_groups.get(
+                channel_group_name
+            )
+            if known_channel_group is not None:
+                return known_channel_group
+            record = self.find_resource(
+                MEDIAPACKAGEV2_CHANNEL_GROUP, channel_group_name
+            )
+            if record is not None:
+                return self.mediapackage_channel_groups.add(
+                    MediaPackageV2ChannelGroup(
+                        name=channel_group_name, arn=record.resource_id
+                    )
+                )
+            try:
+                response: Union[
+                    CreateChannelGroupResponseTypeDef, GetChannelGroupResponseTypeDef
+                ] = self.create_mediapackagev2_channel_group(
+                    channel_group_name, description=None, tags=tags
+                )
+            except self.mediapackagev2.exceptions.ConflictException:
+                logger.debug(
+                    "Reusing existing mediapackagev2 channel group %s",
+                    channel_group_name,
+                )
+                response = self._clients.call(
+                    "mediapackagev2.get_channel_group",
+                    lambda: self.mediapackagev2.get_channel_group(
+                        ChannelGroupName=channel_group_name
+                    ),
+                )
+            channel_group = MediaPackageV2ChannelGroup(
+                name=response["ChannelGroupName"], arn=response["Arn"]
+            )
+            self.record_resource(
+                MEDIAPACKAGEV2_CHANNEL_GROUP, channel_group.arn, channel_group.name
+            )
+            return self.mediapackage_channel_groups.add(channel_group)
+
     def create_mediapackagev2_channel(
         self,
         channel_group_name: Optional[str],
         channel_name: str,
         tags: Optional[MappingTags] = None,
     ) -> CreateChannelResponseTypeDef:
-        """Create a mediapackagev2 channel.
+        """Create a mediapackagev2 channel, and add it to its channel group on this instance.
 
-        Defaults to creating the mediapackagev2 channel under the first mediapackagev2 channel group.
+        The named channel group is looked up, or created, if it is not yet known to this instance. Defaults to
+        creating the mediapackagev2 channel under the first mediapackagev2 channel group known to this instance.
         """
         if not self._boto_session:
             raise SendLiveError("Boto session not set up.")
-        if not channel_group_name and len(self.mediapackage_channel_groups) == 0:
-            raise SendLiveError(
-                "No mediapackagev2 channel groups are associated with this instance. Please add one to create a mediapackagev2 channel."
+        if channel_group_name:
+            channel_group = self.get_or_create_mediapackagev2_channel_group(
+                channel_group_name
             )
-        elif not channel_group_name:
-            channel_group_name = self.mediapackage_channel_groups[0].name
-        mediapackage_v2_channel: CreateChannelResponseTypeDef = (
-            self.mediapackagev2.create_channel(
-                ChannelGroupName=channel_group_name,
+        else:
+            first_channel_group = self.mediapackage_channel_groups.first()
+            if first_channel_group is None:
+                raise SendLiveError(
+                    "No mediapackagev2 channel groups are associated with this instance. Please add one to create a mediapackagev2 channel."
+                )
+            channel_group = first_channel_group
+        mediapackage_v2_channel: CreateChannelResponseTypeDef = self._clients.call(
+            "mediapackagev2.create_channel",
+            lambda: self.mediapackagev2.create_channel(
+                ChannelGroupName=channel_group.name,
                 ChannelName=channel_name,
                 Tags=self.get_tags(tags),
-            )
+            ),
         )
-        logger.info(
-            f"\n\nMEDIAPACKAGEV2 CREATE CHANNEL RES:{mediapackage_v2_channel}\n\n"
-        )
-        if (
-            mediapackage_v2_channel["ResponseMetadata"]["HTTPStatusCode"]
-            != HTTPStatus.CREATED
+        log_response("mediapackagev2.create_channel", mediapackage_v2_channel)
+        # mediapackagev2 responds to a created channel with a 200 ok
+        if mediapackage_v2_channel["ResponseMetadata"]["HTTPStatusCode"] not in (
+            HTTPStatus.OK,
+            HTTPStatus.CREATED,
         ):
             raise SendLiveError(
-                f"Failed to create mediapackagev2 channel, received non 201 created response: {mediapackage_v2_channel}"
+                f"Failed to create mediapackagev2 channel, received non 2xx response: {mediapackage_v2_channel}"
             )
-        if not channel_group_name:
-            # No channel group name was provided, so we can safely add the newly created channel to the first channel group.
-            new_mediapackagev2_channel: MediaPackageV2Channel = MediaPackageV2Channel(
+        channel_group.channels[mediapackage_v2_channel["ChannelName"]] = (
+            MediaPackageV2Channel(
                 name=mediapackage_v2_channel["ChannelName"],
                 arn=mediapackage_v2_channel["Arn"],
             )
-            self.mediapackage_channel_groups[0].channels.append(
-                new_mediapackagev2_channel
-            )
-            return mediapackage_v2_channel
-        else:
-            raise NotImplementedError(
-                "Adding a channel to a specific channel group that may or may not be already associated with this instance is not yet implemented."
-            )
+        )
+        return mediapackage_v2_channel
 
     def create_mediapackagev2_origin_endpoint(  # noqa: PLR0913
         self,
@@ -185,16 +542,19 @@ class MediaPackageV2Mixin(AWSBaseMixin):
         if not self._boto_session:
             raise SendLiveError("Boto session not set up.")
         mediapackagev2_origin_endpoint: CreateOriginEndpointResponseTypeDef = (
-            self.mediapackagev2.create_origin_endpoint(
-                ChannelGroupName=channel_group_name,
-                ChannelName=channel_name,
-                OriginEndpointName=origin_endpoint_name,
-                ContainerType=container_type,
-                Tags=self.get_tags(tags),
+            self._clients.call(
+                "mediapackagev2.create_origin_endpoint",
+                lambda: self.mediapackagev2.create_origin_endpoint(
+                    ChannelGroupName=channel_group_name,
+                    ChannelName=channel_name,
+                    OriginEndpointName=origin_endpoint_name,
+                    ContainerType=container_type,
+                    Tags=self.get_tags(tags),
+                ),
             )
         )
-        logger.info(
-            f"\n\nMEDIAPACKAGEV2 CREATE ORIGIN ENDPOINT RES:{mediapackagev2_origin_endpoint}\n\n"
+        log_response(
+            "mediapackagev2.create_origin_endpoint", mediapackagev2_origin_endpoint
         )
         if (
             mediapackagev2_origin_endpoint["ResponseMetadata"]["HTTPStatusCode"]
@@ -203,3 +563,66 @@ class MediaPackageV2Mixin(AWSBaseMixin):
             raise SendLiveError(
                 f"Failed to create mediapackagev2 origin endpoint, received non 201 created response: {mediapackagev2_origin_endpoint}"
             )
+
+    def list_mediapackagev2_channels(
+        self, channel_group_name: str
+    ) -> list[ChannelListConfigurationTypeDef]:
+        """Page through the channels in a mediapackagev2 channel group, of which there are none if it does not exist."""
+        paginator = self.mediapackagev2.get_paginator("list_channels")
+
+        def list_channels() -> list[ChannelListConfigurationTypeDef]:
+            try:
+                return [
+                    channel
+                    for page in paginator.paginate(ChannelGroupName=channel_group_name)
+                    for channel in page["Items"]
+                ]
+            except self.mediapackagev2.exceptions.ResourceNotFoundException:
+                return []
+
+        return self._clients.call("mediapackagev2.list_channels", list_channels)
+
+    def list_mediapackagev2_origin_endpoints(
+        self, channel_group_name: str, channel_name: str
+    ) -> list[OriginEndpointListConfigurationTypeDef]:
+        """Page through the origin endpoints of a mediapackagev2 channel."""
+        paginator = self.mediapackagev2.get_paginator("list_origin_endpoints")
+        return self._clients.call(
+            "mediapackagev2.list_origin_endpoints",
+            lambda: [
+                origin_endpoint
+                for page in paginator.paginate(
+                    ChannelGroupName=channel_group_name, ChannelName=channel_name
+                )
+                for origin_endpoint in page["Items"]
+            ],
+        )
+
+    def delete_mediapackagev2_origin_endpoint(
+        self, channel_group_name: str, channel_name: str, origin_endpoint_name: str
+    ) -> None:
+        """Delete a mediapackagev2 origin endpoint."""
+        response = self._clients.call(
+            "mediapackagev2.delete_origin_endpoint",
+            lambda: self.mediapackagev2.delete_origin_endpoint(
+                ChannelGroupName=channel_group_name,
+                ChannelName=channel_name,
+                OriginEndpointName=origin_endpoint_name,
+            ),
+        )
+        log_response("mediapackagev2.delete_origin_endpoint", response)
+
+    def delete_mediapackagev2_channel(
+        self, channel_group_name: str, channel_name: str
+    ) -> None:
+        """Delete a mediapackagev2 channel, which must have no origin endpoints."""
+        response = self._clients.call(
+            "mediapackagev2.delete_channel",
+            lambda: self.mediapackagev2.delete_channel(
+                ChannelGroupName=channel_group_name, ChannelName=channel_name
+            ),
+        )
+        log_response("mediapackagev2.delete_channel", response)
+        channel_group = self.mediapackage_channel_groups.get(channel_group_name)
+        if channel_group is not None:
+            channel_group.channels.pop(channel_name, None)
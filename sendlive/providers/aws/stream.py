@@ -1,23 +1,79 @@
-from typing import Optional
+import logging
+from http import HTTPStatus
+from typing import Any, Optional
+from uuid import uuid4
 
-from boto3.session import Session
 from mypy_boto3_medialive import MediaLiveClient
 from mypy_boto3_medialive.literals import InputTypeType
+from mypy_boto3_medialive.type_defs import DescribeChannelResponseTypeDef
+from mypy_boto3_mediapackagev2 import mediapackagev2Client
+from pydantic import PrivateAttr
 from typing_extensions import override
 
 from sendlive.exceptions import SendLiveError
-from sendlive.logger import logger
-from sendlive.stream import BaseStream
+from sendlive.logger import log_response
+from sendlive.profiles import EncodingProfile
+from sendlive.providers.aws.clients import BotoClientRegistry
+from sendlive.providers.aws.constants import (
+    MEDIALIVE_CHANNEL,
+    MEDIALIVE_INPUT,
+    MEDIAPACKAGEV2_CHANNEL,
+    MEDIAPACKAGEV2_ORIGIN_ENDPOINT,
+)
+from sendlive.providers.aws.utils import (
+    build_medialive_channel_params_from_defaults,
+    build_origin_endpoint_hls_params_from_defaults,
+)
+from sendlive.stream import BaseStream, StreamURLs
+
+DEFAULT_MEDIALIVE_WAITER_DELAY = 5
 
 
 class AWSStream(BaseStream):
-    """Represents a single stream on AWS."""
+    """Represents a single stream on AWS.
+
+    A stream is made up of a medialive input that is pushed to, a medialive channel encoding it, and a mediapackagev2
+    channel and HLS origin endpoint that package and serve the encoded output.
+    """
 
     endpoint: Optional[str] = None
+    """The url of the medialive input to push the stream to."""
+    input_id: Optional[str] = None
+    """The id of the medialive input."""
+    channel_id: Optional[str] = None
+    """The id of the medialive channel."""
+    mediapackage_channel_group_name: Optional[str] = None
+    url: Optional[str] = None
+    """The url of the HLS manifest the stream can be watched at."""
+    resource_arns: dict[str, str] = {}
+    """The arns of the resources the stream is made up of, keyed by resource type."""
+
+    _clients: Optional[BotoClientRegistry] = PrivateAttr(default=None)
+    _waiter_delay: int = PrivateAttr(default=DEFAULT_MEDIALIVE_WAITER_DELAY)
+
+    def bind(
+        self,
+        clients: BotoClientRegistry,
+        waiter_delay: int = DEFAULT_MEDIALIVE_WAITER_DELAY,
+    ) -> None:
+        """Bind the clients used to manage the stream, and the delay between polls while waiting on its channel."""
+        self._clients = clients
+        self._waiter_delay = waiter_delay
+
+    @property
+    def clients(self) -> BotoClientRegistry:
+        """Return the clients bound to the stream."""
+        if self._clients is None:
+            raise SendLiveError(f"Stream {self.name} is not bound to any aws clients.")
+        return self._clients
+
+    def _set_resource_arn(self, resource_type: str, arn: Optional[str]) -> None:
+        if arn:
+            self.resource_arns[resource_type] = arn
 
     def setup_endpoint(
         self,
-        boto_session: Session,
+        clients: BotoClientRegistry,
         security_input_group_id: int,
         tags: Optional[dict[str, str]] = None,
         stream_type: InputTypeType = "RTMP_PUSH",
@@ -25,15 +81,22 @@ class AWSStream(BaseStream):
         """Set up and return a livestream endpoint for the stream."""
         if tags is None:
             tags = {}
-        medialive: MediaLiveClient = boto_session.client("medialive")
-        medialive_input = medialive.create_input(
-            Destinations=[{"StreamName": self.name}],
-            InputSecurityGroups=[str(security_input_group_id)],
-            Name=self.name,
-            Type=stream_type,
-            Tags=tags,
+        medialive: MediaLiveClient = clients.client("medialive")
+        # the request id makes retrying the call safe, as medialive will not create a second input for it
+        request_id = str(uuid4())
+        medialive_input = clients.call(
+            "medialive.create_input",
+            lambda: medialive.create_input(
+                Destinations=[{"StreamName": self.name}],
+                InputSecurityGroups=[str(security_input_group_id)],
+                Name=self.name,
+                RequestId=request_id,
+                Type=stream_type,
+                Tags=tags,
+            ),
+            idempotent=True,
         )
-        logger.info(f"MEDIALIVE RESPONSE:\n\n{medialive_input}\n\n")
+        log_response("medialive.create_input", medialive_input)
         response_metadata = medialive_input["ResponseMetadata"]
         if (
             response_metadata["HTTPStatusCode"] not in range(200, 300)
@@ -49,29 +112,199 @@ class AWSStream(BaseStream):
             )
         endpoint = destinations[0].get("Url")
         if not endpoint:
-            logger.error(medialive_input)
+            log_response("medialive.create_input", medialive_input, logging.ERROR)
             raise SendLiveError(
                 f"Failed to create input for stream {self.name}: no endpoint URL returned"
             )
+        self.input_id = medialive_input["Input"].get("Id")
         self.endpoint = endpoint
+        self._set_resource_arn(MEDIALIVE_INPUT, medialive_input["Input"].get("Arn"))
         return endpoint
 
+    def setup_mediapackage_channel(
+        self,
+        clients: BotoClientRegistry,
+        channel_group_name: str,
+        tags: Optional[dict[str, str]] = None,
+    ) -> str:
+        """Create the mediapackagev2 channel the stream's medialive channel pushes to, returning its arn."""
+        mediapackagev2: mediapackagev2Client = clients.client("mediapackagev2")
+        client_token = str(uuid4())
+        mediapackagev2_channel = clients.call(
+            "mediapackagev2.create_channel",
+            lambda: mediapackagev2.create_channel(
+                ChannelGroupName=channel_group_name,
+                ChannelName=self.name,
+                ClientToken=client_token,
+                Tags=tags or {},
+            ),
+            idempotent=True,
+        )
+        log_response("mediapackagev2.create_channel", mediapackagev2_channel)
+        if (
+            mediapackagev2_channel["ResponseMetadata"]["HTTPStatusCode"]
+            != HTTPStatus.OK
+        ):
+            raise SendLiveError(
+                f"Failed to create mediapackagev2 channel for stream {self.name}: {mediapackagev2_channel['ResponseMetadata']}"
+            )
+        self.mediapackage_channel_group_name = channel_group_name
+        self._set_resource_arn(MEDIAPACKAGEV2_CHANNEL, mediapackagev2_channel["Arn"])
+        return mediapackagev2_channel["Arn"]
+
+    def setup_origin_endpoint(
+        self,
+        clients: BotoClientRegistry,
+        tags: Optional[dict[str, str]] = None,
+        encoding_profile: Optional[EncodingProfile] = None,
+    ) -> str:
+        """Create an HLS origin endpoint for the stream's mediapackagev2 channel, returning its manifest url.
+
+        Its segments, their container and its playlist window are those of encoding_profile, or the default profile.
+        """
+        if self.mediapackage_channel_group_name is None:
+            raise SendLiveError(
+                f"Stream {self.name} has no mediapackagev2 channel to create an origin endpoint for."
+            )
+        channel_group_name = self.mediapackage_channel_group_name
+        mediapackagev2: mediapackagev2Client = clients.client("mediapackagev2")
+        client_token = str(uuid4())
+        hls_params: dict[str, Any] = build_origin_endpoint_hls_params_from_defaults(
+            encoding_profile=encoding_profile
+        )
+        origin_endpoint = clients.call(
+            "mediapackagev2.create_origin_endpoint",
+            lambda: mediapackagev2.create_origin_endpoint(
+                ChannelGroupName=channel_group_name,
+                ChannelName=self.name,
+                OriginEndpointName=self.name,
+                ClientToken=client_token,
+                Tags=tags or {},
+                **hls_params,
+            ),
+            idempotent=True,
+        )
+        log_response("mediapackagev2.create_origin_endpoint", origin_endpoint)
+        manifests = origin_endpoint.get("HlsManifests") or origin_endpoint.get(
+            "LowLatencyHlsManifests", []
+        )
+        if not manifests:
+            raise SendLiveError(
+                f"Failed to create origin endpoint for stream {self.name}: no HLS manifest returned"
+            )
+        self.url = manifests[0]["Url"]
+        self._set_resource_arn(MEDIAPACKAGEV2_ORIGIN_ENDPOINT, origin_endpoint["Arn"])
+        return self.url
+
+    def setup_channel(  # noqa: PLR0913
+        self,
+        clients: BotoClientRegistry,
+        role_arn: Optional[str] = None,
+        tags: Optional[dict[str, str]] = None,
+        encoding_profile: Optional[EncodingProfile] = None,
+        encoder_settings_overrides: Optional[dict[str, Any]] = None,
+    ) -> str:
+        """Create the medialive channel encoding the stream's input, waiting until it is ready to start.
+
+        The input is encoded to encoding_profile, or the default profile, with encoder_settings_overrides merged into
+        the compiled encoder settings. Requires the input and mediapackagev2 channel to have been set up. Returns the
+        id of the channel.
+        """
+        if self.input_id is None or self.mediapackage_channel_group_name is None:
+            raise SendLiveError(
+                f"Stream {self.name} needs an input and mediapackagev2 channel before a channel can be created."
+            )
+        medialive: MediaLiveClient = clients.client("medialive")
+        params = build_medialive_channel_params_from_defaults(
+            name=self.name,
+            input_id=self.input_id,
+            channel_group_name=self.mediapackage_channel_group_name,
+            channel_name=self.name,
+            role_arn=role_arn,
+            tags=tags,
+            encoding_profile=encoding_profile,
+            encoder_settings_overrides=encoder_settings_overrides,
+        )
+        request_id = str(uuid4())
+        channel = clients.call(
+            "medialive.create_channel",
+            lambda: medialive.create_channel(RequestId=request_id, **params),
+            idempotent=True,
+        )
+        log_response("medialive.create_channel", channel)
+        channel_id = channel.get("Channel", {}).get("Id")
+        if not channel_id:
+            raise SendLiveError(
+                f"Failed to create channel for stream {self.name}: no channel id returned"
+            )
+        self.channel_id = channel_id
+        self._set_resource_arn(MEDIALIVE_CHANNEL, channel["Channel"].get("Arn"))
+        self._wait("channel_created", clients)
+        return channel_id
+
+    def _wait(
+        self, waiter_name: str, clients: Optional[BotoClientRegistry] = None
+    ) -> None:
+        """Wait on a medialive channel waiter, such as channel_running, translating waiter errors."""
+        (clients or self.clients).wait(
+            "medialive",
+            waiter_name,
+            f"stream {self.name}",
+            self._waiter_delay,
+            ChannelId=self.channel_id,
+        )
+
+    def describe_channel(self) -> DescribeChannelResponseTypeDef:
+        """Return the medialive description of the stream's channel."""
+        if self.channel_id is None:
+            raise SendLiveError(f"Stream {self.name} has no channel.")
+        channel_id = self.channel_id
+        medialive: MediaLiveClient = self.clients.client("medialive")
+        channel: DescribeChannelResponseTypeDef = self.clients.call(
+            "medialive.describe_channel",
+            lambda: medialive.describe_channel(ChannelId=channel_id),
+        )
+        return channel
+
     @override
     def start(self) -> None:
-        pass
+        """Start the stream's channel, returning once it is running."""
+        if self.channel_id is None:
+            raise SendLiveError(f"Stream {self.name} has no channel to start.")
+        channel_id = self.channel_id
+        medialive: MediaLiveClient = self.clients.client("medialive")
+        response = self.clients.call(
+            "medialive.start_channel",
+            lambda: medialive.start_channel(ChannelId=channel_id),
+        )
+        log_response("medialive.start_channel", response)
+        self._wait("channel_running")
 
     @override
     def stop(self) -> None:
-        pass
+        """Stop the stream's channel, returning once it has stopped."""
+        if self.channel_id is None:
+            raise SendLiveError(f"Stream {self.name} has no channel to stop.")
+        channel_id = self.channel_id
+        medialive: MediaLiveClient = self.clients.client("medialive")
+        response = self.clients.call(
+            "medialive.stop_channel",
+            lambda: medialive.stop_channel(ChannelId=channel_id),
+        )
+        log_response("medialive.stop_channel", response)
+        self._wait("channel_stopped")
 
     @override
-    def is_alive(self) -> None:
-        pass
+    def is_alive(self) -> bool:
+        """Return whether the stream's channel is running."""
+        if self.channel_id is None:
+            return False
+        return self.describe_channel().get("State") == "RUNNING"
 
     @override
-    def get_url(self) -> None:
-        pass
+    def get_url(self) -> StreamURLs:
+        return StreamURLs(input=self.endpoint, playback=self.url)
 
     @override
-    def get_name(self) -> None:
-        pass
+    def get_name(self) -> str:
+        return self.name
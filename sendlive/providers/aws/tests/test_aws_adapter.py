@@ -1,31 +1,19 @@
-import os
 from collections.abc import Generator
-from typing import Any
+from typing import Any, Optional
+from unittest import mock
 
 import boto3
 import pytest
+from botocore.exceptions import ClientError
+from botocore.stub import Stubber
 from moto import mock_medialive
 from mypy_boto3_medialive import MediaLiveClient
+from mypy_boto3_medialive.type_defs import InputWhitelistRuleCidrTypeDef
 
-from sendlive.constants import AWSCredentials
+from sendlive.constants import DEFAULT_TAGS, AWSCredentials, AWSOptions, RetryPolicy
+from sendlive.exceptions import SendLiveError
 from sendlive.providers.aws.adapter import AWSAdapter
-
-
-@pytest.fixture(scope="function")
-def aws_credentials() -> None:
-    os.environ["AWS_ACCESS_KEY_ID"] = "testing"
-    os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
-    os.environ["AWS_SECURITY_TOKEN"] = "testing"
-    os.environ["AWS_SESSION_TOKEN"] = "testing"
-    os.environ["AWS_DEFAULT_REGION"] = "ap-southeast-2"
-
-
-@pytest.fixture(scope="function")
-def sendlive_aws_credentials() -> AWSCredentials:
-    sl_aws_credentials = AWSCredentials(
-        access_key="testing", secret_key="testing", region="ap-southeast-2"
-    )
-    return sl_aws_credentials
+from sendlive.stream import StreamURLs
 
 
 @pytest.fixture(scope="function")
@@ -71,3 +59,456 @@ def sendlive_aws_adapter_with_boto_session(
 #     )
 #     assert stream
 #     assert stream.endpoint
+
+
+def _input_security_group(
+    group_id: str, cidr: str = "0.0.0.0/0", tags: Optional[dict[str, str]] = None
+) -> dict[str, Any]:
+    return {
+        "Arn": f"arn:aws:medialive:ap-southeast-2:123456789012:inputSecurityGroup:{group_id}",
+        "Id": group_id,
+        "State": "IDLE",
+        "Tags": {"Created By": "sendlive"} if tags is None else tags,
+        "WhitelistRules": [{"Cidr": cidr}],
+    }
+
+
+def test_aws_adapter_reuses_existing_input_security_group(
+    sendlive_aws_adapter: AWSAdapter,
+) -> None:
+    """Test an existing sendlive tagged input security group with matching rules is found, cached and reused."""
+    with Stubber(sendlive_aws_adapter.medialive) as stubber:
+        stubber.add_response(
+            "list_input_security_groups",
+            {
+                "InputSecurityGroups": [
+                    _input_security_group("1", tags={}),
+                    _input_security_group("2", cidr="10.0.0.0/8"),
+                ],
+                "NextToken": "next",
+            },
+        )
+        stubber.add_response(
+            "list_input_security_groups",
+            {"InputSecurityGroups": [_input_security_group("3")]},
+            {"NextToken": "next"},
+        )
+        assert sendlive_aws_adapter.resolve_input_security_group_id() == 3
+        # Later lookups are served from the cache without any further api calls.
+        assert sendlive_aws_adapter.resolve_input_security_group_id() == 3
+        stubber.assert_no_pending_responses()
+
+
+def test_aws_adapter_creates_input_security_group_if_none_exist(
+    sendlive_aws_adapter: AWSAdapter,
+) -> None:
+    """Test an input security group is created once when no matching group exists."""
+    with Stubber(sendlive_aws_adapter.medialive) as stubber:
+        stubber.add_response("list_input_security_groups", {"InputSecurityGroups": []})
+        stubber.add_response(
+            "create_input_security_group",
+            {
+                "SecurityGroup": _input_security_group("4"),
+                "ResponseMetadata": {"HTTPStatusCode": 201},
+            },
+        )
+        assert sendlive_aws_adapter.resolve_input_security_group_id() == 4
+        assert sendlive_aws_adapter.resolve_input_security_group_id() == 4
+        stubber.assert_no_pending_responses()
+
+
+def test_aws_adapter_caches_input_security_groups_by_cidrs(
+    sendlive_aws_adapter: AWSAdapter,
+) -> None:
+    """Test a cached input security group is only reused for the same whitelisted cidrs."""
+    with Stubber(sendlive_aws_adapter.medialive) as stubber:
+        stubber.add_response(
+            "list_input_security_groups",
+            {"InputSecurityGroups": [_input_security_group("1")]},
+        )
+        stubber.add_response(
+            "list_input_security_groups",
+            {"InputSecurityGroups": [_input_security_group("2", cidr="10.0.0.0/8")]},
+        )
+        assert sendlive_aws_adapter.get_or_create_input_security_group()["Id"] == "1"
+        private: list[InputWhitelistRuleCidrTypeDef] = [{"Cidr": "10.0.0.0/8"}]
+        for _ in range(2):
+            assert (
+                sendlive_aws_adapter.get_or_create_input_security_group(
+                    whitelist_rules=private
+                )["Id"]
+                == "2"
+            )
+        assert sendlive_aws_adapter.get_or_create_input_security_group()["Id"] == "1"
+        stubber.assert_no_pending_responses()
+
+
+@mock_medialive
+def test_aws_adapter_list_streams(
+    aws_credentials: None, sendlive_aws_credentials: AWSCredentials
+) -> None:
+    """Test only sendlive tagged inputs and channels are listed, and results are cached."""
+    adapter = AWSAdapter(
+        credentials=sendlive_aws_credentials,
+        provider_options=AWSOptions(
+            medialive_input_security_group_id=None, list_streams_cache_ttl=60
+        ),
+    )
+    client = adapter.medialive
+    client.create_input(Name="sendlive-stream", Type="RTMP_PUSH", Tags=DEFAULT_TAGS)
+    client.create_input(Name="other-stream", Type="RTMP_PUSH")
+    client.create_channel(Name="sendlive-channel", Tags=DEFAULT_TAGS)
+    assert adapter.list_streams() == ["sendlive-stream", "sendlive-channel"]
+    client.create_input(Name="later-stream", Type="RTMP_PUSH", Tags=DEFAULT_TAGS)
+    assert "later-stream" not in adapter.list_streams()
+    adapter.list_streams_cache.invalidate()
+    assert "later-stream" in adapter.list_streams()
+
+
+def test_aws_adapter_retries_throttled_calls(
+    sendlive_aws_credentials: AWSCredentials,
+) -> None:
+    """Test a throttled medialive call is retried, rather than surfacing the raw SDK error."""
+    adapter = AWSAdapter(
+        credentials=sendlive_aws_credentials,
+        provider_options=AWSOptions(
+            medialive_input_security_group_id=None,
+            retry_policy=RetryPolicy(initial_backoff=0),
+        ),
+    )
+    with Stubber(adapter.medialive) as stubber:
+        stubber.add_client_error(
+            "create_input_security_group",
+            service_error_code="TooManyRequestsException",
+            http_status_code=429,
+        )
+        stubber.add_response(
+            "create_input_security_group",
+            {
+                "SecurityGroup": _input_security_group("5"),
+                "ResponseMetadata": {"HTTPStatusCode": 201},
+            },
+        )
+        assert adapter.create_input_security_group()["Id"] == "5"
+        stubber.assert_no_pending_responses()
+
+
+CHANNEL_GROUP_ARN = (
+    "arn:aws:mediapackagev2:ap-southeast-2:123456789012:channelGroup/sendlive"
+)
+MANIFEST_URL = "https://abc.egress.mediapackagev2.ap-southeast-2.amazonaws.com/out/v1/sendlive/my-stream/my-stream/index.m3u8"
+
+
+@pytest.fixture(scope="function")
+def stream_aws_options() -> AWSOptions:
+    return AWSOptions(
+        medialive_input_security_group_id=1234,
+        medialive_role_arn="arn:aws:iam::123456789012:role/MediaLiveAccessRole",
+        medialive_waiter_delay=0,
+    )
+
+
+def _add_create_stream_responses(
+    medialive: Stubber, mediapackagev2: Stubber, manifests_key: str = "HlsManifests"
+) -> None:
+    """Stub the responses to every call made creating and starting a stream named my-stream."""
+    medialive.add_response(
+        "create_input",
+        {
+            "Input": {
+                "Id": "input-1",
+                "Arn": "arn:aws:medialive:ap-southeast-2:123456789012:input:input-1",
+                "Destinations": [{"Url": "rtmp://1.2.3.4:1935/my-stream"}],
+            },
+            "ResponseMetadata": {"HTTPStatusCode": 201},
+        },
+    )
+    medialive.add_response(
+        "create_channel",
+        {
+            "Channel": {
+                "Id": "channel-1",
+                "Arn": "arn:aws:medialive:ap-southeast-2:123456789012:channel:channel-1",
+            }
+        },
+    )
+    medialive.add_response(
+        "describe_channel", {"State": "IDLE"}, {"ChannelId": "channel-1"}
+    )
+    medialive.add_response("start_channel", {}, {"ChannelId": "channel-1"})
+    medialive.add_response(
+        "describe_channel", {"State": "RUNNING"}, {"ChannelId": "channel-1"}
+    )
+    mediapackagev2.add_client_error(
+        "create_channel_group", service_error_code="ConflictException"
+    )
+    mediapackagev2.add_response(
+        "get_channel_group",
+        {
+            "ChannelGroupName": "sendlive",
+            "Arn": CHANNEL_GROUP_ARN,
+            "EgressDomain": "abc.egress.mediapackagev2.ap-southeast-2.amazonaws.com",
+            "CreatedAt": "2024-01-01",
+            "ModifiedAt": "2024-01-01",
+        },
+    )
+    mediapackagev2.add_response(
+        "create_channel",
+        {
+            "Arn": f"{CHANNEL_GROUP_ARN}/channel/my-stream",
+            "ChannelName": "my-stream",
+            "ChannelGroupName": "sendlive",
+            "CreatedAt": "2024-01-01",
+            "ModifiedAt": "2024-01-01",
+            "ResponseMetadata": {"HTTPStatusCode": 200},
+        },
+    )
+    mediapackagev2.add_response(
+        "create_origin_endpoint",
+        {
+            "Arn": f"{CHANNEL_GROUP_ARN}/channel/my-stream/originEndpoint/my-stream",
+            "ChannelGroupName": "sendlive",
+            "ChannelName": "my-stream",
+            "OriginEndpointName": "my-stream",
+            "ContainerType": "TS",
+            "Segment": {},
+            "CreatedAt": "2024-01-01",
+            "ModifiedAt": "2024-01-01",
+            manifests_key: [{"ManifestName": "index", "Url": MANIFEST_URL}],
+        },
+    )
+
+
+def test_aws_adapter_create_stream_sets_up_and_starts_every_resource(
+    sendlive_aws_credentials: AWSCredentials, stream_aws_options: AWSOptions
+) -> None:
+    """Test creating a stream creates its input, mediapackagev2 channel and endpoint and medialive channel, then starts it."""
+    adapter = AWSAdapter(
+        credentials=sendlive_aws_credentials, provider_options=stream_aws_options
+    )
+    with Stubber(adapter.medialive) as medialive, Stubber(
+        adapter.mediapackagev2
+    ) as mediapackagev2:
+        _add_create_stream_responses(medialive, mediapackagev2)
+        stream = adapter.create_stream("my-stream", start=True)
+        medialive.assert_no_pending_responses()
+        mediapackagev2.assert_no_pending_responses()
+    assert stream.channel_id == "channel-1"
+    assert stream.get_url() == StreamURLs(
+        input="rtmp://1.2.3.4:1935/my-stream", playback=MANIFEST_URL
+    )
+    assert [group.name for group in adapter.mediapackage_channel_groups] == ["sendlive"]
+
+
+def test_aws_adapter_create_low_latency_stream(
+    sendlive_aws_credentials: AWSCredentials, stream_aws_options: AWSOptions
+) -> None:
+    """Test a low latency stream is packaged in short CMAF segments and served as low latency HLS."""
+    adapter = AWSAdapter(
+        credentials=sendlive_aws_credentials, provider_options=stream_aws_options
+    )
+    with Stubber(adapter.medialive) as medialive, Stubber(
+        adapter.mediapackagev2
+    ) as mediapackagev2:
+        _add_create_stream_responses(
+            medialive, mediapackagev2, manifests_key="LowLatencyHlsManifests"
+        )
+        with mock.patch.object(
+            adapter.mediapackagev2,
+            "create_origin_endpoint",
+            wraps=adapter.mediapackagev2.create_origin_endpoint,
+        ) as create_origin_endpoint:
+            stream = adapter.create_stream("my-stream", start=True, latency_mode="low")
+    origin_endpoint = create_origin_endpoint.call_args.kwargs
+    assert origin_endpoint["ContainerType"] == "CMAF"
+    assert origin_endpoint["Segment"]["SegmentDurationSeconds"] == 1
+    assert "LowLatencyHlsManifests" in origin_endpoint
+    assert stream.url == MANIFEST_URL
+    # the stream is reused from the local state only with the latency mode it was created with
+    assert adapter.create_stream("my-stream", latency_mode="low").url == MANIFEST_URL
+    with pytest.raises(SendLiveError):
+        adapter.create_stream("my-stream")
+
+
+def test_aws_adapter_reuses_resources_recorded_in_state(
+    sendlive_aws_credentials: AWSCredentials, stream_aws_options: AWSOptions
+) -> None:
+    """Test a restarted adapter looks up a created stream and channel group from the local state, without api calls."""
+    adapter = AWSAdapter(
+        credentials=sendlive_aws_credentials, provider_options=stream_aws_options
+    )
+    with Stubber(adapter.medialive) as medialive, Stubber(
+        adapter.mediapackagev2
+    ) as mediapackagev2:
+        _add_create_stream_responses(medialive, mediapackagev2)
+        stream = adapter.create_stream("my-stream", start=True)
+    restarted_adapter = AWSAdapter(
+        credentials=sendlive_aws_credentials, provider_options=stream_aws_options
+    )
+    # with nothing stubbed, any api call would fail
+    with Stubber(restarted_adapter.medialive), Stubber(
+        restarted_adapter.mediapackagev2
+    ):
+        recorded_stream = restarted_adapter.create_stream("my-stream")
+        channel_group = restarted_adapter.get_or_create_mediapackagev2_channel_group(
+            "sendlive"
+        )
+    assert recorded_stream.model_dump() == stream.model_dump()
+    assert set(recorded_stream.resource_arns) == {
+        "medialive.input",
+        "medialive.channel",
+        "mediapackagev2.channel",
+        "mediapackagev2.origin_endpoint",
+    }
+    assert channel_group.arn == CHANNEL_GROUP_ARN
+    assert restarted_adapter.get_stream("other-stream") is None
+    with pytest.raises(SendLiveError):
+        restarted_adapter.create_stream("my-stream", latency_mode="low")
+
+
+def test_aws_adapter_state_is_scoped_to_account(
+    sendlive_aws_credentials: AWSCredentials, stream_aws_options: AWSOptions
+) -> None:
+    """Test a stream recorded in one account is not found by an adapter using another account in the same region."""
+    adapter = AWSAdapter(
+        credentials=sendlive_aws_credentials, provider_options=stream_aws_options
+    )
+    # the account is looked up with sts, which the test session answers for the default moto account
+    assert adapter.state_account == "123456789012"
+    with Stubber(adapter.medialive) as medialive, Stubber(
+        adapter.mediapackagev2
+    ) as mediapackagev2:
+        _add_create_stream_responses(medialive, mediapackagev2)
+        adapter.create_stream("my-stream", start=True)
+    other_account_adapter = AWSAdapter(
+        credentials=AWSCredentials(
+            access_key="other", secret_key="other", region="ap-southeast-2"
+        ),
+        provider_options=stream_aws_options.model_copy(
+            update={"account_id": "210987654321"}
+        ),
+    )
+    assert other_account_adapter.get_stream("my-stream") is None
+    assert adapter.get_stream("my-stream") is not None
+
+
+def test_aws_adapter_create_mediapackagev2_channel_in_named_group(
+    sendlive_aws_credentials: AWSCredentials,
+) -> None:
+    """Test a channel created in a named channel group is added to that group, which is resolved by name."""
+    adapter = AWSAdapter(credentials=sendlive_aws_credentials)
+    with Stubber(adapter.mediapackagev2) as mediapackagev2:
+        mediapackagev2.add_response(
+            "create_channel_group",
+            {
+                "ChannelGroupName": "sendlive",
+                "Arn": CHANNEL_GROUP_ARN,
+                "EgressDomain": "abc.egress.mediapackagev2.ap-southeast-2.amazonaws.com",
+                "CreatedAt": "2024-01-01",
+                "ModifiedAt": "2024-01-01",
+            },
+        )
+        for _ in range(2):
+            mediapackagev2.add_response(
+                "create_channel",
+                {
+                    "Arn": f"{CHANNEL_GROUP_ARN}/channel/my-stream",
+                    "ChannelName": "my-stream",
+                    "ChannelGroupName": "sendlive",
+                    "CreatedAt": "2024-01-01",
+                    "ModifiedAt": "2024-01-01",
+                    "ResponseMetadata": {"HTTPStatusCode": 200},
+                },
+            )
+        adapter.create_mediapackagev2_channel("sendlive", "my-stream")
+        adapter.create_mediapackagev2_channel(None, "my-stream")
+        mediapackagev2.assert_no_pending_responses()
+    channel_group = adapter.mediapackage_channel_groups.get("sendlive")
+    assert channel_group is not None
+    assert list(channel_group.channels) == ["my-stream"]
+
+
+def test_aws_adapter_create_stream_raises_step_errors(
+    sendlive_aws_credentials: AWSCredentials,
+) -> None:
+    """Test a failure to create a resource is raised, and resources depending on it are not created."""
+    adapter = AWSAdapter(
+        credentials=sendlive_aws_credentials,
+        provider_options=AWSOptions(medialive_input_security_group_id=1234),
+    )
+    with Stubber(adapter.medialive) as medialive, Stubber(
+        adapter.mediapackagev2
+    ) as mediapackagev2:
+        medialive.add_client_error(
+            "create_input", service_error_code="BadRequestException"
+        )
+        mediapackagev2.add_client_error(
+            "create_channel_group", service_error_code="ValidationException"
+        )
+        with pytest.raises(ClientError):
+            adapter.create_stream("my-stream")
+        # no medialive channel was created for the stream
+        medialive.assert_no_pending_responses()
+
+
+@mock_medialive
+def test_aws_adapter_collect_garbage(
+    aws_credentials: None, sendlive_aws_credentials: AWSCredentials
+) -> None:
+    """Test orphaned medialive channels and inputs are deleted, while running, unknown and untagged streams are not."""
+    adapter = AWSAdapter(
+        credentials=sendlive_aws_credentials,
+        provider_options=AWSOptions(
+            medialive_input_security_group_id=None, medialive_waiter_delay=0
+        ),
+    )
+    client = adapter.medialive
+    orphan_input = client.create_input(
+        Name="orphan-stream", Type="RTMP_PUSH", Tags=DEFAULT_TAGS
+    )["Input"]
+    orphan_channel = client.create_channel(Name="orphan-stream", Tags=DEFAULT_TAGS)[
+        "Channel"
+    ]
+    client.create_input(Name="live-stream", Type="RTMP_PUSH", Tags=DEFAULT_TAGS)
+    live_channel = client.create_channel(Name="live-stream", Tags=DEFAULT_TAGS)[
+        "Channel"
+    ]
+    # moto moves channels out of the creating state, which is live, once described
+    client.describe_channel(ChannelId=orphan_channel["Id"])
+    client.describe_channel(ChannelId=live_channel["Id"])
+    client.start_channel(ChannelId=live_channel["Id"])
+    client.create_input(Name="kept-stream", Type="RTMP_PUSH", Tags=DEFAULT_TAGS)
+    client.create_input(Name="other-stream", Type="RTMP_PUSH")
+    # the orphan failed part way through being created, having only recorded its input, while the rest are unknown
+    adapter.record_resource(
+        "medialive.input",
+        orphan_input["Arn"],
+        name="orphan-stream",
+        stream_name="orphan-stream",
+    )
+    client.create_input(Name="unknown-stream", Type="RTMP_PUSH", Tags=DEFAULT_TAGS)
+    # moto supports neither listing input security groups nor mediapackagev2
+    with mock.patch.object(
+        AWSAdapter, "list_gc_input_security_groups", return_value=[]
+    ), mock.patch.object(
+        AWSAdapter, "list_gc_mediapackagev2_channels", return_value=[]
+    ), mock.patch.object(
+        AWSAdapter, "list_gc_mediapackagev2_origin_endpoints", return_value=[]
+    ):
+        dry_run = adapter.collect_garbage(keep=["kept-stream"], dry_run=True)
+        result = adapter.collect_garbage(keep=["kept-stream"])
+    assert [resource.name for resource in dry_run.orphans] == [
+        "orphan-stream",
+        "orphan-stream",
+    ]
+    assert [resource.resource_id for resource in result.deleted] == [
+        orphan_channel["Arn"],
+        orphan_input["Arn"],
+    ]
+    assert not result.failed
+    assert [channel.name for channel in adapter.list_gc_medialive_channels()] == [
+        "live-stream"
+    ]
+    assert [
+        medialive_input.name for medialive_input in adapter.list_gc_medialive_inputs()
+    ] == ["live-stream", "kept-stream", "unknown-stream"]
@@ -0,0 +1,131 @@
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from boto3.session import Session
+from botocore.exceptions import ClientError
+from botocore.stub import Stubber
+
+from sendlive.constants import AWSCredentials, AWSOptions, RetryPolicy
+from sendlive.instrumentation import InMemoryInstrumentation, set_instrumentation
+from sendlive.providers.aws.adapter import AWSAdapter
+from sendlive.providers.aws.clients import BotoClientRegistry
+
+
+@pytest.fixture(scope="function")
+def boto_session() -> Session:
+    return Session(
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        region_name="ap-southeast-2",
+    )
+
+
+def test_registry_reuses_clients(boto_session: Session) -> None:
+    """Test the registry only builds one client per service and region."""
+    registry = BotoClientRegistry(boto_session)
+    assert registry.client("medialive") is registry.client("medialive")
+    assert registry.client("medialive") is registry.client(
+        "medialive", region_name="ap-southeast-2"
+    )
+    assert len(registry) == 1
+
+
+def test_registry_keys_clients_by_region(boto_session: Session) -> None:
+    """Test clients for different regions are built separately."""
+    registry = BotoClientRegistry(boto_session)
+    default_region_client = registry.client("medialive")
+    other_region_client = registry.client("medialive", region_name="us-east-1")
+    assert default_region_client is not other_region_client
+    assert other_region_client.meta.region_name == "us-east-1"
+
+
+def test_registry_applies_max_pool_connections(boto_session: Session) -> None:
+    """Test the configured connection pool size is passed through to built clients."""
+    registry = BotoClientRegistry(boto_session, max_pool_connections=50)
+    assert registry.client("medialive").meta.config.max_pool_connections == 50
+
+
+def test_registry_is_thread_safe(boto_session: Session) -> None:
+    """Test concurrent access from worker threads results in a single shared client."""
+    registry = BotoClientRegistry(boto_session)
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        clients = list(executor.map(lambda _: registry.client("medialive"), range(64)))
+    assert len({id(client) for client in clients}) == 1
+
+
+def test_registry_close_clears_clients(boto_session: Session) -> None:
+    """Test closing the registry drops built clients, so new ones are built on next use."""
+    registry = BotoClientRegistry(boto_session)
+    client = registry.client("medialive")
+    registry.close()
+    assert len(registry) == 0
+    assert registry.client("medialive") is not client
+
+
+def test_adapter_clients_are_reused(sendlive_aws_credentials: AWSCredentials) -> None:
+    """Test the adapter client properties return the same client on every access."""
+    adapter = AWSAdapter(
+        credentials=sendlive_aws_credentials,
+        provider_options=AWSOptions(
+            medialive_input_security_group_id=None, max_pool_connections=25
+        ),
+    )
+    assert adapter.medialive is adapter.medialive
+    assert adapter.mediapackagev2 is adapter.mediapackagev2
+    # Config sets its options as attributes dynamically, so they aren't typed
+    config = adapter.medialive.meta.config
+    assert getattr(config, "max_pool_connections") == 25  # noqa: B009
+
+
+@pytest.fixture(scope="function")
+def instrumentation() -> Iterator[InMemoryInstrumentation]:
+    collector = InMemoryInstrumentation()
+    set_instrumentation(collector)
+    yield collector
+    set_instrumentation(None)
+
+
+def test_registry_clients_report_api_calls(
+    boto_session: Session, instrumentation: InMemoryInstrumentation
+) -> None:
+    """Test calls made by registry clients are reported, including the error code of failed calls."""
+    medialive = BotoClientRegistry(boto_session).client("medialive")
+    with Stubber(medialive) as stubber:
+        stubber.add_response(
+            "list_input_security_groups",
+            {"InputSecurityGroups": [], "ResponseMetadata": {"RetryAttempts": 2}},
+        )
+        stubber.add_client_error(
+            "create_input", service_error_code="TooManyRequestsException"
+        )
+        medialive.list_input_security_groups()
+        with pytest.raises(ClientError):
+            medialive.create_input(Name="stream")
+    listed, created = instrumentation.calls(provider="aws")
+    assert listed.operation == "medialive.list_input_security_groups"
+    assert listed.retries == 2
+    assert listed.error is None
+    assert created.operation == "medialive.create_input"
+    assert created.error == "TooManyRequestsException"
+
+
+def test_registry_call_reports_retries(
+    boto_session: Session, instrumentation: InMemoryInstrumentation
+) -> None:
+    """Test a call retried after being throttled reports the retry with the attempt that succeeded."""
+    registry = BotoClientRegistry(
+        boto_session, retry_policy=RetryPolicy(initial_backoff=0, max_backoff=0)
+    )
+    medialive = registry.client("medialive")
+    with Stubber(medialive) as stubber:
+        stubber.add_client_error(
+            "list_inputs", service_error_code="TooManyRequestsException"
+        )
+        stubber.add_response("list_inputs", {"Inputs": []})
+        registry.call("medialive.list_inputs", medialive.list_inputs)
+    throttled, listed = instrumentation.calls(provider="aws")
+    assert throttled.error == "TooManyRequestsException"
+    assert throttled.retries == 0
+    assert listed.error is None
+    assert listed.retries == 1
@@ -1,6 +1,6 @@
-import os
 from collections.abc import Generator
 from typing import Any
+from unittest import mock
 
 import boto3
 import pytest
@@ -8,23 +8,9 @@ from moto import mock_medialive
 from mypy_boto3_medialive import MediaLiveClient
 
 from sendlive.constants import AWSCredentials
-
-
-@pytest.fixture(scope="function")
-def aws_credentials() -> None:
-    os.environ["AWS_ACCESS_KEY_ID"] = "testing"
-    os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
-    os.environ["AWS_SECURITY_TOKEN"] = "testing"
-    os.environ["AWS_SESSION_TOKEN"] = "testing"
-    os.environ["AWS_DEFAULT_REGION"] = "ap-southeast-2"
-
-
-@pytest.fixture(scope="function")
-def sendlive_aws_credentials() -> AWSCredentials:
-    sl_aws_credentials = AWSCredentials(
-        access_key="testing", secret_key="testing", region="ap-southeast-2"
-    )
-    return sl_aws_credentials
+from sendlive.exceptions import SendLiveError
+from sendlive.providers.aws.adapter import AWSAdapter
+from sendlive.providers.aws.stream import AWSStream
 
 
 @pytest.fixture(scope="function")
@@ -38,3 +24,45 @@ def medialive(aws_credentials: None) -> Generator[MediaLiveClient, Any, None]:
 
 #     s = AWSStream(url="my-url.com", name="my stream", endpoint="my-endpoint.com")
 #     s.setup_endpoint()
+
+
+@pytest.fixture(scope="function")
+def aws_stream(
+    medialive: MediaLiveClient, sendlive_aws_credentials: AWSCredentials
+) -> AWSStream:
+    adapter = AWSAdapter(credentials=sendlive_aws_credentials)
+    channel = medialive.create_channel(Name="my-stream")
+    # moto resolves the channel from CREATING to IDLE on the next describe
+    medialive.describe_channel(ChannelId=channel["Channel"]["Id"])
+    stream = AWSStream(name="my-stream", channel_id=channel["Channel"]["Id"])
+    stream.bind(adapter.clients, waiter_delay=0)
+    return stream
+
+
+def test_aws_stream_start_and_stop(aws_stream: AWSStream) -> None:
+    """Test starting and stopping a stream waits for its channel to be running and stopped."""
+    assert not aws_stream.is_alive()
+    aws_stream.start()
+    assert aws_stream.is_alive()
+    aws_stream.stop()
+    assert not aws_stream.is_alive()
+
+
+def test_aws_stream_waits_for_channel_using_waiters(aws_stream: AWSStream) -> None:
+    """Test starting and stopping a stream waits on the medialive waiters rather than its own polling loop."""
+    client = aws_stream.clients.client("medialive")
+    with mock.patch.object(client, "get_waiter", wraps=client.get_waiter) as get_waiter:
+        aws_stream.start()
+        aws_stream.stop()
+    assert [call.args[0] for call in get_waiter.call_args_list] == [
+        "channel_running",
+        "channel_stopped",
+    ]
+
+
+def test_aws_stream_requires_a_channel() -> None:
+    """Test a stream without a channel is not alive, and cannot be started."""
+    stream = AWSStream(name="my-stream")
+    assert not stream.is_alive()
+    with pytest.raises(SendLiveError):
+        stream.start()
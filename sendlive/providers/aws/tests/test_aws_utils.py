@@ -0,0 +1,141 @@
+from typing import Any
+
+import boto3
+import pytest
+from botocore.validate import validate_parameters
+
+from sendlive.exceptions import SendLiveError
+from sendlive.profiles import EncodingProfile, VideoRendition, to_low_latency
+from sendlive.providers.aws import constants
+from sendlive.providers.aws.constants import AWS_DEFAULT_ENCODING_PROFILE
+from sendlive.providers.aws.utils import (
+    build_medialive_channel_params_from_defaults,
+    build_origin_endpoint_hls_params_from_defaults,
+    compile_medialive_encoder_settings,
+)
+
+
+def _build(**kwargs: Any) -> dict[str, Any]:
+    return build_medialive_channel_params_from_defaults(
+        "my-stream",
+        input_id="input-1",
+        channel_group_name="sendlive",
+        channel_name="my-stream",
+        **kwargs,
+    )
+
+
+def _validate_create_channel(params: dict[str, Any]) -> None:
+    """Validate params against the boto3 model of create_channel, as botocore does before sending a request."""
+    client = boto3.client("medialive", region_name="ap-southeast-2")
+    input_shape = client.meta.service_model.operation_model("CreateChannel").input_shape
+    assert input_shape is not None
+    validate_parameters(params, input_shape)
+
+
+def _validate_create_origin_endpoint(params: dict[str, Any]) -> None:
+    """Validate params against the boto3 model of create_origin_endpoint."""
+    client = boto3.client("mediapackagev2", region_name="ap-southeast-2")
+    input_shape = client.meta.service_model.operation_model(
+        "CreateOriginEndpoint"
+    ).input_shape
+    assert input_shape is not None
+    validate_parameters(
+        {
+            "ChannelGroupName": "sendlive",
+            "ChannelName": "my-stream",
+            "OriginEndpointName": "my-stream",
+            **params,
+        },
+        input_shape,
+    )
+
+
+def test_build_medialive_channel_params_from_default_profile() -> None:
+    """Test channel params compiled from the default profile are valid, with an output per rendition."""
+    params = _build(role_arn="arn:aws:iam::123456789012:role/MediaLive")
+    _validate_create_channel(params)
+    encoder_settings = params["EncoderSettings"]
+    assert [
+        output["OutputName"]
+        for output in encoder_settings["OutputGroups"][0]["Outputs"]
+    ] == [
+        "video_1080p",
+        "video_720p",
+        "video_480p",
+        "video_240p",
+    ]
+    h264 = encoder_settings["VideoDescriptions"][1]["CodecSettings"]["H264Settings"]
+    assert (h264["Bitrate"], h264["FramerateNumerator"], h264["GopSize"]) == (
+        3000000,
+        25,
+        1.92,
+    )
+    assert params["InputAttachments"][0]["InputId"] == "input-1"
+
+
+def test_build_medialive_channel_params_with_overrides() -> None:
+    """Test overrides are merged into the encoder settings, without changing the cached compiled settings."""
+    params = _build(
+        encoder_settings_overrides={
+            "timecodeConfig": {"source": "EMBEDDED"},
+            "globalConfiguration": {"outputTimingSource": "SYSTEM_CLOCK"},
+        }
+    )
+    _validate_create_channel(params)
+    assert params["EncoderSettings"]["TimecodeConfig"] == {"Source": "EMBEDDED"}
+    assert params["EncoderSettings"]["GlobalConfiguration"]["OutputLockingMode"] == (
+        "PIPELINE_LOCKING"
+    )
+    params["EncoderSettings"]["VideoDescriptions"].clear()
+    compiled = compile_medialive_encoder_settings(AWS_DEFAULT_ENCODING_PROFILE)
+    assert compiled["timecodeConfig"] == {"source": "SYSTEMCLOCK"}
+    assert len(_build()["EncoderSettings"]["VideoDescriptions"]) == 4
+
+
+def test_default_medialive_encoder_settings_are_compiled() -> None:
+    """Test the default encoder settings kept for compatibility are a copy of those of the default profile."""
+    settings = constants.DEFAULT_MEDIALIVE_ENCODER_SETTINGS
+    compiled = compile_medialive_encoder_settings(AWS_DEFAULT_ENCODING_PROFILE)
+    assert settings == compiled
+    settings["videoDescriptions"].clear()
+    assert len(compiled["videoDescriptions"]) == 4
+    assert constants.DEFAULT_MEDIALIVE_ENCODER_SETTINGS is settings
+
+
+def test_build_origin_endpoint_hls_params_from_profile() -> None:
+    """Test origin endpoint segments and playlist window follow the profile, which must use whole second segments."""
+    profile = EncodingProfile(
+        video=(VideoRendition(name="720p", width=1280, height=720, bitrate=3000000),),
+        gop_seconds=1,
+        segment_seconds=2,
+        playlist_window_seconds=32.5,
+    )
+    params = build_origin_endpoint_hls_params_from_defaults(encoding_profile=profile)
+    _validate_create_origin_endpoint(params)
+    assert params["ContainerType"] == "TS"
+    assert params["Segment"]["SegmentDurationSeconds"] == 2
+    assert params["HlsManifests"][0]["ManifestWindowSeconds"] == 33
+    with pytest.raises(SendLiveError):
+        build_origin_endpoint_hls_params_from_defaults(
+            encoding_profile=profile.model_copy(update={"segment_seconds": 2.5})
+        )
+
+
+def test_build_low_latency_params() -> None:
+    """Test low latency streams get one second GOPs and CMAF segments, served as low latency HLS."""
+    profile = to_low_latency(AWS_DEFAULT_ENCODING_PROFILE, 1, 30)
+    params = build_origin_endpoint_hls_params_from_defaults(encoding_profile=profile)
+    _validate_create_origin_endpoint(params)
+    assert params["ContainerType"] == "CMAF"
+    assert params["Segment"]["SegmentDurationSeconds"] == 1
+    assert "HlsManifests" not in params
+    assert params["LowLatencyHlsManifests"] == [
+        {"ManifestName": "index", "ManifestWindowSeconds": 30}
+    ]
+    channel_params = _build(encoding_profile=profile)
+    _validate_create_channel(channel_params)
+    assert {
+        description["CodecSettings"]["H264Settings"]["GopSize"]
+        for description in channel_params["EncoderSettings"]["VideoDescriptions"]
+    } == {1}
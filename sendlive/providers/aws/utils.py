@@ -0,0 +1,196 @@
+import math
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Optional
+
+from sendlive.exceptions import SendLiveError
+from sendlive.profiles import EncodingProfile, merge_overrides
+from sendlive.providers.aws.constants import (
+    AWS_DEFAULT_ENCODING_PROFILE,
+    DEFAULT_MEDIALIVE_AAC_SETTINGS,
+    DEFAULT_MEDIALIVE_CHANNEL_PARAMS,
+    DEFAULT_MEDIALIVE_GLOBAL_CONFIGURATION,
+    DEFAULT_MEDIALIVE_H264_SETTINGS,
+    DEFAULT_ORIGIN_ENDPOINT_HLS_PACKAGE,
+    DEFAULT_ORIGIN_ENDPOINT_MANIFEST_NAME,
+    MEDIALIVE_AAC_CODING_MODES,
+    MEDIALIVE_MEDIAPACKAGE_DESTINATION_ID,
+)
+from sendlive.types import MappingTags
+
+
+def to_boto_params(value: Any) -> Any:
+    """Convert the lower camel case keys of a medialive api request, as written in the defaults, to boto3 params."""
+    if isinstance(value, dict):
+        return {
+            key[:1].upper() + key[1:]: to_boto_params(v) for key, v in value.items()
+        }
+    if isinstance(value, list):
+        return [to_boto_params(item) for item in value]
+    return value
+
+
+@lru_cache(maxsize=32)
+def compile_medialive_encoder_settings(profile: EncodingProfile) -> dict[str, Any]:
+    """Compile an encoding profile to medialive encoder settings, pushing each rendition to mediapackage.
+
+    Settings are cached per profile and shared by every caller, so must not be modified.
+    """
+    video_descriptions = []
+    audio_descriptions = []
+    outputs = []
+    for i, rendition in enumerate(profile.video):
+        video_name = f"video_{rendition.name}"
+        audio_name = f"audio_{i}"
+        video_descriptions.append(
+            {
+                "codecSettings": {
+                    "h264Settings": {
+                        **DEFAULT_MEDIALIVE_H264_SETTINGS,
+                        "bitrate": rendition.bitrate,
+                        "maxBitrate": rendition.bitrate,
+                        "framerateNumerator": profile.frame_rate,
+                        "gopSize": profile.gop_seconds,
+                        "profile": profile.h264_profile.upper(),
+                    }
+                },
+                "height": rendition.height,
+                "name": video_name,
+                "respondToAfd": "NONE",
+                "scalingBehavior": "DEFAULT",
+                "sharpness": 50,
+                "width": rendition.width,
+            }
+        )
+        audio_descriptions.append(
+            {
+                "audioSelectorName": "Default",
+                "audioTypeControl": "FOLLOW_INPUT",
+                "codecSettings": {
+                    "aacSettings": {
+                        **DEFAULT_MEDIALIVE_AAC_SETTINGS,
+                        "bitrate": profile.audio.bitrate,
+                        "codingMode": MEDIALIVE_AAC_CODING_MODES[
+                            profile.audio.channels
+                        ],
+                        "sampleRate": profile.audio.sample_rate,
+                    }
+                },
+                "languageCodeControl": "FOLLOW_INPUT",
+                "name": audio_name,
+            }
+        )
+        outputs.append(
+            {
+                "audioDescriptionNames": [audio_name],
+                "outputName": video_name,
+                "outputSettings": {"mediaPackageOutputSettings": {}},
+                "videoDescriptionName": video_name,
+            }
+        )
+    return {
+        "audioDescriptions": audio_descriptions,
+        "globalConfiguration": DEFAULT_MEDIALIVE_GLOBAL_CONFIGURATION,
+        "outputGroups": [
+            {
+                "outputGroupSettings": {
+                    "mediaPackageGroupSettings": {
+                        "destination": {
+                            "destinationRefId": MEDIALIVE_MEDIAPACKAGE_DESTINATION_ID
+                        }
+                    }
+                },
+                "outputs": outputs,
+            }
+        ],
+        "timecodeConfig": {"source": "SYSTEMCLOCK"},
+        "videoDescriptions": video_descriptions,
+    }
+
+
+def build_medialive_channel_params_from_defaults(  # noqa: PLR0913
+    name: str,
+    *,
+    input_id: str,
+    channel_group_name: str,
+    channel_name: str,
+    role_arn: Optional[str] = None,
+    tags: Optional[MappingTags] = None,
+    encoding_profile: Optional[EncodingProfile] = None,
+    encoder_settings_overrides: Optional[Mapping[str, Any]] = None,
+) -> dict[str, Any]:
+    """Build boto3 params for a medialive channel that encodes an input and pushes it to a mediapackagev2 channel.
+
+    The encoder settings are compiled from encoding_profile, or the default profile, and then any overrides, written
+    in the same lower camel case as the defaults, are deep merged into them.
+    """
+    encoder_settings = compile_medialive_encoder_settings(
+        encoding_profile or AWS_DEFAULT_ENCODING_PROFILE
+    )
+    if encoder_settings_overrides:
+        encoder_settings = merge_overrides(encoder_settings, encoder_settings_overrides)
+    (input_attachment,) = DEFAULT_MEDIALIVE_CHANNEL_PARAMS["inputAttachments"]
+    params = {
+        **DEFAULT_MEDIALIVE_CHANNEL_PARAMS,
+        "name": name,
+        "destinations": [
+            {
+                "id": MEDIALIVE_MEDIAPACKAGE_DESTINATION_ID,
+                "mediaPackageSettings": [
+                    {"channelGroup": channel_group_name, "channelName": channel_name}
+                ],
+            }
+        ],
+        "encoderSettings": encoder_settings,
+        "inputAttachments": [
+            {**input_attachment, "inputAttachmentName": name, "inputId": input_id}
+        ],
+    }
+    # converting keys builds new dicts and lists throughout, so the shared defaults are never handed to the caller
+    boto_params: dict[str, Any] = to_boto_params(params)
+    if role_arn:
+        boto_params["RoleArn"] = role_arn
+    # tags are added after converting keys, as their keys are user supplied
+    boto_params["Tags"] = dict(tags or {})
+    return boto_params
+
+
+def build_origin_endpoint_hls_params_from_defaults(
+    manifest_name: str = DEFAULT_ORIGIN_ENDPOINT_MANIFEST_NAME,
+    encoding_profile: Optional[EncodingProfile] = None,
+) -> dict[str, Any]:
+    """Build the boto3 ContainerType, Segment and HLS manifest params of a mediapackagev2 origin endpoint from defaults.
+
+    Segments, their container and the playlist window are those of encoding_profile, or the default profile. Profiles
+    with low_latency_hls set get a LowLatencyHlsManifests manifest rather than an HlsManifests one.
+    """
+    profile = encoding_profile or AWS_DEFAULT_ENCODING_PROFILE
+    if not float(profile.segment_seconds).is_integer():
+        raise SendLiveError(
+            f"mediapackagev2 segments must be a whole number of seconds, not {profile.segment_seconds}"
+        )
+    package = DEFAULT_ORIGIN_ENDPOINT_HLS_PACKAGE
+    manifest: dict[str, Any] = {
+        "ManifestName": manifest_name,
+        "ManifestWindowSeconds": math.ceil(profile.playlist_window_seconds),
+    }
+    # an interval of 0 disables program date time tags, which mediapackagev2 expresses by leaving it unset
+    if package["programDateTimeIntervalSeconds"]:
+        manifest["ProgramDateTimeIntervalSeconds"] = package[
+            "programDateTimeIntervalSeconds"
+        ]
+    segment: dict[str, Any] = {
+        "SegmentDurationSeconds": int(profile.segment_seconds),
+        "IncludeIframeOnlyStreams": package["includeIframeOnlyStream"],
+    }
+    container_type = "CMAF" if profile.container == "cmaf" else "TS"
+    if container_type == "TS":
+        segment["TsUseAudioRenditionGroup"] = package["useAudioRenditionGroup"]
+    manifests_key = (
+        "LowLatencyHlsManifests" if profile.low_latency_hls else "HlsManifests"
+    )
+    return {
+        "ContainerType": container_type,
+        "Segment": segment,
+        manifests_key: [manifest],
+    }
@@ -1,10 +1,30 @@
-from pydantic import ConfigDict
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Optional, Union
+
+from google.cloud.video.live_stream_v1 import Channel
+from google.cloud.video.live_stream_v1 import Input as InputEndpoint
+from pydantic import ConfigDict, PrivateAttr
 from typing_extensions import override
 
 from sendlive.adapter import BaseAdapter
 from sendlive.constants import GCPCredentials
+from sendlive.gc import GCResourceType, SendLiveResource
+from sendlive.graph import Task, run_task_graph
+from sendlive.logger import logger
+from sendlive.profiles import LatencyMode
+from sendlive.providers.gcp.constants import (
+    GCP_STOPPED_STREAMING_STATES,
+    LIVESTREAM_CHANNEL,
+    LIVESTREAM_INPUT,
+)
 from sendlive.providers.gcp.mixins import GCPLiveStreamAPIMixin
 from sendlive.providers.gcp.stream import GCPStream
+from sendlive.providers.gcp.utils import construct_gcp_manifest_url
+
+# the bucket and input are independent of each other, so are set up at the same time
+MAX_STREAM_SETUP_CONCURRENCY = 2
 
 
 class GCPAdapter(GCPLiveStreamAPIMixin, BaseAdapter):
@@ -13,14 +33,206 @@ class GCPAdapter(GCPLiveStreamAPIMixin, BaseAdapter):
     credentials: GCPCredentials
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    _bucket_lock: Lock = PrivateAttr(default_factory=Lock)
+
+    @override
+    def fetch_stream_names(self) -> list[str]:
+        # Stream names are the final segment of the input and channel resource names.
+        resources: list[Union[InputEndpoint, Channel]] = [
+            *self.list_input_endpoints(),
+            *self.list_channels(),
+        ]
+        return list(
+            dict.fromkeys(
+                resource.name.rsplit("/", 1)[-1]
+                for resource in resources
+                if self.is_sendlive_resource(resource.labels)
+            )
+        )
+
+    def _build_stream(
+        self, name: str, input_endpoint: InputEndpoint, channel: Channel
+    ) -> GCPStream:
+        """Build the stream made up of a created input and channel, bound to this adapter."""
+        stream = GCPStream(
+            name=name,
+            endpoint=input_endpoint.uri or None,
+            channel_name=channel.name,
+            url=construct_gcp_manifest_url(channel.output.uri)
+            if channel.output.uri
+            else None,
+        )
+        stream.bind(self)
+        return stream
+
     @override
-    def list_streams(self) -> list[str]:
-        return []
+    def get_stream(self, name: str) -> Optional[GCPStream]:
+        """Return a stream created earlier, rebuilt from the input and channel in the local state without api calls.
+
+        Returns None unless both the stream's input and channel are recorded.
+        """
+        records = self.find_stream_resources(name)
+        if LIVESTREAM_INPUT not in records or LIVESTREAM_CHANNEL not in records:
+            return None
+        input_endpoint = InputEndpoint.from_json(
+            records[LIVESTREAM_INPUT].attributes["resource"], ignore_unknown_fields=True
+        )
+        channel = Channel.from_json(
+            records[LIVESTREAM_CHANNEL].attributes["resource"],
+            ignore_unknown_fields=True,
+        )
+        return self._build_stream(name, input_endpoint, channel)
+
+    @override
+    def create_stream(
+        self,
+        name: str,
+        start: bool = False,
+        *,
+        latency_mode: LatencyMode = "standard",
+    ) -> GCPStream:
+        """Create a stream's input and channel, named after the stream.
+
+        The bucket is set up while the input is being created, then the channel is created once both are ready. If
+        start is True, the channel is then asked to start, without waiting for it to have started.
+
+        With latency_mode="low", the channel is encoded in two second GOPs, packaged in two second fmp4 segments, and
+        its manifest lists the fewest segments gcp allows. GCP does not serve low latency HLS.
+
+        A stream already recorded in the local state is returned from it, rather than created again, as long as it was
+        created with the same latency_mode.
+        """
+        stream = self.get_stream(name)
+        if stream is not None:
+            self.check_recorded_latency_mode(LIVESTREAM_CHANNEL, name, latency_mode)
+            logger.debug("Reusing stream %s recorded in the local state", name)
+            if start:
+                stream.start()
+            return stream
+        tasks = {
+            "bucket": Task(lambda _: self.setup_shared_resources()),
+            "input": Task(lambda _: self.create_input_endpoint(name)),
+            "channel": Task(
+                lambda _: self.create_channel(
+                    name, supplied_channel_id=name, latency_mode=latency_mode
+                ),
+                depends_on=("bucket", "input"),
+            ),
+        }
+        with ThreadPoolExecutor(
+            max_workers=MAX_STREAM_SETUP_CONCURRENCY,
+            thread_name_prefix=f"sendlive-gcp-{name}",
+        ) as executor:
+            results = run_task_graph(tasks, executor)
+        stream = self._build_stream(name, results["input"], results["channel"])
+        if start:
+            stream.start()
+        return stream
 
     @override
-    def create_stream(self, name: str) -> GCPStream:
-        return GCPStream(name=name)
+    async def create_stream_async(
+        self,
+        name: str,
+        start: bool = False,
+        *,
+        latency_mode: LatencyMode = "standard",
+    ) -> GCPStream:
+        """Create a stream without blocking the event loop, awaiting the input and channel operations natively."""
+        stream = self.get_stream(name)
+        if stream is not None:
+            self.check_recorded_latency_mode(LIVESTREAM_CHANNEL, name, latency_mode)
+            if start:
+                await asyncio.to_thread(stream.start)
+            return stream
+        _, input_endpoint = await asyncio.gather(
+            asyncio.to_thread(self.setup_shared_resources),
+            self.create_input_endpoint_async(name),
+        )
+        channel = await self.create_channel_async(
+            name, supplied_channel_id=name, latency_mode=latency_mode
+        )
+        stream = self._build_stream(name, input_endpoint, channel)
+        if start:
+            await asyncio.to_thread(stream.start)
+        return stream
 
     @override
     def setup_stream(self) -> None:
         return None
+
+    @override
+    def setup_shared_resources(self) -> None:
+        if getattr(self, "_bucket", None) is None:
+            # streams created at the same time share a single bucket lookup or creation
+            with self._bucket_lock:
+                if getattr(self, "_bucket", None) is None:
+                    self.init_bucket()
+
+    def _gc_resource(
+        self,
+        resource_type: str,
+        resource: Union[InputEndpoint, Channel],
+        live: bool = False,
+    ) -> SendLiveResource:
+        """Describe an input or channel for the garbage collector, named after the stream it belongs to."""
+        name = resource.name.rsplit("/", 1)[-1]
+        return SendLiveResource(
+            provider=self.state_provider,
+            resource_type=resource_type,
+            resource_id=resource.name,
+            name=name,
+            stream_name=name,
+            live=live,
+        )
+
+    def list_gc_channels(self) -> list[SendLiveResource]:
+        """List sendlive channels for the garbage collector, where any that have not been stopped are live."""
+        return [
+            self._gc_resource(
+                LIVESTREAM_CHANNEL,
+                channel,
+                live=channel.streaming_state.name not in GCP_STOPPED_STREAMING_STATES,
+            )
+            for channel in self.list_channels()
+            if self.is_sendlive_resource(channel.labels)
+        ]
+
+    def list_gc_input_endpoints(self) -> list[SendLiveResource]:
+        """List sendlive input endpoints for the garbage collector."""
+        return [
+            self._gc_resource(LIVESTREAM_INPUT, input_endpoint)
+            for input_endpoint in self.list_input_endpoints()
+            if self.is_sendlive_resource(input_endpoint.labels)
+        ]
+
+    @override
+    def gc_recorded_resource_ids(self) -> set[str]:
+        """Every input, channel and bucket created is recorded in the local state."""
+        return self.find_recorded_resource_ids()
+
+    @override
+    def gc_desired_stream_names(self) -> set[str]:
+        """Streams whose input and channel are both recorded in the local state were created in full."""
+        return self.find_complete_stream_names((LIVESTREAM_INPUT, LIVESTREAM_CHANNEL))
+
+    @override
+    def gc_resource_types(self) -> list[GCResourceType]:
+        """Channels are deleted before inputs, as an input can't be deleted while attached to a channel.
+
+        The bucket is shared by every stream and never deleted.
+        """
+        return [
+            GCResourceType(
+                LIVESTREAM_CHANNEL,
+                self.list_gc_channels,
+                lambda resource: self.delete_channel(resource.resource_id, wait=True),
+            ),
+            GCResourceType(
+                LIVESTREAM_INPUT,
+                self.list_gc_input_endpoints,
+                lambda resource: self.delete_input_endpoint(
+                    resource.resource_id, wait=True
+                ),
+                delete_after=(LIVESTREAM_CHANNEL,),
+            ),
+        ]
@@ -0,0 +1,85 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from threading import Lock
+from typing import ClassVar, Optional, Union
+
+from sendlive.logger import logger
+
+
+class BucketNameCache:
+    """Remembers the sendlive bucket resolved for each GCP project, so buckets need not be searched for every time.
+
+    Resolved names are held in memory for the lifetime of the process, and optionally persisted to a JSON file keyed
+    by project id so that they survive restarts. Cached names may be stale, so callers should validate them.
+    """
+
+    _memory: ClassVar[dict[str, str]] = {}
+    _lock: ClassVar[Lock] = Lock()
+
+    def __init__(self, path: Optional[Union[str, Path]] = None) -> None:
+        """Optionally back the in-memory cache with a JSON file at path."""
+        self.path = Path(path).expanduser() if path is not None else None
+
+    def get(self, project_id: str) -> Optional[str]:
+        """Return the cached bucket name for a project, if there is one."""
+        bucket_name = self._memory.get(project_id)
+        if bucket_name is None and self.path is not None:
+            bucket_name = self._read_file().get(project_id)
+            if bucket_name is not None:
+                self._memory[project_id] = bucket_name
+        return bucket_name
+
+    def set(self, project_id: str, bucket_name: str) -> None:
+        """Cache the bucket name resolved for a project."""
+        with self._lock:
+            self._memory[project_id] = bucket_name
+            if self.path is not None:
+                self._update_file(project_id, bucket_name)
+
+    def invalidate(self, project_id: str) -> None:
+        """Forget the bucket name cached for a project."""
+        with self._lock:
+            self._memory.pop(project_id, None)
+            if self.path is not None:
+                self._update_file(project_id, None)
+
+    @classmethod
+    def clear_memory(cls) -> None:
+        """Forget all bucket names cached in memory."""
+        with cls._lock:
+            cls._memory.clear()
+
+    def _read_file(self) -> dict[str, str]:
+        """Read the cache file, treating a missing or unreadable file as empty."""
+        if self.path is None:
+            return {}
+        try:
+            with self.path.open() as cache_file:
+                cached: dict[str, str] = json.load(cache_file)
+            return cached
+        except (OSError, ValueError) as e:
+            logger.debug("Could not read bucket name cache at %s: %s", self.path, e)
+            return {}
+
+    def _update_file(self, project_id: str, bucket_name: Optional[str]) -> None:
+        """Set or remove a project's entry in the cache file, replacing the file atomically."""
+        if self.path is None:
+            return
+        cached = self._read_file()
+        if bucket_name is None:
+            if cached.pop(project_id, None) is None:
+                return
+        else:
+            cached[project_id] = bucket_name
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            file_descriptor, temp_path = tempfile.mkstemp(
+                dir=self.path.parent, prefix=f".{self.path.name}."
+            )
+            with os.fdopen(file_descriptor, "w") as temp_file:
+                json.dump(cached, temp_file)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning("Could not write bucket name cache at %s: %s", self.path, e)
@@ -1,59 +1,80 @@
-from google.cloud.video import live_stream_v1
-from google.protobuf import duration_pb2 as duration
+from typing import Any
+
+from sendlive.profiles import AudioRendition, EncodingProfile, VideoRendition
 
 ### GCP Channel Defaults ###
 
-## Elementary Stream Defaults ##
-
-GCP_DEFAULT_720P_ES = live_stream_v1.ElementaryStream(
-    key="es_video_720p",
-    video_stream=live_stream_v1.VideoStream(
-        h264=live_stream_v1.VideoStream.H264CodecSettings(
-            profile="high",
-            width_pixels=1280,
-            height_pixels=720,
-            bitrate_bps=3000000,
-            frame_rate=30,
-        )
-    ),
+# profile that streams are encoded with unless GCPOptions.encoding_profile is set, see compile_gcp_channel_streams
+GCP_DEFAULT_ENCODING_PROFILE = EncodingProfile(
+    video=(VideoRendition(name="720p", width=1280, height=720, bitrate=3000000),),
+    audio=AudioRendition(bitrate=160000),
+    h264_profile="high",
+    frame_rate=30,
+    gop_seconds=2,
+    segment_seconds=2,
+    playlist_window_seconds=10,
 )
 
-GCP_DEFAULT_AUDIO_ES = live_stream_v1.ElementaryStream(
-    key="es_audio",
-    audio_stream=live_stream_v1.AudioStream(
-        codec="aac", channel_count=2, bitrate_bps=160000
-    ),
-)
+# The GCP_DEFAULT_* protobuf messages channels were built from before encoding profiles, kept for compatibility. They
+# are compiled from GCP_DEFAULT_ENCODING_PROFILE on first access (see __getattr__), so that importing this module does
+# not pull in the live stream api protobuf stack.
+_GCP_DEFAULT_MESSAGES = {
+    "GCP_DEFAULT_720P_ES": (0, 0),
+    "GCP_DEFAULT_AUDIO_ES": (0, 1),
+    "GCP_DEFAULT_720P_MUX": (1, 0),
+    "GCP_DEFAULT_AUDIO_MUX": (1, 1),
+    "GCP_DEFAULT_MANIFEST": (2, 0),
+}
 
-## Mux Stream Defaults ##
 
-GCP_DEFAULT_720P_MUX = live_stream_v1.MuxStream(
-    key="mux_video_720p",
-    elementary_streams=["es_video_720p"],
-    segment_settings=live_stream_v1.SegmentSettings(
-        segment_duration=duration.Duration(
-            seconds=2,
-        ),
-    ),
-)
+def __getattr__(name: str) -> Any:
+    """Compile the GCP_DEFAULT_* protobuf messages from the default encoding profile on first access."""
+    if name not in _GCP_DEFAULT_MESSAGES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # utils imports this module and the live stream api, so is only imported once a default is used
+    from sendlive.providers.gcp.utils import (  # noqa: PLC0415
+        compile_gcp_channel_streams,
+    )
 
-GCP_DEFAULT_AUDIO_MUX = live_stream_v1.MuxStream(
-    key="mux_audio",
-    elementary_streams=["es_audio"],
-    segment_settings=live_stream_v1.SegmentSettings(
-        segment_duration=duration.Duration(
-            seconds=2,
-        ),
-    ),
-)
+    compiled = compile_gcp_channel_streams(GCP_DEFAULT_ENCODING_PROFILE)
+    for message_name, (kind, index) in _GCP_DEFAULT_MESSAGES.items():
+        globals()[message_name] = compiled[kind][index]
+    return globals()[name]
 
-## Other channel defaults ##
 
-GCP_DEFAULT_MANIFEST = live_stream_v1.Manifest(
-    file_name="manifest.m3u8",
-    type_="HLS",
-    mux_streams=["mux_video_720p", "mux_audio"],
-    max_segment_count=5,
-)
+# segment length of streams created with latency_mode="low", and their playlist window of the fewest segments gcp
+# allows in a manifest, 3
+GCP_LOW_LATENCY_SEGMENT_SECONDS = 2
+GCP_LOW_LATENCY_PLAYLIST_WINDOW_SECONDS = 6
+
+# mux stream container of each profile container
+GCP_MUX_CONTAINERS = {"ts": "ts", "cmaf": "fmp4"}
+
+# file name of the HLS manifest channels write to their output uri
+GCP_MANIFEST_FILE_NAME = "manifest.m3u8"
 
 DEFAULT_CHANNEL_NAME = "sendlive-default-channel"
+
+# path within the bucket that channels write their output to, under a folder named after the channel
+GCP_CHANNEL_OUTPUT_PATH = "sendlive/gcp-streams"
+
+# channel streaming states in which a channel has been started and not stopped
+GCP_ALIVE_STREAMING_STATES = frozenset(
+    {"STREAMING", "AWAITING_INPUT", "STREAMING_ERROR", "STREAMING_NO_INPUT"}
+)
+# channel streaming states in which a channel is not running, so can be deleted
+GCP_STOPPED_STREAMING_STATES = frozenset({"STOPPED", "STREAMING_STATE_UNSPECIFIED"})
+
+### GCP Cloud Storage Defaults ###
+
+DEFAULT_BUCKET_LIST_PAGE_SIZE = 200
+
+GCP_STORAGE_PUBLIC_URL = "https://storage.googleapis.com"
+
+# provider name that api calls are reported under by sendlive.instrumentation
+INSTRUMENTATION_PROVIDER = "gcp"
+
+# Resource types recorded in the local state, see sendlive.state
+LIVESTREAM_INPUT = "livestream.input"
+LIVESTREAM_CHANNEL = "livestream.channel"
+STORAGE_BUCKET = "storage.bucket"
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+from collections.abc import Awaitable, Callable
+from threading import Lock
+from typing import Any, ClassVar, Literal, Optional, TypeVar, Union, overload
 
-from google.api_core.exceptions import AlreadyExists
+import grpc  # type: ignore
+from google.api_core.exceptions import AlreadyExists, Conflict, NotFound
 from google.api_core.operation import Operation
+from google.api_core.operation_async import AsyncOperation
 from google.cloud.storage import Bucket  # type: ignore
 from google.cloud.storage import Client as StorageClient
-from google.cloud.video.live_stream_v1 import Channel
+from google.cloud.video.live_stream_v1 import Channel, ChannelOperationResponse
 from google.cloud.video.live_stream_v1 import Input as InputEndpoint
 from google.cloud.video.live_stream_v1.services.livestream_service import (
+    LivestreamServiceAsyncClient,
     LivestreamServiceClient,
 )
-from google.oauth2.service_account import Credentials  # type: ignore
-from google.protobuf.message import Message
+from google.cloud.video.live_stream_v1.services.livestream_service.transports import (
+    LivestreamServiceGrpcTransport,
+)
+from google.oauth2.service_account import Credentials
+from google.protobuf.message import Message  # type: ignore[import-untyped]
 from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from sendlive.constants import (
@@ -22,47 +30,172 @@ from sendlive.constants import (
     GCPOptions,
 )
 from sendlive.exceptions import SendLiveError
-from sendlive.logger import logger
-from sendlive.mixins import TagMixin
-from sendlive.providers.gcp.constants import DEFAULT_CHANNEL_NAME
+from sendlive.instrumentation import instrument_call, instrument_pending_operation
+from sendlive.logger import log_response, logger
+from sendlive.mixins import StateMixin, TagMixin
+from sendlive.operations import (
+    OperationPoller,
+    PendingOperation,
+    get_default_operation_poller,
+)
+from sendlive.profiles import EncodingProfile, LatencyMode, to_low_latency
+from sendlive.providers.gcp.bucket_cache import BucketNameCache
+from sendlive.providers.gcp.constants import (
+    DEFAULT_BUCKET_LIST_PAGE_SIZE,
+    DEFAULT_CHANNEL_NAME,
+    GCP_DEFAULT_ENCODING_PROFILE,
+    GCP_LOW_LATENCY_PLAYLIST_WINDOW_SECONDS,
+    GCP_LOW_LATENCY_SEGMENT_SECONDS,
+    INSTRUMENTATION_PROVIDER,
+    LIVESTREAM_CHANNEL,
+    LIVESTREAM_INPUT,
+    STORAGE_BUCKET,
+)
 from sendlive.providers.gcp.utils import (
     build_gcp_channel_obj_from_defaults,
     construct_gcp_base_name,
     construct_gcp_channel_name,
+    construct_gcp_channel_output_path,
     construct_gcp_input_endpoint_name,
 )
+from sendlive.registry import ResourceRegistry
+from sendlive.retry import ProviderRetrier, translated_errors
 from sendlive.types import MappingTags
-from sendlive.utils import generate_dns_compliant_name
+from sendlive.utils import DEFAULT_DNS_NAME_MAX_ATTEMPTS, generate_dns_compliant_name
+
+T = TypeVar("T")
 
 
-class GCPBaseMixin(BaseModel, TagMixin):
+class GCPBaseMixin(BaseModel, TagMixin, StateMixin):
     """Base mixin for GCP operations."""
 
+    state_provider: ClassVar[str] = INSTRUMENTATION_PROVIDER
     _gcp_session: Credentials = PrivateAttr()
     _gcp_credentials: GCPCredentials = PrivateAttr()
+    _grpc_channel: Optional[grpc.Channel] = PrivateAttr(default=None)
+    _live_stream_client: Optional[LivestreamServiceClient] = PrivateAttr(default=None)
+    _storage_client: Optional[StorageClient] = PrivateAttr(default=None)
+    _client_lock: Lock = PrivateAttr(default_factory=Lock)
+    _retrier: ProviderRetrier = PrivateAttr()
     provider_options: Optional[GCPOptions] = GCPOptions()
 
     def get_tags(self, tags: Optional[MappingTags] = None) -> MappingTags:
         """Tags are referred to as labels in GCP land, and keys must not contain spaces."""
         return self.get_operation_tags_lowercase_no_space_keys(tags)
 
-    def gcp_storage_client(self) -> StorageClient:
-        """Create a google storage client."""
-        return StorageClient(
-            project=self._gcp_credentials.project_id, credentials=self._gcp_session
+    def is_sendlive_resource(self, labels: MappingTags) -> bool:
+        """Check whether a resource's labels mark it as created by sendlive."""
+        return bool(
+            labels.get(self.created_by_tag_key_lowercase_no_space)
+            == self.created_by_tag_value_lowercase_no_space
         )
 
+    @property
+    def state_account(self) -> str:
+        """Get the project of the credentials, which resources are recorded under."""
+        return self._gcp_credentials.project_id
+
+    @property
+    def state_region(self) -> str:
+        """Get the region of the credentials, which resources are recorded under."""
+        return self._gcp_credentials.region
+
+    def gcp_storage_client(self) -> StorageClient:
+        """Return the google storage client, creating it on first use."""
+        if self._storage_client is None:
+            with self._client_lock:
+                if self._storage_client is None:
+                    self._storage_client = StorageClient(
+                        project=self._gcp_credentials.project_id,
+                        credentials=self._gcp_session,
+                    )
+        return self._storage_client
+
     def gcp_live_streaming_api_client(self) -> LivestreamServiceClient:
-        """Create a google live streaming api client."""
-        return LivestreamServiceClient(credentials=self._gcp_session)
+        """Return the google live streaming api client, creating it on first use.
+
+        If a shared gRPC channel was supplied, the client is built on top of it rather than opening its own.
+        """
+        if self._live_stream_client is None:
+            with self._client_lock:
+                if self._live_stream_client is None:
+                    if self._grpc_channel is not None:
+                        self._live_stream_client = LivestreamServiceClient(
+                            transport=LivestreamServiceGrpcTransport(
+                                channel=self._grpc_channel
+                            )
+                        )
+                    else:
+                        self._live_stream_client = LivestreamServiceClient(
+                            credentials=self._gcp_session
+                        )
+        return self._live_stream_client
+
+    def close(self) -> None:
+        """Close the clients created by this instance.
+
+        A shared gRPC channel supplied by the caller is left open, as it may still be in use elsewhere.
+        """
+        with self._client_lock:
+            live_stream_client, self._live_stream_client = (
+                self._live_stream_client,
+                None,
+            )
+            storage_client, self._storage_client = self._storage_client, None
+        if live_stream_client is not None and self._grpc_channel is None:
+            live_stream_client.transport.close()  # type: ignore[no-untyped-call]
+        if storage_client is not None:
+            storage_client.close()
 
-    def __init__(self, credentials: GCPCredentials, **data: dict[Any, Any]) -> None:
-        """Set gcp session and credentials up."""
+    def __init__(
+        self,
+        credentials: GCPCredentials,
+        grpc_channel: Optional[grpc.Channel] = None,
+        **data: dict[Any, Any],
+    ) -> None:
+        """Set gcp session and credentials up.
+
+        Optionally accepts a gRPC channel (see `create_live_stream_grpc_channel`) to share between instances.
+        """
         super().__init__(credentials=credentials, **data)
-        self._gcp_session = Credentials.from_service_account_info(
+        self._gcp_session = Credentials.from_service_account_info(  # type: ignore[no-untyped-call]
             info=credentials.service_account_json
         )
         self._gcp_credentials = credentials
+        self._grpc_channel = grpc_channel
+        self._retrier = ProviderRetrier(
+            INSTRUMENTATION_PROVIDER,
+            credentials.region,
+            self.provider_options.retry_policy if self.provider_options else None,
+        )
+
+    def call_provider(
+        self,
+        operation: str,
+        fn: Callable[[], T],
+        idempotent: Optional[bool] = None,
+    ) -> T:
+        """Call fn, which makes the api call for operation (such as "livestream.get_input"), retrying it as needed.
+
+        Calls are instrumented, rate limited and retried according to the retry policy, and throttling, transient and
+        permission errors are raised as sendlive exceptions once retries run out. See `sendlive.retry`.
+        """
+        with instrument_call(INSTRUMENTATION_PROVIDER, operation) as call:
+            return self._retrier.call(
+                operation, fn, idempotent=idempotent, on_retry=call.add_retries
+            )
+
+    async def call_provider_async(
+        self,
+        operation: str,
+        fn: Callable[[], Awaitable[T]],
+        idempotent: Optional[bool] = None,
+    ) -> T:
+        """Await the api call for operation made by fn, retrying it as needed without blocking the event loop."""
+        with instrument_call(INSTRUMENTATION_PROVIDER, operation) as call:
+            return await self._retrier.call_async(
+                operation, fn, idempotent=idempotent, on_retry=call.add_retries
+            )
 
 
 class GCPCloudStorageMixin(GCPBaseMixin):
@@ -75,6 +208,13 @@ class GCPCloudStorageMixin(GCPBaseMixin):
         """Get the gcp bucket uri."""
         return f"gs://{self._bucket.name}"
 
+    @property
+    def bucket_name_cache(self) -> BucketNameCache:
+        """Get the cache of sendlive bucket names resolved per project."""
+        return BucketNameCache(
+            self.provider_options.bucket_cache_path if self.provider_options else None
+        )
+
     def init_bucket(
         self, bucket_name: Optional[str] = None, tags: Optional[MappingTags] = None
     ) -> None:
@@ -82,62 +222,138 @@ class GCPCloudStorageMixin(GCPBaseMixin):
         if bucket_name is None and (
             self.provider_options is None or self.provider_options.bucket_name is None
         ):
-            found_bucket_name = self.find_sendlive_metadata_tagged_bucket_name()
-            if found_bucket_name is False:
+            found_bucket = self.find_sendlive_metadata_tagged_bucket()
+            if found_bucket is None:
                 # User has not supplied a bucket name, and no pre-existing sendlive bucket was found - we'll create one now.
-                new_bucket_name = generate_dns_compliant_name()
                 logger.debug(
-                    f"init_bucket: User did not supply bucket, and no pre-existing buckets found - creating a new bucket named {new_bucket_name}"
+                    "init_bucket: User did not supply bucket, and no pre-existing buckets found - creating a new bucket"
                 )
-                new_bucket = self.create_gcp_bucket(new_bucket_name, tags=tags)
-                self._bucket = new_bucket
-                return
-            elif isinstance(found_bucket_name, str):
-                found_bucket = self.get_gcp_bucket_with_name(found_bucket_name)
-                logger.debug(
-                    f"init_bucket: Found pre-existing sendlive bucket named {found_bucket.name} - using this bucket."
+                new_bucket = self.create_sendlive_bucket(tags=tags)
+                self.bucket_name_cache.set(
+                    self._gcp_credentials.project_id, new_bucket.name
                 )
-                self._bucket = found_bucket
+                self._bucket = new_bucket
                 return
+            logger.debug(
+                "init_bucket: Found pre-existing sendlive bucket named %s - using this bucket.",
+                found_bucket.name,
+            )
+            self._bucket = found_bucket
+            return
+        bucket_name = bucket_name or self.provider_options.bucket_name  # type: ignore
         supplied_bucket = self.get_gcp_bucket_with_name(bucket_name)  # type: ignore
         logger.debug(
-            f"init_bucket: User supplied bucket name {bucket_name} - using this bucket."
+            "init_bucket: User supplied bucket name %s - using this bucket.",
+            bucket_name,
         )
         self._bucket = supplied_bucket
         return
 
+    def create_sendlive_bucket(
+        self,
+        tags: Optional[MappingTags] = None,
+        max_attempts: int = DEFAULT_DNS_NAME_MAX_ATTEMPTS,
+    ) -> Bucket:
+        """Create a bucket with a generated name, drawing a new name whenever the name is already taken.
+
+        Bucket names are global across every GCP project, so a generated name can collide with a bucket that sendlive
+        can't see. Names already tried are never drawn again.
+        """
+        tried_names: set[str] = set()
+        for _ in range(max_attempts):
+            bucket_name = generate_dns_compliant_name(exists=tried_names.__contains__)
+            try:
+                return self.create_gcp_bucket(bucket_name, tags=tags)
+            except Conflict:
+                logger.debug(
+                    "create_sendlive_bucket: bucket name %s is taken, retrying",
+                    bucket_name,
+                )
+                tried_names.add(bucket_name)
+        raise SendLiveError(
+            f"Could not create a bucket with an unused name in {max_attempts} attempts."
+        )
+
     def get_gcp_bucket_with_name(self, bucket_name: str) -> Bucket:
         """Get a GCP bucket with the passed in name."""
         client = self.gcp_storage_client()
-        return client.get_bucket(bucket_name)
+        return self.call_provider(
+            "storage.get_bucket", lambda: client.get_bucket(bucket_name)
+        )
 
-    def find_sendlive_metadata_tagged_bucket_name(self) -> str | bool:
-        """Search buckets by label to find gcp bucket name created for sendlive."""
+    def is_sendlive_bucket(self, bucket: Bucket) -> bool:
+        """Check whether a bucket has the sendlive label."""
+        return self.is_sendlive_resource(bucket.labels)
+
+    def find_sendlive_metadata_tagged_bucket(self) -> Optional[Bucket]:
+        """Find the gcp bucket created for sendlive, using the cached bucket name for this project where possible.
+
+        A cached name is validated with a single get of that bucket. Buckets are only searched by label when nothing
+        is cached or the cached bucket is no longer valid.
+        """
+        project_id = self._gcp_credentials.project_id
+        cached_bucket_name = self.bucket_name_cache.get(project_id)
+        if cached_bucket_name is not None:
+            try:
+                cached_bucket = self.get_gcp_bucket_with_name(cached_bucket_name)
+            except NotFound:
+                cached_bucket = None
+            if cached_bucket is not None and self.is_sendlive_bucket(cached_bucket):
+                return cached_bucket
+            logger.debug(
+                "Cached sendlive bucket %s for project %s is no longer valid.",
+                cached_bucket_name,
+                project_id,
+            )
+            self.bucket_name_cache.invalidate(project_id)
+        found_bucket = self.scan_for_sendlive_metadata_tagged_bucket()
+        if found_bucket is not None:
+            self.bucket_name_cache.set(project_id, found_bucket.name)
+        return found_bucket
+
+    def scan_for_sendlive_metadata_tagged_bucket(
+        self, page_size: int = DEFAULT_BUCKET_LIST_PAGE_SIZE
+    ) -> Optional[Bucket]:
+        """Search buckets page by page for one labelled as created by sendlive, stopping at the first match."""
         client = self.gcp_storage_client()
-        buckets = client.list_buckets()
-
-        found_buckets: list[str] = list()
-        for bucket in buckets:
-            logger.info(f"Looking at bucket {bucket.name} with labels: {bucket.labels}")
-            if (
-                bucket.labels.get(self.created_by_tag_key_lowercase_no_space)
-                == self.created_by_tag_value_lowercase_no_space
-            ):
-                found_buckets.append(bucket.name)
-        if len(found_buckets) > 1:
-            raise SendLiveError(
-                f"Expected to find one bucket with label {CREATED_BY_KEY}:{CREATED_BY_VALUE}, instead found {len(found_buckets)}!"
+
+        def scan() -> tuple[Optional[Bucket], int]:
+            scanned = 0
+            for bucket in client.list_buckets(page_size=page_size):
+                scanned += 1
+                if self.is_sendlive_bucket(bucket):
+                    return bucket, scanned
+            return None, scanned
+
+        found_bucket, scanned = self.call_provider("storage.list_buckets", scan)
+        if found_bucket is not None:
+            logger.debug(
+                "Found sendlive bucket %s after scanning %d buckets.",
+                found_bucket.name,
+                scanned,
             )
-        elif len(found_buckets) == 0:
+            return found_bucket
+        logger.debug(
+            "No bucket with label %s:%s found after scanning %d buckets.",
+            CREATED_BY_KEY,
+            CREATED_BY_VALUE,
+            scanned,
+        )
+        return None
+
+    def find_sendlive_metadata_tagged_bucket_name(self) -> str | bool:
+        """Search buckets by label to find gcp bucket name created for sendlive."""
+        found_bucket = self.find_sendlive_metadata_tagged_bucket()
+        if found_bucket is None:
             return False
-        return found_buckets[0]
+        return str(found_bucket.name)
 
     def add_tags_to_bucket(self, tags: Optional[MappingTags] = None) -> None:
         """Add tags to a GCP bucket."""
         tags_to_be_set: MappingTags = self.get_tags(tags)
-        logger.debug(f"Setting tags on bucket {self._bucket.name}: {tags_to_be_set}")
+        logger.debug("Setting tags on bucket %s: %s", self._bucket.name, tags_to_be_set)
         self._bucket.labels = tags_to_be_set
-        self._bucket.patch()
+        self.call_provider("storage.patch_bucket", self._bucket.patch, idempotent=True)
 
     def create_gcp_bucket(
         self,
@@ -150,8 +366,14 @@ class GCPCloudStorageMixin(GCPBaseMixin):
         storage_client = self.gcp_storage_client()
         bucket = storage_client.bucket(bucket_name)
         bucket.storage_class = storage_class
-        sendlive_bucket = storage_client.create_bucket(bucket, location=location)
-        logger.info(f"\nGCP Create bucket res:{sendlive_bucket}\n\n")
+        sendlive_bucket = self.call_provider(
+            "storage.create_bucket",
+            lambda: storage_client.create_bucket(bucket, location=location),
+        )
+        log_response("storage.create_bucket", sendlive_bucket)
+        self.record_resource(
+            STORAGE_BUCKET, f"projects/_/buckets/{bucket_name}", bucket_name
+        )
         self._bucket = sendlive_bucket
         self.add_tags_to_bucket(tags)
         return sendlive_bucket
@@ -160,35 +382,242 @@ class GCPCloudStorageMixin(GCPBaseMixin):
 class GCPLiveStreamAPIMixin(GCPCloudStorageMixin):
     """Mixin for GCP Live Streaming API operations."""
 
-    gcp_input_endpoints: list[InputEndpoint] = []
-
-    gcp_channels: list[Channel] = []
+    _gcp_input_endpoints: ResourceRegistry[InputEndpoint] = PrivateAttr(
+        default_factory=lambda: ResourceRegistry(key=lambda resource: resource.name)
+    )
+    _gcp_channels: ResourceRegistry[Channel] = PrivateAttr(
+        default_factory=lambda: ResourceRegistry(key=lambda resource: resource.name)
+    )
+    _live_stream_async_client: Optional[LivestreamServiceAsyncClient] = PrivateAttr(
+        default=None
+    )
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    @property
+    def gcp_input_endpoints(self) -> ResourceRegistry[InputEndpoint]:
+        """Get the input endpoints created or looked up by this instance, by resource name."""
+        return self._gcp_input_endpoints
+
+    @property
+    def gcp_channels(self) -> ResourceRegistry[Channel]:
+        """Get the channels created or looked up by this instance, by resource name."""
+        return self._gcp_channels
+
+    def gcp_live_streaming_api_async_client(self) -> LivestreamServiceAsyncClient:
+        """Return the asyncio google live streaming api client, creating it on first use.
+
+        The async client is bound to the event loop it is first used in, so must only be used from within that loop.
+        """
+        if self._live_stream_async_client is None:
+            self._live_stream_async_client = LivestreamServiceAsyncClient(
+                credentials=self._gcp_session
+            )
+        return self._live_stream_async_client
+
+    async def aclose(self) -> None:
+        """Close the clients created by this instance, including the asyncio live streaming api client."""
+        self.close()
+        async_client, self._live_stream_async_client = (
+            self._live_stream_async_client,
+            None,
+        )
+        if async_client is not None:
+            await async_client.transport.close()  # type: ignore[no-untyped-call]
+
+    @property
+    def operation_poller(self) -> OperationPoller:
+        """Get the poller that tracks long running operations started with wait=False."""
+        return get_default_operation_poller()
+
+    @property
+    def gcp_parent(self) -> str:
+        """Get the parent resource name that inputs and channels are created under."""
+        return construct_gcp_base_name(
+            self._gcp_credentials.project_id, self._gcp_credentials.region
+        )
+
+    def get_encoding_profile(
+        self, latency_mode: LatencyMode = "standard"
+    ) -> EncodingProfile:
+        """Get the profile channels are encoded to, tuned for low latency if latency_mode is "low"."""
+        profile = (
+            self.provider_options.encoding_profile if self.provider_options else None
+        ) or GCP_DEFAULT_ENCODING_PROFILE
+        if latency_mode == "low":
+            return to_low_latency(
+                profile,
+                GCP_LOW_LATENCY_SEGMENT_SECONDS,
+                GCP_LOW_LATENCY_PLAYLIST_WINDOW_SECONDS,
+            )
+        return profile
+
+    def _build_channel(
+        self,
+        input_id: str,
+        supplied_channel_id: Optional[str] = None,
+        tags: Optional[MappingTags] = None,
+        latency_mode: LatencyMode = "standard",
+    ) -> tuple[str, Channel]:
+        """Build the channel id and channel object used to create a channel attached to the passed in input."""
+        channel_id = supplied_channel_id or DEFAULT_CHANNEL_NAME
+        if getattr(self, "_bucket", None) is None:
+            raise SendLiveError(
+                "Cannot create a channel without a bucket - please call init_bucket first."
+            )
+        input_str = construct_gcp_input_endpoint_name(
+            self._gcp_credentials.project_id, self._gcp_credentials.region, input_id
+        )
+        name = construct_gcp_channel_name(
+            self._gcp_credentials.project_id,
+            self._gcp_credentials.region,
+            channel_id,
+        )
+        channel: Channel = build_gcp_channel_obj_from_defaults(
+            name,
+            input_str,
+            self.bucket_uri,
+            tags=self.get_tags(tags),
+            output_path=construct_gcp_channel_output_path(channel_id),
+            encoding_profile=self.get_encoding_profile(latency_mode),
+        )
+        return channel_id, channel
+
+    def _add_created_input_endpoint(self, response: Message) -> InputEndpoint:
+        """Check a create input endpoint response is an input endpoint, and add it to this instance."""
+        log_response("livestream.create_input", response)
+        if not isinstance(response, InputEndpoint):
+            raise SendLiveError(
+                f"Unexpected response from GCP - Create input endpoint response not of type InputEndpoint: {response}"
+            )
+        self.gcp_input_endpoints.add(response)
+        self._record_live_stream_resource(LIVESTREAM_INPUT, response)
+        return response
+
+    def _add_created_channel(
+        self, response: Message, latency_mode: LatencyMode = "standard"
+    ) -> Channel:
+        """Check a create channel response is a channel, and add it to this instance along with its latency mode."""
+        log_response("livestream.create_channel", response)
+        if not isinstance(response, Channel):
+            raise SendLiveError(
+                f"Unexpected response from GCP - Create channel response not of type Channel: {response}"
+            )
+        self.gcp_channels.add(response)
+        self._record_live_stream_resource(
+            LIVESTREAM_CHANNEL, response, latency_mode=latency_mode
+        )
+        return response
+
+    def _record_live_stream_resource(
+        self,
+        resource_type: str,
+        resource: Union[InputEndpoint, Channel],
+        **attributes: Any,
+    ) -> None:
+        """Record an input or channel, named after the final segment of its resource name as streams are."""
+        name = resource.name.rsplit("/", 1)[-1]
+        self.record_resource(
+            resource_type,
+            resource.name,
+            name=name,
+            stream_name=name,
+            resource=type(resource).to_json(resource),
+            **attributes,
+        )
+
+    def _recorded_live_stream_resource(self, resource_name: str) -> Optional[str]:
+        """Return the json of an input or channel recorded in the local state by its resource name, if there is one."""
+        record = self.state.get(resource_name)
+        return record.attributes.get("resource") if record is not None else None
+
     def get_input_endpoint(
-        self, input_id: str, add_to_self: bool = False
+        self, input_id: str, add_to_self: bool = False, from_state: bool = True
+    ) -> InputEndpoint:
+        """Get a GCP input endpoint.
+
+        An input recorded in the local state is returned without an api call, unless from_state is False.
+        """
+        input_str = construct_gcp_input_endpoint_name(
+            self._gcp_credentials.project_id, self._gcp_credentials.region, input_id
+        )
+        recorded_input_endpoint = (
+            self._recorded_live_stream_resource(input_str) if from_state else None
+        )
+        input_endpoint: InputEndpoint
+        if recorded_input_endpoint is not None:
+            input_endpoint = InputEndpoint.from_json(
+                recorded_input_endpoint, ignore_unknown_fields=True
+            )
+        else:
+            input_endpoint = self.call_provider(
+                "livestream.get_input",
+                lambda: self.gcp_live_streaming_api_client().get_input(name=input_str),
+            )
+        if add_to_self:
+            self.gcp_input_endpoints.add(input_endpoint)
+        return input_endpoint
+
+    async def get_input_endpoint_async(
+        self, input_id: str, add_to_self: bool = False, from_state: bool = True
     ) -> InputEndpoint:
-        """Get a GCP input endpoint."""
+        """Get a GCP input endpoint without blocking the event loop, in the same way as `get_input_endpoint`."""
         input_str = construct_gcp_input_endpoint_name(
             self._gcp_credentials.project_id, self._gcp_credentials.region, input_id
         )
-        input_endpoint = self.gcp_live_streaming_api_client().get_input(name=input_str)
+        recorded_input_endpoint = (
+            self._recorded_live_stream_resource(input_str) if from_state else None
+        )
+        input_endpoint: InputEndpoint
+        if recorded_input_endpoint is not None:
+            input_endpoint = InputEndpoint.from_json(
+                recorded_input_endpoint, ignore_unknown_fields=True
+            )
+        else:
+            input_endpoint = await self.call_provider_async(
+                "livestream.get_input",
+                lambda: self.gcp_live_streaming_api_async_client().get_input(
+                    name=input_str
+                ),
+            )
         if add_to_self:
-            self.gcp_input_endpoints.extend([input_endpoint])
+            self.gcp_input_endpoints.add(input_endpoint)
         return input_endpoint
 
+    @overload
+    def create_input_endpoint(
+        self,
+        input_id: str,
+        input_type: str = ...,
+        get_if_exists: bool = ...,
+        tags: Optional[MappingTags] = ...,
+        wait: Literal[True] = ...,
+    ) -> InputEndpoint: ...
+
+    @overload
     def create_input_endpoint(
+        self,
+        input_id: str,
+        input_type: str = ...,
+        get_if_exists: bool = ...,
+        tags: Optional[MappingTags] = ...,
+        *,
+        wait: Literal[False],
+    ) -> PendingOperation[InputEndpoint]: ...
+
+    def create_input_endpoint(  # noqa: PLR0913
         self,
         input_id: str,
         input_type: str = "RTMP_PUSH",
         get_if_exists: bool = True,
         tags: Optional[MappingTags] = None,
-    ) -> InputEndpoint:
+        wait: bool = True,
+    ) -> Union[InputEndpoint, PendingOperation[InputEndpoint]]:
         """Create a GCP input endpoint.
 
         This operation appears to take a decent amount of time to complete.
-        It may be advisable to use a library such as celery when invoking.
+        Pass wait=False to return a pending operation handle immediately rather than blocking until it completes,
+        or use `create_input_endpoint_async`.
 
         Args:
         ----
@@ -196,114 +625,388 @@ class GCPLiveStreamAPIMixin(GCPCloudStorageMixin):
             input_type (str, optional): The type of the input. Defaults to "RTMP_PUSH".
             get_if_exists (bool, optional): If True, fetches the input with the passed in input_id if an already exists error is returned by GCP. Defaults to True.
             tags (Optional[MappingTags], optional): The tags for the input. Defaults to None.
+            wait (bool, optional): If False, returns a handle tracked by the operation poller instead of waiting for the operation to complete. Defaults to True.
 
         Returns:
         -------
-            InputEndpoint: The created input endpoint.
+            InputEndpoint: The created input endpoint, or a pending operation resolving to it if wait is False.
         """
-        parent = construct_gcp_base_name(
-            self._gcp_credentials.project_id, self._gcp_credentials.region
-        )
         input_endpoint = InputEndpoint(type_=input_type, labels=self.get_tags(tags))
         try:
-            operation: Operation = self.gcp_live_streaming_api_client().create_input(
-                parent=parent, input=input_endpoint, input_id=input_id
+            # creating an input with an explicit id is safe to retry, as a duplicate is rejected with AlreadyExists
+            operation: Operation = self.call_provider(
+                "livestream.create_input",
+                lambda: self.gcp_live_streaming_api_client().create_input(
+                    parent=self.gcp_parent, input=input_endpoint, input_id=input_id
+                ),
+                idempotent=True,
             )
         except AlreadyExists as e:
             if get_if_exists:
-                return self.get_input_endpoint(input_id, add_to_self=True)
+                existing_input_endpoint = self.get_input_endpoint(
+                    input_id, add_to_self=True
+                )
+                if wait:
+                    return existing_input_endpoint
+                return PendingOperation.from_result(existing_input_endpoint)
             else:
                 raise e
-        response: Message = operation.result(900)  # type: ignore
-        logger.info(f"\nGCP Create input endpoint res:{response}\n\n")
+        if not wait:
+            return instrument_pending_operation(
+                INSTRUMENTATION_PROVIDER,
+                "livestream.create_input.wait",
+                self.operation_poller.submit(
+                    operation, self._add_created_input_endpoint, timeout=900
+                ),
+            )
+        with instrument_call(INSTRUMENTATION_PROVIDER, "livestream.create_input.wait"):
+            with translated_errors("livestream.create_input"):
+                response: Message = operation.result(900)  # type: ignore
+        return self._add_created_input_endpoint(response)
 
-        if not isinstance(response, InputEndpoint):
-            raise SendLiveError(
-                f"Unexpected response from GCP - Create input endpoint response not of type InputEndpoint: {response}"
+    async def create_input_endpoint_async(
+        self,
+        input_id: str,
+        input_type: str = "RTMP_PUSH",
+        get_if_exists: bool = True,
+        tags: Optional[MappingTags] = None,
+    ) -> InputEndpoint:
+        """Create a GCP input endpoint, awaiting the long running operation rather than blocking on it.
+
+        Takes the same arguments as `create_input_endpoint`.
+        """
+        input_endpoint = InputEndpoint(type_=input_type, labels=self.get_tags(tags))
+        try:
+            operation: AsyncOperation = await self.call_provider_async(
+                "livestream.create_input",
+                lambda: self.gcp_live_streaming_api_async_client().create_input(
+                    parent=self.gcp_parent, input=input_endpoint, input_id=input_id
+                ),
+                idempotent=True,
             )
-        self.gcp_input_endpoints.extend([response])
-        return response
+        except AlreadyExists as e:
+            if get_if_exists:
+                return await self.get_input_endpoint_async(input_id, add_to_self=True)
+            else:
+                raise e
+        with instrument_call(INSTRUMENTATION_PROVIDER, "livestream.create_input.wait"):
+            with translated_errors("livestream.create_input"):
+                response: Message = await operation.result(timeout=900)  # type: ignore[no-untyped-call]
+        return self._add_created_input_endpoint(response)
 
+    @overload
     def create_channel(
+        self,
+        input_id: str,
+        supplied_channel_id: Optional[str] = ...,
+        tags: Optional[MappingTags] = ...,
+        wait: Literal[True] = ...,
+        latency_mode: LatencyMode = ...,
+    ) -> Channel: ...
+
+    @overload
+    def create_channel(
+        self,
+        input_id: str,
+        supplied_channel_id: Optional[str] = ...,
+        tags: Optional[MappingTags] = ...,
+        *,
+        wait: Literal[False],
+        latency_mode: LatencyMode = ...,
+    ) -> PendingOperation[Channel]: ...
+
+    def create_channel(  # noqa: PLR0913
         self,
         input_id: str,
         supplied_channel_id: Optional[str] = None,
         tags: Optional[MappingTags] = None,
-    ) -> Channel:
-        """Create a GCP channel.
+        wait: bool = True,
+        latency_mode: LatencyMode = "standard",
+    ) -> Union[Channel, PendingOperation[Channel]]:
+        """Create a GCP channel, encoding to the profile of latency_mode.
 
         If the specified channel name already exists, the existing channel will be looked up and returned.
+        Pass wait=False to return a pending operation handle immediately rather than blocking until it completes.
         """
-        channel_id = supplied_channel_id or DEFAULT_CHANNEL_NAME
-        if not self._bucket:
-            raise SendLiveError(
-                "Cannot create a channel without a bucket - please call init_bucket first."
-            )
-        input_str = construct_gcp_input_endpoint_name(
-            self._gcp_credentials.project_id, self._gcp_credentials.region, input_id
-        )
-        name = construct_gcp_channel_name(
-            self._gcp_credentials.project_id,
-            self._gcp_credentials.region,
-            channel_id,
+        channel_id, channel = self._build_channel(
+            input_id, supplied_channel_id, tags, latency_mode
         )
+        try:
+            # creating a channel with an explicit id is safe to retry, as a duplicate is rejected with AlreadyExists
+            operation: Operation = self.call_provider(
+                "livestream.create_channel",
+                lambda: self.gcp_live_streaming_api_client().create_channel(
+                    parent=self.gcp_parent,
+                    channel=channel,
+                    channel_id=channel_id,
+                ),
+                idempotent=True,
+            )
+            if not wait:
+                return instrument_pending_operation(
+                    INSTRUMENTATION_PROVIDER,
+                    "livestream.create_channel.wait",
+                    self.operation_poller.submit(
+                        operation,
+                        lambda response: self._add_created_channel(
+                            response, latency_mode
+                        ),
+                        timeout=600,
+                    ),
+                )
+            with instrument_call(
+                INSTRUMENTATION_PROVIDER, "livestream.create_channel.wait"
+            ):
+                with translated_errors("livestream.create_channel"):
+                    response: Message = operation.result(600)  # type: ignore
+            return self._add_created_channel(response, latency_mode)
+        except AlreadyExists:
+            logger.warning(
+                "Channel with specified name of '%s' already exists. Getting that channel and returning it.",
+                channel.name,
+            )
+            existing_channel: Channel = self.get_channel(channel.name)
+            if wait:
+                return existing_channel
+            return PendingOperation.from_result(existing_channel)
 
-        channel: Channel = build_gcp_channel_obj_from_defaults(
-            name,
-            input_str,
-            self.bucket_uri,
-            tags=self.get_tags(tags),
+    async def create_channel_async(
+        self,
+        input_id: str,
+        supplied_channel_id: Optional[str] = None,
+        tags: Optional[MappingTags] = None,
+        latency_mode: LatencyMode = "standard",
+    ) -> Channel:
+        """Create a GCP channel, awaiting the long running operation rather than blocking on it.
+
+        If the specified channel name already exists, the existing channel will be looked up and returned.
+        """
+        channel_id, channel = self._build_channel(
+            input_id, supplied_channel_id, tags, latency_mode
         )
         try:
-            operation: Operation = self.gcp_live_streaming_api_client().create_channel(
-                parent=construct_gcp_base_name(
-                    self._gcp_credentials.project_id, self._gcp_credentials.region
+            operation: AsyncOperation = await self.call_provider_async(
+                "livestream.create_channel",
+                lambda: self.gcp_live_streaming_api_async_client().create_channel(
+                    parent=self.gcp_parent,
+                    channel=channel,
+                    channel_id=channel_id,
                 ),
-                channel=channel,
-                channel_id=channel_id,
+                idempotent=True,
             )
-            response: Message = operation.result(600)  # type: ignore
-            logger.info(f"\nGCP Create channel res:{response}\n\n")
-            if not isinstance(response, Channel):
-                raise SendLiveError(
-                    f"Unexpected response from GCP - Create channel response not of type Channel: {response}"
-                )
-            self.gcp_channels.extend([response])
-            return response
+            with instrument_call(
+                INSTRUMENTATION_PROVIDER, "livestream.create_channel.wait"
+            ):
+                with translated_errors("livestream.create_channel"):
+                    response: Message = await operation.result(timeout=600)  # type: ignore[no-untyped-call]
+            return self._add_created_channel(response, latency_mode)
         except AlreadyExists:
-            logger.warn(
-                f"Channel with specified name of '{name}' already exists. Getting that channel and returning it."
+            logger.warning(
+                "Channel with specified name of '%s' already exists. Getting that channel and returning it.",
+                channel.name,
             )
-            existing_channel: Channel = self.get_channel(name)
+            existing_channel: Channel = await self.get_channel_async(channel.name)
             return existing_channel
 
     def get_channel(
-        self, name: Optional[str] = None, add_to_self: bool = False
+        self,
+        name: Optional[str] = None,
+        add_to_self: bool = False,
+        from_state: bool = True,
     ) -> Channel:
-        """Get a GCP channel."""
-        channel = self.gcp_live_streaming_api_client().get_channel(
-            name=name or DEFAULT_CHANNEL_NAME
+        """Get a GCP channel.
+
+        A channel recorded in the local state is returned without an api call, unless from_state is False. Its
+        streaming state is as of when it was recorded, so pass from_state=False to check the current state.
+        """
+        channel_name = name or DEFAULT_CHANNEL_NAME
+        recorded_channel = (
+            self._recorded_live_stream_resource(channel_name) if from_state else None
         )
+        channel: Channel
+        if recorded_channel is not None:
+            channel = Channel.from_json(recorded_channel, ignore_unknown_fields=True)
+        else:
+            channel = self.call_provider(
+                "livestream.get_channel",
+                lambda: self.gcp_live_streaming_api_client().get_channel(
+                    name=channel_name
+                ),
+            )
         if add_to_self:
-            self.gcp_channels.extend([channel])
+            self.gcp_channels.add(channel)
+        return channel
+
+    async def get_channel_async(
+        self,
+        name: Optional[str] = None,
+        add_to_self: bool = False,
+        from_state: bool = True,
+    ) -> Channel:
+        """Get a GCP channel without blocking the event loop, in the same way as `get_channel`."""
+        channel_name = name or DEFAULT_CHANNEL_NAME
+        recorded_channel = (
+            self._recorded_live_stream_resource(channel_name) if from_state else None
+        )
+        channel: Channel
+        if recorded_channel is not None:
+            channel = Channel.from_json(recorded_channel, ignore_unknown_fields=True)
+        else:
+            channel = await self.call_provider_async(
+                "livestream.get_channel",
+                lambda: self.gcp_live_streaming_api_async_client().get_channel(
+                    name=channel_name
+                ),
+            )
+        if add_to_self:
+            self.gcp_channels.add(channel)
         return channel
 
     def list_channels(self) -> list[Channel]:
         """List GCP channels."""
-        parent = construct_gcp_base_name(
-            self._gcp_credentials.project_id, self._gcp_credentials.region
+        return self.call_provider(
+            "livestream.list_channels",
+            lambda: list(
+                self.gcp_live_streaming_api_client().list_channels(
+                    parent=self.gcp_parent
+                )
+            ),
+        )
+
+    async def list_channels_async(self) -> list[Channel]:
+        """List GCP channels without blocking the event loop."""
+
+        async def list_channels() -> list[Channel]:
+            channels_response = (
+                await self.gcp_live_streaming_api_async_client().list_channels(
+                    parent=self.gcp_parent
+                )
+            )
+            return [channel async for channel in channels_response]
+
+        return await self.call_provider_async("livestream.list_channels", list_channels)
+
+    def list_input_endpoints(self) -> list[InputEndpoint]:
+        """List GCP input endpoints."""
+        return self.call_provider(
+            "livestream.list_inputs",
+            lambda: list(
+                self.gcp_live_streaming_api_client().list_inputs(parent=self.gcp_parent)
+            ),
+        )
+
+    def _wait_for_deletion(self, operation_path: str, operation: Operation) -> None:
+        """Block until a delete operation completes."""
+        with instrument_call(INSTRUMENTATION_PROVIDER, f"{operation_path}.wait"):
+            with translated_errors(operation_path):
+                operation.result(600)  # type: ignore
+
+    def delete_channel(self, channel_resource_path: str, wait: bool = False) -> None:
+        """Delete a GCP channel.
+
+        Pass wait=True to block until the channel is deleted, such as before deleting the input attached to it.
+        """
+        response = self.call_provider(
+            "livestream.delete_channel",
+            lambda: self.gcp_live_streaming_api_client().delete_channel(
+                name=channel_resource_path
+            ),
         )
-        channels = list()
-        channels_response = self.gcp_live_streaming_api_client().list_channels(
-            parent=parent
+        log_response("livestream.delete_channel", response)
+        if wait:
+            self._wait_for_deletion("livestream.delete_channel", response)
+        self.gcp_channels.remove(channel_resource_path)
+        self.state.delete(channel_resource_path)
+
+    def delete_input_endpoint(
+        self, input_resource_path: str, wait: bool = False
+    ) -> None:
+        """Delete a GCP input endpoint, which must not be attached to a channel."""
+        response = self.call_provider(
+            "livestream.delete_input",
+            lambda: self.gcp_live_streaming_api_client().delete_input(
+                name=input_resource_path
+            ),
         )
-        for channel in channels_response:
-            channels.append(channel)
-        return channels
-
-    def delete_channel(self, channel_resource_path: str) -> None:
-        """Delete a GCP channel."""
-        response = self.gcp_live_streaming_api_client().delete_channel(
-            name=channel_resource_path
+        log_response("livestream.delete_input", response)
+        if wait:
+            self._wait_for_deletion("livestream.delete_input", response)
+        self.gcp_input_endpoints.remove(input_resource_path)
+        self.state.delete(input_resource_path)
+
+    def _run_channel_operation(
+        self, operation_name: str, call: Callable[[], Operation], wait: bool
+    ) -> Union[ChannelOperationResponse, PendingOperation[ChannelOperationResponse]]:
+        """Start or stop a channel, waiting on the long running operation or tracking it in the background."""
+        operation_path = f"livestream.{operation_name}"
+        # starting or stopping a channel that is already started or stopped has no further effect, so is safe to retry
+        operation: Operation = self.call_provider(operation_path, call, idempotent=True)
+
+        def log_completed(
+            response: ChannelOperationResponse,
+        ) -> ChannelOperationResponse:
+            log_response(operation_path, response)
+            return response
+
+        if not wait:
+            return instrument_pending_operation(
+                INSTRUMENTATION_PROVIDER,
+                f"{operation_path}.wait",
+                self.operation_poller.submit(operation, log_completed, timeout=600),
+            )
+        with instrument_call(INSTRUMENTATION_PROVIDER, f"{operation_path}.wait"):
+            with translated_errors(operation_path):
+                response: ChannelOperationResponse = operation.result(600)  # type: ignore
+        return log_completed(response)
+
+    @overload
+    def start_channel(
+        self, channel_resource_path: str, wait: Literal[True] = ...
+    ) -> ChannelOperationResponse: ...
+
+    @overload
+    def start_channel(
+        self, channel_resource_path: str, *, wait: Literal[False]
+    ) -> PendingOperation[ChannelOperationResponse]: ...
+
+    def start_channel(
+        self, channel_resource_path: str, wait: bool = True
+    ) -> Union[ChannelOperationResponse, PendingOperation[ChannelOperationResponse]]:
+        """Start a GCP channel.
+
+        Pass wait=False to return a pending operation handle immediately rather than blocking until the channel
+        has started.
+        """
+        return self._run_channel_operation(
+            "start_channel",
+            lambda: self.gcp_live_streaming_api_client().start_channel(
+                name=channel_resource_path
+            ),
+            wait,
+        )
+
+    @overload
+    def stop_channel(
+        self, channel_resource_path: str, wait: Literal[True] = ...
+    ) -> ChannelOperationResponse: ...
+
+    @overload
+    def stop_channel(
+        self, channel_resource_path: str, *, wait: Literal[False]
+    ) -> PendingOperation[ChannelOperationResponse]: ...
+
+    def stop_channel(
+        self, channel_resource_path: str, wait: bool = True
+    ) -> Union[ChannelOperationResponse, PendingOperation[ChannelOperationResponse]]:
+        """Stop a GCP channel.
+
+        Pass wait=False to return a pending operation handle immediately rather than blocking until the channel
+        has stopped.
+        """
+        return self._run_channel_operation(
+            "stop_channel",
+            lambda: self.gcp_live_streaming_api_client().stop_channel(
+                name=channel_resource_path
+            ),
+            wait,
         )
-        logger.debug(f"\nGCP Delete channel res:{response}\n\n")
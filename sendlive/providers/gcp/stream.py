@@ -1,27 +1,91 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+from pydantic import PrivateAttr
 from typing_extensions import override
 
-from sendlive.stream import BaseStream
+from sendlive.exceptions import SendLiveError
+from sendlive.providers.gcp.constants import GCP_ALIVE_STREAMING_STATES
+from sendlive.stream import BaseStream, StreamURLs
+
+if TYPE_CHECKING:
+    from sendlive.operations import PendingOperation
+    from sendlive.providers.gcp.mixins import GCPLiveStreamAPIMixin
 
 
 class GCPStream(BaseStream):
-    """Represents a single stream on GCP."""
+    """Represents a single stream on GCP.
+
+    A stream is made up of a live stream api input that is pushed to, and a channel that encodes it and writes HLS
+    output to the adapter's bucket.
+    """
+
+    endpoint: Optional[str] = None
+    """The uri of the input to push the stream to."""
+    channel_name: Optional[str] = None
+    """The resource name of the channel."""
+    url: Optional[str] = None
+    """The url of the HLS manifest the stream can be watched at."""
+
+    _live_stream: Optional[GCPLiveStreamAPIMixin] = PrivateAttr(default=None)
+    _pending_operation: Optional[PendingOperation[Any]] = PrivateAttr(default=None)
+
+    def bind(self, live_stream: GCPLiveStreamAPIMixin) -> None:
+        """Bind the live stream api instance used to manage the stream."""
+        self._live_stream = live_stream
+
+    @property
+    def live_stream(self) -> GCPLiveStreamAPIMixin:
+        """Return the live stream api instance bound to the stream."""
+        if self._live_stream is None:
+            raise SendLiveError(f"Stream {self.name} is not bound to a gcp adapter.")
+        return self._live_stream
+
+    @property
+    def pending_operation(self) -> Optional[PendingOperation[Any]]:
+        """The operation of the last start or stop, which is tracked in the background until it completes."""
+        return self._pending_operation
+
+    def _require_channel_name(self) -> str:
+        if self.channel_name is None:
+            raise SendLiveError(f"Stream {self.name} has no channel.")
+        return self.channel_name
 
     @override
-    def start(self) -> None:
-        pass
+    def start(self, wait: bool = False) -> None:
+        """Start the stream's channel.
+
+        Returns as soon as the channel has been asked to start, unless wait is True. The start operation is tracked
+        in the background, and can be waited on through `pending_operation`.
+        """
+        self._pending_operation = self.live_stream.start_channel(
+            self._require_channel_name(), wait=False
+        )
+        if wait:
+            self._pending_operation.result()
 
     @override
-    def stop(self) -> None:
-        pass
+    def stop(self, wait: bool = False) -> None:
+        """Stop the stream's channel, in the same way as `start`."""
+        self._pending_operation = self.live_stream.stop_channel(
+            self._require_channel_name(), wait=False
+        )
+        if wait:
+            self._pending_operation.result()
 
     @override
-    def is_alive(self) -> None:
-        pass
+    def is_alive(self) -> bool:
+        """Return whether the stream's channel has been started, and not stopped."""
+        if self.channel_name is None:
+            return False
+        channel = self.live_stream.get_channel(self.channel_name, from_state=False)
+        return channel.streaming_state.name in GCP_ALIVE_STREAMING_STATES
 
     @override
-    def get_url(self) -> None:
-        pass
+    def get_url(self) -> StreamURLs:
+        return StreamURLs(input=self.endpoint, playback=self.url)
 
     @override
-    def get_name(self) -> None:
-        pass
+    def get_name(self) -> str:
+        return self.name
@@ -0,0 +1,478 @@
+import asyncio
+import threading
+from collections.abc import Generator
+from typing import Any
+from unittest import mock
+
+import pytest
+from google.api_core.exceptions import AlreadyExists
+from google.cloud.video.live_stream_v1 import Channel, ChannelOperationResponse
+from google.cloud.video.live_stream_v1 import Input as InputEndpoint
+
+from sendlive.constants import GCPCredentials
+from sendlive.exceptions import SendLiveError
+from sendlive.instrumentation import InMemoryInstrumentation, set_instrumentation
+from sendlive.operations import OperationPoller
+from sendlive.providers.gcp.adapter import GCPAdapter
+from sendlive.providers.gcp.stream import GCPStream
+from sendlive.stream import StreamURLs
+
+
+@pytest.fixture(scope="function")
+def sendlive_gcp_credentials() -> GCPCredentials:
+    return GCPCredentials(
+        project_id="testing",
+        service_account_json={"type": "service_account"},
+        region="australia-southeast1",
+    )
+
+
+@pytest.fixture(scope="function")
+def gcp_clients() -> Generator[dict[str, Any], Any, None]:
+    """Patch out service account parsing and the google clients, so no network or real key is required."""
+    with mock.patch(
+        "sendlive.providers.gcp.mixins.Credentials"
+    ), mock.patch(
+        "sendlive.providers.gcp.mixins.LivestreamServiceClient"
+    ) as live_stream_client_cls, mock.patch(
+        "sendlive.providers.gcp.mixins.StorageClient"
+    ) as storage_client_cls:
+        yield {
+            "live_stream": live_stream_client_cls,
+            "storage": storage_client_cls,
+        }
+
+
+@pytest.fixture(scope="function")
+def sendlive_gcp_adapter(
+    sendlive_gcp_credentials: GCPCredentials, gcp_clients: dict[str, Any]
+) -> GCPAdapter:
+    return GCPAdapter(credentials=sendlive_gcp_credentials)
+
+
+def test_gcp_adapter_builds_one_live_stream_client(
+    sendlive_gcp_adapter: GCPAdapter, gcp_clients: dict[str, Any]
+) -> None:
+    """Test only one live streaming api client is built per adapter."""
+    first_client = sendlive_gcp_adapter.gcp_live_streaming_api_client()
+    second_client = sendlive_gcp_adapter.gcp_live_streaming_api_client()
+    assert first_client is second_client
+    assert gcp_clients["live_stream"].call_count == 1
+
+
+def test_gcp_adapter_builds_one_storage_client(
+    sendlive_gcp_adapter: GCPAdapter, gcp_clients: dict[str, Any]
+) -> None:
+    """Test only one storage client is built per adapter."""
+    sendlive_gcp_adapter.gcp_storage_client()
+    sendlive_gcp_adapter.get_gcp_bucket_with_name("bucket")
+    sendlive_gcp_adapter.get_gcp_bucket_with_name("other-bucket")
+    assert gcp_clients["storage"].call_count == 1
+
+
+def test_gcp_adapter_close(
+    sendlive_gcp_adapter: GCPAdapter, gcp_clients: dict[str, Any]
+) -> None:
+    """Test closing the adapter closes the clients, and new clients are built on next use."""
+    sendlive_gcp_adapter.gcp_live_streaming_api_client()
+    sendlive_gcp_adapter.gcp_storage_client()
+    sendlive_gcp_adapter.close()
+    gcp_clients["live_stream"].return_value.transport.close.assert_called_once()
+    gcp_clients["storage"].return_value.close.assert_called_once()
+    sendlive_gcp_adapter.gcp_live_streaming_api_client()
+    assert gcp_clients["live_stream"].call_count == 2
+
+
+def test_gcp_adapter_context_manager(
+    sendlive_gcp_credentials: GCPCredentials, gcp_clients: dict[str, Any]
+) -> None:
+    """Test the adapter closes its clients when used as a context manager."""
+    with GCPAdapter(credentials=sendlive_gcp_credentials) as adapter:
+        adapter.gcp_live_streaming_api_client()
+    gcp_clients["live_stream"].return_value.transport.close.assert_called_once()
+
+
+def test_gcp_adapter_shared_grpc_channel(
+    sendlive_gcp_credentials: GCPCredentials, gcp_clients: dict[str, Any]
+) -> None:
+    """Test a supplied gRPC channel is used by the client, and left open when the adapter is closed."""
+    grpc_channel = mock.MagicMock()
+    with mock.patch(
+        "sendlive.providers.gcp.mixins.LivestreamServiceGrpcTransport"
+    ) as transport_cls:
+        adapter = GCPAdapter(
+            credentials=sendlive_gcp_credentials, grpc_channel=grpc_channel
+        )
+        adapter.gcp_live_streaming_api_client()
+        transport_cls.assert_called_once_with(channel=grpc_channel)
+        adapter.close()
+    gcp_clients["live_stream"].return_value.transport.close.assert_not_called()
+    grpc_channel.close.assert_not_called()
+
+
+def test_gcp_adapter_create_input_endpoint_async(
+    sendlive_gcp_adapter: GCPAdapter,
+) -> None:
+    """Test the async input endpoint creation awaits the long running operation via the asyncio client."""
+    created_input = InputEndpoint(name="my-input", type_="RTMP_PUSH")
+    operation = mock.MagicMock()
+    operation.result = mock.AsyncMock(return_value=created_input)
+    async_client = mock.MagicMock()
+    async_client.create_input = mock.AsyncMock(return_value=operation)
+    async_client.transport.close = mock.AsyncMock()
+
+    async def run() -> InputEndpoint:
+        with mock.patch(
+            "sendlive.providers.gcp.mixins.LivestreamServiceAsyncClient",
+            return_value=async_client,
+        ):
+            response = await sendlive_gcp_adapter.create_input_endpoint_async(
+                "my-input"
+            )
+            await sendlive_gcp_adapter.aclose()
+        return response
+
+    assert asyncio.run(run()) == created_input
+    operation.result.assert_awaited_once_with(timeout=900)
+    async_client.transport.close.assert_awaited_once()
+    assert created_input in sendlive_gcp_adapter.gcp_input_endpoints
+
+
+def test_gcp_adapter_create_input_endpoint_without_waiting(
+    sendlive_gcp_adapter: GCPAdapter, gcp_clients: dict[str, Any]
+) -> None:
+    """Test wait=False returns a pending operation handle that resolves in the background."""
+    created_input = InputEndpoint(name="my-input", type_="RTMP_PUSH")
+    operation = mock.MagicMock()
+    operation.done.return_value = True
+    operation.result.return_value = created_input
+    gcp_clients["live_stream"].return_value.create_input.return_value = operation
+    poller = OperationPoller(initial_delay=0.001)
+    with mock.patch.object(
+        GCPAdapter, "operation_poller", new_callable=mock.PropertyMock
+    ) as operation_poller:
+        operation_poller.return_value = poller
+        pending = sendlive_gcp_adapter.create_input_endpoint("my-input", wait=False)
+    assert pending.result(timeout=5) == created_input
+    assert created_input in sendlive_gcp_adapter.gcp_input_endpoints
+    poller.shutdown()
+
+
+def test_gcp_adapter_registers_existing_input_endpoint_once(
+    sendlive_gcp_adapter: GCPAdapter, gcp_clients: dict[str, Any]
+) -> None:
+    """Test an input looked up again after AlreadyExists replaces its registered entry, rather than duplicating it."""
+    client = gcp_clients["live_stream"].return_value
+    existing_input = InputEndpoint(
+        name="projects/testing/locations/australia-southeast1/inputs/my-input"
+    )
+    client.create_input.side_effect = AlreadyExists("exists")  # type: ignore[no-untyped-call]
+    client.get_input.return_value = existing_input
+    sendlive_gcp_adapter.create_input_endpoint("my-input")
+    sendlive_gcp_adapter.create_input_endpoint("my-input")
+    assert list(sendlive_gcp_adapter.gcp_input_endpoints) == [existing_input]
+    assert sendlive_gcp_adapter.gcp_input_endpoints.get(existing_input.name) == (
+        existing_input
+    )
+
+
+def test_gcp_adapter_list_streams(
+    sendlive_gcp_adapter: GCPAdapter, gcp_clients: dict[str, Any]
+) -> None:
+    """Test only sendlive labelled inputs and channels are listed, by their short names."""
+    parent = "projects/testing/locations/australia-southeast1"
+    client = gcp_clients["live_stream"].return_value
+    client.list_inputs.return_value = [
+        InputEndpoint(name=f"{parent}/inputs/stream", labels={"created-by": "sendlive"}),
+        InputEndpoint(name=f"{parent}/inputs/other"),
+    ]
+    client.list_channels.return_value = [
+        Channel(name=f"{parent}/channels/stream", labels={"created-by": "sendlive"}),
+    ]
+    assert sendlive_gcp_adapter.list_streams() == ["stream"]
+    client.list_inputs.assert_called_once_with(parent=parent)
+
+
+def test_gcp_adapter_reports_create_input_endpoint_calls(
+    sendlive_gcp_adapter: GCPAdapter, gcp_clients: dict[str, Any]
+) -> None:
+    """Test creating an input endpoint reports the api call and the wait on its long running operation."""
+    operation = mock.MagicMock()
+    operation.result.return_value = InputEndpoint(name="my-input")
+    gcp_clients["live_stream"].return_value.create_input.return_value = operation
+    instrumentation = InMemoryInstrumentation()
+    set_instrumentation(instrumentation)
+    try:
+        sendlive_gcp_adapter.create_input_endpoint("my-input")
+    finally:
+        set_instrumentation(None)
+    assert [record.operation for record in instrumentation.calls(provider="gcp")] == [
+        "livestream.create_input",
+        "livestream.create_input.wait",
+    ]
+
+
+def _completed_operation(result: Any) -> mock.MagicMock:
+    operation = mock.MagicMock()
+    operation.done.return_value = True
+    operation.result.return_value = result
+    return operation
+
+
+@pytest.fixture(scope="function")
+def operation_poller() -> Generator[OperationPoller, Any, None]:
+    poller = OperationPoller(initial_delay=0.001)
+    with mock.patch.object(
+        GCPAdapter, "operation_poller", new_callable=mock.PropertyMock
+    ) as operation_poller:
+        operation_poller.return_value = poller
+        yield poller
+    poller.shutdown()
+
+
+def test_gcp_adapter_create_stream(
+    sendlive_gcp_adapter: GCPAdapter, gcp_clients: dict[str, Any]
+) -> None:
+    """Test the bucket and input are set up at the same time, then the channel is created from both."""
+    parent = "projects/testing/locations/australia-southeast1"
+    client = gcp_clients["live_stream"].return_value
+    # each step waits for the other to start, so this only completes if both run at once
+    barrier = threading.Barrier(2, timeout=5)
+
+    def init_bucket() -> None:
+        barrier.wait()
+        bucket = mock.MagicMock()
+        bucket.name = "my-bucket"
+        sendlive_gcp_adapter._bucket = bucket
+
+    def create_input(**_: Any) -> mock.MagicMock:
+        barrier.wait()
+        return _completed_operation(
+            InputEndpoint(
+                name=f"{parent}/inputs/my-stream", uri="rtmp://1.2.3.4/live/abc"
+            )
+        )
+
+    client.create_input.side_effect = create_input
+    client.create_channel.return_value = _completed_operation(
+        Channel(
+            name=f"{parent}/channels/my-stream",
+            output=Channel.Output(uri="gs://my-bucket/sendlive/gcp-streams/my-stream"),
+        )
+    )
+    with mock.patch.object(GCPAdapter, "init_bucket", side_effect=init_bucket):
+        stream = sendlive_gcp_adapter.create_stream("my-stream")
+    channel = client.create_channel.call_args.kwargs["channel"]
+    assert channel.input_attachments[0].input == f"{parent}/inputs/my-stream"
+    assert channel.output.uri == "gs://my-bucket/sendlive/gcp-streams/my-stream"
+    assert stream.channel_name == f"{parent}/channels/my-stream"
+    assert stream.get_url() == StreamURLs(
+        input="rtmp://1.2.3.4/live/abc",
+        playback="https://storage.googleapis.com/my-bucket/sendlive/gcp-streams/my-stream/manifest.m3u8",
+    )
+
+
+def test_gcp_adapter_create_low_latency_stream(
+    sendlive_gcp_adapter: GCPAdapter, gcp_clients: dict[str, Any]
+) -> None:
+    """Test a low latency stream's channel is encoded in short fmp4 segments, with a short manifest window."""
+    parent = "projects/testing/locations/australia-southeast1"
+    client = gcp_clients["live_stream"].return_value
+    sendlive_gcp_adapter._bucket = mock.MagicMock()
+    client.create_input.return_value = _completed_operation(
+        InputEndpoint(name=f"{parent}/inputs/my-stream", uri="rtmp://1.2.3.4/live/abc")
+    )
+    client.create_channel.return_value = _completed_operation(
+        Channel(name=f"{parent}/channels/my-stream")
+    )
+    sendlive_gcp_adapter.create_stream("my-stream", latency_mode="low")
+    channel = client.create_channel.call_args.kwargs["channel"]
+    assert {stream.container for stream in channel.mux_streams} == {"fmp4"}
+    assert channel.manifests[0].max_segment_count == 3
+    with pytest.raises(SendLiveError):
+        sendlive_gcp_adapter.create_stream("my-stream")
+
+
+def test_gcp_adapter_reuses_resources_recorded_in_state(
+    sendlive_gcp_credentials: GCPCredentials, gcp_clients: dict[str, Any]
+) -> None:
+    """Test a restarted adapter looks up a created stream's input and channel from the local state without api calls."""
+    parent = "projects/testing/locations/australia-southeast1"
+    client = gcp_clients["live_stream"].return_value
+    client.create_input.return_value = _completed_operation(
+        InputEndpoint(name=f"{parent}/inputs/my-stream", uri="rtmp://1.2.3.4/live/abc")
+    )
+    client.create_channel.return_value = _completed_operation(
+        Channel(
+            name=f"{parent}/channels/my-stream",
+            output=Channel.Output(uri="gs://my-bucket/sendlive/gcp-streams/my-stream"),
+        )
+    )
+    adapter = GCPAdapter(credentials=sendlive_gcp_credentials)
+    adapter._bucket = mock.MagicMock()
+    stream = adapter.create_stream("my-stream")
+    client.reset_mock()
+
+    restarted_adapter = GCPAdapter(credentials=sendlive_gcp_credentials)
+    recorded_stream = restarted_adapter.create_stream("my-stream")
+    input_endpoint = restarted_adapter.get_input_endpoint("my-stream")
+    assert recorded_stream.model_dump() == stream.model_dump()
+    assert input_endpoint.uri == "rtmp://1.2.3.4/live/abc"
+    assert client.method_calls == []
+    # the current streaming state is never read from the local state
+    client.get_channel.return_value = Channel(
+        streaming_state=Channel.StreamingState.STREAMING
+    )
+    assert recorded_stream.is_alive()
+    client.get_channel.assert_called_once()
+    with pytest.raises(SendLiveError):
+        restarted_adapter.create_stream("my-stream", latency_mode="low")
+    with pytest.raises(SendLiveError):
+        asyncio.run(
+            restarted_adapter.create_stream_async("my-stream", latency_mode="low")
+        )
+
+
+def test_gcp_adapter_create_stream_async(
+    sendlive_gcp_adapter: GCPAdapter, gcp_clients: dict[str, Any]
+) -> None:
+    """Test the async stream creation awaits the input and channel operations via the asyncio client."""
+    parent = "projects/testing/locations/australia-southeast1"
+    async_client = mock.MagicMock()
+    async_client.create_input = mock.AsyncMock(
+        return_value=mock.MagicMock(
+            result=mock.AsyncMock(
+                return_value=InputEndpoint(
+                    name=f"{parent}/inputs/my-stream", uri="rtmp://1.2.3.4/live/abc"
+                )
+            )
+        )
+    )
+    async_client.create_channel = mock.AsyncMock(
+        return_value=mock.MagicMock(
+            result=mock.AsyncMock(
+                return_value=Channel(
+                    name=f"{parent}/channels/my-stream",
+                    output=Channel.Output(
+                        uri="gs://my-bucket/sendlive/gcp-streams/my-stream"
+                    ),
+                )
+            )
+        )
+    )
+    bucket = mock.MagicMock()
+    bucket.name = "my-bucket"
+    sendlive_gcp_adapter._bucket = bucket
+
+    async def run() -> GCPStream:
+        with mock.patch(
+            "sendlive.providers.gcp.mixins.LivestreamServiceAsyncClient",
+            return_value=async_client,
+        ):
+            return await sendlive_gcp_adapter.create_stream_async("my-stream")
+
+    stream = asyncio.run(run())
+    assert stream.get_url().input == "rtmp://1.2.3.4/live/abc"
+    assert stream.channel_name == f"{parent}/channels/my-stream"
+    gcp_clients["live_stream"].return_value.create_input.assert_not_called()
+
+
+def test_gcp_stream_start_and_stop_do_not_block(
+    sendlive_gcp_adapter: GCPAdapter,
+    gcp_clients: dict[str, Any],
+    operation_poller: OperationPoller,
+) -> None:
+    """Test starting and stopping a stream returns before the operation completes, tracking it in the background."""
+    client = gcp_clients["live_stream"].return_value
+    start_operation = mock.MagicMock()
+    start_operation.done.return_value = False
+    start_operation.result.return_value = ChannelOperationResponse()
+    client.start_channel.return_value = start_operation
+    client.stop_channel.return_value = _completed_operation(ChannelOperationResponse())
+    stream = GCPStream(name="my-stream", channel_name="channels/my-stream")
+    stream.bind(sendlive_gcp_adapter)
+
+    stream.start()
+    client.start_channel.assert_called_once_with(name="channels/my-stream")
+    pending = stream.pending_operation
+    assert pending is not None
+    assert not pending.done()
+    start_operation.done.return_value = True
+    assert pending.result(timeout=5) == ChannelOperationResponse()
+
+    stream.stop(wait=True)
+    client.stop_channel.assert_called_once_with(name="channels/my-stream")
+    assert stream.pending_operation is not None
+    assert stream.pending_operation.done()
+
+
+@pytest.mark.parametrize(
+    ("streaming_state", "alive"),
+    [
+        (Channel.StreamingState.STREAMING, True),
+        (Channel.StreamingState.AWAITING_INPUT, True),
+        (Channel.StreamingState.STARTING, False),
+        (Channel.StreamingState.STOPPED, False),
+    ],
+)
+def test_gcp_stream_is_alive(
+    sendlive_gcp_adapter: GCPAdapter,
+    gcp_clients: dict[str, Any],
+    streaming_state: Channel.StreamingState,
+    alive: bool,
+) -> None:
+    """Test a stream is alive once its channel has started, until it is stopped."""
+    gcp_clients["live_stream"].return_value.get_channel.return_value = Channel(
+        name="channels/my-stream", streaming_state=streaming_state
+    )
+    stream = GCPStream(name="my-stream", channel_name="channels/my-stream")
+    stream.bind(sendlive_gcp_adapter)
+    assert stream.is_alive() is alive
+
+
+def test_gcp_adapter_collect_garbage(
+    sendlive_gcp_adapter: GCPAdapter, gcp_clients: dict[str, Any]
+) -> None:
+    """Test an orphaned stream's channel is deleted before its input, and live or unknown streams are kept."""
+    parent = "projects/testing/locations/australia-southeast1"
+    labels = {"created-by": "sendlive"}
+    client = gcp_clients["live_stream"].return_value
+    client.list_inputs.return_value = [
+        InputEndpoint(name=f"{parent}/inputs/orphan", labels=labels),
+        InputEndpoint(name=f"{parent}/inputs/live", labels=labels),
+        InputEndpoint(name=f"{parent}/inputs/other"),
+    ]
+    client.list_channels.return_value = [
+        Channel(
+            name=f"{parent}/channels/orphan",
+            labels=labels,
+            streaming_state=Channel.StreamingState.STOPPED,
+        ),
+        Channel(
+            name=f"{parent}/channels/live",
+            labels=labels,
+            streaming_state=Channel.StreamingState.STREAMING,
+        ),
+    ]
+    deleted: list[str] = []
+
+    def delete(name: str) -> mock.MagicMock:
+        deleted.append(name)
+        return _completed_operation(None)
+
+    client.delete_channel.side_effect = delete
+    client.delete_input.side_effect = delete
+    result = sendlive_gcp_adapter.collect_garbage()
+    # none of the streams are recorded in the local state, so may have been created elsewhere
+    assert deleted == []
+    assert not result.orphans
+    sendlive_gcp_adapter.record_resource(
+        "livestream.input",
+        f"{parent}/inputs/orphan",
+        name="orphan",
+        stream_name="orphan",
+    )
+    result = sendlive_gcp_adapter.collect_garbage()
+    assert deleted == [f"{parent}/channels/orphan", f"{parent}/inputs/orphan"]
+    assert len(result.deleted) == 2
+    assert len(result.resources) == 4
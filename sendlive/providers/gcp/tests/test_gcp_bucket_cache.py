@@ -0,0 +1,146 @@
+from collections.abc import Generator, Iterator
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+from google.api_core.exceptions import Conflict, NotFound
+
+from sendlive.constants import GCPCredentials, GCPOptions
+from sendlive.exceptions import SendLiveError
+from sendlive.providers.gcp.adapter import GCPAdapter
+from sendlive.providers.gcp.bucket_cache import BucketNameCache
+
+
+@pytest.fixture(autouse=True)
+def clear_bucket_name_cache() -> Generator[None, Any, None]:
+    BucketNameCache.clear_memory()
+    yield
+    BucketNameCache.clear_memory()
+
+
+@pytest.fixture(scope="function")
+def storage_client() -> Generator[mock.MagicMock, Any, None]:
+    with mock.patch("sendlive.providers.gcp.mixins.Credentials"), mock.patch(
+        "sendlive.providers.gcp.mixins.StorageClient"
+    ) as storage_client_cls:
+        yield storage_client_cls.return_value
+
+
+@pytest.fixture(scope="function")
+def sendlive_gcp_adapter(
+    storage_client: mock.MagicMock, tmp_path: Path
+) -> GCPAdapter:
+    return GCPAdapter(
+        credentials=GCPCredentials(
+            project_id="testing",
+            service_account_json={"type": "service_account"},
+            region="australia-southeast1",
+        ),
+        provider_options=GCPOptions(
+            bucket_cache_path=str(tmp_path / "bucket-cache.json")
+        ),
+    )
+
+
+def make_bucket(name: str, sendlive: bool = False) -> mock.MagicMock:
+    bucket = mock.MagicMock()
+    bucket.name = name
+    bucket.labels = {"created-by": "sendlive"} if sendlive else {}
+    return bucket
+
+
+def test_bucket_name_cache_persists_to_file(tmp_path: Path) -> None:
+    """Test cached bucket names are written to and read back from the cache file."""
+    path = tmp_path / "cache.json"
+    BucketNameCache(path).set("project", "bucket")
+    BucketNameCache.clear_memory()
+    assert BucketNameCache(path).get("project") == "bucket"
+    BucketNameCache(path).invalidate("project")
+    BucketNameCache.clear_memory()
+    assert BucketNameCache(path).get("project") is None
+
+
+def test_scan_exits_early_and_populates_cache(
+    sendlive_gcp_adapter: GCPAdapter, storage_client: mock.MagicMock
+) -> None:
+    """Test the bucket scan stops at the first sendlive bucket and caches its name."""
+    consumed: list[str] = []
+
+    def list_buckets(**kwargs: Any) -> Iterator[mock.MagicMock]:
+        for bucket in [
+            make_bucket("other"),
+            make_bucket("sendlive-bucket", sendlive=True),
+            make_bucket("never-reached"),
+        ]:
+            consumed.append(bucket.name)
+            yield bucket
+
+    storage_client.list_buckets.side_effect = list_buckets
+    sendlive_gcp_adapter.init_bucket()
+    assert sendlive_gcp_adapter.bucket_uri == "gs://sendlive-bucket"
+    assert consumed == ["other", "sendlive-bucket"]
+    assert sendlive_gcp_adapter.bucket_name_cache.get("testing") == "sendlive-bucket"
+
+
+def test_cached_bucket_is_validated_without_scanning(
+    sendlive_gcp_adapter: GCPAdapter, storage_client: mock.MagicMock
+) -> None:
+    """Test a cached bucket name is validated with a single get rather than a scan."""
+    sendlive_gcp_adapter.bucket_name_cache.set("testing", "sendlive-bucket")
+    storage_client.get_bucket.return_value = make_bucket(
+        "sendlive-bucket", sendlive=True
+    )
+    sendlive_gcp_adapter.init_bucket()
+    assert sendlive_gcp_adapter.bucket_uri == "gs://sendlive-bucket"
+    storage_client.get_bucket.assert_called_once_with("sendlive-bucket")
+    storage_client.list_buckets.assert_not_called()
+
+
+def test_stale_cached_bucket_falls_back_to_scan(
+    sendlive_gcp_adapter: GCPAdapter, storage_client: mock.MagicMock
+) -> None:
+    """Test a cached bucket that no longer exists is dropped and buckets are scanned instead."""
+    sendlive_gcp_adapter.bucket_name_cache.set("testing", "deleted-bucket")
+    storage_client.get_bucket.side_effect = NotFound("deleted")  # type: ignore[no-untyped-call]
+    storage_client.list_buckets.return_value = iter(
+        [make_bucket("new-sendlive-bucket", sendlive=True)]
+    )
+    assert (
+        sendlive_gcp_adapter.find_sendlive_metadata_tagged_bucket_name()
+        == "new-sendlive-bucket"
+    )
+    assert (
+        sendlive_gcp_adapter.bucket_name_cache.get("testing") == "new-sendlive-bucket"
+    )
+
+
+def test_created_bucket_name_is_redrawn_when_taken(
+    sendlive_gcp_adapter: GCPAdapter, storage_client: mock.MagicMock
+) -> None:
+    """Test creating a bucket whose generated name is taken by another project retries with a new name."""
+    storage_client.list_buckets.return_value = iter([])
+    tried: list[str] = []
+
+    def create_bucket(bucket: mock.MagicMock, **kwargs: Any) -> mock.MagicMock:
+        tried.append(bucket.name)
+        if len(tried) == 1:
+            raise Conflict("taken")  # type: ignore[no-untyped-call]
+        return make_bucket(bucket.name, sendlive=True)
+
+    storage_client.bucket.side_effect = make_bucket
+    storage_client.create_bucket.side_effect = create_bucket
+    sendlive_gcp_adapter.init_bucket()
+    assert len(set(tried)) == 2
+    assert sendlive_gcp_adapter.bucket_uri == f"gs://{tried[1]}"
+    assert sendlive_gcp_adapter.bucket_name_cache.get("testing") == tried[1]
+
+
+def test_create_sendlive_bucket_gives_up(
+    sendlive_gcp_adapter: GCPAdapter, storage_client: mock.MagicMock
+) -> None:
+    """Test creating a bucket fails once every generated name has been taken."""
+    storage_client.create_bucket.side_effect = Conflict("taken")  # type: ignore[no-untyped-call]
+    with pytest.raises(SendLiveError):
+        sendlive_gcp_adapter.create_sendlive_bucket(max_attempts=3)
+    assert storage_client.create_bucket.call_count == 3
@@ -0,0 +1,125 @@
+import pytest
+from google.cloud.video import live_stream_v1
+
+from sendlive.exceptions import SendLiveError
+from sendlive.profiles import EncodingProfile, VideoRendition, to_low_latency
+from sendlive.providers.gcp import constants
+from sendlive.providers.gcp.utils import (
+    build_gcp_channel_obj_from_defaults,
+    compile_gcp_channel_streams,
+)
+
+LADDER = EncodingProfile(
+    video=(
+        VideoRendition(name="1080p", width=1920, height=1080, bitrate=5000000),
+        VideoRendition(name="480p", width=854, height=480, bitrate=1500000),
+    ),
+    gop_seconds=2,
+    segment_seconds=4,
+    playlist_window_seconds=30,
+)
+
+
+def _build(name: str = "one", **kwargs: object) -> live_stream_v1.Channel:
+    return build_gcp_channel_obj_from_defaults(
+        f"projects/p/locations/l/channels/{name}",
+        f"projects/p/locations/l/inputs/{name}",
+        "gs://bucket",
+        output_path=f"sendlive/gcp-streams/{name}",
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def test_build_gcp_channel_obj_from_defaults() -> None:
+    """Test a channel built from the cached template has the default profile and the channel's own fields."""
+    channel = _build(tags={"team": "video"})
+    assert channel.name == "projects/p/locations/l/channels/one"
+    assert list(channel.input_attachments) == [
+        live_stream_v1.InputAttachment(
+            key="input-attachment", input="projects/p/locations/l/inputs/one"
+        )
+    ]
+    assert channel.output.uri == "gs://bucket/sendlive/gcp-streams/one"
+    assert dict(channel.labels) == {"team": "video"}
+    assert [stream.key for stream in channel.elementary_streams] == [
+        "es_video_720p",
+        "es_audio",
+    ]
+    h264 = channel.elementary_streams[0].video_stream.h264
+    assert (h264.width_pixels, h264.height_pixels, h264.frame_rate) == (1280, 720, 30)
+    assert h264.profile == "high"
+    (manifest,) = channel.manifests
+    assert list(manifest.mux_streams) == ["mux_video_720p", "mux_audio"]
+    assert manifest.max_segment_count == 5
+
+
+def test_build_gcp_channel_obj_from_defaults_isolated() -> None:
+    """Test channels built from the template don't share messages with each other or the compiled profile."""
+    first = _build("one")
+    first.elementary_streams[0].video_stream.h264.bitrate_bps = 1
+    first.manifests[0].max_segment_count = 1
+    second = _build("two")
+    assert second.name.endswith("/two")
+    assert second.elementary_streams[0].video_stream.h264.bitrate_bps == 3000000
+    assert second.manifests[0].max_segment_count == 5
+    assert not second.labels
+
+
+def test_build_gcp_channel_obj_from_profile() -> None:
+    """Test a channel encodes each rendition of its profile to its own mux stream, segmented as configured."""
+    channel = _build(encoding_profile=LADDER)
+    assert [stream.key for stream in channel.mux_streams] == [
+        "mux_video_1080p",
+        "mux_video_480p",
+        "mux_audio",
+    ]
+    assert {
+        stream.segment_settings.segment_duration.total_seconds()
+        for stream in channel.mux_streams
+    } == {4}
+    assert channel.manifests[0].max_segment_count == 8
+
+
+def test_compile_gcp_channel_streams_returns_new_messages() -> None:
+    """Test callers modifying compiled messages don't change the channels built from the same profile."""
+    elementary_streams, _, manifests = compile_gcp_channel_streams(LADDER)
+    elementary_streams[0].video_stream.h264.bitrate_bps = 1
+    manifests[0].max_segment_count = 1
+    assert (
+        compile_gcp_channel_streams(LADDER)[0][0].video_stream.h264.bitrate_bps
+        == 5000000
+    )
+    channel = _build(encoding_profile=LADDER)
+    assert channel.elementary_streams[0].video_stream.h264.bitrate_bps == 5000000
+    assert channel.manifests[0].max_segment_count == 8
+
+
+def test_gcp_default_messages_are_compiled_from_the_default_profile() -> None:
+    """Test the default messages kept for compatibility are those of channels built from the default profile."""
+    channel = _build()
+    assert [constants.GCP_DEFAULT_720P_ES, constants.GCP_DEFAULT_AUDIO_ES] == list(
+        channel.elementary_streams
+    )
+    assert [constants.GCP_DEFAULT_720P_MUX, constants.GCP_DEFAULT_AUDIO_MUX] == list(
+        channel.mux_streams
+    )
+    assert constants.GCP_DEFAULT_MANIFEST == channel.manifests[0]
+    with pytest.raises(AttributeError):
+        constants.GCP_DEFAULT_1080P_ES  # noqa: B018
+
+
+def test_build_low_latency_gcp_channel_obj() -> None:
+    """Test low latency channels have fmp4 segments of a single GOP, and the shortest manifest gcp allows."""
+    channel = _build(encoding_profile=to_low_latency(LADDER, 2, 6))
+    assert {stream.container for stream in channel.mux_streams} == {"fmp4"}
+    h264 = channel.elementary_streams[0].video_stream.h264
+    assert h264.gop_duration.total_seconds() == 2
+    assert channel.manifests[0].max_segment_count == 3
+    assert {stream.container for stream in _build().mux_streams} == {""}
+
+
+def test_compile_gcp_channel_streams_requires_whole_gops() -> None:
+    """Test profiles whose segments can't be cut on a GOP boundary are rejected."""
+    profile = LADDER.model_copy(update={"gop_seconds": 1.92})
+    with pytest.raises(SendLiveError):
+        compile_gcp_channel_streams(profile)
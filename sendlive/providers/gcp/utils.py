@@ -1,44 +1,164 @@
+import math
+from datetime import timedelta
+from functools import lru_cache
 from typing import Optional
 
+import grpc  # type: ignore
 from google.cloud.video import live_stream_v1
+from google.cloud.video.live_stream_v1.services.livestream_service.transports import (
+    LivestreamServiceGrpcTransport,
+)
+from google.oauth2.service_account import Credentials
 
+from sendlive.constants import GCPCredentials
+from sendlive.exceptions import SendLiveError
+from sendlive.profiles import EncodingProfile
 from sendlive.providers.gcp.constants import (
-    GCP_DEFAULT_720P_ES,
-    GCP_DEFAULT_720P_MUX,
-    GCP_DEFAULT_AUDIO_ES,
-    GCP_DEFAULT_AUDIO_MUX,
-    GCP_DEFAULT_MANIFEST,
+    GCP_CHANNEL_OUTPUT_PATH,
+    GCP_DEFAULT_ENCODING_PROFILE,
+    GCP_MANIFEST_FILE_NAME,
+    GCP_MUX_CONTAINERS,
+    GCP_STORAGE_PUBLIC_URL,
 )
 from sendlive.types import MappingTags
 
 
-def build_gcp_channel_obj_from_defaults(
+def compile_gcp_channel_streams(
+    profile: EncodingProfile,
+) -> tuple[
+    list[live_stream_v1.ElementaryStream],
+    list[live_stream_v1.MuxStream],
+    list[live_stream_v1.Manifest],
+]:
+    """Compile an encoding profile to the elementary streams, mux streams and HLS manifest of a GCP channel.
+
+    Every video rendition is muxed on its own, with audio in a separate mux stream. GCP does not serve low latency
+    HLS, so low_latency_hls is ignored. Every call compiles new messages, which the caller is free to modify, as
+    channels are built from a serialized template cached per profile instead.
+    """
+    gops_per_segment = profile.segment_seconds / profile.gop_seconds
+    if not math.isclose(gops_per_segment, round(gops_per_segment)):
+        raise SendLiveError(
+            f"GCP segments must be a whole number of GOPs long, not {profile.segment_seconds}s for "
+            f"{profile.gop_seconds}s GOPs"
+        )
+    segment_settings = live_stream_v1.SegmentSettings(
+        segment_duration=timedelta(seconds=profile.segment_seconds)
+    )
+    # unset uses gcp's default container, fmp4
+    container = GCP_MUX_CONTAINERS[profile.container] if profile.container else ""
+    elementary_streams = [
+        live_stream_v1.ElementaryStream(
+            key=f"es_video_{rendition.name}",
+            video_stream=live_stream_v1.VideoStream(
+                h264=live_stream_v1.VideoStream.H264CodecSettings(
+                    profile=profile.h264_profile,
+                    width_pixels=rendition.width,
+                    height_pixels=rendition.height,
+                    bitrate_bps=rendition.bitrate,
+                    frame_rate=profile.frame_rate,
+                    gop_duration=timedelta(seconds=profile.gop_seconds),
+                )
+            ),
+        )
+        for rendition in profile.video
+    ]
+    elementary_streams.append(
+        live_stream_v1.ElementaryStream(
+            key="es_audio",
+            audio_stream=live_stream_v1.AudioStream(
+                codec="aac",
+                channel_count=profile.audio.channels,
+                bitrate_bps=profile.audio.bitrate,
+                sample_rate_hertz=profile.audio.sample_rate,
+            ),
+        )
+    )
+    mux_streams = [
+        live_stream_v1.MuxStream(
+            key=f"mux_video_{rendition.name}",
+            container=container,
+            elementary_streams=[f"es_video_{rendition.name}"],
+            segment_settings=segment_settings,
+        )
+        for rendition in profile.video
+    ]
+    mux_streams.append(
+        live_stream_v1.MuxStream(
+            key="mux_audio",
+            container=container,
+            elementary_streams=["es_audio"],
+            segment_settings=segment_settings,
+        )
+    )
+    manifest = live_stream_v1.Manifest(
+        file_name=GCP_MANIFEST_FILE_NAME,
+        type_="HLS",
+        mux_streams=[mux_stream.key for mux_stream in mux_streams],
+        max_segment_count=math.ceil(
+            profile.playlist_window_seconds / profile.segment_seconds
+        ),
+    )
+    return elementary_streams, mux_streams, [manifest]
+
+
+@lru_cache(maxsize=32)
+def _gcp_channel_template(profile: EncodingProfile) -> bytes:
+    """Serialize the parts of a channel that are the same for every channel encoded to a profile.
+
+    The template is never handed out, so channels built from it can't be changed by each other.
+    """
+    elementary_streams, mux_streams, manifests = compile_gcp_channel_streams(profile)
+    template: bytes = live_stream_v1.Channel.serialize(
+        live_stream_v1.Channel(
+            elementary_streams=elementary_streams,
+            mux_streams=mux_streams,
+            manifests=manifests,
+        )
+    )
+    return template
+
+
+def build_gcp_channel_obj_from_defaults(  # noqa: PLR0913
     name: str,
     input_str: str,
     bucket_output_uri: str,
     tags: Optional[MappingTags] = None,
+    output_path: str = GCP_CHANNEL_OUTPUT_PATH,
+    *,
+    encoding_profile: Optional[EncodingProfile] = None,
 ) -> live_stream_v1.Channel:
-    """Build a GCP channel object from defaults."""
-    # TODO check relevance of input attachment key
-    if tags is None:
-        tags = dict()
-    input_attachment = live_stream_v1.InputAttachment(
-        key="input-attachment", input=input_str
-    )
-    bucket_uri_with_path = f"{bucket_output_uri}/sendlive/gcp-streams"
-    output = live_stream_v1.Channel.Output(uri=bucket_uri_with_path)
-    channel = live_stream_v1.Channel(
-        name=name,
-        input_attachments=[input_attachment],
-        output=output,
-        elementary_streams=[GCP_DEFAULT_720P_ES, GCP_DEFAULT_AUDIO_ES],
-        mux_streams=[GCP_DEFAULT_720P_MUX, GCP_DEFAULT_AUDIO_MUX],
-        manifests=[GCP_DEFAULT_MANIFEST],
-        labels=tags or dict(),
+    """Build a GCP channel object from defaults, writing its output to output_path within the bucket.
+
+    The channel encodes to encoding_profile, or the default profile. Each channel is parsed from a cached template of its
+    profile, then only the fields specific to the channel are set, which is much cheaper than building every message of
+    the channel again.
+    """
+    channel: live_stream_v1.Channel = live_stream_v1.Channel.deserialize(
+        _gcp_channel_template(encoding_profile or GCP_DEFAULT_ENCODING_PROFILE)
     )
+    # set fields on the underlying protobuf message, skipping the proto-plus wrappers
+    channel_pb = live_stream_v1.Channel.pb(channel)
+    channel_pb.name = name
+    # TODO check relevance of input attachment key
+    channel_pb.input_attachments.add(key="input-attachment", input=input_str)
+    channel_pb.output.uri = f"{bucket_output_uri}/{output_path}"
+    if tags:
+        channel_pb.labels.update(tags)
     return channel
 
 
+def construct_gcp_channel_output_path(channel_id: str) -> str:
+    """Construct the path within the bucket that a channel writes its output to."""
+    return f"{GCP_CHANNEL_OUTPUT_PATH}/{channel_id}"
+
+
+def construct_gcp_manifest_url(output_uri: str) -> str:
+    """Construct the public url of the default HLS manifest written by a channel to its gs:// output uri."""
+    bucket_and_path = output_uri.removeprefix("gs://").rstrip("/")
+    return f"{GCP_STORAGE_PUBLIC_URL}/{bucket_and_path}/{GCP_MANIFEST_FILE_NAME}"
+
+
 def construct_gcp_base_name(project_id: str, location: str) -> str:
     """Construct the base name that makes up other specific GCP names."""
     return f"projects/{project_id}/locations/{location}"
@@ -54,3 +174,16 @@ def construct_gcp_input_endpoint_name(
 def construct_gcp_channel_name(project_id: str, location: str, channel_id: str) -> str:
     """Construct a channel name string for GCP."""
     return f"{construct_gcp_base_name(project_id, location)}/channels/{channel_id}"
+
+
+def create_live_stream_grpc_channel(credentials: GCPCredentials) -> grpc.Channel:
+    """Create a gRPC channel for the live streaming api that can be shared between multiple adapters.
+
+    The caller owns the returned channel and is responsible for closing it.
+    """
+    return LivestreamServiceGrpcTransport.create_channel(
+        credentials=Credentials.from_service_account_info(  # type: ignore[no-untyped-call]
+            info=credentials.service_account_json
+        ),
+        scopes=LivestreamServiceGrpcTransport.AUTH_SCOPES,
+    )
@@ -0,0 +1 @@
+"""Simulated, in-memory live streaming provider, for load testing and development without a cloud account."""
@@ -0,0 +1,387 @@
+from collections.abc import Callable
+from typing import Any, ClassVar, Literal, Optional, TypeVar, Union, overload
+
+from pydantic import ConfigDict, PrivateAttr
+from typing_extensions import override
+
+from sendlive.adapter import BaseAdapter
+from sendlive.constants import (
+    CREATED_BY_KEY,
+    CREATED_BY_VALUE,
+    LocalCredentials,
+    LocalOptions,
+)
+from sendlive.gc import GCResourceType, SendLiveResource
+from sendlive.instrumentation import instrument_call, instrument_pending_operation
+from sendlive.logger import logger
+from sendlive.mixins import StateMixin, TagMixin
+from sendlive.operations import (
+    OperationPoller,
+    PendingOperation,
+    get_default_operation_poller,
+)
+from sendlive.profiles import LatencyMode
+from sendlive.providers.local.cloud import (
+    LocalChannel,
+    LocalCloud,
+    LocalInput,
+    LocalOperation,
+    get_local_cloud,
+)
+from sendlive.providers.local.constants import (
+    INSTRUMENTATION_PROVIDER,
+    LOCAL_CHANNEL,
+    LOCAL_DELETABLE_CHANNEL_STATES,
+    LOCAL_INPUT,
+    LOCAL_OPERATION_TIMEOUT,
+)
+from sendlive.providers.local.stream import LocalStream
+from sendlive.retry import ProviderRetrier, translated_errors
+from sendlive.types import MappingTags
+
+T = TypeVar("T")
+
+
+class LocalAdapter(TagMixin, StateMixin, BaseAdapter):
+    """Adapter for the simulated local provider, see `sendlive.providers.local`.
+
+    Adapters with the same account id share the same simulated inputs and channels, which last for the lifetime of
+    the process.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    credentials: LocalCredentials
+    provider_options: Optional[LocalOptions] = LocalOptions()
+
+    state_provider: ClassVar[str] = INSTRUMENTATION_PROVIDER
+    _retrier: ProviderRetrier = PrivateAttr()
+
+    def __init__(self, credentials: LocalCredentials, **data: Any) -> None:
+        """Set up the retrier for calls to the simulated provider."""
+        super().__init__(credentials=credentials, **data)
+        if self.provider_options is None:
+            # simulated resources only last as long as the process, so must not be recorded in the on-disk state
+            self.provider_options = LocalOptions()
+        self._retrier = ProviderRetrier(
+            INSTRUMENTATION_PROVIDER,
+            credentials.region,
+            self.provider_options.retry_policy,
+        )
+
+    @property
+    def cloud(self) -> LocalCloud:
+        """Get the simulated provider account of the credentials."""
+        return get_local_cloud(self.credentials.account_id, self.provider_options)
+
+    @property
+    def state_account(self) -> str:
+        """Get the simulated account of the credentials, which resources are recorded under."""
+        return self.credentials.account_id
+
+    @property
+    def state_region(self) -> str:
+        """Get the region of the credentials, which resources are recorded under."""
+        return self.credentials.region
+
+    @property
+    def operation_poller(self) -> OperationPoller:
+        """Get the poller that tracks long running operations started with wait=False."""
+        return get_default_operation_poller()
+
+    def call_provider(
+        self,
+        operation: str,
+        fn: Callable[[], T],
+        idempotent: Optional[bool] = None,
+    ) -> T:
+        """Call fn, which makes the api call for operation (such as "local.get_input"), retrying it as needed.
+
+        Calls are instrumented, rate limited and retried in the same way as those of real providers, see
+        `sendlive.retry`.
+        """
+        with instrument_call(INSTRUMENTATION_PROVIDER, operation) as call:
+            return self._retrier.call(
+                operation, fn, idempotent=idempotent, on_retry=call.add_retries
+            )
+
+    def _wait(self, operation_path: str, operation: LocalOperation[T]) -> T:
+        """Block until a long running operation completes."""
+        with instrument_call(INSTRUMENTATION_PROVIDER, f"{operation_path}.wait"):
+            with translated_errors(operation_path):
+                return operation.result(LOCAL_OPERATION_TIMEOUT)
+
+    def resource_path(self, collection: str, resource_id: str) -> str:
+        """Return the path of a resource, which uniquely identifies it across accounts and regions."""
+        return (
+            f"local/{self.credentials.account_id}/{self.state_region}/"
+            f"{collection}/{resource_id}"
+        )
+
+    def is_sendlive_resource(self, tags: MappingTags) -> bool:
+        """Check whether a resource's tags mark it as created by sendlive."""
+        return tags.get(CREATED_BY_KEY) == CREATED_BY_VALUE
+
+    def create_input(self, name: str, tags: Optional[MappingTags] = None) -> LocalInput:
+        """Create an input named after a stream, and record it in the local state."""
+        local_input = self.call_provider(
+            "local.create_input",
+            lambda: self.cloud.create_input(name, dict(self.get_operation_tags(tags))),
+        )
+        self.record_resource(
+            LOCAL_INPUT,
+            self.resource_path("inputs", local_input.id),
+            name,
+            stream_name=name,
+            resource=local_input.model_dump(),
+        )
+        return local_input
+
+    def list_inputs(self) -> list[LocalInput]:
+        """List every input."""
+        return self.call_provider("local.list_inputs", self.cloud.list_inputs)
+
+    def delete_input(self, input_id: str) -> None:
+        """Delete an input, which must not be attached to a channel."""
+        self.call_provider(
+            "local.delete_input", lambda: self.cloud.delete_input(input_id)
+        )
+        self.state.delete(self.resource_path("inputs", input_id))
+
+    def create_channel(
+        self, name: str, input_id: str, tags: Optional[MappingTags] = None
+    ) -> LocalChannel:
+        """Create a channel encoding an input, wait for it to be created, and record it in the local state."""
+        operation = self.call_provider(
+            "local.create_channel",
+            lambda: self.cloud.create_channel(
+                name, input_id, dict(self.get_operation_tags(tags))
+            ),
+        )
+        channel = self._wait("local.create_channel", operation)
+        self.record_resource(
+            LOCAL_CHANNEL,
+            self.resource_path("channels", channel.id),
+            name,
+            stream_name=name,
+            resource=channel.model_dump(),
+        )
+        return channel
+
+    def get_channel(self, channel_id: str) -> LocalChannel:
+        """Get a channel, with its current state."""
+        return self.call_provider(
+            "local.get_channel", lambda: self.cloud.get_channel(channel_id)
+        )
+
+    def list_channels(self) -> list[LocalChannel]:
+        """List every channel."""
+        return self.call_provider("local.list_channels", self.cloud.list_channels)
+
+    def delete_channel(self, channel_id: str) -> None:
+        """Delete a channel, which must be idle."""
+        self.call_provider(
+            "local.delete_channel", lambda: self.cloud.delete_channel(channel_id)
+        )
+        self.state.delete(self.resource_path("channels", channel_id))
+
+    def _run_channel_operation(
+        self,
+        operation_name: str,
+        call: Callable[[], LocalOperation[LocalChannel]],
+        wait: bool,
+    ) -> Union[LocalChannel, PendingOperation[LocalChannel]]:
+        """Start or stop a channel, waiting on the long running operation or tracking it in the background."""
+        operation_path = f"local.{operation_name}"
+        # starting or stopping a channel that is already started or stopped has no further effect, so is safe to retry
+        operation = self.call_provider(operation_path, call, idempotent=True)
+        if not wait:
+            return instrument_pending_operation(
+                INSTRUMENTATION_PROVIDER,
+                f"{operation_path}.wait",
+                self.operation_poller.submit(
+                    operation, timeout=LOCAL_OPERATION_TIMEOUT
+                ),
+            )
+        return self._wait(operation_path, operation)
+
+    @overload
+    def start_channel(
+        self, channel_id: str, wait: Literal[True] = ...
+    ) -> LocalChannel: ...
+
+    @overload
+    def start_channel(
+        self, channel_id: str, *, wait: Literal[False]
+    ) -> PendingOperation[LocalChannel]: ...
+
+    def start_channel(
+        self, channel_id: str, wait: bool = True
+    ) -> Union[LocalChannel, PendingOperation[LocalChannel]]:
+        """Start a channel.
+
+        Pass wait=False to return a pending operation handle immediately rather than blocking until the channel
+        has started.
+        """
+        return self._run_channel_operation(
+            "start_channel", lambda: self.cloud.start_channel(channel_id), wait
+        )
+
+    @overload
+    def stop_channel(
+        self, channel_id: str, wait: Literal[True] = ...
+    ) -> LocalChannel: ...
+
+    @overload
+    def stop_channel(
+        self, channel_id: str, *, wait: Literal[False]
+    ) -> PendingOperation[LocalChannel]: ...
+
+    def stop_channel(
+        self, channel_id: str, wait: bool = True
+    ) -> Union[LocalChannel, PendingOperation[LocalChannel]]:
+        """Stop a channel, in the same way as `start_channel`."""
+        return self._run_channel_operation(
+            "stop_channel", lambda: self.cloud.stop_channel(channel_id), wait
+        )
+
+    @override
+    def setup_stream(self) -> None:
+        return None
+
+    @override
+    def fetch_stream_names(self) -> list[str]:
+        # Streams are created with an input named after the stream, and later a channel of the same name.
+        resources: list[Union[LocalInput, LocalChannel]] = [
+            *self.list_inputs(),
+            *self.list_channels(),
+        ]
+        return list(
+            dict.fromkeys(
+                resource.name
+                for resource in resources
+                if self.is_sendlive_resource(resource.tags)
+            )
+        )
+
+    def _build_stream(
+        self, name: str, local_input: LocalInput, channel: LocalChannel
+    ) -> LocalStream:
+        """Build the stream made up of a created input and channel, bound to this adapter."""
+        stream = LocalStream(
+            name=name,
+            endpoint=local_input.endpoint,
+            input_id=local_input.id,
+            channel_id=channel.id,
+            url=channel.url,
+        )
+        stream.bind(self)
+        return stream
+
+    @override
+    def get_stream(self, name: str) -> Optional[LocalStream]:
+        """Return a stream created earlier, rebuilt from the input and channel in the local state without api calls.
+
+        Returns None unless both the stream's input and channel are recorded.
+        """
+        records = self.find_stream_resources(name)
+        if LOCAL_INPUT not in records or LOCAL_CHANNEL not in records:
+            return None
+        return self._build_stream(
+            name,
+            LocalInput.model_validate(records[LOCAL_INPUT].attributes["resource"]),
+            LocalChannel.model_validate(records[LOCAL_CHANNEL].attributes["resource"]),
+        )
+
+    @override
+    def create_stream(
+        self,
+        name: str,
+        start: bool = False,
+        *,
+        latency_mode: LatencyMode = "standard",
+    ) -> LocalStream:
+        """Create a stream's input, then the channel encoding it, named after the stream.
+
+        If start is True, the channel is then asked to start, without waiting for it to have started. A stream
+        already recorded in the local state is returned from it, rather than created again. Simulated channels have
+        no encoding settings, so latency_mode has no effect.
+        """
+        stream = self.get_stream(name)
+        if stream is not None:
+            logger.debug("Reusing stream %s recorded in the local state", name)
+        else:
+            local_input = self.create_input(name)
+            channel = self.create_channel(name, local_input.id)
+            stream = self._build_stream(name, local_input, channel)
+        if start:
+            stream.start()
+        return stream
+
+    def _gc_resource(
+        self,
+        resource_type: str,
+        resource_id: str,
+        resource: Union[LocalInput, LocalChannel],
+        live: bool = False,
+    ) -> SendLiveResource:
+        """Describe an input or channel for the garbage collector, named after the stream it belongs to."""
+        return SendLiveResource(
+            provider=self.state_provider,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            provider_id=resource.id,
+            name=resource.name,
+            stream_name=resource.name,
+            live=live,
+        )
+
+    def list_gc_channels(self) -> list[SendLiveResource]:
+        """List sendlive channels for the garbage collector, where any that are not idle are live."""
+        return [
+            self._gc_resource(
+                LOCAL_CHANNEL,
+                self.resource_path("channels", channel.id),
+                channel,
+                live=channel.state not in LOCAL_DELETABLE_CHANNEL_STATES,
+            )
+            for channel in self.list_channels()
+            if self.is_sendlive_resource(channel.tags)
+        ]
+
+    def list_gc_inputs(self) -> list[SendLiveResource]:
+        """List sendlive inputs for the garbage collector."""
+        return [
+            self._gc_resource(
+                LOCAL_INPUT, self.resource_path("inputs", local_input.id), local_input
+            )
+            for local_input in self.list_inputs()
+            if self.is_sendlive_resource(local_input.tags)
+        ]
+
+    @override
+    def gc_recorded_resource_ids(self) -> set[str]:
+        """Every input and channel created is recorded in the local state."""
+        return self.find_recorded_resource_ids()
+
+    @override
+    def gc_desired_stream_names(self) -> set[str]:
+        """Streams whose input and channel are both recorded in the local state were created in full."""
+        return self.find_complete_stream_names((LOCAL_INPUT, LOCAL_CHANNEL))
+
+    @override
+    def gc_resource_types(self) -> list[GCResourceType]:
+        """Channels are deleted before inputs, as an input can't be deleted while attached to a channel."""
+        return [
+            GCResourceType(
+                LOCAL_CHANNEL,
+                self.list_gc_channels,
+                lambda resource: self.delete_channel(str(resource.provider_id)),
+            ),
+            GCResourceType(
+                LOCAL_INPUT,
+                self.list_gc_inputs,
+                lambda resource: self.delete_input(str(resource.provider_id)),
+                delete_after=(LOCAL_CHANNEL,),
+            ),
+        ]
@@ -0,0 +1,369 @@
+"""An in-memory simulation of a live streaming provider, which the local adapter makes its api calls to.
+
+The simulated provider has inputs, channels that encode an input, and long running operations to create, start and
+stop channels. Every api call takes a latency drawn from the configured distribution, and may be throttled or fail
+with a transient error at the configured rates. Creating more inputs or channels than the configured quotas fails.
+
+All randomness comes from a single generator seeded from the options, so a run is reproducible when the same calls
+are made in the same order, such as from a single thread.
+"""
+import itertools
+import math
+import random
+import threading
+import time
+from typing import Callable, Generic, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from sendlive.constants import LatencyDistribution, LocalOptions
+from sendlive.exceptions import SendLiveTimeoutError
+from sendlive.providers.local.constants import (
+    LOCAL_CHANNEL_CREATING,
+    LOCAL_CHANNEL_IDLE,
+    LOCAL_CHANNEL_RUNNING,
+    LOCAL_CHANNEL_STARTING,
+    LOCAL_CHANNEL_STOPPING,
+    LOCAL_DELETABLE_CHANNEL_STATES,
+    LOCAL_INPUT_URL,
+    LOCAL_PLAYBACK_URL,
+)
+from sendlive.providers.local.errors import (
+    LocalInvalidStateError,
+    LocalNotFoundError,
+    LocalQuotaExceededError,
+    LocalThrottlingError,
+    LocalUnavailableError,
+)
+
+T = TypeVar("T")
+
+
+class LocalInput(BaseModel):
+    """A simulated input that streams are pushed to."""
+
+    id: str
+    name: str
+    endpoint: str
+    tags: dict[str, str] = {}
+    channel_id: Optional[str] = None
+    """The channel the input is attached to, if any."""
+
+
+class LocalChannel(BaseModel):
+    """A simulated channel that encodes an input."""
+
+    id: str
+    name: str
+    input_id: str
+    state: str
+    url: str
+    """The url of the manifest the channel's output can be watched at."""
+    tags: dict[str, str] = {}
+
+
+class LocalOperation(Generic[T]):
+    """A simulated long running operation, which completes once its duration has passed.
+
+    It can be waited on with result, or tracked by an `OperationPoller` like any provider operation.
+    """
+
+    def __init__(self, name: str, duration: float, complete: Callable[[], T]) -> None:
+        """Start an operation that calls complete, for its result, once duration seconds have passed."""
+        self.name = name
+        self.done_at = time.monotonic() + duration
+        self._complete = complete
+        self._lock = threading.Lock()
+        self._completed = False
+        self._result: Optional[T] = None
+        self._exception: Optional[Exception] = None
+
+    def __repr__(self) -> str:
+        """Describe the operation by name."""
+        return f"LocalOperation({self.name!r})"
+
+    def _finish(self) -> T:
+        """Complete the operation, once, returning its result or raising its error."""
+        with self._lock:
+            if not self._completed:
+                try:
+                    self._result = self._complete()
+                except Exception as e:
+                    self._exception = e
+                self._completed = True
+        if self._exception is not None:
+            raise self._exception
+        return self._result  # type: ignore[return-value]
+
+    def done(self) -> bool:
+        """Return whether the operation has completed."""
+        if time.monotonic() < self.done_at:
+            return False
+        try:
+            self._finish()
+        except Exception:  # noqa: S110
+            # the error is raised from result, as for any failed operation
+            pass
+        return True
+
+    def result(self, timeout: Optional[float] = None) -> T:
+        """Wait up to timeout seconds for the operation to complete and return its result."""
+        remaining = self.done_at - time.monotonic()
+        if timeout is not None and remaining > timeout:
+            time.sleep(timeout)
+            raise SendLiveTimeoutError(
+                f"Operation {self.name} did not complete within {timeout} seconds."
+            )
+        if remaining > 0:
+            time.sleep(remaining)
+        return self._finish()
+
+
+class LocalCloud:
+    """A simulated provider account, holding its inputs and channels in memory. Thread-safe."""
+
+    def __init__(self, options: Optional[LocalOptions] = None) -> None:
+        """Create an empty account, simulating latency, errors and quotas as configured by options."""
+        self.options = options or LocalOptions()
+        self._random = random.Random(self.options.seed)  # noqa: S311
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.inputs: dict[str, LocalInput] = {}
+        self.channels: dict[str, LocalChannel] = {}
+
+    def _sample(self, distribution: LatencyDistribution) -> float:
+        """Draw a duration from a distribution. Must be called holding the lock."""
+        if distribution.distribution == "uniform":
+            duration = self._random.uniform(
+                distribution.mean - distribution.spread,
+                distribution.mean + distribution.spread,
+            )
+        elif distribution.distribution == "lognormal" and distribution.mean > 0:
+            # parameterised so that the mean of the lognormal distribution is the configured mean
+            sigma = distribution.spread
+            duration = self._random.lognormvariate(
+                math.log(distribution.mean) - sigma**2 / 2, sigma
+            )
+        else:
+            duration = distribution.mean
+        if distribution.max is not None:
+            duration = min(duration, distribution.max)
+        return max(duration, 0.0)
+
+    def _call(self, operation: str) -> None:
+        """Simulate the latency of an api call, and fail it if it is throttled or errors."""
+        with self._lock:
+            latency = self._sample(self.options.latency)
+            throttled = self._random.random() < self.options.throttle_rate
+            failed = self._random.random() < self.options.error_rate
+        if latency:
+            time.sleep(latency)
+        if throttled:
+            raise LocalThrottlingError(f"{operation} was throttled.")
+        if failed:
+            raise LocalUnavailableError(f"{operation} failed, try again.")
+
+    def _operation(self, name: str, complete: Callable[[], T]) -> LocalOperation[T]:
+        """Start a long running operation that takes a duration drawn from the options."""
+        with self._lock:
+            duration = self._sample(self.options.operation_duration)
+        return LocalOperation(name, duration, complete)
+
+    def _next_id(self, prefix: str) -> str:
+        return f"{prefix}-{next(self._ids)}"
+
+    def create_input(
+        self, name: str, tags: Optional[dict[str, str]] = None
+    ) -> LocalInput:
+        """Create an input."""
+        self._call("create_input")
+        with self._lock:
+            if (
+                self.options.max_inputs is not None
+                and len(self.inputs) >= self.options.max_inputs
+            ):
+                raise LocalQuotaExceededError(
+                    f"Quota of {self.options.max_inputs} inputs exceeded."
+                )
+            input_id = self._next_id("input")
+            local_input = self.inputs[input_id] = LocalInput(
+                id=input_id,
+                name=name,
+                endpoint=f"{LOCAL_INPUT_URL}/{input_id}/{name}",
+                tags=dict(tags or {}),
+            )
+            return local_input.model_copy()
+
+    def get_input(self, input_id: str) -> LocalInput:
+        """Get an input by id."""
+        self._call("get_input")
+        with self._lock:
+            return self._get_input(input_id).model_copy()
+
+    def _get_input(self, input_id: str) -> LocalInput:
+        local_input = self.inputs.get(input_id)
+        if local_input is None:
+            raise LocalNotFoundError(f"Input {input_id} does not exist.")
+        return local_input
+
+    def list_inputs(self) -> list[LocalInput]:
+        """List every input."""
+        self._call("list_inputs")
+        with self._lock:
+            return [local_input.model_copy() for local_input in self.inputs.values()]
+
+    def delete_input(self, input_id: str) -> None:
+        """Delete an input, which must not be attached to a channel."""
+        self._call("delete_input")
+        with self._lock:
+            local_input = self._get_input(input_id)
+            if local_input.channel_id is not None:
+                raise LocalInvalidStateError(
+                    f"Input {input_id} is attached to channel {local_input.channel_id}."
+                )
+            del self.inputs[input_id]
+
+    def create_channel(
+        self, name: str, input_id: str, tags: Optional[dict[str, str]] = None
+    ) -> LocalOperation[LocalChannel]:
+        """Create a channel encoding an input, which becomes idle once the returned operation completes."""
+        self._call("create_channel")
+        with self._lock:
+            local_input = self._get_input(input_id)
+            if local_input.channel_id is not None:
+                raise LocalInvalidStateError(
+                    f"Input {input_id} is attached to channel {local_input.channel_id}."
+                )
+            if (
+                self.options.max_channels is not None
+                and len(self.channels) >= self.options.max_channels
+            ):
+                raise LocalQuotaExceededError(
+                    f"Quota of {self.options.max_channels} channels exceeded."
+                )
+            channel_id = self._next_id("channel")
+            self.channels[channel_id] = LocalChannel(
+                id=channel_id,
+                name=name,
+                input_id=input_id,
+                state=LOCAL_CHANNEL_CREATING,
+                url=f"{LOCAL_PLAYBACK_URL}/{channel_id}/{name}/index.m3u8",
+                tags=dict(tags or {}),
+            )
+            local_input.channel_id = channel_id
+        return self._operation(
+            f"create_channel {channel_id}",
+            lambda: self._transition(channel_id, LOCAL_CHANNEL_IDLE),
+        )
+
+    def get_channel(self, channel_id: str) -> LocalChannel:
+        """Get a channel by id."""
+        self._call("get_channel")
+        with self._lock:
+            return self._get_channel(channel_id).model_copy()
+
+    def _get_channel(self, channel_id: str) -> LocalChannel:
+        channel = self.channels.get(channel_id)
+        if channel is None:
+            raise LocalNotFoundError(f"Channel {channel_id} does not exist.")
+        return channel
+
+    def list_channels(self) -> list[LocalChannel]:
+        """List every channel."""
+        self._call("list_channels")
+        with self._lock:
+            return [channel.model_copy() for channel in self.channels.values()]
+
+    def _transition(self, channel_id: str, state: str) -> LocalChannel:
+        """Move a channel to state, as an operation on it completes."""
+        with self._lock:
+            channel = self._get_channel(channel_id)
+            channel.state = state
+            return channel.model_copy()
+
+    def _change_state(
+        self,
+        operation: str,
+        channel_id: str,
+        from_states: frozenset[str],
+        transitional_state: str,
+        final_state: str,
+    ) -> LocalOperation[LocalChannel]:
+        """Start moving a channel from one of from_states to final_state, through transitional_state."""
+        self._call(operation)
+        with self._lock:
+            channel = self._get_channel(channel_id)
+            if channel.state in (transitional_state, final_state):
+                # already starting or started, or stopping or stopped
+                return LocalOperation(
+                    f"{operation} {channel_id}",
+                    0,
+                    lambda: self._transition(channel_id, final_state),
+                )
+            if channel.state not in from_states:
+                raise LocalInvalidStateError(
+                    f"Channel {channel_id} can't be changed from {channel.state}."
+                )
+            channel.state = transitional_state
+        return self._operation(
+            f"{operation} {channel_id}",
+            lambda: self._transition(channel_id, final_state),
+        )
+
+    def start_channel(self, channel_id: str) -> LocalOperation[LocalChannel]:
+        """Start an idle channel, which is running once the returned operation completes."""
+        return self._change_state(
+            "start_channel",
+            channel_id,
+            frozenset({LOCAL_CHANNEL_IDLE}),
+            LOCAL_CHANNEL_STARTING,
+            LOCAL_CHANNEL_RUNNING,
+        )
+
+    def stop_channel(self, channel_id: str) -> LocalOperation[LocalChannel]:
+        """Stop a running channel, which is idle once the returned operation completes."""
+        return self._change_state(
+            "stop_channel",
+            channel_id,
+            frozenset({LOCAL_CHANNEL_RUNNING}),
+            LOCAL_CHANNEL_STOPPING,
+            LOCAL_CHANNEL_IDLE,
+        )
+
+    def delete_channel(self, channel_id: str) -> None:
+        """Delete an idle channel, detaching its input."""
+        self._call("delete_channel")
+        with self._lock:
+            channel = self._get_channel(channel_id)
+            if channel.state not in LOCAL_DELETABLE_CHANNEL_STATES:
+                raise LocalInvalidStateError(
+                    f"Channel {channel_id} is {channel.state}, so can't be deleted."
+                )
+            del self.channels[channel_id]
+            local_input = self.inputs.get(channel.input_id)
+            if local_input is not None:
+                local_input.channel_id = None
+
+
+_clouds: dict[str, LocalCloud] = {}
+_clouds_lock = threading.Lock()
+
+
+def get_local_cloud(
+    account_id: str, options: Optional[LocalOptions] = None
+) -> LocalCloud:
+    """Return the simulated provider account shared by every adapter with account_id.
+
+    The account is created with the options of the first adapter to use it.
+    """
+    with _clouds_lock:
+        cloud = _clouds.get(account_id)
+        if cloud is None:
+            cloud = _clouds[account_id] = LocalCloud(options)
+        return cloud
+
+
+def reset_local_clouds() -> None:
+    """Forget every simulated provider account, and the inputs and channels in them."""
+    with _clouds_lock:
+        _clouds.clear()
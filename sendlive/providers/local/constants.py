@@ -0,0 +1,23 @@
+# provider name that api calls are reported under by sendlive.instrumentation, and resources are recorded under
+INSTRUMENTATION_PROVIDER = "local"
+
+# Resource types recorded in the local state, see sendlive.state
+LOCAL_INPUT = "local.input"
+LOCAL_CHANNEL = "local.channel"
+
+# seconds to wait for a long running operation, such as creating a channel, to complete
+LOCAL_OPERATION_TIMEOUT = 600
+
+# channel states, which move from CREATING to IDLE, and between IDLE and RUNNING through STARTING and STOPPING
+LOCAL_CHANNEL_CREATING = "CREATING"
+LOCAL_CHANNEL_IDLE = "IDLE"
+LOCAL_CHANNEL_STARTING = "STARTING"
+LOCAL_CHANNEL_RUNNING = "RUNNING"
+LOCAL_CHANNEL_STOPPING = "STOPPING"
+# channel states in which a stream is live
+LOCAL_ALIVE_CHANNEL_STATES = frozenset({LOCAL_CHANNEL_STARTING, LOCAL_CHANNEL_RUNNING})
+# channels can only be deleted in these states, so a channel in any other is live
+LOCAL_DELETABLE_CHANNEL_STATES = frozenset({LOCAL_CHANNEL_IDLE})
+
+LOCAL_INPUT_URL = "rtmp://localhost:1935"
+LOCAL_PLAYBACK_URL = "http://localhost:8080"
@@ -0,0 +1,41 @@
+"""Errors raised by the simulated local provider.
+
+Like google api_core errors, each carries the http status code a real provider would respond with, which
+`sendlive.retry` classifies them by - so throttled calls are retried, and transient errors retried when idempotent.
+"""
+
+
+class LocalProviderError(Exception):
+    """An error response from the simulated local provider."""
+
+    code: int = 500
+
+
+class LocalThrottlingError(LocalProviderError):
+    """The call was rejected as too many requests."""
+
+    code = 429
+
+
+class LocalUnavailableError(LocalProviderError):
+    """The call failed with a transient error."""
+
+    code = 503
+
+
+class LocalNotFoundError(LocalProviderError):
+    """The resource does not exist."""
+
+    code = 404
+
+
+class LocalQuotaExceededError(LocalProviderError):
+    """Creating the resource would exceed the quota, so the call fails until other resources are deleted."""
+
+    code = 400
+
+
+class LocalInvalidStateError(LocalProviderError):
+    """The resource is not in a state that allows the call, such as deleting a running channel."""
+
+    code = 409
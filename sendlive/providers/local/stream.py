@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+from pydantic import PrivateAttr
+from typing_extensions import override
+
+from sendlive.exceptions import SendLiveError
+from sendlive.providers.local.constants import LOCAL_ALIVE_CHANNEL_STATES
+from sendlive.stream import BaseStream, StreamURLs
+
+if TYPE_CHECKING:
+    from sendlive.operations import PendingOperation
+    from sendlive.providers.local.adapter import LocalAdapter
+
+
+class LocalStream(BaseStream):
+    """Represents a single stream on the simulated local provider.
+
+    A stream is made up of an input that is pushed to, and a channel that encodes it.
+    """
+
+    endpoint: Optional[str] = None
+    """The url of the input to push the stream to."""
+    input_id: Optional[str] = None
+    """The id of the input."""
+    channel_id: Optional[str] = None
+    """The id of the channel."""
+    url: Optional[str] = None
+    """The url of the manifest the stream can be watched at."""
+
+    _adapter: Optional[LocalAdapter] = PrivateAttr(default=None)
+    _pending_operation: Optional[PendingOperation[Any]] = PrivateAttr(default=None)
+
+    def bind(self, adapter: LocalAdapter) -> None:
+        """Bind the adapter used to manage the stream."""
+        self._adapter = adapter
+
+    @property
+    def adapter(self) -> LocalAdapter:
+        """Return the adapter bound to the stream."""
+        if self._adapter is None:
+            raise SendLiveError(f"Stream {self.name} is not bound to a local adapter.")
+        return self._adapter
+
+    @property
+    def pending_operation(self) -> Optional[PendingOperation[Any]]:
+        """The operation of the last start or stop, which is tracked in the background until it completes."""
+        return self._pending_operation
+
+    def _require_channel_id(self) -> str:
+        if self.channel_id is None:
+            raise SendLiveError(f"Stream {self.name} has no channel.")
+        return self.channel_id
+
+    @override
+    def start(self, wait: bool = False) -> None:
+        """Start the stream's channel.
+
+        Returns as soon as the channel has been asked to start, unless wait is True. The start operation is tracked
+        in the background, and can be waited on through `pending_operation`.
+        """
+        self._pending_operation = self.adapter.start_channel(
+            self._require_channel_id(), wait=False
+        )
+        if wait:
+            self._pending_operation.result()
+
+    @override
+    def stop(self, wait: bool = False) -> None:
+        """Stop the stream's channel, in the same way as `start`."""
+        self._pending_operation = self.adapter.stop_channel(
+            self._require_channel_id(), wait=False
+        )
+        if wait:
+            self._pending_operation.result()
+
+    @override
+    def is_alive(self) -> bool:
+        """Return whether the stream's channel has been started, and not stopped."""
+        if self.channel_id is None:
+            return False
+        channel = self.adapter.get_channel(self.channel_id)
+        return channel.state in LOCAL_ALIVE_CHANNEL_STATES
+
+    @override
+    def get_url(self) -> StreamURLs:
+        return StreamURLs(input=self.endpoint, playback=self.url)
+
+    @override
+    def get_name(self) -> str:
+        return self.name
@@ -0,0 +1,224 @@
+import time
+from collections.abc import Generator
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from sendlive import SendLive
+from sendlive.constants import (
+    LatencyDistribution,
+    LocalCredentials,
+    LocalOptions,
+    RetryPolicy,
+)
+from sendlive.exceptions import SendLiveTimeoutError
+from sendlive.instrumentation import InMemoryInstrumentation, set_instrumentation
+from sendlive.operations import OperationPoller
+from sendlive.providers.local.adapter import LocalAdapter
+from sendlive.providers.local.cloud import LocalCloud, LocalOperation
+from sendlive.providers.local.errors import (
+    LocalInvalidStateError,
+    LocalQuotaExceededError,
+    LocalThrottlingError,
+    LocalUnavailableError,
+)
+from sendlive.providers.local.stream import LocalStream
+from sendlive.stream import StreamURLs
+
+# retries are near instant, so that simulated throttling doesn't slow tests down
+FAST_RETRY_POLICY = RetryPolicy(initial_backoff=0.001, max_backoff=0.01)
+
+
+def _adapter(region: str = "local", **options: Any) -> LocalAdapter:
+    # retry budgets are shared per provider region, so tests that retry use their own region
+    return LocalAdapter(
+        credentials=LocalCredentials(region=region),
+        provider_options=LocalOptions(retry_policy=FAST_RETRY_POLICY, **options),
+    )
+
+
+@pytest.fixture(scope="function")
+def local_adapter() -> LocalAdapter:
+    return _adapter()
+
+
+@pytest.fixture(scope="function")
+def operation_poller() -> Generator[OperationPoller, Any, None]:
+    poller = OperationPoller(initial_delay=0.001)
+    with mock.patch.object(
+        LocalAdapter, "operation_poller", new_callable=mock.PropertyMock
+    ) as operation_poller:
+        operation_poller.return_value = poller
+        yield poller
+    poller.shutdown()
+
+
+def test_local_adapter_create_stream(local_adapter: LocalAdapter) -> None:
+    """Test a stream's input and channel are created, and the stream is listed and recorded."""
+    stream = local_adapter.create_stream("one")
+    assert isinstance(stream, LocalStream)
+    assert stream.get_url() == StreamURLs(
+        input=f"rtmp://localhost:1935/{stream.input_id}/one",
+        playback=f"http://localhost:8080/{stream.channel_id}/one/index.m3u8",
+    )
+    assert not stream.is_alive()
+    assert local_adapter.list_streams() == ["one"]
+    assert local_adapter.get_stream("one") == stream
+    assert local_adapter.get_stream("missing") is None
+
+
+def test_local_adapter_create_stream_reuses_recorded_stream(
+    local_adapter: LocalAdapter,
+) -> None:
+    """Test creating a stream that is already recorded returns it, rather than creating it again."""
+    stream = local_adapter.create_stream("one")
+    assert local_adapter.create_stream("one") == stream
+    assert len(local_adapter.cloud.channels) == 1
+
+
+def test_local_adapter_shares_resources_by_account(
+    local_adapter: LocalAdapter,
+) -> None:
+    """Test adapters with the same account see the same streams, and those of other accounts don't."""
+    local_adapter.create_stream("one")
+    assert _adapter().fetch_stream_names() == ["one"]
+    other = LocalAdapter(credentials=LocalCredentials(account_id="other"))
+    assert other.fetch_stream_names() == []
+
+
+def test_local_stream_start_and_stop(
+    local_adapter: LocalAdapter, operation_poller: OperationPoller
+) -> None:
+    """Test starting and stopping a stream is tracked in the background, and changes whether it is alive."""
+    stream = local_adapter.create_stream("one", start=True)
+    assert stream.pending_operation is not None
+    assert stream.pending_operation.result(timeout=5).state == "RUNNING"
+    assert stream.is_alive()
+    stream.stop(wait=True)
+    assert not stream.is_alive()
+
+
+def test_local_adapter_channel_operations_take_simulated_time() -> None:
+    """Test long running operations only complete once their simulated duration has passed."""
+    adapter = _adapter(operation_duration=LatencyDistribution(mean=0.05))
+    started = time.monotonic()
+    stream = adapter.create_stream("one")
+    assert time.monotonic() - started >= 0.05
+    operation = adapter.cloud.start_channel(str(stream.channel_id))
+    assert not operation.done()
+    assert adapter.cloud.get_channel(str(stream.channel_id)).state == "STARTING"
+    with pytest.raises(LocalInvalidStateError):
+        adapter.delete_channel(str(stream.channel_id))
+    assert operation.result(timeout=5).state == "RUNNING"
+    assert operation.done()
+
+
+def test_local_operation_times_out() -> None:
+    """Test waiting on an operation for less than its duration fails with a timeout."""
+    operation = LocalOperation("slow", 10, lambda: "done")
+    with pytest.raises(SendLiveTimeoutError):
+        operation.result(timeout=0.01)
+    assert not operation.done()
+
+
+def test_local_adapter_collect_garbage(
+    local_adapter: LocalAdapter, operation_poller: OperationPoller
+) -> None:
+    """Test partially created streams are deleted, while live, idle complete and unknown streams are kept."""
+    # resources created by sendlive with another local state are tagged, but not recorded in this state
+    tags = dict(local_adapter.get_operation_tags())
+    unknown_input = local_adapter.cloud.create_input("unknown", tags)
+    local_adapter.cloud.create_channel("unknown", unknown_input.id, tags).result()
+    local_adapter.create_input("partial")
+    local_adapter.create_stream("idle")
+    live_stream = local_adapter.create_stream("live")
+    local_adapter.start_channel(str(live_stream.channel_id))
+    result = local_adapter.collect_garbage()
+    assert not result.failed
+    assert [resource.name for resource in result.deleted] == ["partial"]
+    assert sorted(local_adapter.fetch_stream_names()) == ["idle", "live", "unknown"]
+    result = local_adapter.collect_garbage(include_unknown=True)
+    assert [resource.resource_type for resource in result.deleted] == [
+        "local.channel",
+        "local.input",
+    ]
+    assert sorted(local_adapter.fetch_stream_names()) == ["idle", "live"]
+
+
+def test_local_cloud_is_deterministic_under_a_seed() -> None:
+    """Test clouds with the same seed simulate the same latencies and errors for the same calls."""
+    options = LocalOptions(
+        seed=1234,
+        latency=LatencyDistribution(distribution="lognormal", mean=0.0001, spread=1),
+        throttle_rate=0.3,
+        error_rate=0.2,
+    )
+
+    def run(cloud: LocalCloud) -> list[str]:
+        outcomes = []
+        for i in range(50):
+            try:
+                cloud.create_input(f"stream-{i}")
+                outcomes.append("created")
+            except (LocalThrottlingError, LocalUnavailableError) as e:
+                outcomes.append(type(e).__name__)
+        return outcomes
+
+    first = run(LocalCloud(options))
+    assert first == run(LocalCloud(options))
+    assert {"created", "LocalThrottlingError", "LocalUnavailableError"} == set(first)
+
+
+def test_local_cloud_latency_distributions() -> None:
+    """Test latencies are drawn from the configured distribution, and capped at its max."""
+    cloud = LocalCloud(LocalOptions(seed=1))
+    uniform = LatencyDistribution(distribution="uniform", mean=1, spread=0.5)
+    assert all(0.5 <= cloud._sample(uniform) <= 1.5 for _ in range(100))
+    lognormal = LatencyDistribution(distribution="lognormal", mean=1, spread=2, max=3)
+    samples = [cloud._sample(lognormal) for _ in range(1000)]
+    assert max(samples) == 3
+    assert min(samples) > 0
+    assert cloud._sample(LatencyDistribution(mean=0.25)) == 0.25
+
+
+def test_local_adapter_retries_throttled_calls() -> None:
+    """Test throttled calls are retried, and reported as retries by the instrumentation."""
+    adapter = _adapter(region="throttled", seed=7, throttle_rate=0.1)
+    instrumentation = InMemoryInstrumentation()
+    set_instrumentation(instrumentation)
+    try:
+        # one at a time, so that the seeded throttling is the same on every run
+        result = adapter.create_streams(
+            [f"stream-{i}" for i in range(20)], max_concurrency=1
+        )
+    finally:
+        set_instrumentation(None)
+    assert len(result.succeeded) == 20
+    assert len(adapter.cloud.channels) == 20
+    assert sum(instrumentation.retries.values()) > 0
+
+
+def test_local_adapter_quota_exceeded() -> None:
+    """Test creating more channels than the quota fails the stream, without retrying."""
+    adapter = _adapter(max_channels=1)
+    adapter.create_stream("one")
+    with pytest.raises(LocalQuotaExceededError):
+        adapter.create_stream("two")
+    assert len(adapter.cloud.inputs) == 2
+
+
+def test_local_adapter_bulk_create_streams(local_adapter: LocalAdapter) -> None:
+    """Test a thousand streams are created in a single bulk creation."""
+    names = [f"stream-{i}" for i in range(1000)]
+    result = local_adapter.create_streams(names, max_concurrency=32)
+    assert len(result.succeeded) == 1000
+    assert sorted(local_adapter.fetch_stream_names()) == sorted(names)
+
+
+def test_sendlive_with_local_credentials() -> None:
+    """Test SendLive uses the local adapter for local credentials."""
+    sendlive = SendLive(credentials=LocalCredentials())
+    assert isinstance(sendlive.adapter, LocalAdapter)
+    sendlive.create_stream("one")
+    assert sendlive.list_streams() == ["one"]
@@ -0,0 +1,68 @@
+from collections import OrderedDict
+from collections.abc import Iterator
+from threading import Lock
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_REGISTRY_MAX_SIZE = 1000
+
+
+class ResourceRegistry(Generic[T]):
+    """Remembers the resources an adapter has created or looked up, keyed by their name or ARN.
+
+    Adding a resource with the same key as one already registered replaces it, so resources are never duplicated.
+    The registry holds at most max_size resources, forgetting the least recently added once full - a forgotten
+    resource is simply looked up again when next needed.
+    """
+
+    def __init__(
+        self, key: Callable[[T], str], max_size: int = DEFAULT_REGISTRY_MAX_SIZE
+    ) -> None:
+        """Key resources with the key function, holding at most max_size of them."""
+        self.key = key
+        self.max_size = max_size
+        self._resources: OrderedDict[str, T] = OrderedDict()
+        self._lock = Lock()
+
+    def add(self, resource: T) -> T:
+        """Register a resource, replacing any registered with the same key, and return it."""
+        key = self.key(resource)
+        with self._lock:
+            self._resources[key] = resource
+            self._resources.move_to_end(key)
+            while len(self._resources) > self.max_size:
+                self._resources.popitem(last=False)
+        return resource
+
+    def get(self, key: str) -> Optional[T]:
+        """Return the resource registered under key, if there is one."""
+        return self._resources.get(key)
+
+    def remove(self, key: str) -> Optional[T]:
+        """Forget the resource registered under key, returning it if there was one."""
+        with self._lock:
+            return self._resources.pop(key, None)
+
+    def first(self) -> Optional[T]:
+        """Return the least recently added resource, if any are registered."""
+        with self._lock:
+            return next(iter(self._resources.values()), None)
+
+    def __contains__(self, resource: object) -> bool:
+        """Check whether a resource is registered, under its key."""
+        try:
+            key = self.key(resource)  # type: ignore[arg-type]
+        except AttributeError:
+            return False
+        return self._resources.get(key) == resource
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over the registered resources, least recently added first."""
+        with self._lock:
+            resources = list(self._resources.values())
+        return iter(resources)
+
+    def __len__(self) -> int:
+        """Return the number of registered resources."""
+        return len(self._resources)
@@ -0,0 +1,373 @@
+"""Retrying, rate limiting and translating the errors of provider api calls.
+
+Errors are classified without importing either provider SDK: botocore ClientErrors by their error code and http
+status, and google api_core errors and those of the simulated local provider by their http status. Throttling errors
+are always retried, as the provider rejected the request without acting on it. Transient server and connection errors
+are only retried for idempotent operations, as the provider may have acted on the request before failing. Anything
+else is raised unchanged, so callers can still handle errors such as google's AlreadyExists.
+
+Once retries run out, throttling, transient and permission errors are raised as the matching SendLiveProviderError.
+"""
+import asyncio
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from enum import Enum
+from typing import Any, NoReturn, Optional, TypeVar
+
+from sendlive.constants import RetryPolicy
+from sendlive.exceptions import (
+    SendLiveProviderPermissionError,
+    SendLiveProviderThrottlingError,
+    SendLiveProviderUnavailableError,
+)
+from sendlive.logger import logger
+
+T = TypeVar("T")
+
+AWS_THROTTLING_ERROR_CODES = frozenset(
+    {
+        "LimitExceededException",
+        "RequestLimitExceeded",
+        "RequestThrottled",
+        "RequestThrottledException",
+        "SlowDown",
+        "ThrottledException",
+        "Throttling",
+        "ThrottlingException",
+        "TooManyRequestsException",
+    }
+)
+AWS_PERMISSION_ERROR_CODES = frozenset(
+    {
+        "AccessDenied",
+        "AccessDeniedException",
+        "ExpiredToken",
+        "ExpiredTokenException",
+        "ForbiddenException",
+        "InvalidClientTokenId",
+        "InvalidSignatureException",
+        "SignatureDoesNotMatch",
+        "UnauthorizedException",
+        "UnrecognizedClientException",
+    }
+)
+AWS_TRANSIENT_ERROR_CODES = frozenset(
+    {
+        "BadGatewayException",
+        "GatewayTimeoutException",
+        "InternalFailure",
+        "InternalServerErrorException",
+        "RequestTimeout",
+        "RequestTimeoutException",
+        "ServiceUnavailable",
+        "ServiceUnavailableException",
+    }
+)
+# botocore errors raised when no response was received at all
+BOTOCORE_CONNECTION_ERROR_CLASSES = frozenset({"ConnectionError", "HTTPClientError"})
+
+HTTP_TOO_MANY_REQUESTS = 429
+HTTP_PERMISSION_STATUSES = frozenset({401, 403})
+HTTP_TRANSIENT_STATUSES = frozenset({500, 502, 503, 504})
+
+# operations that can safely be repeated, going by the name of the api method called
+IDEMPOTENT_OPERATION_PREFIXES = ("delete_", "describe_", "get_", "list_")
+
+
+class ErrorKind(Enum):
+    """How a provider error should be handled."""
+
+    THROTTLED = "throttled"
+    TRANSIENT = "transient"
+    PERMISSION = "permission"
+    OTHER = "other"
+
+
+def _kind_from_http_status(status: Any) -> ErrorKind:
+    if status == HTTP_TOO_MANY_REQUESTS:
+        return ErrorKind.THROTTLED
+    if status in HTTP_PERMISSION_STATUSES:
+        return ErrorKind.PERMISSION
+    if status in HTTP_TRANSIENT_STATUSES:
+        return ErrorKind.TRANSIENT
+    return ErrorKind.OTHER
+
+
+def classify_error(error: BaseException) -> ErrorKind:  # noqa: PLR0911
+    """Classify an error raised by a provider SDK.
+
+    botocore error classes are matched by module, as modelled errors are built dynamically in botocore.errorfactory.
+    """
+    module = type(error).__module__
+    if module.startswith("botocore."):
+        response = getattr(error, "response", None)
+        if isinstance(response, dict):
+            code = response.get("Error", {}).get("Code")
+            if code in AWS_THROTTLING_ERROR_CODES:
+                return ErrorKind.THROTTLED
+            if code in AWS_PERMISSION_ERROR_CODES:
+                return ErrorKind.PERMISSION
+            if code in AWS_TRANSIENT_ERROR_CODES:
+                return ErrorKind.TRANSIENT
+            return _kind_from_http_status(
+                response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+            )
+        if any(
+            cls.__name__ in BOTOCORE_CONNECTION_ERROR_CLASSES
+            for cls in type(error).__mro__
+        ):
+            return ErrorKind.TRANSIENT
+        return ErrorKind.OTHER
+    if module in ("google.api_core.exceptions", "sendlive.providers.local.errors"):
+        return _kind_from_http_status(getattr(error, "code", None))
+    return ErrorKind.OTHER
+
+
+def translate_error(error: BaseException, operation: str) -> BaseException:
+    """Return the sendlive exception for a provider error, or the error itself if it is not one sendlive translates."""
+    kind = classify_error(error)
+    if kind is ErrorKind.THROTTLED:
+        return SendLiveProviderThrottlingError(f"{operation} was throttled: {error}")
+    if kind is ErrorKind.TRANSIENT:
+        return SendLiveProviderUnavailableError(
+            f"{operation} failed with a transient error: {error}"
+        )
+    if kind is ErrorKind.PERMISSION:
+        return SendLiveProviderPermissionError(
+            f"{operation} was not permitted: {error}"
+        )
+    return error
+
+
+def _raise_translated(error: Exception, operation: str) -> NoReturn:
+    translated = translate_error(error, operation)
+    if translated is error:
+        raise error
+    raise translated from error
+
+
+@contextmanager
+def translated_errors(operation: str) -> Iterator[None]:
+    """Raise provider errors from within the block as the matching sendlive exception, without retrying."""
+    try:
+        yield
+    except Exception as e:
+        _raise_translated(e, operation)
+
+
+def is_idempotent(operation: str) -> bool:
+    """Guess whether an operation, such as "medialive.list_inputs", can safely be repeated."""
+    return operation.rpartition(".")[2].startswith(IDEMPOTENT_OPERATION_PREFIXES)
+
+
+def should_retry(kind: ErrorKind, idempotent: bool) -> bool:
+    """Return whether an error of kind should be retried."""
+    return kind is ErrorKind.THROTTLED or (kind is ErrorKind.TRANSIENT and idempotent)
+
+
+def backoff_delay(policy: RetryPolicy, retry: int) -> float:
+    """Return a jittered delay in seconds before the nth retry, using full jitter exponential backoff."""
+    ceiling = min(
+        policy.max_backoff, policy.initial_backoff * policy.multiplier ** (retry - 1)
+    )
+    return random.uniform(0, ceiling)  # noqa: S311
+
+
+class TokenBucket:
+    """A thread-safe token bucket, refilled at rate tokens per second up to capacity."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Create a full bucket."""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token, returning how many seconds to wait before using it.
+
+        Tokens may be reserved ahead of time, in which case callers are queued up in the order they reserved.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Take a token, sleeping until it is available."""
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Take a token, without blocking the event loop while waiting for it."""
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class RetryBudget:
+    """Limits retries to a ratio of successful calls, so that retries stop rather than add load to a failing provider."""
+
+    def __init__(self, ratio: float, capacity: float) -> None:
+        """Create a full budget."""
+        self.ratio = ratio
+        self.capacity = capacity
+        self._tokens = capacity
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Earn budget for a successful call."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Spend budget on a retry, returning False if there is none left."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+_rate_limiters: dict[tuple[str, Optional[str]], TokenBucket] = {}
+_retry_budgets: dict[tuple[str, Optional[str]], RetryBudget] = {}
+_registry_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    provider: str, region: Optional[str], policy: RetryPolicy
+) -> Optional[TokenBucket]:
+    """Return the rate limiter shared by calls to a provider region, or None if the policy does not rate limit."""
+    if policy.requests_per_second is None:
+        return None
+    key = (provider, region)
+    with _registry_lock:
+        limiter = _rate_limiters.get(key)
+        if limiter is None:
+            limiter = _rate_limiters[key] = TokenBucket(
+                policy.requests_per_second, policy.burst
+            )
+        return limiter
+
+
+def get_retry_budget(
+    provider: str, region: Optional[str], policy: RetryPolicy
+) -> RetryBudget:
+    """Return the retry budget shared by calls to a provider region."""
+    key = (provider, region)
+    with _registry_lock:
+        budget = _retry_budgets.get(key)
+        if budget is None:
+            budget = _retry_budgets[key] = RetryBudget(
+                policy.budget_ratio, policy.budget_capacity
+            )
+        return budget
+
+
+class ProviderRetrier:
+    """Makes calls to one provider region, rate limiting and retrying them according to a retry policy.
+
+    The rate limiter and retry budget are shared by all retriers for the same provider region, and are built from the
+    policy of the first retrier created for it.
+    """
+
+    def __init__(
+        self, provider: str, region: Optional[str], policy: Optional[RetryPolicy] = None
+    ) -> None:
+        """Bind the retrier to a provider region, and the limiter and budget shared by calls to it."""
+        self.provider = provider
+        self.region = region
+        self.policy = policy or RetryPolicy()
+        self.rate_limiter = get_rate_limiter(provider, region, self.policy)
+        self.budget = get_retry_budget(provider, region, self.policy)
+
+    def _retry_delay(
+        self, error: Exception, operation: str, attempt: int, idempotent: bool
+    ) -> float:
+        """Return the delay before retrying a failed attempt, or raise the translated error if it is not retried."""
+        kind = classify_error(error)
+        if (
+            not should_retry(kind, idempotent)
+            or attempt >= self.policy.max_attempts
+            or not self.budget.withdraw()
+        ):
+            _raise_translated(error, operation)
+        delay = backoff_delay(self.policy, attempt)
+        logger.debug(
+            "%s attempt %d failed with %s error %s, retrying in %.2fs",
+            operation,
+            attempt,
+            kind.value,
+            type(error).__name__,
+            delay,
+        )
+        return delay
+
+    def call(
+        self,
+        operation: str,
+        fn: Callable[[], T],
+        idempotent: Optional[bool] = None,
+        on_retry: Optional[Callable[[int], Any]] = None,
+    ) -> T:
+        """Call fn, retrying it while it fails with retryable errors.
+
+        If idempotent is unset, it is guessed from the operation name. on_retry is called with 1 on each retry.
+        """
+        if idempotent is None:
+            idempotent = is_idempotent(operation)
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                result = fn()
+            except Exception as e:
+                delay = self._retry_delay(e, operation, attempt, idempotent)
+                if on_retry is not None:
+                    on_retry(1)
+                time.sleep(delay)
+                continue
+            self.budget.deposit()
+            return result
+
+    async def call_async(
+        self,
+        operation: str,
+        fn: Callable[[], Awaitable[T]],
+        idempotent: Optional[bool] = None,
+        on_retry: Optional[Callable[[int], Any]] = None,
+    ) -> T:
+        """Await fn(), retrying it while it fails with retryable errors, without blocking the event loop."""
+        if idempotent is None:
+            idempotent = is_idempotent(operation)
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            try:
+                result = await fn()
+            except Exception as e:
+                delay = self._retry_delay(e, operation, attempt, idempotent)
+                if on_retry is not None:
+                    on_retry(1)
+                await asyncio.sleep(delay)
+                continue
+            self.budget.deposit()
+            return result
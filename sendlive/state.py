@@ -0,0 +1,359 @@
+"""A local record of the provider resources sendlive creates.
+
+Every resource an adapter creates is recorded in a `StateBackend`, indexed by provider, account, region, resource type
+and name, by the stream it belongs to, and by its ARN or resource path. Records are scoped to the account (the AWS
+account or GCP project) that the resource was created in, so adapters using different accounts never see each other's
+resources. Adapters consult the state before making provider calls, so looking up a resource created earlier (even by
+a previous process) is a local read rather than a list or get call.
+
+State is a cache of what sendlive created, not the source of truth: a resource deleted outside of sendlive is still
+recorded until sendlive deletes it or the record is removed.
+
+`SQLiteStateBackend` persists state across restarts, and is the default. `InMemoryStateBackend` keeps it for the
+lifetime of the process.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from sendlive.constants import ProviderOptions
+
+STATE_PATH_ENV_VAR = "SENDLIVE_STATE_PATH"
+DEFAULT_STATE_PATH = "~/.cache/sendlive/state.sqlite3"
+
+
+class ResourceRecord(BaseModel):
+    """A provider resource created by sendlive."""
+
+    provider: str
+    """The provider the resource was created with, such as "aws" or "gcp"."""
+    account: str
+    """The account the resource was created in, such as the AWS account id or GCP project id."""
+    region: str
+    resource_type: str
+    """The type of resource, named after the api that creates it, such as "medialive.input"."""
+    resource_id: str
+    """The ARN or resource path of the resource, which uniquely identifies it."""
+    name: str
+    """The name the resource is looked up by, unique per provider, account, region and resource type."""
+    stream_name: Optional[str] = None
+    """The name of the stream the resource belongs to, if any."""
+    attributes: dict[str, Any] = {}
+    """Anything else needed to use the resource without looking it up, such as its url."""
+    created_at: float = Field(default_factory=time.time)
+
+
+class StateBackend(ABC):
+    """Stores records of the resources sendlive creates. Implementations must be thread-safe."""
+
+    @abstractmethod
+    def put(self, record: ResourceRecord) -> None:
+        """Add a record, replacing any existing record with the same resource id."""
+
+    @abstractmethod
+    def get(self, resource_id: str) -> Optional[ResourceRecord]:
+        """Return the record of a resource by its ARN or resource path."""
+
+    @abstractmethod
+    def find(  # noqa: PLR0913
+        self,
+        provider: Optional[str] = None,
+        account: Optional[str] = None,
+        region: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        name: Optional[str] = None,
+        *,
+        stream_name: Optional[str] = None,
+    ) -> list[ResourceRecord]:
+        """Return the records matching every passed in field, oldest first."""
+
+    @abstractmethod
+    def delete(self, resource_id: str) -> bool:
+        """Remove the record of a resource, returning whether there was one."""
+
+    def find_one(  # noqa: PLR0913
+        self, provider: str, account: str, region: str, resource_type: str, name: str
+    ) -> Optional[ResourceRecord]:
+        """Return the record of a resource by its name."""
+        records = self.find(provider, account, region, resource_type, name)
+        return records[-1] if records else None
+
+    def close(self) -> None:  # noqa: B027 - optional, as backends holding no connections have nothing to release
+        """Release any connections held by the backend."""
+
+
+class InMemoryStateBackend(StateBackend):
+    """Keeps records in memory for the lifetime of the process."""
+
+    def __init__(self) -> None:
+        """Create an empty state."""
+        self._records: dict[str, ResourceRecord] = {}
+        self._names: dict[tuple[str, str, str, str, str], set[str]] = {}
+        self._lock = threading.Lock()
+
+    def put(self, record: ResourceRecord) -> None:
+        """Add a record, replacing any existing record with the same resource id."""
+        with self._lock:
+            self._delete(record.resource_id)
+            self._records[record.resource_id] = record
+            self._names.setdefault(self._name_key(record), set()).add(
+                record.resource_id
+            )
+
+    def get(self, resource_id: str) -> Optional[ResourceRecord]:
+        """Return the record of a resource by its ARN or resource path."""
+        return self._records.get(resource_id)
+
+    def find(  # noqa: PLR0913
+        self,
+        provider: Optional[str] = None,
+        account: Optional[str] = None,
+        region: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        name: Optional[str] = None,
+        *,
+        stream_name: Optional[str] = None,
+    ) -> list[ResourceRecord]:
+        """Return the records matching every passed in field, oldest first."""
+        with self._lock:
+            if (
+                provider is not None
+                and account is not None
+                and region is not None
+                and resource_type is not None
+                and name is not None
+            ):
+                # looking up by name is the common case, so is served from the index rather than a scan
+                candidates = [
+                    self._records[resource_id]
+                    for resource_id in self._names.get(
+                        (provider, account, region, resource_type, name), ()
+                    )
+                ]
+            else:
+                candidates = list(self._records.values())
+            records = [
+                record
+                for record in candidates
+                if (provider is None or record.provider == provider)
+                and (account is None or record.account == account)
+                and (region is None or record.region == region)
+                and (resource_type is None or record.resource_type == resource_type)
+                and (name is None or record.name == name)
+                and (stream_name is None or record.stream_name == stream_name)
+            ]
+        return sorted(records, key=lambda record: record.created_at)
+
+    def delete(self, resource_id: str) -> bool:
+        """Remove the record of a resource, returning whether there was one."""
+        with self._lock:
+            return self._delete(resource_id)
+
+    @staticmethod
+    def _name_key(record: ResourceRecord) -> tuple[str, str, str, str, str]:
+        return (
+            record.provider,
+            record.account,
+            record.region,
+            record.resource_type,
+            record.name,
+        )
+
+    def _delete(self, resource_id: str) -> bool:
+        record = self._records.pop(resource_id, None)
+        if record is None:
+            return False
+        key = self._name_key(record)
+        self._names[key].discard(resource_id)
+        if not self._names[key]:
+            del self._names[key]
+        return True
+
+
+class SQLiteStateBackend(StateBackend):
+    """Persists records to a SQLite database, so they survive restarts and can be shared between processes."""
+
+    _COLUMNS = (
+        "resource_id",
+        "provider",
+        "account",
+        "region",
+        "resource_type",
+        "name",
+        "stream_name",
+        "attributes",
+        "created_at",
+    )
+
+    def __init__(self, path: Union[str, Path] = ":memory:") -> None:
+        """Open, and if needed create, the database at path."""
+        self.path = str(path) if str(path) == ":memory:" else Path(path).expanduser()
+        if isinstance(self.path, Path):
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        # the connection is shared between threads, with access serialised by the lock
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            if isinstance(self.path, Path):
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS resources (
+                    resource_id TEXT PRIMARY KEY,
+                    provider TEXT NOT NULL,
+                    account TEXT NOT NULL,
+                    region TEXT NOT NULL,
+                    resource_type TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    stream_name TEXT,
+                    attributes TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            self._migrate()
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS resources_by_account_name "
+                "ON resources (provider, account, region, resource_type, name)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS resources_by_account_stream "
+                "ON resources (stream_name, provider, account, region)"
+            )
+
+    def _migrate(self) -> None:
+        """Add the account column to databases created before records were scoped to an account.
+
+        Records from those databases are kept, but as their account is unknown they are never found by an adapter.
+        Must be called holding the lock.
+        """
+        columns = {
+            row[1] for row in self._connection.execute("PRAGMA table_info(resources)")
+        }
+        if "account" in columns:
+            return
+        self._connection.execute(
+            "ALTER TABLE resources ADD COLUMN account TEXT NOT NULL DEFAULT ''"
+        )
+        self._connection.execute("DROP INDEX IF EXISTS resources_by_name")
+        self._connection.execute("DROP INDEX IF EXISTS resources_by_stream")
+
+    def _record(self, row: tuple[Any, ...]) -> ResourceRecord:
+        values = dict(zip(self._COLUMNS, row))  # noqa: B905 - zip(strict=) needs python 3.10
+        values["attributes"] = json.loads(values["attributes"])
+        return ResourceRecord(**values)
+
+    def put(self, record: ResourceRecord) -> None:
+        """Add a record, replacing any existing record with the same resource id."""
+        with self._lock:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO resources ({', '.join(self._COLUMNS)}) "  # noqa: S608
+                f"VALUES ({', '.join('?' * len(self._COLUMNS))})",
+                (
+                    record.resource_id,
+                    record.provider,
+                    record.account,
+                    record.region,
+                    record.resource_type,
+                    record.name,
+                    record.stream_name,
+                    json.dumps(record.attributes),
+                    record.created_at,
+                ),
+            )
+
+    def get(self, resource_id: str) -> Optional[ResourceRecord]:
+        """Return the record of a resource by its ARN or resource path."""
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT {', '.join(self._COLUMNS)} FROM resources WHERE resource_id = ?",  # noqa: S608
+                (resource_id,),
+            ).fetchone()
+        return self._record(row) if row is not None else None
+
+    def find(  # noqa: PLR0913
+        self,
+        provider: Optional[str] = None,
+        account: Optional[str] = None,
+        region: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        name: Optional[str] = None,
+        *,
+        stream_name: Optional[str] = None,
+    ) -> list[ResourceRecord]:
+        """Return the records matching every passed in field, oldest first."""
+        filters = {
+            "provider": provider,
+            "account": account,
+            "region": region,
+            "resource_type": resource_type,
+            "name": name,
+            "stream_name": stream_name,
+        }
+        conditions = [f"{column} = ?" for column, value in filters.items() if value]
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {', '.join(self._COLUMNS)} FROM resources{where} ORDER BY created_at",  # noqa: S608
+                [value for value in filters.values() if value],
+            ).fetchall()
+        return [self._record(row) for row in rows]
+
+    def delete(self, resource_id: str) -> bool:
+        """Remove the record of a resource, returning whether there was one."""
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM resources WHERE resource_id = ?", (resource_id,)
+            )
+        return cursor.rowcount > 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+_state_backends: dict[str, StateBackend] = {}
+_state_backends_lock = threading.Lock()
+
+
+def resolve_state_path(options: Optional[ProviderOptions] = None) -> str:
+    """Return the path of the sqlite state database, from the provider options, environment or default."""
+    path = (options.state_path if options else None) or os.environ.get(
+        STATE_PATH_ENV_VAR, DEFAULT_STATE_PATH
+    )
+    return str(Path(path).expanduser())
+
+
+def get_state_backend(options: Optional[ProviderOptions] = None) -> StateBackend:
+    """Return the state backend configured by the provider options.
+
+    Backends are shared by every adapter configured with the same backend and path.
+    """
+    in_memory = options is not None and options.state_backend == "memory"
+    key = "memory" if in_memory else resolve_state_path(options)
+    with _state_backends_lock:
+        backend = _state_backends.get(key)
+        if backend is None:
+            backend = _state_backends[key] = (
+                InMemoryStateBackend() if in_memory else SQLiteStateBackend(key)
+            )
+        return backend
+
+
+def close_state_backends() -> None:
+    """Close and forget every shared state backend."""
+    with _state_backends_lock:
+        backends = list(_state_backends.values())
+        _state_backends.clear()
+    for backend in backends:
+        backend.close()
@@ -1,8 +1,18 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from pydantic import BaseModel
 
 
+class StreamURLs(BaseModel):
+    """The urls of a stream."""
+
+    input: Optional[str] = None
+    """The url to push the stream to."""
+    playback: Optional[str] = None
+    """The url of the manifest the stream can be watched at."""
+
+
 class BaseStream(BaseModel, ABC):
     """BaseStream is an abstract class that defines the interface for all individual stream implementations.
 
@@ -20,13 +30,13 @@ class BaseStream(BaseModel, ABC):
         """Stop the stream."""
 
     @abstractmethod
-    def is_alive(self) -> None:
+    def is_alive(self) -> bool:
         """Check if the stream is alive."""
 
     @abstractmethod
-    def get_url(self) -> None:
-        """Get the URL for the stream."""
+    def get_url(self) -> StreamURLs:
+        """Get the URLs to push the stream to and watch it at."""
 
     @abstractmethod
-    def get_name(self) -> None:
+    def get_name(self) -> str:
         """Get the name of the stream."""
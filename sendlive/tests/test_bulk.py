@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from sendlive.bulk import (
+    StreamCreationResult,
+    create_streams,
+    create_streams_async,
+)
+from sendlive.constants import AWSCredentials
+from sendlive.providers.aws.adapter import AWSAdapter
+from sendlive.providers.aws.stream import AWSStream
+
+
+def create_stream(name: str) -> AWSStream:
+    if name == "broken":
+        raise RuntimeError("provider error")
+    return AWSStream(name=name)
+
+
+def test_create_streams_reports_failures_without_aborting() -> None:
+    """Test a failing stream is reported in its result and does not stop the rest of the batch."""
+    result = create_streams(create_stream, ["one", "broken", "two"], max_concurrency=2)
+    assert [r.name for r in result.results] == ["one", "broken", "two"]
+    assert [r.name for r in result.succeeded] == ["one", "two"]
+    assert len(result.failed) == 1
+    assert result.failed[0].error == "RuntimeError: provider error"
+    assert [stream.name for stream in result.streams] == ["one", "two"]
+    assert result.duration >= 0
+    assert result.max_stream_duration >= result.mean_stream_duration
+
+
+def test_create_streams_bounds_concurrency() -> None:
+    """Test no more than max_concurrency streams are created at once."""
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def slow_create_stream(name: str) -> AWSStream:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return AWSStream(name=name)
+
+    result = create_streams(
+        slow_create_stream, [f"stream-{i}" for i in range(20)], max_concurrency=4
+    )
+    assert len(result.succeeded) == 20
+    assert 1 < peak <= 4
+
+
+def test_create_streams_reports_each_result_as_it_is_ready() -> None:
+    """Test on_result is called once per stream, and before the slowest stream is created."""
+    release = threading.Event()
+    reported: list[str] = []
+
+    def blocking_create_stream(name: str) -> AWSStream:
+        if name == "slow":
+            assert release.wait(5)
+        return create_stream(name)
+
+    def on_result(result: StreamCreationResult) -> None:
+        reported.append(result.name)
+        if len(reported) == 2:
+            release.set()
+
+    result = create_streams(
+        blocking_create_stream,
+        ["slow", "one", "broken"],
+        max_concurrency=3,
+        on_result=on_result,
+    )
+    assert sorted(reported[:2]) == ["broken", "one"]
+    assert reported[2] == "slow"
+    assert [r.succeeded for r in result.results] == [True, True, False]
+
+
+def test_create_streams_async_reports_failures_without_aborting() -> None:
+    """Test the asyncio bulk creation reports per stream failures."""
+
+    async def create_stream_async(name: str) -> AWSStream:
+        return create_stream(name)
+
+    result = asyncio.run(
+        create_streams_async(create_stream_async, ["one", "broken"], max_concurrency=1)
+    )
+    assert [r.succeeded for r in result.results] == [True, False]
+
+
+@pytest.fixture(scope="function")
+def sendlive_aws_adapter() -> AWSAdapter:
+    return AWSAdapter(
+        credentials=AWSCredentials(
+            access_key="testing", secret_key="testing", region="ap-southeast-2"
+        )
+    )
+
+
+def test_aws_create_streams_shares_input_security_group(
+    sendlive_aws_adapter: AWSAdapter,
+) -> None:
+    """Test a bulk creation on AWS creates a single input security group for the whole batch."""
+    with mock.patch.object(
+        AWSAdapter, "find_input_security_group", return_value=None
+    ), mock.patch.object(
+        AWSAdapter, "create_input_security_group", return_value={"Id": "1234"}
+    ) as create_input_security_group, mock.patch.object(
+        AWSStream, "setup_endpoint"
+    ) as setup_endpoint, mock.patch.object(
+        AWSAdapter, "get_or_create_mediapackagev2_channel_group"
+    ), mock.patch.object(
+        AWSStream, "setup_mediapackage_channel"
+    ), mock.patch.object(
+        AWSStream, "setup_origin_endpoint"
+    ), mock.patch.object(
+        AWSStream, "setup_channel"
+    ):
+        result = sendlive_aws_adapter.create_streams(
+            [f"stream-{i}" for i in range(10)], max_concurrency=5
+        )
+    assert len(result.succeeded) == 10
+    create_input_security_group.assert_called_once()
+    assert {
+        call.kwargs["security_input_group_id"] for call in setup_endpoint.call_args_list
+    } == {1234}
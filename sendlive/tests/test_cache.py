@@ -0,0 +1,70 @@
+import threading
+import time
+
+import pytest
+
+from sendlive.cache import CoalescingTTLCache
+
+
+def test_cache_returns_cached_value_within_ttl() -> None:
+    """Test a value is only loaded once while it is fresh."""
+    cache: CoalescingTTLCache[int] = CoalescingTTLCache(ttl=60)
+    calls: list[int] = []
+
+    def loader() -> int:
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get("key", loader) == 1
+    assert cache.get("key", loader) == 1
+    cache.invalidate("key")
+    assert cache.get("key", loader) == 2
+
+
+def test_cache_reloads_expired_values() -> None:
+    """Test a ttl of zero loads the value on every call."""
+    cache: CoalescingTTLCache[float] = CoalescingTTLCache(ttl=0)
+    assert cache.get("key", time.monotonic) != cache.get("key", time.monotonic)
+
+
+def test_cache_coalesces_concurrent_loads() -> None:
+    """Test concurrent callers share one in-flight load instead of each loading."""
+    cache: CoalescingTTLCache[str] = CoalescingTTLCache(ttl=0)
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[int] = []
+
+    def loader() -> str:
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return "value"
+
+    results: list[str] = []
+    leader = threading.Thread(target=lambda: results.append(cache.get("key", loader)))
+    leader.start()
+    assert started.wait(timeout=5)
+    followers = [
+        threading.Thread(target=lambda: results.append(cache.get("key", loader)))
+        for _ in range(5)
+    ]
+    for follower in followers:
+        follower.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(timeout=5)
+    assert results == ["value"] * 6
+    assert len(calls) == 1
+
+
+def test_cache_does_not_cache_errors() -> None:
+    """Test a failed load raises, and the next call loads again."""
+    cache: CoalescingTTLCache[str] = CoalescingTTLCache(ttl=60)
+
+    def failing_loader() -> str:
+        raise RuntimeError("provider error")
+
+    with pytest.raises(RuntimeError):
+        cache.get("key", failing_loader)
+    assert cache.get("key", lambda: "value") == "value"
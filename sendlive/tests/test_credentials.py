@@ -0,0 +1,72 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from sendlive.constants import (
+    AWSCredentials,
+    AWSOptions,
+    GCPCredentials,
+    ServiceProvider,
+)
+from sendlive.credentials import load_credentials, load_provider_options
+from sendlive.exceptions import SendLiveError
+
+
+def test_load_aws_credentials_from_environment_and_file(tmp_path: Path) -> None:
+    """Test AWS credentials are read from the standard environment variables, overridden by a credentials file."""
+    environ = {
+        "AWS_ACCESS_KEY_ID": "env-key",
+        "AWS_SECRET_ACCESS_KEY": "env-secret",
+        "AWS_DEFAULT_REGION": "ap-southeast-2",
+    }
+    credentials = load_credentials(ServiceProvider.AWS, environ=environ)
+    assert isinstance(credentials, AWSCredentials)
+    assert credentials.access_key == "env-key"
+    assert credentials.region == "ap-southeast-2"
+    credentials_file = tmp_path / "credentials.json"
+    credentials_file.write_text(json.dumps({"region": "us-east-1"}))
+    credentials = load_credentials(
+        ServiceProvider.AWS, credentials_file, environ=environ
+    )
+    assert isinstance(credentials, AWSCredentials)
+    assert credentials.region == "us-east-1"
+    assert credentials.secret_key.get_secret_value() == "env-secret"
+
+
+def test_load_gcp_credentials_from_service_account(tmp_path: Path) -> None:
+    """Test GCP credentials are read from the service account key file, taking its project."""
+    service_account_file = tmp_path / "service-account.json"
+    service_account_file.write_text(
+        json.dumps({"type": "service_account", "project_id": "my-project"})
+    )
+    credentials = load_credentials(
+        ServiceProvider.GCP,
+        environ={
+            "GOOGLE_APPLICATION_CREDENTIALS": str(service_account_file),
+            "SENDLIVE_GCP_REGION": "australia-southeast1",
+        },
+    )
+    assert isinstance(credentials, GCPCredentials)
+    assert credentials.project_id == "my-project"
+    assert credentials.service_account_json["type"] == "service_account"
+
+
+def test_load_credentials_reports_missing_fields(tmp_path: Path) -> None:
+    """Test missing credentials and unreadable files raise a sendlive error naming the problem."""
+    with pytest.raises(SendLiveError, match="access_key, region, secret_key"):
+        load_credentials(ServiceProvider.AWS, environ={})
+    not_an_object = tmp_path / "credentials.json"
+    not_an_object.write_text("[]")
+    with pytest.raises(SendLiveError, match="must contain a json object"):
+        load_credentials(ServiceProvider.AWS, not_an_object, environ={})
+
+
+def test_load_provider_options(tmp_path: Path) -> None:
+    """Test provider options are read from an options file, or left as the defaults."""
+    assert load_provider_options(ServiceProvider.AWS) is None
+    options_file = tmp_path / "options.json"
+    options_file.write_text(json.dumps({"medialive_waiter_delay": 1}))
+    assert load_provider_options(ServiceProvider.AWS, options_file) == AWSOptions(
+        medialive_waiter_delay=1
+    )
@@ -0,0 +1,291 @@
+import threading
+import time
+from typing import Optional
+from unittest import mock
+
+import pytest
+
+from sendlive.exceptions import SendLiveError
+from sendlive.gc import (
+    GCResourceType,
+    SendLiveResource,
+    collect_garbage,
+    delete_streams,
+    find_orphans,
+)
+
+
+def _resource(
+    resource_type: str,
+    stream_name: Optional[str],
+    live: bool = False,
+    references: Optional[list[str]] = None,
+) -> SendLiveResource:
+    name = stream_name or "shared"
+    return SendLiveResource(
+        provider="fake",
+        resource_type=resource_type,
+        resource_id=f"{resource_type}:{name}",
+        provider_id=f"{resource_type}-{name}",
+        name=name,
+        stream_name=stream_name,
+        live=live,
+        references=references or [],
+    )
+
+
+class FakeProvider:
+    """Lists fixed resources, recording the order resources are deleted in."""
+
+    def __init__(
+        self, resources: list[SendLiveResource], fail: tuple[str, ...] = ()
+    ) -> None:
+        """List the resources, failing to delete those with an id in fail."""
+        self.resources = resources
+        self.fail = fail
+        self.deleted: list[str] = []
+        self.lock = threading.Lock()
+
+    def resource_type(
+        self, resource_type: str, delete_after: tuple[str, ...] = ()
+    ) -> GCResourceType:
+        """Describe a resource type listing the resources of that type."""
+
+        def delete_resource(resource: SendLiveResource) -> None:
+            if resource.resource_id in self.fail:
+                raise RuntimeError("provider error")
+            with self.lock:
+                self.deleted.append(resource.resource_id)
+
+        return GCResourceType(
+            resource_type,
+            lambda: [r for r in self.resources if r.resource_type == resource_type],
+            delete_resource,
+            delete_after=delete_after,
+        )
+
+    def adapter(
+        self, desired: tuple[str, ...] = (), recorded: Optional[tuple[str, ...]] = None
+    ) -> mock.Mock:
+        """Mock an adapter collecting the garbage of this provider, where desired streams are kept.
+
+        The adapter recorded creating the resources with an id in recorded, or every resource if it is None.
+        """
+        recorded_ids = (
+            {id_ for resource in self.resources for id_ in resource.ids}
+            if recorded is None
+            else set(recorded)
+        )
+        return mock.Mock(
+            gc_resource_types=lambda: [
+                self.resource_type("group", delete_after=("input",)),
+                self.resource_type("input", delete_after=("channel",)),
+                self.resource_type("channel"),
+            ],
+            gc_desired_stream_names=lambda: set(desired),
+            gc_recorded_resource_ids=lambda: recorded_ids,
+        )
+
+
+def test_find_orphans() -> None:
+    """Test resources of live and kept streams are not orphaned, nor are shared resources they use."""
+    orphan_input = _resource("input", "orphan")
+    live_channel = _resource("channel", "live", live=True)
+    live_input = _resource("input", "live")
+    kept_input = _resource("input", "kept")
+    orphan_group = _resource("group", None, references=[orphan_input.resource_id])
+    used_group = _resource(
+        "group", None, references=[orphan_input.resource_id, "input-live"]
+    )
+    resources = [
+        orphan_input,
+        live_channel,
+        live_input,
+        kept_input,
+        orphan_group,
+        used_group,
+    ]
+    assert find_orphans(resources, keep=["kept"]) == [orphan_input, orphan_group]
+
+
+def test_collect_garbage_deletes_orphans_in_dependency_order() -> None:
+    """Test channels are deleted before inputs, and inputs before the groups they use."""
+    provider = FakeProvider(
+        [
+            _resource("group", None, references=["input-one", "input-two"]),
+            _resource("input", "one"),
+            _resource("input", "two"),
+            _resource("channel", "one"),
+            _resource("channel", "running", live=True),
+        ]
+    )
+    result = collect_garbage([provider.adapter()])
+    assert sorted(provider.deleted[:1]) == ["channel:one"]
+    assert sorted(provider.deleted[1:3]) == ["input:one", "input:two"]
+    assert provider.deleted[3:] == ["group:shared"]
+    assert [resource.resource_id for resource in result.deleted] == [
+        "channel:one",
+        "input:one",
+        "input:two",
+        "group:shared",
+    ]
+    assert not result.failed
+    assert len(result.resources) == 5
+    assert "found 4 orphaned resources" in result.report()
+
+
+def test_collect_garbage_keeps_desired_streams() -> None:
+    """Test the resources of streams an adapter created in full are kept, even when idle."""
+    provider = FakeProvider(
+        [
+            _resource("input", "desired"),
+            _resource("channel", "desired"),
+            _resource("input", "partial"),
+        ]
+    )
+    result = collect_garbage([provider.adapter(desired=("desired",))])
+    assert provider.deleted == ["input:partial"]
+    assert not result.failed
+
+
+def test_collect_garbage_keeps_resources_unknown_to_the_local_state() -> None:
+    """Test only streams and shared resources with a recorded resource are collected, unless unknown ones are too."""
+    provider = FakeProvider(
+        [
+            _resource("input", "recorded"),
+            _resource("channel", "recorded"),
+            _resource("input", "unknown"),
+            _resource("group", None),
+        ]
+    )
+    result = collect_garbage(
+        [provider.adapter(recorded=("input:recorded",))], dry_run=True
+    )
+    assert [resource.resource_id for resource in result.orphans] == [
+        "channel:recorded",
+        "input:recorded",
+    ]
+    result = collect_garbage([provider.adapter(recorded=())], include_unknown=True)
+    assert sorted(provider.deleted) == [
+        "channel:recorded",
+        "group:shared",
+        "input:recorded",
+        "input:unknown",
+    ]
+
+
+def test_collect_garbage_dry_run() -> None:
+    """Test a dry run finds orphans without deleting anything."""
+    provider = FakeProvider([_resource("input", "one"), _resource("channel", "one")])
+    result = collect_garbage([provider.adapter()], dry_run=True)
+    assert [resource.resource_id for resource in result.orphans] == [
+        "channel:one",
+        "input:one",
+    ]
+    assert provider.deleted == []
+    assert result.deletions == []
+    assert "dry run" in result.report()
+
+
+def test_collect_garbage_skips_resources_attached_to_failed_deletions() -> None:
+    """Test a failed deletion skips the rest of its stream, and shared resources it uses, but not other streams."""
+    provider = FakeProvider(
+        [
+            _resource("group", None, references=["input-one"]),
+            _resource("input", "one"),
+            _resource("channel", "one"),
+            _resource("input", "two"),
+        ],
+        fail=("channel:one",),
+    )
+    result = collect_garbage([provider.adapter()])
+    assert provider.deleted == ["input:two"]
+    assert {failure.resource.resource_id for failure in result.failed} == {
+        "channel:one",
+        "input:one",
+        "group:shared",
+    }
+    assert result.failed[0].error == "RuntimeError: provider error"
+
+
+def test_delete_streams() -> None:
+    """Test every resource of the named streams is deleted, except for live streams and shared resources."""
+    provider = FakeProvider(
+        [
+            _resource("group", None, references=["input-one"]),
+            _resource("input", "one"),
+            _resource("channel", "one"),
+            _resource("input", "two"),
+            _resource("input", "live"),
+            _resource("channel", "live", live=True),
+        ]
+    )
+    result = delete_streams([provider.adapter()], ["one", "live"])
+    assert provider.deleted == ["channel:one", "input:one"]
+    assert [failure.resource.resource_id for failure in result.failed] == [
+        "channel:live",
+        "input:live",
+    ]
+    assert "must be stopped" in str(result.failed[0].error)
+
+
+def test_collect_garbage_fails_before_deleting_if_listing_fails() -> None:
+    """Test nothing is deleted when any resource type fails to be listed."""
+    provider = FakeProvider([_resource("input", "one")])
+
+    def list_resources() -> list[SendLiveResource]:
+        raise RuntimeError("provider error")
+
+    adapter = mock.Mock(
+        gc_resource_types=lambda: [
+            provider.resource_type("input"),
+            GCResourceType("channel", list_resources, lambda resource: None),
+        ],
+        gc_desired_stream_names=set,
+        gc_recorded_resource_ids=set,
+    )
+    with pytest.raises(RuntimeError):
+        collect_garbage([adapter])
+    assert provider.deleted == []
+
+
+def test_collect_garbage_bounds_concurrency() -> None:
+    """Test no more than max_concurrency resources are deleted at once."""
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def delete_resource(resource: SendLiveResource) -> None:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+
+    resources = [_resource("input", f"stream-{i}") for i in range(20)]
+    adapter = mock.Mock(
+        gc_resource_types=lambda: [
+            GCResourceType("input", lambda: resources, delete_resource)
+        ],
+        gc_desired_stream_names=set,
+        gc_recorded_resource_ids=set,
+    )
+    result = collect_garbage([adapter], max_concurrency=4, include_unknown=True)
+    assert len(result.deleted) == 20
+    assert 1 < peak <= 4
+
+
+def test_collect_garbage_rejects_cyclic_resource_types() -> None:
+    """Test resource types that must each be deleted after the other are rejected."""
+    adapter = mock.Mock(
+        gc_resource_types=lambda: [
+            GCResourceType("input", list, lambda resource: None, ("channel",)),
+            GCResourceType("channel", list, lambda resource: None, ("input",)),
+        ],
+        gc_desired_stream_names=set,
+        gc_recorded_resource_ids=set,
+    )
+    with pytest.raises(SendLiveError):
+        collect_garbage([adapter])
@@ -0,0 +1,85 @@
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sendlive.exceptions import SendLiveError
+from sendlive.graph import Task, run_task_graph
+
+
+@pytest.fixture(scope="function")
+def executor() -> Iterator[ThreadPoolExecutor]:
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        yield pool
+
+
+def test_run_task_graph_passes_dependency_results(executor: ThreadPoolExecutor) -> None:
+    """Test each task is called with the results of the tasks it depends on."""
+    results = run_task_graph(
+        {
+            "input": Task(lambda _: "input-1"),
+            "channel": Task(
+                lambda results: f"channel-for-{results['input']}",
+                depends_on=("input",),
+            ),
+        },
+        executor,
+    )
+    assert results == {"input": "input-1", "channel": "channel-for-input-1"}
+
+
+def test_run_task_graph_runs_independent_tasks_concurrently(
+    executor: ThreadPoolExecutor,
+) -> None:
+    """Test independent tasks are started at the same time, rather than one after another."""
+    # each task waits for the other to start, so this only completes if both run at once
+    barrier = threading.Barrier(2, timeout=5)
+    results = run_task_graph(
+        {
+            "input": Task(lambda _: barrier.wait()),
+            "channel_group": Task(lambda _: barrier.wait()),
+        },
+        executor,
+    )
+    assert set(results) == {"input", "channel_group"}
+
+
+def test_run_task_graph_does_not_start_dependents_of_failed_tasks(
+    executor: ThreadPoolExecutor,
+) -> None:
+    """Test a failed task's error is raised, and tasks depending on it are never started."""
+    started: list[str] = []
+
+    def fail(_: object) -> None:
+        raise ValueError("input failed")
+
+    with pytest.raises(ValueError, match="input failed"):
+        run_task_graph(
+            {
+                "input": Task(fail),
+                "channel": Task(
+                    lambda _: started.append("channel"), depends_on=("input",)
+                ),
+            },
+            executor,
+        )
+    assert started == []
+
+
+@pytest.mark.parametrize(
+    "tasks",
+    [
+        {"channel": Task(lambda _: None, depends_on=("input",))},
+        {
+            "input": Task(lambda _: None, depends_on=("channel",)),
+            "channel": Task(lambda _: None, depends_on=("input",)),
+        },
+    ],
+)
+def test_run_task_graph_rejects_invalid_graphs(
+    tasks: dict[str, Task], executor: ThreadPoolExecutor
+) -> None:
+    """Test unknown dependencies and dependency cycles are rejected before any task runs."""
+    with pytest.raises(SendLiveError):
+        run_task_graph(tasks, executor)
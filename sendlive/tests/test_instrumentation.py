@@ -0,0 +1,123 @@
+from collections.abc import Iterator
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from sendlive.instrumentation import (
+    InMemoryInstrumentation,
+    LatencyHistogram,
+    OpenTelemetryInstrumentation,
+    ProviderCallRecord,
+    get_instrumentation,
+    instrument_call,
+    instrument_pending_operation,
+    set_instrumentation,
+)
+from sendlive.operations import PendingOperation
+
+
+@pytest.fixture(scope="function")
+def instrumentation() -> Iterator[InMemoryInstrumentation]:
+    collector = InMemoryInstrumentation()
+    set_instrumentation(collector)
+    yield collector
+    set_instrumentation(None)
+
+
+def test_instrument_call_is_a_shared_no_op_by_default() -> None:
+    """Test no call object is built and nothing is timed when no instrumentation is installed."""
+    assert get_instrumentation() is None
+    assert instrument_call("aws", "medialive.create_input") is instrument_call(
+        "gcp", "livestream.create_input"
+    )
+    with instrument_call("aws", "medialive.create_input") as call:
+        call.add_retries(1)
+
+
+def test_instrument_call_records_successful_calls(
+    instrumentation: InMemoryInstrumentation,
+) -> None:
+    """Test a successful call is recorded with its latency and retries."""
+    with instrument_call("aws", "medialive.create_input") as call:
+        call.add_retries(2)
+    (record,) = instrumentation.calls()
+    assert record.provider == "aws"
+    assert record.operation == "medialive.create_input"
+    assert record.retries == 2
+    assert record.error is None
+    assert record.duration >= 0
+    assert instrumentation.latencies[("aws", "medialive.create_input")].count == 1
+    assert instrumentation.retries[("aws", "medialive.create_input")] == 2
+
+
+def test_instrument_call_records_error_class(
+    instrumentation: InMemoryInstrumentation,
+) -> None:
+    """Test a failed call is recorded with the class name of its error, and the error still propagates."""
+    with pytest.raises(ValueError):
+        with instrument_call("gcp", "storage.create_bucket"):
+            raise ValueError("bad bucket")
+    assert instrumentation.errors[("gcp", "storage.create_bucket")] == {
+        "ValueError": 1
+    }
+
+
+def test_instrument_pending_operation_records_once_resolved(
+    instrumentation: InMemoryInstrumentation,
+) -> None:
+    """Test long running operations tracked in the background are recorded when they complete."""
+    pending: PendingOperation[str] = PendingOperation()
+    instrument_pending_operation("gcp", "livestream.create_channel.wait", pending)
+    assert instrumentation.calls() == []
+    pending._future.set_exception(TimeoutError())
+    (record,) = instrumentation.calls(operation="livestream.create_channel.wait")
+    assert record.error == "TimeoutError"
+
+
+def test_latency_histogram_buckets() -> None:
+    """Test durations are counted in the first bucket whose upper bound they do not exceed."""
+    histogram = LatencyHistogram(buckets=(0.1, 1.0))
+    for duration in (0.05, 0.1, 0.5, 5.0):
+        histogram.observe(duration)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.mean == pytest.approx(1.4125)
+
+
+def test_open_telemetry_instrumentation() -> None:
+    """Test calls are reported as spans with their recorded times, and as metrics."""
+    tracer, meter = mock.MagicMock(), mock.MagicMock()
+    instruments: dict[str, Any] = {}
+    meter.create_histogram.side_effect = lambda name, **_: instruments.setdefault(
+        name, mock.MagicMock()
+    )
+    meter.create_counter.side_effect = lambda name, **_: instruments.setdefault(
+        name, mock.MagicMock()
+    )
+    OpenTelemetryInstrumentation(tracer=tracer, meter=meter).record_call(
+        ProviderCallRecord(
+            provider="aws",
+            operation="medialive.create_input",
+            started=10.0,
+            duration=0.5,
+            retries=1,
+            error="TooManyRequestsException",
+        )
+    )
+    attributes = {
+        "sendlive.provider": "aws",
+        "sendlive.operation": "medialive.create_input",
+    }
+    instruments["sendlive.provider.call.duration"].record.assert_called_once_with(
+        0.5, attributes
+    )
+    instruments["sendlive.provider.call.retries"].add.assert_called_once_with(
+        1, attributes
+    )
+    instruments["sendlive.provider.call.errors"].add.assert_called_once_with(
+        1, {**attributes, "error.type": "TooManyRequestsException"}
+    )
+    assert tracer.start_span.call_args.kwargs["start_time"] == 10_000_000_000
+    tracer.start_span.return_value.end.assert_called_once_with(
+        end_time=10_500_000_000
+    )
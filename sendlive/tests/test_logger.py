@@ -0,0 +1,119 @@
+import io
+import json
+import logging
+import subprocess
+import sys
+from collections.abc import Iterator
+from unittest import mock
+
+import pytest
+from google.cloud.video.live_stream_v1 import Input as InputEndpoint
+
+from sendlive.logger import (
+    REDACTED,
+    JSONFormatter,
+    SanitisedResponse,
+    configure_logging,
+    log_response,
+    logger,
+)
+
+MEDIALIVE_INPUT_RESPONSE = {
+    "Input": {
+        "Id": "1234567",
+        "Destinations": [{"Url": "rtmp://1.2.3.4:1935/my-stream", "Port": "1935"}],
+        "Name": "my-stream",
+    },
+    "ResponseMetadata": {"HTTPStatusCode": 201, "RequestId": "abc"},
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_sendlive_logger() -> Iterator[None]:
+    """Restore the sendlive logger's level and handlers after each test."""
+    level, handlers = logger.level, list(logger.handlers)
+    yield
+    logger.setLevel(level)
+    logger.handlers[:] = handlers
+
+
+def test_importing_sendlive_does_not_configure_root_logger() -> None:
+    """Test the library only installs a NullHandler on its own logger, and leaves the root logger alone."""
+    assert [type(handler) for handler in logger.handlers] == [logging.NullHandler]
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            "import logging, sendlive.logger; print(len(logging.getLogger().handlers))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "0"
+
+
+def test_log_response_does_nothing_when_level_disabled() -> None:
+    """Test responses are not sanitised or formatted when the log level is disabled."""
+    logger.setLevel(logging.INFO)
+    with mock.patch.object(SanitisedResponse, "sanitise") as sanitise:
+        log_response("medialive.create_input", MEDIALIVE_INPUT_RESPONSE)
+    sanitise.assert_not_called()
+
+
+def test_log_response_redacts_and_omits_fields(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test input urls are redacted and response metadata is dropped from logged responses."""
+    with caplog.at_level(logging.DEBUG, logger="sendlive"):
+        log_response("medialive.create_input", MEDIALIVE_INPUT_RESPONSE)
+    (record,) = caplog.records
+    assert record.operation == "medialive.create_input"  # type: ignore[attr-defined]
+    assert "rtmp://" not in record.getMessage()
+    assert "ResponseMetadata" not in record.getMessage()
+    sanitised = record.response.sanitise()  # type: ignore[attr-defined]
+    assert sanitised["Input"]["Destinations"][0]["Url"] == REDACTED
+    assert sanitised["Input"]["Destinations"][0]["Port"] == "1935"
+
+
+def test_sanitised_response_truncates_large_values() -> None:
+    """Test long strings and long lists are truncated."""
+    sanitised = SanitisedResponse(
+        {"Description": "x" * 50, "Items": list(range(10))},
+        max_string_length=10,
+        max_items=3,
+    ).sanitise()
+    assert sanitised["Description"] == "xxxxxxxxxx...<40 more chars>"
+    assert sanitised["Items"] == [0, 1, 2, "<7 more items>"]
+
+
+def test_sanitised_response_converts_proto_messages() -> None:
+    """Test proto-plus messages returned by the GCP client libraries are converted and redacted."""
+    response = InputEndpoint(
+        name="projects/p/locations/l/inputs/i", uri="rtmp://1.2.3.4/live/secret-key"
+    )
+    sanitised = SanitisedResponse(response).sanitise()
+    assert sanitised["name"] == "projects/p/locations/l/inputs/i"
+    assert sanitised["uri"] == REDACTED
+
+
+def test_json_formatter_includes_structured_fields() -> None:
+    """Test the json formatter emits the operation and sanitised response as json."""
+    stream = io.StringIO()
+    configure_logging(logging.DEBUG, json_format=True, stream=stream)
+    log_response("medialive.create_input", MEDIALIVE_INPUT_RESPONSE)
+    entry = json.loads(stream.getvalue())
+    assert entry["level"] == "DEBUG"
+    assert entry["logger"] == "sendlive"
+    assert entry["operation"] == "medialive.create_input"
+    assert entry["response"]["Input"]["Id"] == "1234567"
+
+
+def test_configure_logging_replaces_previous_handler() -> None:
+    """Test configuring logging twice does not duplicate output."""
+    first = configure_logging(stream=io.StringIO())
+    second = configure_logging(stream=io.StringIO())
+    assert first not in logger.handlers
+    assert second in logger.handlers
+    assert isinstance(second.formatter, logging.Formatter)
+    assert not isinstance(second.formatter, JSONFormatter)
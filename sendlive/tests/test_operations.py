@@ -0,0 +1,106 @@
+import threading
+from collections.abc import Generator
+from typing import Any, Optional
+
+import pytest
+
+from sendlive.exceptions import SendLiveTimeoutError
+from sendlive.operations import OperationPoller, PendingOperation
+
+
+class FakeOperation:
+    """Operation that completes after a set number of polls."""
+
+    def __init__(
+        self,
+        polls_until_done: int,
+        result: Any = "result",
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Set up the operation to complete after polls_until_done polls."""
+        self.polls_until_done = polls_until_done
+        self.polls = 0
+        self._result = result
+        self._error = error
+
+    def done(self) -> bool:
+        """Record a poll, and return whether the operation has completed."""
+        self.polls += 1
+        return self.polls >= self.polls_until_done
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """Return the result, or raise the configured error."""
+        if self._error:
+            raise self._error
+        return self._result
+
+
+@pytest.fixture(scope="function")
+def poller() -> Generator[OperationPoller, Any, None]:
+    operation_poller = OperationPoller(initial_delay=0.001, max_delay=0.01)
+    yield operation_poller
+    operation_poller.shutdown()
+
+
+def test_pending_operation_resolves_with_transformed_result(
+    poller: OperationPoller,
+) -> None:
+    """Test a pending operation resolves once the operation completes, applying the transform."""
+    operation = FakeOperation(polls_until_done=3)
+    pending = poller.submit(operation, transform=str.upper)
+    assert pending.result(timeout=5) == "RESULT"
+    assert pending.done()
+    assert operation.polls == 3
+
+
+def test_pending_operation_propagates_errors(poller: OperationPoller) -> None:
+    """Test an operation that fails raises its error from the handle."""
+    pending: PendingOperation[str] = poller.submit(
+        FakeOperation(1, error=ValueError("failed"))
+    )
+    with pytest.raises(ValueError, match="failed"):
+        pending.result(timeout=5)
+
+
+def test_pending_operation_callbacks(poller: OperationPoller) -> None:
+    """Test done callbacks are called with the handle once the operation completes."""
+    called = threading.Event()
+    pending: PendingOperation[str] = poller.submit(FakeOperation(2))
+    pending.add_done_callback(lambda handle: called.set())
+    assert called.wait(timeout=5)
+
+
+def test_poller_times_out_operations(poller: OperationPoller) -> None:
+    """Test an operation that never completes fails once its timeout passes."""
+    pending: PendingOperation[str] = poller.submit(
+        FakeOperation(polls_until_done=10**9), timeout=0.05
+    )
+    with pytest.raises(SendLiveTimeoutError):
+        pending.result(timeout=5)
+
+
+def test_pending_operation_result_timeout() -> None:
+    """Test waiting on a handle for less time than the operation takes raises a timeout error."""
+    pending: PendingOperation[str] = PendingOperation(FakeOperation(1))
+    with pytest.raises(SendLiveTimeoutError):
+        pending.result(timeout=0.01)
+
+
+def test_poller_multiplexes_many_operations_on_one_thread(
+    poller: OperationPoller,
+) -> None:
+    """Test many outstanding operations are driven without a thread per operation."""
+    threads_before = threading.active_count()
+    pendings: list[PendingOperation[int]] = [
+        poller.submit(FakeOperation(5, result=i)) for i in range(200)
+    ]
+    assert threading.active_count() <= threads_before + 1
+    assert [pending.result(timeout=10) for pending in pendings] == list(range(200))
+    assert len(poller) == 0
+
+
+def test_pending_operation_from_result() -> None:
+    """Test a handle can be created already completed."""
+    pending = PendingOperation.from_result("existing")
+    assert pending.done()
+    assert pending.result() == "existing"
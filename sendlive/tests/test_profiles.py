@@ -0,0 +1,66 @@
+import pytest
+from pydantic import ValidationError
+
+from sendlive.profiles import (
+    EncodingProfile,
+    VideoRendition,
+    merge_overrides,
+    to_low_latency,
+)
+
+RENDITION = VideoRendition(name="720p", width=1280, height=720, bitrate=3000000)
+
+
+def test_encoding_profiles_are_hashable_by_value() -> None:
+    """Test equal profiles hash equally, so that settings compiled from them are cached once."""
+    profile = EncodingProfile(video=(RENDITION,))
+    assert hash(profile) == hash(EncodingProfile(video=[RENDITION]))
+    assert profile != EncodingProfile(video=(RENDITION,), segment_seconds=6)
+    with pytest.raises(ValidationError):
+        profile.frame_rate = 30  # type: ignore[misc]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"video": ()},
+        {"video": (RENDITION, RENDITION)},
+        {"video": (RENDITION,), "gop_seconds": 4, "segment_seconds": 2},
+        {"video": (RENDITION,), "segment_seconds": 6, "playlist_window_seconds": 4},
+    ],
+)
+def test_encoding_profile_validation(options: dict[str, object]) -> None:
+    """Test profiles without renditions, with duplicate renditions or with segments shorter than a GOP are rejected."""
+    with pytest.raises(ValidationError):
+        EncodingProfile(**options)
+
+
+def test_merge_overrides() -> None:
+    """Test overrides are merged into nested mappings, replace other values, and only copy what they change."""
+    base = {
+        "timecodeConfig": {"source": "SYSTEMCLOCK", "syncThreshold": 1},
+        "globalConfiguration": {"outputLockingMode": "PIPELINE_LOCKING"},
+        "outputGroups": [{"name": "one"}],
+    }
+    merged = merge_overrides(
+        base, {"timecodeConfig": {"source": "EMBEDDED"}, "outputGroups": []}
+    )
+    assert merged == {
+        "timecodeConfig": {"source": "EMBEDDED", "syncThreshold": 1},
+        "globalConfiguration": {"outputLockingMode": "PIPELINE_LOCKING"},
+        "outputGroups": [],
+    }
+    assert base["timecodeConfig"] == {"source": "SYSTEMCLOCK", "syncThreshold": 1}
+    assert merged["globalConfiguration"] is base["globalConfiguration"]
+
+
+def test_to_low_latency() -> None:
+    """Test low latency profiles have single GOP segments in CMAF with low latency HLS, and keep the ladder."""
+    profile = EncodingProfile(video=(RENDITION,), gop_seconds=1.92)
+    low_latency = to_low_latency(profile, 1, 30)
+    assert low_latency.video == profile.video
+    assert (low_latency.gop_seconds, low_latency.segment_seconds) == (1, 1)
+    assert low_latency.playlist_window_seconds == 30
+    assert low_latency.container == "cmaf"
+    assert low_latency.low_latency_hls
+    assert to_low_latency(profile, 1, 30) is low_latency
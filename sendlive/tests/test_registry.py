@@ -0,0 +1,35 @@
+from sendlive.providers.aws.mediapackage import MediaPackageV2ChannelGroup
+from sendlive.registry import ResourceRegistry
+
+
+def _channel_group(name: str, arn_suffix: str = "") -> MediaPackageV2ChannelGroup:
+    return MediaPackageV2ChannelGroup(
+        name=name, arn=f"arn:aws:mediapackagev2:channelGroup/{name}{arn_suffix}"
+    )
+
+
+def test_resource_registry_deduplicates_by_key() -> None:
+    """Test adding a resource with a registered key replaces it, rather than registering it twice."""
+    registry: ResourceRegistry[MediaPackageV2ChannelGroup] = ResourceRegistry(
+        key=lambda channel_group: channel_group.name
+    )
+    registry.add(_channel_group("sendlive"))
+    replacement = registry.add(_channel_group("sendlive", arn_suffix="-2"))
+    assert len(registry) == 1
+    assert registry.get("sendlive") == replacement
+    assert replacement in registry
+    assert _channel_group("sendlive") not in registry
+    assert registry.remove("sendlive") == replacement
+    assert registry.get("sendlive") is None
+
+
+def test_resource_registry_forgets_least_recently_added_when_full() -> None:
+    """Test the registry never holds more than max_size resources, forgetting the oldest first."""
+    registry: ResourceRegistry[MediaPackageV2ChannelGroup] = ResourceRegistry(
+        key=lambda channel_group: channel_group.name, max_size=2
+    )
+    for name in ("first", "second", "first", "third"):
+        registry.add(_channel_group(name))
+    assert [channel_group.name for channel_group in registry] == ["first", "third"]
+    assert registry.first() == _channel_group("first")
+    assert registry.get("second") is None
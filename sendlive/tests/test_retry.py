@@ -0,0 +1,213 @@
+import asyncio
+import time
+from typing import Any
+from unittest import mock
+
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+from google.api_core.exceptions import (
+    AlreadyExists,
+    PermissionDenied,
+    ResourceExhausted,
+    ServiceUnavailable,
+)
+
+from sendlive.constants import RetryPolicy
+from sendlive.exceptions import (
+    SendLiveProviderPermissionError,
+    SendLiveProviderThrottlingError,
+    SendLiveProviderUnavailableError,
+)
+from sendlive.retry import (
+    ErrorKind,
+    ProviderRetrier,
+    RetryBudget,
+    TokenBucket,
+    backoff_delay,
+    classify_error,
+    is_idempotent,
+    translated_errors,
+)
+
+NO_BACKOFF = RetryPolicy(initial_backoff=0, max_attempts=3)
+
+
+def client_error(code: str, status: int = 400) -> ClientError:
+    return ClientError(
+        {
+            "Error": {"Code": code},
+            "ResponseMetadata": {
+                "RequestId": "request-id",
+                "HostId": "host-id",
+                "HTTPStatusCode": status,
+                "HTTPHeaders": {},
+                "RetryAttempts": 0,
+            },
+        },
+        "CreateInput",
+    )
+
+
+def failing(*errors: Exception, result: Any = "ok") -> mock.Mock:
+    """Return a mock that raises each of errors in turn, then returns result."""
+    return mock.Mock(side_effect=[*errors, result])
+
+
+@pytest.mark.parametrize(
+    ("error", "kind"),
+    [
+        (client_error("TooManyRequestsException", 429), ErrorKind.THROTTLED),
+        (client_error("AccessDeniedException", 403), ErrorKind.PERMISSION),
+        (client_error("InternalServerErrorException", 500), ErrorKind.TRANSIENT),
+        (client_error("SomethingElse", 503), ErrorKind.TRANSIENT),
+        (client_error("BadRequestException"), ErrorKind.OTHER),
+        (EndpointConnectionError(endpoint_url="https://x"), ErrorKind.TRANSIENT),
+        (ResourceExhausted("quota"), ErrorKind.THROTTLED),  # type: ignore[no-untyped-call]
+        (ServiceUnavailable("down"), ErrorKind.TRANSIENT),  # type: ignore[no-untyped-call]
+        (PermissionDenied("no"), ErrorKind.PERMISSION),  # type: ignore[no-untyped-call]
+        (AlreadyExists("exists"), ErrorKind.OTHER),  # type: ignore[no-untyped-call]
+        (ValueError("not a provider error"), ErrorKind.OTHER),
+    ],
+)
+def test_classify_error(error: Exception, kind: ErrorKind) -> None:
+    """Test provider SDK errors are classified by their error code or http status."""
+    assert classify_error(error) is kind
+
+
+def test_is_idempotent() -> None:
+    """Test reads and deletes are treated as idempotent, and creates are not."""
+    assert is_idempotent("medialive.list_inputs")
+    assert is_idempotent("livestream.get_channel")
+    assert not is_idempotent("medialive.create_input")
+
+
+def test_backoff_delay_is_jittered_and_capped() -> None:
+    """Test backoff grows exponentially, with full jitter, up to the maximum backoff."""
+    policy = RetryPolicy(initial_backoff=1, multiplier=2, max_backoff=5)
+    with mock.patch("sendlive.retry.random.uniform", side_effect=lambda a, b: b):
+        assert [backoff_delay(policy, retry) for retry in range(1, 5)] == [
+            1,
+            2,
+            4,
+            5,
+        ]
+
+
+def test_retrier_retries_throttled_calls() -> None:
+    """Test throttled calls are retried, even when the operation is not idempotent."""
+    fn = failing(client_error("TooManyRequestsException", 429))
+    retries: list[int] = []
+    retrier = ProviderRetrier("aws", "test-throttled", NO_BACKOFF)
+    assert retrier.call("medialive.create_input", fn, on_retry=retries.append) == "ok"
+    assert fn.call_count == 2
+    assert retries == [1]
+
+
+def test_retrier_raises_translated_error_once_attempts_run_out() -> None:
+    """Test the sendlive exception is raised once a call has been throttled max_attempts times."""
+    fn = mock.Mock(side_effect=ResourceExhausted("quota"))  # type: ignore[no-untyped-call]
+    retrier = ProviderRetrier("gcp", "test-attempts", NO_BACKOFF)
+    with pytest.raises(SendLiveProviderThrottlingError) as error:
+        retrier.call("livestream.create_input", fn)
+    assert isinstance(error.value.__cause__, ResourceExhausted)
+    assert fn.call_count == 3
+
+
+def test_retrier_only_retries_transient_errors_for_idempotent_calls() -> None:
+    """Test transient errors are retried for idempotent calls, but not for other calls."""
+    retrier = ProviderRetrier("gcp", "test-transient", NO_BACKOFF)
+    assert (
+        retrier.call("livestream.get_input", failing(ServiceUnavailable("down")))  # type: ignore[no-untyped-call]
+        == "ok"
+    )
+    fn = failing(ServiceUnavailable("down"))  # type: ignore[no-untyped-call]
+    with pytest.raises(SendLiveProviderUnavailableError):
+        retrier.call("storage.create_bucket", fn)
+    assert fn.call_count == 1
+
+
+def test_retrier_does_not_retry_or_translate_other_errors() -> None:
+    """Test errors callers handle themselves, such as AlreadyExists, are raised unchanged."""
+    fn = failing(AlreadyExists("exists"))  # type: ignore[no-untyped-call]
+    retrier = ProviderRetrier("gcp", "test-other", NO_BACKOFF)
+    with pytest.raises(AlreadyExists):
+        retrier.call("livestream.get_input", fn)
+    assert fn.call_count == 1
+
+
+def test_retrier_raises_permission_errors_without_retrying() -> None:
+    """Test permission errors are translated and not retried."""
+    fn = failing(client_error("AccessDeniedException", 403))
+    retrier = ProviderRetrier("aws", "test-permission", NO_BACKOFF)
+    with pytest.raises(SendLiveProviderPermissionError):
+        retrier.call("medialive.list_inputs", fn)
+    assert fn.call_count == 1
+
+
+def test_retrier_stops_retrying_when_budget_is_spent() -> None:
+    """Test retries stop once the shared retry budget is spent."""
+    policy = RetryPolicy(initial_backoff=0, budget_capacity=1, budget_ratio=0)
+    retrier = ProviderRetrier("aws", "test-budget", policy)
+    throttled = client_error("TooManyRequestsException", 429)
+    assert retrier.call("medialive.list_inputs", failing(throttled)) == "ok"
+    fn = failing(throttled)
+    with pytest.raises(SendLiveProviderThrottlingError):
+        retrier.call("medialive.list_inputs", fn)
+    assert fn.call_count == 1
+
+
+def test_retry_budget_is_earned_by_successful_calls() -> None:
+    """Test each successful call earns a fraction of a retry."""
+    budget = RetryBudget(ratio=0.5, capacity=1)
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+
+
+def test_token_bucket_queues_calls_beyond_burst() -> None:
+    """Test calls beyond the bucket capacity are delayed according to the refill rate."""
+    bucket = TokenBucket(rate=10, capacity=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_retrier_rate_limits_calls() -> None:
+    """Test calls to a provider region are rate limited when the policy sets a rate."""
+    policy = RetryPolicy(requests_per_second=50, burst=1)
+    retrier = ProviderRetrier("aws", "test-rate-limit", policy)
+    started = time.monotonic()
+    for _ in range(3):
+        retrier.call("medialive.list_inputs", lambda: None)
+    assert time.monotonic() - started >= 0.035
+
+
+def test_retrier_call_async() -> None:
+    """Test async calls are retried in the same way as blocking calls."""
+    calls = 0
+
+    async def create_input() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise ResourceExhausted("quota")  # type: ignore[no-untyped-call]
+        return "ok"
+
+    retrier = ProviderRetrier("gcp", "test-async", NO_BACKOFF)
+    assert asyncio.run(retrier.call_async("livestream.create_input", create_input)) == (
+        "ok"
+    )
+    assert calls == 2
+
+
+def test_translated_errors() -> None:
+    """Test errors raised within the block are translated without being retried."""
+    with pytest.raises(SendLiveProviderThrottlingError):
+        with translated_errors("livestream.create_channel"):
+            raise ResourceExhausted("quota")  # type: ignore[no-untyped-call]
+    with pytest.raises(AlreadyExists):
+        with translated_errors("livestream.create_channel"):
+            raise AlreadyExists("exists")  # type: ignore[no-untyped-call]
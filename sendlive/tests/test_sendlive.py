@@ -0,0 +1,113 @@
+import asyncio
+import threading
+from unittest import mock
+
+import pytest
+
+from sendlive import AsyncSendLive, SendLive
+from sendlive.constants import AWSCredentials
+from sendlive.providers.aws.adapter import AWSAdapter
+from sendlive.providers.aws.stream import AWSStream
+
+
+@pytest.fixture(scope="function")
+def sendlive_instance(sendlive_aws_credentials: AWSCredentials) -> SendLive:
+    return SendLive(credentials=sendlive_aws_credentials)
+
+
+def test_adapter_is_cached(sendlive_instance: SendLive) -> None:
+    """Test the adapter is only built once per SendLive instance."""
+    assert sendlive_instance.adapter is sendlive_instance.adapter
+
+
+def test_adapter_not_included_in_model_dump(sendlive_instance: SendLive) -> None:
+    """Test serializing the model does not build or include the adapter."""
+    dumped = sendlive_instance.model_dump()
+    assert "adapter" not in dumped
+    assert sendlive_instance._adapter is None
+
+
+def test_adapter_invalidated_on_credentials_change(
+    sendlive_instance: SendLive,
+) -> None:
+    """Test reassigning credentials causes a new adapter to be built, keeping the old one open until close."""
+    original_adapter = sendlive_instance.adapter
+    assert isinstance(original_adapter, AWSAdapter)
+    original_adapter.medialive  # noqa: B018
+    new_credentials = AWSCredentials(
+        access_key="other", secret_key="other", region="us-east-1"
+    )
+    sendlive_instance.credentials = new_credentials
+    # streams returned by the original adapter still use its clients
+    assert len(original_adapter.clients) == 1
+    new_adapter = sendlive_instance.adapter
+    assert new_adapter is not original_adapter
+    assert new_adapter.credentials == new_credentials
+    sendlive_instance.close()
+    assert len(original_adapter.clients) == 0
+
+
+def test_invalidate_adapter(sendlive_instance: SendLive) -> None:
+    """Test explicitly invalidating the adapter causes a new adapter to be built, and both are closed on close."""
+    original_adapter = sendlive_instance.adapter
+    with mock.patch.object(AWSAdapter, "close") as close:
+        sendlive_instance.invalidate_adapter()
+        close.assert_not_called()
+        assert sendlive_instance.adapter is not original_adapter
+        sendlive_instance.close()
+    assert close.call_count == 2
+
+
+def test_async_aclose_awaits_replaced_adapters(
+    sendlive_aws_credentials: AWSCredentials,
+) -> None:
+    """Test AsyncSendLive awaits aclose on the adapters replaced by reassigning provider options."""
+
+    async def run(sl: AsyncSendLive) -> None:
+        sl.adapter  # noqa: B018
+        sl.provider_options = None
+        sl.adapter  # noqa: B018
+        await sl.aclose()
+
+    with mock.patch.object(AWSAdapter, "aclose") as aclose, mock.patch.object(
+        AWSAdapter, "close"
+    ) as close:
+        asyncio.run(run(AsyncSendLive(credentials=sendlive_aws_credentials)))
+    assert aclose.await_count == 2
+    close.assert_not_called()
+
+
+def test_close_discards_adapter(sendlive_instance: SendLive) -> None:
+    """Test closing SendLive closes and discards the cached adapter."""
+    with sendlive_instance as sl:
+        original_adapter = sl.adapter
+        assert isinstance(original_adapter, AWSAdapter)
+        original_adapter.medialive  # noqa: B018
+        assert len(original_adapter.clients) == 1
+    assert sendlive_instance._adapter is None
+    assert len(original_adapter.clients) == 0
+
+
+def test_async_create_stream_does_not_block_event_loop(
+    sendlive_aws_credentials: AWSCredentials,
+) -> None:
+    """Test AsyncSendLive offloads blocking provider calls away from the event loop thread."""
+    calling_threads: list[threading.Thread] = []
+
+    def create_stream(
+        self: AWSAdapter, name: str, latency_mode: str = "standard"
+    ) -> AWSStream:
+        calling_threads.append(threading.current_thread())
+        return AWSStream(name=name)
+
+    async def run() -> AWSStream:
+        async with AsyncSendLive(credentials=sendlive_aws_credentials) as sl:
+            stream = await sl.create_stream("my-stream")
+            assert isinstance(stream, AWSStream)
+            return stream
+
+    with mock.patch.object(AWSAdapter, "create_stream", create_stream):
+        stream = asyncio.run(run())
+    assert stream.name == "my-stream"
+    assert calling_threads
+    assert calling_threads[0] is not threading.main_thread()
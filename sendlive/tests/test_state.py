@@ -0,0 +1,157 @@
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from sendlive.constants import AWSOptions
+from sendlive.state import (
+    STATE_PATH_ENV_VAR,
+    InMemoryStateBackend,
+    ResourceRecord,
+    SQLiteStateBackend,
+    StateBackend,
+    get_state_backend,
+    resolve_state_path,
+)
+
+
+def _record(
+    resource_id: str,
+    name: str = "my-stream",
+    resource_type: str = "medialive.input",
+    created_at: float = 1.0,
+    account: str = "123456789012",
+) -> ResourceRecord:
+    return ResourceRecord(
+        provider="aws",
+        account=account,
+        region="ap-southeast-2",
+        resource_type=resource_type,
+        resource_id=resource_id,
+        name=name,
+        stream_name=name,
+        attributes={"id": resource_id.rsplit(":", 1)[-1]},
+        created_at=created_at,
+    )
+
+
+@pytest.fixture(scope="function", params=["memory", "sqlite"])
+def state_backend(request: pytest.FixtureRequest) -> Iterator[StateBackend]:
+    backend: StateBackend = (
+        InMemoryStateBackend() if request.param == "memory" else SQLiteStateBackend()
+    )
+    yield backend
+    backend.close()
+
+
+def test_state_backend_put_get_and_delete(state_backend: StateBackend) -> None:
+    """Test records are looked up by resource id, with their attributes, until deleted."""
+    record = _record("arn:input:1")
+    state_backend.put(record)
+    assert state_backend.get("arn:input:1") == record
+    assert state_backend.delete("arn:input:1")
+    assert state_backend.get("arn:input:1") is None
+    assert not state_backend.delete("arn:input:1")
+
+
+def test_state_backend_find(state_backend: StateBackend) -> None:
+    """Test records are found by any combination of fields, oldest first, and by name the latest is returned."""
+    first_input = _record("arn:input:1", created_at=1.0)
+    channel = _record(
+        "arn:channel:1", resource_type="medialive.channel", created_at=2.0
+    )
+    second_input = _record("arn:input:2", created_at=3.0)
+    other_stream = _record("arn:input:3", name="other-stream", created_at=4.0)
+    for record in (other_stream, channel, second_input, first_input):
+        state_backend.put(record)
+    assert state_backend.find(stream_name="my-stream") == [
+        first_input,
+        channel,
+        second_input,
+    ]
+    assert state_backend.find(
+        "aws", "123456789012", "ap-southeast-2", "medialive.input"
+    ) == [
+        first_input,
+        second_input,
+        other_stream,
+    ]
+    assert (
+        state_backend.find_one(
+            "aws", "123456789012", "ap-southeast-2", "medialive.input", "my-stream"
+        )
+        == second_input
+    )
+    assert state_backend.find("gcp") == []
+
+
+def test_state_backend_scopes_records_to_accounts(
+    state_backend: StateBackend,
+) -> None:
+    """Test a resource recorded in one account is not found by name or stream from another account."""
+    record = _record("arn:input:1", account="111111111111")
+    state_backend.put(record)
+    for account, expected in (("111111111111", record), ("222222222222", None)):
+        assert (
+            state_backend.find_one(
+                "aws", account, "ap-southeast-2", "medialive.input", "my-stream"
+            )
+            == expected
+        )
+        assert state_backend.find(
+            "aws", account, "ap-southeast-2", stream_name="my-stream"
+        ) == ([expected] if expected else [])
+
+
+def test_sqlite_state_backend_migrates_records_without_account(
+    tmp_path: Path,
+) -> None:
+    """Test a database created before records had an account is upgraded, leaving its records unscoped."""
+    path = tmp_path / "state.sqlite3"
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE resources (resource_id TEXT PRIMARY KEY, provider TEXT NOT NULL, region TEXT NOT NULL, "
+        "resource_type TEXT NOT NULL, name TEXT NOT NULL, stream_name TEXT, attributes TEXT NOT NULL, "
+        "created_at REAL NOT NULL)"
+    )
+    connection.execute(
+        "INSERT INTO resources VALUES ('arn:input:1', 'aws', 'ap-southeast-2', 'medialive.input', 'my-stream', "
+        "'my-stream', '{}', 1.0)"
+    )
+    connection.commit()
+    connection.close()
+    backend = SQLiteStateBackend(path)
+    legacy_record = backend.get("arn:input:1")
+    assert legacy_record is not None
+    assert legacy_record.account == ""
+    assert not backend.find("aws", "123456789012")
+    backend.put(_record("arn:input:2"))
+    assert backend.find("aws", "123456789012") == [_record("arn:input:2")]
+    backend.close()
+
+
+def test_sqlite_state_backend_persists_records(tmp_path: Path) -> None:
+    """Test records written to a sqlite state file are read back after it is reopened."""
+    path = tmp_path / "nested" / "state.sqlite3"
+    backend = SQLiteStateBackend(path)
+    backend.put(_record("arn:input:1"))
+    backend.close()
+    reopened_backend = SQLiteStateBackend(path)
+    assert reopened_backend.get("arn:input:1") == _record("arn:input:1")
+    reopened_backend.close()
+
+
+def test_get_state_backend(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test backends are shared per configured path, with the path taken from options before the environment."""
+    monkeypatch.setenv(STATE_PATH_ENV_VAR, str(tmp_path / "env.sqlite3"))
+    options_path = str(tmp_path / "options.sqlite3")
+    assert resolve_state_path() == str(tmp_path / "env.sqlite3")
+    assert resolve_state_path(AWSOptions(state_path=options_path)) == options_path
+    assert get_state_backend() is get_state_backend(AWSOptions())
+    assert get_state_backend(AWSOptions(state_path=options_path)) is not (
+        get_state_backend()
+    )
+    assert isinstance(
+        get_state_backend(AWSOptions(state_backend="memory")), InMemoryStateBackend
+    )
@@ -1,4 +1,16 @@
-from sendlive.utils import generate_dns_compliant_name
+from unittest import mock
+
+import pytest
+
+from sendlive.constants import ServiceProvider
+from sendlive.exceptions import SendLiveError
+from sendlive.providers.local.adapter import LocalAdapter
+from sendlive.utils import (
+    generate_dns_compliant_name,
+    get_adapter_for_provider,
+    register_adapter,
+    validate_dns_compliant_name,
+)
 
 
 def test_generate_dns_compliant_name_returns_string_with_default_parameters() -> None:
@@ -32,3 +44,81 @@ def test_generate_dns_compliant_name_returns_string_with_custom_num_words() -> N
     assert isinstance(result, str)
     assert result.startswith("sendlive-")
     assert len(result.split("-")) == 6
+
+
+def test_generate_dns_compliant_name_is_valid() -> None:
+    """Test generated names satisfy the GCS/S3 bucket naming rules."""
+    for _ in range(100):
+        name = generate_dns_compliant_name()
+        assert validate_dns_compliant_name(name) == name
+
+
+def test_generate_dns_compliant_name_without_prefix() -> None:
+    """Test a name made up of only words is generated when prefix is unset."""
+    result = generate_dns_compliant_name(prefix=None)
+    assert len(result.split("-")) == 3
+    assert not result.startswith("None")
+
+
+def test_generate_dns_compliant_name_retries_existing_names() -> None:
+    """Test a new name is drawn while the exists predicate reports the candidate name as taken."""
+    seen: list[str] = []
+
+    def exists(name: str) -> bool:
+        seen.append(name)
+        return len(seen) < 3
+
+    result = generate_dns_compliant_name(exists=exists)
+    assert len(seen) == 3
+    assert result == seen[-1]
+
+
+def test_generate_dns_compliant_name_gives_up_after_max_attempts() -> None:
+    """Test an error is raised if every candidate name already exists."""
+    exists = mock.Mock(return_value=True)
+    with pytest.raises(SendLiveError):
+        generate_dns_compliant_name(exists=exists, max_attempts=4)
+    assert exists.call_count == 4
+
+
+def test_generate_dns_compliant_name_rejects_invalid_prefix() -> None:
+    """Test an error is raised if the prefix makes the generated name invalid."""
+    with pytest.raises(SendLiveError):
+        generate_dns_compliant_name(prefix="Not_Valid")
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "ab",
+        "a" * 64,
+        "UPPER-case",
+        "under_score",
+        "-leading-hyphen",
+        "trailing-hyphen-",
+        "goog-bucket",
+        "xn--bucket",
+        "sthree-bucket",
+        "bucket-s3alias",
+        "bucket--ol-s3",
+        "my-google-bucket",
+    ],
+)
+def test_validate_dns_compliant_name_rejects_invalid_names(name: str) -> None:
+    """Test names breaking the GCS/S3 bucket naming rules are rejected."""
+    with pytest.raises(SendLiveError):
+        validate_dns_compliant_name(name)
+
+
+def test_get_adapter_for_provider_imports_registered_adapters() -> None:
+    """Test adapters are imported from their registered path on first use, and can be replaced."""
+    assert get_adapter_for_provider(ServiceProvider.LOCAL) is LocalAdapter
+    replacement = mock.Mock()
+    try:
+        register_adapter(ServiceProvider.LOCAL, replacement)
+        assert get_adapter_for_provider(ServiceProvider.LOCAL) is replacement
+    finally:
+        register_adapter(
+            ServiceProvider.LOCAL, "sendlive.providers.local.adapter:LocalAdapter"
+        )
+    assert get_adapter_for_provider(ServiceProvider.LOCAL) is LocalAdapter
@@ -1,36 +1,111 @@
 import random
-from typing import Optional
-
-from faker import Faker
+import re
+from importlib import import_module
+from typing import Callable, Optional, Union
 
 from sendlive.adapter import BaseAdapter
 from sendlive.constants import ServiceProvider
+from sendlive.exceptions import SendLiveError
+from sendlive.logger import logger
+from sendlive.wordlist import WORDS
+
+# GCS and S3 bucket naming rules, see https://cloud.google.com/storage/docs/buckets#naming
+# and https://docs.aws.amazon.com/AmazonS3/latest/userguide/bucketnamingrules.html
+MIN_DNS_NAME_LENGTH = 3
+MAX_DNS_NAME_LENGTH = 63
+DNS_NAME_PATTERN = re.compile(r"[a-z0-9]([a-z0-9-]*[a-z0-9])?")
+FORBIDDEN_DNS_NAME_PREFIXES = ("goog", "xn--", "sthree-")
+FORBIDDEN_DNS_NAME_SUFFIXES = ("-s3alias", "--ol-s3")
+DEFAULT_DNS_NAME_MAX_ATTEMPTS = 5
+
+# names end up as globally visible bucket names, so are drawn from the OS's secure random source
+_random = random.SystemRandom()
+
+
+# adapter classes by provider, as "module:class" paths so that a provider's SDK is only imported once it is used
+_adapter_paths: dict[ServiceProvider, str] = {
+    ServiceProvider.AWS: "sendlive.providers.aws.adapter:AWSAdapter",
+    ServiceProvider.GCP: "sendlive.providers.gcp.adapter:GCPAdapter",
+    ServiceProvider.LOCAL: "sendlive.providers.local.adapter:LocalAdapter",
+}
+_adapter_classes: dict[ServiceProvider, type[BaseAdapter]] = {}
+
+
+def register_adapter(
+    provider: ServiceProvider, adapter: Union[str, type[BaseAdapter]]
+) -> None:
+    """Register the adapter class for a provider, or its "module:class" path to import it from on first use.
+
+    Replaces any adapter already registered for the provider.
+    """
+    _adapter_classes.pop(provider, None)
+    if isinstance(adapter, str):
+        _adapter_paths[provider] = adapter
+    else:
+        _adapter_classes[provider] = adapter
 
 
 def get_adapter_for_provider(
     provider: ServiceProvider,
 ) -> type[BaseAdapter]:
-    """Return the adapter class for the given provider."""
-    if provider == ServiceProvider.AWS:
-        from sendlive.providers.aws.adapter import AWSAdapter
+    """Return the adapter class registered for the given provider."""
+    adapter_cls = _adapter_classes.get(provider)
+    if adapter_cls is None:
+        path = _adapter_paths.get(provider)
+        if path is None:
+            raise NotImplementedError(f"Provider {provider} is not supported.")
+        module_name, _, class_name = path.partition(":")
+        adapter_cls = _adapter_classes[provider] = getattr(
+            import_module(module_name), class_name
+        )
+    return adapter_cls
 
-        return AWSAdapter
-    if provider == ServiceProvider.GCP:
-        from sendlive.providers.gcp.adapter import GCPAdapter
 
-        return GCPAdapter
-    raise NotImplementedError(f"Provider {provider} is not supported.")
+def validate_dns_compliant_name(name: str) -> str:
+    """Validate a name against the GCS and S3 bucket naming rules, returning it unchanged if valid.
+
+    Raises SendLiveError describing the first rule the name breaks.
+    """
+    if not MIN_DNS_NAME_LENGTH <= len(name) <= MAX_DNS_NAME_LENGTH:
+        raise SendLiveError(
+            f"{name!r} must be between {MIN_DNS_NAME_LENGTH} and {MAX_DNS_NAME_LENGTH} characters long."
+        )
+    if DNS_NAME_PATTERN.fullmatch(name) is None:
+        raise SendLiveError(
+            f"{name!r} must only contain lowercase letters, digits and hyphens, and start and end with a letter or digit."
+        )
+    if name.startswith(FORBIDDEN_DNS_NAME_PREFIXES):
+        raise SendLiveError(
+            f"{name!r} must not start with any of {', '.join(FORBIDDEN_DNS_NAME_PREFIXES)}."
+        )
+    if name.endswith(FORBIDDEN_DNS_NAME_SUFFIXES):
+        raise SendLiveError(
+            f"{name!r} must not end with any of {', '.join(FORBIDDEN_DNS_NAME_SUFFIXES)}."
+        )
+    if "google" in name:
+        raise SendLiveError(f"{name!r} must not contain 'google'.")
+    return name
 
 
 def generate_dns_compliant_name(
-    prefix: Optional[str] = "sendlive", num_words: Optional[int] = 3
+    prefix: Optional[str] = "sendlive",
+    num_words: int = 3,
+    exists: Optional[Callable[[str], bool]] = None,
+    max_attempts: int = DEFAULT_DNS_NAME_MAX_ATTEMPTS,
 ) -> str:
     """Generate a DNS compliant name suitable for S3/GCP bucket names for example.
 
-    You may optionally include a string that the generated name should contain.
+    The name is the prefix followed by num_words words drawn at random from an embedded wordlist, and is validated
+    against the GCS and S3 naming rules. If exists is supplied, it is called with each candidate name, and a new
+    name is drawn while it returns True, up to max_attempts times.
     """
-    faker = Faker()
-    words = faker.words(num_words)
-
-    # TODO ensure prefix cannot make the returned string not DNS compliant
-    return f'{prefix}-{"-".join(random.sample(words, len(words)))}'
+    for _ in range(max_attempts):
+        words = _random.sample(WORDS, num_words)
+        name = "-".join([prefix, *words] if prefix else words)
+        validate_dns_compliant_name(name)
+        if exists is None or not exists(name):
+            return name
+        logger.debug("generate_dns_compliant_name: %s already exists, retrying", name)
+    raise SendLiveError(
+        f"Could not generate an unused name with prefix {prefix!r} in {max_attempts} attempts."
+    )
@@ -0,0 +1,26 @@
+# Short, lowercase, purely alphabetical words used to build human readable DNS compliant names.
+# Embedded rather than loaded from a dependency such as faker, so that generating a name is cheap.
+WORDS: tuple[str, ...] = tuple(
+    """
+    able acid aged also area army away baby back ball band bank base bath bear beat
+    bell belt best bird blue boat body bone book boot born boss both bowl bulk burn
+    bush busy cake call calm camp card care cart case cash cast cell chat chip city
+    clay club coal coat code cold cook cool cope copy core corn cost crew crop dark
+    data date dawn deal dear deck deep deer desk dial diet dish disk dock door dose
+    down draw drop drum dual duck dust duty each earn ease east easy edge else even
+    ever face fact fair fall farm fast fern file fill film find fine fire firm fish
+    flat flow folk food foot ford form fort four free frog fuel full fund gain game
+    gate gear gift girl glad glow goal gold golf good gray grid grow gulf hair half
+    hall hand hard harp hawk head heat herb hero high hill hint hold home hope horn
+    host hour huge idea inch iron isle item jade jazz join jump june just keen keep
+    kind king kite knot lake lamp land lane last lawn lead leaf lean left lens life
+    lift lime line link lion list live load loan lock loft long loop lord loud luck
+    lush main mane many maple mark mast meal mild mile milk mill mind mint mist mode
+    moon moss most move much nest news next nice node noon norm nose note oak oasis
+    ocean olive open oval pace pack page palm park part path peak pear pine pink
+    plan plum poem pond pool port post quay quiz rain rare reed reef rest rice rich
+    ride ring rise river road rock roof room root rope rose ruby rush safe sage sail
+    salt sand seal seed ship shoe silk sky slow snow soft soil song star stem sun
+    surf swan
+    """.split()
+)
@@ -0,0 +1,74 @@
+"""Checks that importing the sendlive package and command-line interface does not eagerly import heavy dependencies.
+
+These run in a fresh interpreter with `python -X importtime`, so that modules already imported by the test session
+do not hide what importing sendlive imports. Import times vary too much between machines to assert on directly, so
+they are budgeted as a multiple of starting a bare interpreter on the same machine.
+"""
+import subprocess
+import sys
+import time
+
+# Modules that must only be imported once they are actually used.
+LAZY_MODULES = (
+    "boto3",
+    "botocore",
+    "google.cloud.video.live_stream_v1",
+    "google.cloud.storage",
+    "pydantic",
+)
+
+# How many times longer than `python -c pass` an import may take. Importing sendlive currently takes about as long, and
+# `sendlive --version` about twice as long, while eagerly importing pydantic and boto3 alone takes over five times as
+# long.
+IMPORT_TIME_BUDGET = 4
+
+
+def imported_modules(*args: str) -> set[str]:
+    """Run python with -X importtime and return the name of every module it imports."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {
+        line.split("|")[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "cumulative" not in line
+    }
+
+
+def run_time(*args: str, repeat: int = 5) -> float:
+    """Run python with the given arguments and return the fastest wall time of several runs, to discount noise."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], capture_output=True, check=True)  # noqa: S603
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def test_import_sendlive_is_lazy() -> None:
+    """Importing sendlive does not import pydantic or any provider SDK."""
+    modules = imported_modules("-c", "import sendlive")
+    assert "sendlive" in modules
+    assert not [module for module in LAZY_MODULES if module in modules]
+
+
+def test_cli_version_is_lazy() -> None:
+    """Running `sendlive --version` does not import pydantic or any provider SDK."""
+    modules = imported_modules("-m", "sendlive", "--version")
+    assert not [module for module in LAZY_MODULES if module in modules]
+
+
+def test_gcp_constants_do_not_import_protobuf_defaults() -> None:
+    """Importing the GCP provider constants does not import the live stream api until a default is used."""
+    modules = imported_modules("-c", "import sendlive.providers.gcp.constants")
+    assert "google.cloud.video.live_stream_v1" not in modules
+
+
+def test_import_time_budget() -> None:
+    """Importing sendlive and running `sendlive --version` take a small multiple of starting a bare interpreter."""
+    budget = IMPORT_TIME_BUDGET * run_time("-c", "pass")
+    assert run_time("-c", "import sendlive") < budget
+    assert run_time("-m", "sendlive", "--version") < budget
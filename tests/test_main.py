@@ -1,8 +1,30 @@
 """Test cases for the __main__ module."""
+import json
+from collections.abc import Iterator
+from typing import Any
+from unittest import mock
+
+import boto3
 import pytest
 from click.testing import CliRunner
+from moto import mock_medialive
 
 from sendlive import __main__
+from sendlive.bulk import create_streams
+from sendlive.constants import DEFAULT_TAGS
+from sendlive.gc import (
+    GarbageCollectionResult,
+    ResourceDeletionResult,
+    SendLiveResource,
+)
+from sendlive.providers.aws.stream import AWSStream
+from sendlive.stream import StreamURLs
+
+AWS_ENV = {
+    "AWS_ACCESS_KEY_ID": "testing",
+    "AWS_SECRET_ACCESS_KEY": "testing",
+    "AWS_REGION": "ap-southeast-2",
+}
 
 
 @pytest.fixture
@@ -11,7 +33,190 @@ def runner() -> CliRunner:
     return CliRunner()
 
 
+@pytest.fixture
+def adapter() -> Iterator[mock.MagicMock]:
+    """Fixture replacing the adapter the commands use."""
+    with mock.patch.object(
+        __main__.CLIContext, "adapter", new_callable=mock.PropertyMock
+    ) as adapter_property:
+        yield adapter_property.return_value
+
+
+def json_lines(output: str) -> list[dict[str, Any]]:
+    """Parse json lines output."""
+    return [json.loads(line) for line in output.splitlines()]
+
+
 def test_main_succeeds(runner: CliRunner) -> None:
     """It exits with a status code of zero."""
-    result = runner.invoke(__main__.main)
+    result = runner.invoke(__main__.main, ["--help"])
+    assert result.exit_code == 0
+
+
+def test_create_streams_from_stdin(runner: CliRunner, adapter: mock.MagicMock) -> None:
+    """It creates streams named as arguments and on stdin, writing a json line per stream."""
+
+    def create_stream(name: str) -> AWSStream:
+        if name == "broken":
+            raise RuntimeError("provider error")
+        return AWSStream(name=name, endpoint=f"rtmp://{name}")
+
+    def create_adapter_streams(names: list[str], on_result: Any, **kwargs: Any) -> Any:
+        return create_streams(create_stream, names, on_result=on_result, **kwargs)
+
+    adapter.create_streams.side_effect = create_adapter_streams
+    result = runner.invoke(
+        __main__.main,
+        ["create", "one", "--file", "-", "--concurrency", "1"],
+        input="two\n\n# a comment\nbroken\none\n",
+    )
+    assert result.exit_code == 1
+    assert adapter.create_streams.call_args.args[0] == ["one", "two", "broken"]
+    assert adapter.create_streams.call_args.kwargs["max_concurrency"] == 1
+    lines = json_lines(result.stdout)
+    assert [(line["name"], line["created"]) for line in lines] == [
+        ("one", True),
+        ("two", True),
+        ("broken", False),
+    ]
+    assert lines[0]["urls"] == {"input": "rtmp://one", "playback": None}
+    assert lines[2]["error"] == "RuntimeError: provider error"
+
+
+def test_create_low_latency_streams(runner: CliRunner, adapter: mock.MagicMock) -> None:
+    """It creates streams in the latency mode given."""
+
+    def create_adapter_streams(
+        names: list[str], on_result: Any, latency_mode: str
+    ) -> Any:
+        return create_streams(
+            lambda name: AWSStream(name=name), names, on_result=on_result
+        )
+
+    adapter.create_streams.side_effect = create_adapter_streams
+    result = runner.invoke(__main__.main, ["create", "one", "--latency-mode", "low"])
     assert result.exit_code == 0
+    assert adapter.create_streams.call_args.kwargs["latency_mode"] == "low"
+
+
+def test_create_requires_names(runner: CliRunner, adapter: mock.MagicMock) -> None:
+    """It fails when no stream names are given."""
+    result = runner.invoke(__main__.main, ["create"])
+    assert result.exit_code == 2
+    adapter.create_streams.assert_not_called()
+
+
+def test_status_and_url(runner: CliRunner, adapter: mock.MagicMock) -> None:
+    """It reports streams recorded in the local state, and an error for those that are not."""
+    stream = mock.MagicMock()
+    stream.name = "one"
+    stream.is_alive.return_value = True
+    stream.get_url.return_value = StreamURLs(input="rtmp://one", playback="https://one")
+    adapter.get_stream.side_effect = lambda name: stream if name == "one" else None
+    status = runner.invoke(__main__.main, ["status", "one", "missing"])
+    assert status.exit_code == 1
+    assert json_lines(status.stdout) == [
+        {"name": "one", "alive": True},
+        {"name": "missing", "error": "Stream not found."},
+    ]
+    url = runner.invoke(__main__.main, ["url", "one"])
+    assert url.exit_code == 0
+    assert json_lines(url.stdout) == [
+        {"name": "one", "input": "rtmp://one", "playback": "https://one"}
+    ]
+
+
+def test_gc_dry_run(runner: CliRunner, adapter: mock.MagicMock) -> None:
+    """It lists orphaned resources without deleting them on a dry run."""
+    orphan = SendLiveResource(
+        provider="aws",
+        resource_type="medialive.input",
+        resource_id="arn:input:1",
+        name="one",
+        stream_name="one",
+    )
+    adapter.collect_garbage.return_value = GarbageCollectionResult(
+        dry_run=True, resources=[orphan], orphans=[orphan], list_duration=0.5
+    )
+    result = runner.invoke(__main__.main, ["gc", "--keep", "two"])
+    assert result.exit_code == 0
+    adapter.collect_garbage.assert_called_once_with(
+        keep=("two",), dry_run=True, include_unknown=False
+    )
+    assert json_lines(result.stdout) == [
+        {
+            "provider": "aws",
+            "resource_type": "medialive.input",
+            "resource_id": "arn:input:1",
+            "stream_name": "one",
+            "dry_run": True,
+        }
+    ]
+
+
+def test_gc_force_all(runner: CliRunner, adapter: mock.MagicMock) -> None:
+    """It deletes orphans only with --force, including those unknown to the local state with --all."""
+    adapter.collect_garbage.return_value = GarbageCollectionResult(
+        dry_run=False, resources=[], orphans=[], list_duration=0.5
+    )
+    result = runner.invoke(__main__.main, ["gc", "--force", "--all"])
+    assert result.exit_code == 0
+    adapter.collect_garbage.assert_called_once_with(
+        keep=(), dry_run=False, include_unknown=True
+    )
+
+
+def test_delete_reports_failures(runner: CliRunner, adapter: mock.MagicMock) -> None:
+    """It writes a json line per resource deleted, and fails if any could not be deleted."""
+    resource = SendLiveResource(
+        provider="aws",
+        resource_type="medialive.channel",
+        resource_id="arn:channel:1",
+        name="one",
+        stream_name="one",
+    )
+    adapter.delete_streams.return_value = GarbageCollectionResult(
+        dry_run=False,
+        resources=[resource],
+        orphans=[resource],
+        deletions=[
+            ResourceDeletionResult(
+                resource=resource, exception=RuntimeError("failed"), duration=0.1
+            )
+        ],
+        list_duration=0.5,
+    )
+    result = runner.invoke(__main__.main, ["delete", "one"])
+    assert result.exit_code == 1
+    adapter.delete_streams.assert_called_once_with(["one"], dry_run=False)
+    assert json_lines(result.stdout)[0]["error"] == "RuntimeError: failed"
+
+
+@mock_medialive
+def test_list_streams_with_credentials_from_environment(runner: CliRunner) -> None:
+    """It lists sendlive streams with an adapter built from credentials in the environment."""
+    with mock.patch.dict("os.environ", AWS_ENV):
+        medialive = boto3.client("medialive", region_name="ap-southeast-2")
+        medialive.create_input(Name="one", Type="RTMP_PUSH", Tags=DEFAULT_TAGS)
+        medialive.create_input(Name="other", Type="RTMP_PUSH")
+        result = runner.invoke(__main__.main, ["--provider", "aws", "list"])
+    assert result.exit_code == 0, result.output
+    assert json_lines(result.stdout) == [{"name": "one"}]
+
+
+def test_missing_credentials(runner: CliRunner) -> None:
+    """It reports missing credentials as an error rather than a traceback."""
+    with mock.patch.dict("os.environ", clear=True):
+        result = runner.invoke(__main__.main, ["--provider", "gcp", "list"])
+    assert result.exit_code == 1
+    assert "Missing or invalid gcp credentials" in result.stderr
+
+
+def test_local_provider(runner: CliRunner) -> None:
+    """It creates streams on the simulated local provider without any credentials."""
+    with mock.patch.dict("os.environ", clear=True):
+        result = runner.invoke(__main__.main, ["--provider", "local", "create", "one"])
+    assert result.exit_code == 0, result.output
+    [line] = json_lines(result.stdout)
+    assert line["name"] == "one"
+    assert line["urls"]["input"].startswith("rtmp://localhost")